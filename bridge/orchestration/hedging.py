@@ -0,0 +1,99 @@
+"""
+Hedged request support for ModelOrchestrator.
+
+A hedged call dispatches to the best-ranked provider and, if it has not
+answered once that provider's p90 latency has elapsed, fires a backup request
+to the next provider; the first success wins and the loser is cancelled.
+A budget caps hedges at a percentage of traffic so tail-latency protection
+cannot multiply provider load.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class HedgingPolicy:
+    """Configuration for hedged provider calls"""
+
+    enabled: bool = True
+    quantile: float = 0.9  # Hedge once the primary exceeds this latency quantile
+    min_delay_s: float = 0.05
+    max_delay_s: float = 10.0
+    default_delay_s: float = 2.0  # Used until a provider has min_samples latencies
+    min_samples: int = 20
+    window: int = 256  # Recent latencies kept per provider
+    budget_percent: float = 5.0  # Maximum hedges as a percentage of requests
+    budget_burst: float = 10.0  # Hedges that may be spent back-to-back
+    failure_cooldown_s: float = 30.0  # Failing providers rank last for this long after an error
+
+
+class LatencyTracker:
+    """Recent successful-call latencies and consecutive failures per provider"""
+
+    def __init__(self, window: int = 256):
+        self.window = window
+        self._samples: dict[Hashable, deque[float]] = {}
+        self._failures: dict[Hashable, tuple[int, float]] = {}  # (consecutive, last failure time)
+
+    def record(self, provider: Hashable, latency_s: float) -> None:
+        self.record_lower_bound(provider, latency_s)
+        self._failures.pop(provider, None)
+
+    def record_lower_bound(self, provider: Hashable, latency_s: float) -> None:
+        """Keep the elapsed time of a call that never finished as a latency sample"""
+        samples = self._samples.get(provider)
+        if samples is None:
+            samples = self._samples[provider] = deque(maxlen=self.window)
+        samples.append(latency_s)
+
+    def record_failure(self, provider: Hashable, now: float) -> None:
+        count, _ = self._failures.get(provider, (0, now))
+        self._failures[provider] = (count + 1, now)
+
+    def failing(self, provider: Hashable, now: float, cooldown_s: float) -> int:
+        """Consecutive failures of a provider whose last call failed within cooldown_s, else 0"""
+        count, failed_at = self._failures.get(provider, (0, now))
+        return count if now - failed_at < cooldown_s else 0
+
+    def count(self, provider: Hashable) -> int:
+        return len(self._samples.get(provider, ()))
+
+    def quantile(self, provider: Hashable, q: float) -> Optional[float]:
+        """Nearest-rank latency quantile, or None without samples"""
+        samples = self._samples.get(provider)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class HedgeBudget:
+    """
+    Token bucket that limits hedges to a percentage of requests.
+
+    Each request earns ``percent / 100`` of a hedge, up to ``burst`` saved
+    hedges; each hedge spends one.
+    """
+
+    def __init__(self, percent: float, burst: float = 10.0):
+        self.rate = percent / 100.0
+        self.burst = burst
+        self.credit = burst
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.credit = min(self.burst, self.credit + self.rate)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.credit >= 1.0:
+                self.credit -= 1.0
+                return True
+            return False
@@ -1,19 +1,45 @@
-from typing import Optional
+import asyncio
+import contextlib
+import time
+from typing import Any, Optional
 
 from bridge.llm_wrappers.anthropic_wrapper import AnthropicWrapper
 from bridge.llm_wrappers.base import LLMProvider, LLMWrapper
 from bridge.llm_wrappers.gemini_wrapper import GeminiWrapper
 from bridge.llm_wrappers.unified_openai_client import UnifiedOpenAIClient
+from bridge.orchestration.hedging import HedgeBudget, HedgingPolicy, LatencyTracker
 
 
 class ModelOrchestrator:
     """
     Orchestrates multiple LLM providers.
+
+    When no provider is requested, calls are hedged: the best-ranked provider
+    (lowest median latency; unmeasured providers first) is called, and if it
+    has not answered within its p90 latency a backup request goes to the next
+    provider. The first success wins and the other call is cancelled. Hedges
+    are capped at ``policy.budget_percent`` of requests. A failed call falls
+    over to the next provider without waiting, and a provider whose last call
+    failed ranks after healthy ones for ``policy.failure_cooldown_s``. At most
+    two providers are tried per request.
     """
 
-    def __init__(self):
+    MAX_ATTEMPTS = 2
+
+    def __init__(
+        self,
+        hedging: Optional[HedgingPolicy] = None,
+        wrappers: Optional[dict[LLMProvider, LLMWrapper]] = None,
+    ):
         self.wrappers: dict[LLMProvider, LLMWrapper] = {}
-        self._initialize_wrappers()
+        self.hedging = hedging or HedgingPolicy()
+        self.latency = LatencyTracker(self.hedging.window)
+        self.hedge_budget = HedgeBudget(self.hedging.budget_percent, self.hedging.budget_burst)
+        self.hedge_stats = {"requests": 0, "hedges": 0, "hedge_wins": 0, "failovers": 0}
+        if wrappers is None:
+            self._initialize_wrappers()
+        else:
+            self.wrappers.update(wrappers)
 
     def _initialize_wrappers(self):
         """
@@ -54,23 +80,139 @@ class ModelOrchestrator:
         Returns:
             A tuple of (generated response, provider name, model used).
         """
-        selected_wrapper = None
-        selected_provider = None
         if provider:
-            if provider in self.wrappers:
-                selected_wrapper = self.wrappers[provider]
-                selected_provider = provider
-            else:
+            if provider not in self.wrappers:
                 raise ValueError(f"Provider {provider.value} is not available.")
-        elif self.wrappers:
-            # Simple fallback strategy: use the first available wrapper.
-            selected_provider = next(iter(self.wrappers.keys()))
-            selected_wrapper = self.wrappers[selected_provider]
-        else:
+            response_text, model_used = await self._timed_call(provider, prompt, model, kwargs)
+            return response_text, provider.value, model_used
+        if not self.wrappers:
             raise ValueError("No LLM providers are available.")
 
-        response_text, model_used = await selected_wrapper.generate_response(prompt, model=model, **kwargs)
-        return response_text, selected_provider.value, model_used
+        return await self._generate_hedged(prompt, model, kwargs)
+
+    async def _generate_hedged(
+        self, prompt: str, model: Optional[str], kwargs: dict[str, Any]
+    ) -> tuple[str, str, str]:
+        """Race the best-ranked provider against a delayed backup, keeping the first success."""
+        ranked = self._rank_providers()
+        self.hedge_stats["requests"] += 1
+        self.hedge_budget.record_request()
+
+        loop = asyncio.get_running_loop()
+        pending: dict[asyncio.Task, LLMProvider] = {}
+        attempts = 0
+        hedged = False
+        hedge_at: Optional[float] = None
+
+        def launch(provider: LLMProvider) -> None:
+            nonlocal attempts, hedge_at
+            task = asyncio.create_task(self._timed_call(provider, prompt, model, kwargs))
+            pending[task] = provider
+            attempts += 1
+            can_hedge = self.hedging.enabled and attempts < min(self.MAX_ATTEMPTS, len(ranked))
+            hedge_at = loop.time() + self._hedge_delay(provider) if can_hedge else None
+
+        launch(ranked[0])
+        last_error: Optional[BaseException] = None
+        try:
+            while pending:
+                timeout = None if hedge_at is None else max(0.0, hedge_at - loop.time())
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # The primary is slower than its hedge delay
+                    hedge_at = None
+                    if self.hedge_budget.try_spend():
+                        self.hedge_stats["hedges"] += 1
+                        hedged = True
+                        launch(ranked[attempts])
+                    continue
+
+                for task in done:
+                    provider = pending.pop(task)
+                    try:
+                        response_text, model_used = task.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if hedged and provider is not ranked[0]:
+                        self.hedge_stats["hedge_wins"] += 1
+                    return response_text, provider.value, model_used
+
+                # Every finished call failed: fail over rather than wait out a hedge delay
+                if not pending and attempts < min(self.MAX_ATTEMPTS, len(ranked)):
+                    self.hedge_stats["failovers"] += 1
+                    launch(ranked[attempts])
+
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+            for task in pending:
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+
+    async def _timed_call(
+        self, provider: LLMProvider, prompt: str, model: Optional[str], kwargs: dict[str, Any]
+    ) -> tuple[str, str]:
+        """Call a provider, recording the latency of successful calls and any failure."""
+        start = time.perf_counter()
+        try:
+            result = await self.wrappers[provider].generate_response(prompt, model=model, **kwargs)
+        except asyncio.CancelledError:
+            # Cancelled after its hedge delay, the call lost a race: its latency
+            # is at least the elapsed time. Keeping that as a sample stops the
+            # quantile from drifting down to the fast calls that won.
+            elapsed = time.perf_counter() - start
+            if elapsed >= self._hedge_delay(provider):
+                self.latency.record_lower_bound(provider, elapsed)
+            raise
+        except Exception:
+            self.latency.record_failure(provider, time.monotonic())
+            raise
+        self.latency.record(provider, time.perf_counter() - start)
+        return result
+
+    def _rank_providers(self) -> list[LLMProvider]:
+        """
+        Available providers by median latency; unmeasured providers keep their order first.
+
+        Providers that failed within the cooldown rank last, fewest consecutive failures first.
+        """
+        failing = self._failing_providers()
+        medians = {provider: self.latency.quantile(provider, 0.5) for provider in self.wrappers}
+        return sorted(
+            self.wrappers,
+            key=lambda p: (failing.get(p, 0), medians[p] is not None, medians[p] or 0.0),
+        )
+
+    def _failing_providers(self) -> dict[LLMProvider, int]:
+        """Consecutive failures per provider still inside its failure cooldown."""
+        now = time.monotonic()
+        cooldown = self.hedging.failure_cooldown_s
+        counts = {p: self.latency.failing(p, now, cooldown) for p in self.wrappers}
+        return {p: count for p, count in counts.items() if count}
+
+    def _hedge_delay(self, provider: LLMProvider) -> float:
+        """How long to wait on a provider before hedging: its latency quantile, clamped."""
+        policy = self.hedging
+        if self.latency.count(provider) < policy.min_samples:
+            return policy.default_delay_s
+        delay = self.latency.quantile(provider, policy.quantile)
+        return min(policy.max_delay_s, max(policy.min_delay_s, delay))
+
+    def get_hedging_stats(self) -> dict[str, Any]:
+        """
+        Returns hedging counters, the current hedge delay per provider and
+        the consecutive failures of providers ranked down after an error.
+        """
+        return {
+            **self.hedge_stats,
+            "hedge_delay_s": {p.value: self._hedge_delay(p) for p in self.wrappers},
+            "failing": {p.value: count for p, count in self._failing_providers().items()},
+        }
 
     def get_available_providers(self) -> list[LLMProvider]:
         """
@@ -0,0 +1,258 @@
+"""
+Roaring-style integer bitmap used for glyph → fold postings.
+
+Values are 32-bit integer ids split into a 16-bit chunk key and a 16-bit low
+part. Each chunk is stored in whichever container is smaller:
+
+- a sorted ``uint16`` array while the chunk holds at most 4096 values
+- a 65536-bit bitmap (1024 ``uint64`` words) once it grows past that
+
+AND / OR / AND-NOT run chunk by chunk with NumPy set and bitwise operations,
+so combining postings costs time proportional to their compressed size rather
+than to the number of Python objects involved.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Union
+
+import numpy as np
+
+ARRAY_MAX = 4096  # Array containers above this size become bitmaps
+_WORDS = 1024  # uint64 words per bitmap container
+_EMPTY_LOW = np.empty(0, dtype=np.uint16)
+
+Container = np.ndarray  # uint16 sorted array or uint64[1024] bitmap
+
+
+def _is_bitmap(container: Container) -> bool:
+    return container.dtype == np.uint64
+
+
+def _popcount(words: np.ndarray) -> int:
+    return int(np.unpackbits(words.view(np.uint8)).sum())
+
+
+def _array_to_bitmap(values: np.ndarray) -> np.ndarray:
+    bits = np.zeros(_WORDS * 64, dtype=bool)
+    bits[values] = True
+    return np.packbits(bits, bitorder="little").view(np.uint64)
+
+
+def _bitmap_to_array(words: np.ndarray) -> np.ndarray:
+    return np.flatnonzero(np.unpackbits(words.view(np.uint8), bitorder="little")).astype(np.uint16)
+
+
+def _bitmap_contains(words: np.ndarray, values: np.ndarray) -> np.ndarray:
+    values = values.astype(np.uint64)
+    return ((words[values >> np.uint64(6)] >> (values & np.uint64(63))) & np.uint64(1)).astype(bool)
+
+
+def _normalize(container: Container) -> Container:
+    """Pick the smaller representation for a container."""
+    if _is_bitmap(container):
+        if _popcount(container) <= ARRAY_MAX:
+            return _bitmap_to_array(container)
+        return container
+    if len(container) > ARRAY_MAX:
+        return _array_to_bitmap(container)
+    return container
+
+
+def _and(a: Container, b: Container) -> Container:
+    if _is_bitmap(a) and _is_bitmap(b):
+        return _normalize(a & b)
+    if _is_bitmap(a):
+        a, b = b, a
+    if _is_bitmap(b):
+        return a[_bitmap_contains(b, a)]
+    return np.intersect1d(a, b, assume_unique=True)
+
+
+def _or(a: Container, b: Container) -> Container:
+    if _is_bitmap(a) or _is_bitmap(b):
+        words_a = a if _is_bitmap(a) else _array_to_bitmap(a)
+        words_b = b if _is_bitmap(b) else _array_to_bitmap(b)
+        return words_a | words_b
+    return _normalize(np.union1d(a, b))
+
+
+def _andnot(a: Container, b: Container) -> Container:
+    if _is_bitmap(a):
+        words_b = b if _is_bitmap(b) else _array_to_bitmap(b)
+        return _normalize(a & ~words_b)
+    if _is_bitmap(b):
+        return a[~_bitmap_contains(b, a)]
+    return np.setdiff1d(a, b, assume_unique=True)
+
+
+class GlyphBitmap:
+    """Compressed set of non-negative 32-bit integers."""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, values: Union[Iterable[int], np.ndarray, None] = None):
+        self._chunks: dict[int, Container] = {}
+        if values is not None:
+            self.update(values)
+
+    @classmethod
+    def _from_chunks(cls, chunks: dict[int, Container]) -> GlyphBitmap:
+        bitmap = cls()
+        bitmap._chunks = {key: container for key, container in chunks.items() if _nonempty(container)}
+        return bitmap
+
+    # Mutation
+
+    def add(self, value: int) -> None:
+        key, low = value >> 16, value & 0xFFFF
+        container = self._chunks.get(key)
+        if container is None:
+            self._chunks[key] = np.array([low], dtype=np.uint16)
+        elif _is_bitmap(container):
+            container[low >> 6] |= np.uint64(1) << np.uint64(low & 63)
+        else:
+            position = int(np.searchsorted(container, low))
+            if position == len(container) or container[position] != low:
+                self._chunks[key] = _normalize(np.insert(container, position, low))
+
+    def discard(self, value: int) -> None:
+        key, low = value >> 16, value & 0xFFFF
+        container = self._chunks.get(key)
+        if container is None:
+            return
+        if _is_bitmap(container):
+            container[low >> 6] &= ~(np.uint64(1) << np.uint64(low & 63))
+            container = _normalize(container)
+        else:
+            position = int(np.searchsorted(container, low))
+            if position < len(container) and container[position] == low:
+                container = np.delete(container, position)
+        if _nonempty(container):
+            self._chunks[key] = container
+        else:
+            del self._chunks[key]
+
+    def update(self, values: Union[Iterable[int], np.ndarray]) -> None:
+        """Add many values at once."""
+        values = np.unique(np.asarray(values if isinstance(values, np.ndarray) else list(values), dtype=np.int64))
+        if not values.size:
+            return
+        keys = values >> 16
+        bounds = np.flatnonzero(np.diff(keys)) + 1
+        for chunk in np.split(values, bounds):
+            key = int(chunk[0] >> 16)
+            lows = (chunk & 0xFFFF).astype(np.uint16)
+            existing = self._chunks.get(key)
+            self._chunks[key] = _normalize(lows) if existing is None else _or(existing, _normalize(lows))
+
+    # Queries
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, (int, np.integer)):
+            return False
+        container = self._chunks.get(int(value) >> 16)
+        if container is None:
+            return False
+        low = int(value) & 0xFFFF
+        if _is_bitmap(container):
+            return bool((int(container[low >> 6]) >> (low & 63)) & 1)
+        position = int(np.searchsorted(container, low))
+        return position < len(container) and container[position] == low
+
+    def contains_many(self, values: np.ndarray) -> np.ndarray:
+        """Vectorised membership test."""
+        values = np.asarray(values, dtype=np.int64)
+        result = np.zeros(len(values), dtype=bool)
+        if not values.size or not self._chunks:
+            return result
+        keys = values >> 16
+        for key, container in self._chunks.items():
+            positions = np.flatnonzero(keys == key)
+            if not positions.size:
+                continue
+            lows = (values[positions] & 0xFFFF).astype(np.uint16)
+            if _is_bitmap(container):
+                result[positions] = _bitmap_contains(container, lows)
+            else:
+                result[positions] = np.isin(lows, container, assume_unique=False)
+        return result
+
+    def __len__(self) -> int:
+        return sum(_popcount(c) if _is_bitmap(c) else len(c) for c in self._chunks.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.to_array().tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GlyphBitmap):
+            return NotImplemented
+        return np.array_equal(self.to_array(), other.to_array())
+
+    def __repr__(self) -> str:
+        return f"GlyphBitmap(len={len(self)}, chunks={len(self._chunks)})"
+
+    def copy(self) -> GlyphBitmap:
+        return GlyphBitmap._from_chunks({key: c.copy() for key, c in self._chunks.items()})
+
+    def to_array(self) -> np.ndarray:
+        """All values in ascending order as an int64 array."""
+        parts = []
+        for key in sorted(self._chunks):
+            container = self._chunks[key]
+            lows = _bitmap_to_array(container) if _is_bitmap(container) else container
+            parts.append(lows.astype(np.int64) + (key << 16))
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    # Set algebra
+
+    def __and__(self, other: GlyphBitmap) -> GlyphBitmap:
+        small, large = (self, other) if len(self._chunks) <= len(other._chunks) else (other, self)
+        return GlyphBitmap._from_chunks(
+            {key: _and(c, large._chunks[key]) for key, c in small._chunks.items() if key in large._chunks}
+        )
+
+    def __or__(self, other: GlyphBitmap) -> GlyphBitmap:
+        chunks = {key: c.copy() for key, c in self._chunks.items()}
+        for key, container in other._chunks.items():
+            chunks[key] = _or(chunks[key], container) if key in chunks else container.copy()
+        return GlyphBitmap._from_chunks(chunks)
+
+    def __sub__(self, other: GlyphBitmap) -> GlyphBitmap:
+        return GlyphBitmap._from_chunks(
+            {
+                key: _andnot(c, other._chunks[key]) if key in other._chunks else c.copy()
+                for key, c in self._chunks.items()
+            }
+        )
+
+    def intersection_cardinality(self, other: GlyphBitmap) -> int:
+        return len(self & other)
+
+    @staticmethod
+    def intersect_all(bitmaps: Iterable[GlyphBitmap]) -> GlyphBitmap:
+        """AND of several bitmaps, smallest first so the running result shrinks fastest."""
+        ordered = sorted(bitmaps, key=len)
+        if not ordered:
+            return GlyphBitmap()
+        result = ordered[0]
+        for bitmap in ordered[1:]:
+            if not result:
+                break
+            result = result & bitmap
+        return result if len(ordered) > 1 else result.copy()
+
+    @staticmethod
+    def union_all(bitmaps: Iterable[GlyphBitmap]) -> GlyphBitmap:
+        result = GlyphBitmap()
+        for bitmap in bitmaps:
+            result = result | bitmap
+        return result
+
+
+def _nonempty(container: Container) -> bool:
+    return bool(container.any()) if _is_bitmap(container) else len(container) > 0
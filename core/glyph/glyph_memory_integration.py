@@ -60,14 +60,18 @@
 """
 from __future__ import annotations
 
+import itertools
 import logging
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Any, Optional
 
 import numpy as np
+from core.glyph.glyph_bitmap import GlyphBitmap
 
 # Internal imports
 try:
@@ -153,21 +157,66 @@ class CompressionType(Enum):
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+class _GlyphFoldsView(Mapping):
+    """Read-only glyph -> set of fold keys view over the bitmap postings."""
+
+    def __init__(self, index: GlyphMemoryIndex):
+        self._index = index
+
+    def __getitem__(self, glyph: str) -> set[str]:
+        postings = self._index.postings.get(glyph)
+        if postings is None:
+            # Missing glyphs read as empty, like the defaultdict this replaces
+            return set()
+        return set(self._index.fold_keys_for(postings))
+
+    def get(self, glyph: str, default: Any = None) -> Any:
+        return self[glyph] if glyph in self._index.postings else default
+
+    def __contains__(self, glyph: object) -> bool:
+        return glyph in self._index.postings
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index.postings)
+
+    def __len__(self) -> int:
+        return len(self._index.postings)
+
+
 class GlyphMemoryIndex:
     """
     Maintains bidirectional mapping between glyphs and memory folds.
     Enables symbolic indexing and retrieval of memories.
+
+    Fold keys are interned to dense integer ids so that each glyph's postings
+    are a compressed GlyphBitmap, and AND / OR / NOT queries over many glyphs
+    run as bitmap operations. Each glyph also keeps its bindings ordered by
+    strength, so strongest-first retrieval never re-sorts.
     """
 
     def __init__(self):
         """Initialize the glyph-memory index."""
-        self.glyph_to_folds: dict[str, set[str]] = defaultdict(set)
+        self.postings: dict[str, GlyphBitmap] = {}
         self.fold_to_glyphs: dict[str, set[str]] = defaultdict(set)
         self.glyph_bindings: dict[tuple[str, str], GlyphBinding] = {}
         self._index_lock = True  # Thread safety placeholder
 
+        # Fold key <-> dense integer id
+        self._fold_ids: dict[str, int] = {}
+        self._fold_keys: list[str] = []
+
+        # Per-glyph bindings as (-strength, sequence, fold_id), ascending
+        self._ranked: dict[str, list[tuple[float, int, int]]] = {}
+        self._rank_entries: dict[tuple[str, int], tuple[float, int, int]] = {}
+        self._sequence = itertools.count()
+
         logger.info("GlyphMemoryIndex initialized")
 
+    @property
+    def glyph_to_folds(self) -> Mapping[str, set[str]]:
+        """Glyph -> fold keys, materialised from the bitmap postings."""
+        return _GlyphFoldsView(self)
+
     def bind_glyph_to_fold(
         self,
         glyph: str,
@@ -202,35 +251,51 @@ class GlyphMemoryIndex:
         )
 
         # Update indices
-        self.glyph_to_folds[glyph].add(fold_key)
+        fold_id = self._intern(fold_key)
+        self.postings.setdefault(glyph, GlyphBitmap()).add(fold_id)
         self.fold_to_glyphs[fold_key].add(glyph)
         self.glyph_bindings[(glyph, fold_key)] = binding
 
+        # Keep the glyph's bindings ordered by strength (rebinding replaces)
+        ranked = self._ranked.setdefault(glyph, [])
+        previous = self._rank_entries.pop((glyph, fold_id), None)
+        if previous is not None:
+            del ranked[bisect_left(ranked, previous)]
+        entry = (-binding_strength, next(self._sequence), fold_id)
+        insort(ranked, entry)
+        self._rank_entries[(glyph, fold_id)] = entry
+
         logger.debug(f"Bound glyph '{glyph}' to fold '{fold_key}' with strength {binding_strength}")
 
         return binding
 
-    def get_folds_by_glyph(self, glyph: str, min_strength: float = 0.0) -> list[tuple[str, GlyphBinding]]:
+    def get_folds_by_glyph(
+        self, glyph: str, min_strength: float = 0.0, limit: Optional[int] = None
+    ) -> list[tuple[str, GlyphBinding]]:
         """
-        Retrieve all memory folds associated with a glyph.
+        Retrieve memory folds associated with a glyph, strongest first.
 
         Args:
             glyph: The glyph to search for
             min_strength: Minimum binding strength threshold
+            limit: Optional maximum number of folds (top-k by strength)
 
         Returns:
             List of (fold_key, binding) tuples
         """
-        fold_keys = self.glyph_to_folds.get(glyph, set())
-        results = []
+        ranked = self._ranked.get(glyph)
+        if not ranked:
+            return []
 
-        for fold_key in fold_keys:
-            binding = self.glyph_bindings.get((glyph, fold_key))
-            if binding and binding.binding_strength >= min_strength:
-                results.append((fold_key, binding))
+        # Bindings are pre-sorted, so the threshold is a prefix boundary
+        end = bisect_right(ranked, (-min_strength, float("inf"), 0))
+        if limit is not None:
+            end = min(end, limit)
 
-        # Sort by binding strength
-        results.sort(key=lambda x: x[1].binding_strength, reverse=True)
+        results = []
+        for _, _, fold_id in ranked[:end]:
+            fold_key = self._fold_keys[fold_id]
+            results.append((fold_key, self.glyph_bindings[(glyph, fold_key)]))
 
         return results
 
@@ -254,6 +319,45 @@ class GlyphMemoryIndex:
 
         return results
 
+    def query(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+    ) -> GlyphBitmap:
+        """
+        Find folds by glyph set algebra over the bitmap postings.
+
+        Args:
+            all_of: Glyphs every result must carry (AND)
+            any_of: Glyphs of which a result must carry at least one (OR)
+            none_of: Glyphs no result may carry (NOT)
+
+        Returns:
+            Bitmap of matching fold ids (see ``fold_keys_for``)
+        """
+        all_of, any_of = list(all_of), list(any_of)
+        if not all_of and not any_of:
+            return GlyphBitmap()
+
+        empty = GlyphBitmap()
+        terms = [self.postings.get(glyph, empty) for glyph in all_of]
+        if any_of:
+            terms.append(GlyphBitmap.union_all(self.postings[g] for g in any_of if g in self.postings))
+        result = GlyphBitmap.intersect_all(terms)
+
+        for glyph in none_of:
+            if not result:
+                break
+            if glyph in self.postings:
+                result = result - self.postings[glyph]
+
+        return result
+
+    def fold_keys_for(self, fold_ids: Iterable[int]) -> list[str]:
+        """Map fold ids from ``query`` back to fold keys."""
+        return [self._fold_keys[fold_id] for fold_id in fold_ids]
+
     def calculate_glyph_affinity(self, glyph1: str, glyph2: str) -> float:
         """
         Calculate affinity between two glyphs based on shared memories.
@@ -265,18 +369,26 @@ class GlyphMemoryIndex:
         Returns:
             Affinity score (0-1)
         """
-        folds1 = self.glyph_to_folds.get(glyph1, set())
-        folds2 = self.glyph_to_folds.get(glyph2, set())
+        folds1 = self.postings.get(glyph1)
+        folds2 = self.postings.get(glyph2)
 
         if not folds1 or not folds2:
             return 0.0
 
         # Jaccard similarity
-        intersection = len(folds1 & folds2)
-        union = len(folds1 | folds2)
+        intersection = folds1.intersection_cardinality(folds2)
+        union = len(folds1) + len(folds2) - intersection
 
         return intersection / union if union > 0 else 0.0
 
+    def _intern(self, fold_key: str) -> int:
+        fold_id = self._fold_ids.get(fold_key)
+        if fold_id is None:
+            fold_id = len(self._fold_keys)
+            self._fold_ids[fold_key] = fold_id
+            self._fold_keys.append(fold_key)
+        return fold_id
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # EMOTIONAL FOLDING ENGINE
@@ -625,8 +737,8 @@ class GlyphAffectCoupler:
         Returns:
             List of memories with glyph-affect coupling
         """
-        # Get all memories bound to this glyph
-        bound_folds = self.glyph_index.get_folds_by_glyph(target_glyph)
+        # Strongest bindings first, with extra for filtering
+        bound_folds = self.glyph_index.get_folds_by_glyph(target_glyph, limit=limit * 2)
 
         if not bound_folds:
             logger.info(f"No memories found for glyph '{target_glyph}'")
@@ -635,22 +747,25 @@ class GlyphAffectCoupler:
         # Get glyph's affect
         target_affect = self.glyph_affect_map.get(target_glyph, np.zeros(3))
 
-        # Filter and score by affect distance
-        results = []
-        for fold_key, binding in bound_folds[: limit * 2]:  # Get extra for filtering
-            # Calculate affect distance
-            affect_distance = np.linalg.norm(binding.affect_vector - target_affect)
-
-            if affect_distance <= affect_threshold:
-                # Retrieve full memory
-                memories = self.memory_system.database.get_folds(limit=1)
-                memory = next((m for m in memories if m["hash"] == fold_key), None)
+        # Filter by affect distance in one vectorised pass
+        affects = np.stack([binding.affect_vector for _, binding in bound_folds])
+        distances = np.linalg.norm(affects - target_affect, axis=1)
+        selected = {
+            fold_key: (binding, float(distance))
+            for (fold_key, binding), distance in zip(bound_folds, distances)
+            if distance <= affect_threshold
+        }
+        if not selected:
+            return []
 
-                if memory:
-                    memory["glyph_binding"] = binding
-                    memory["affect_distance"] = float(affect_distance)
-                    memory["affect_similarity"] = 1.0 - (affect_distance / 2.0)
-                    results.append(memory)
+        # Retrieve the surviving memories in one batch
+        results = []
+        for memory in self.memory_system.database.get_folds_by_hash(list(selected)):
+            binding, affect_distance = selected[memory["hash"]]
+            memory["glyph_binding"] = binding
+            memory["affect_distance"] = affect_distance
+            memory["affect_similarity"] = 1.0 - (affect_distance / 2.0)
+            results.append(memory)
 
         # Sort by affect similarity
         results.sort(key=lambda x: x["affect_similarity"], reverse=True)
@@ -890,44 +1005,38 @@ class GlyphMemorySystem:
         Returns:
             List of matching memories
         """
+        if not glyphs:
+            return []
+
         if mode == "all":
             # Find memories containing all glyphs
-            fold_sets = []
-            for glyph in glyphs:
-                folds = {f[0] for f in self.glyph_index.get_folds_by_glyph(glyph)}
-                fold_sets.append(folds)
-
-            if not fold_sets:
-                return []
-
-            # Intersection of all sets
-            common_folds = fold_sets[0]
-            for fold_set in fold_sets[1:]:
-                common_folds &= fold_set
-
-            fold_keys = list(common_folds)[:limit]
-
+            matches = self.glyph_index.query(all_of=glyphs)
         else:  # mode == "any"
             # Find memories containing any glyph
-            all_folds = set()
-            for glyph in glyphs:
-                folds = {f[0] for f in self.glyph_index.get_folds_by_glyph(glyph)}
-                all_folds |= folds
+            matches = self.glyph_index.query(any_of=glyphs)
 
-            fold_keys = list(all_folds)[:limit]
+        # Most recently indexed folds first
+        fold_ids = matches.to_array()[::-1][:limit]
+        if not fold_ids.size:
+            return []
+        fold_keys = self.glyph_index.fold_keys_for(fold_ids.tolist())
 
-        # Retrieve full memories
-        results = []
-        for fold_key in fold_keys:
-            memories = self.memory_system.recall_memory_folds(user_tier=user_tier, limit=1)
-            memory = next((m for m in memories if m["hash"] == fold_key), None)
+        # Which query glyphs each fold carries, one vectorised probe per glyph
+        carried = {
+            glyph: self.glyph_index.postings[glyph].contains_many(fold_ids)
+            for glyph in glyphs
+            if glyph in self.glyph_index.postings
+        }
+        matched_glyphs = {
+            fold_key: [glyph for glyph in glyphs if glyph in carried and carried[glyph][position]]
+            for position, fold_key in enumerate(fold_keys)
+        }
 
-            if memory:
-                # Add glyph binding info
-                memory["matched_glyphs"] = [
-                    g for g in glyphs if fold_key in self.glyph_index.glyph_to_folds.get(g, set())
-                ]
-                results.append(memory)
+        # Retrieve full memories in one batch
+        results = []
+        for memory in self.memory_system.recall_memory_folds_by_hash(fold_keys, user_tier=user_tier):
+            memory["matched_glyphs"] = matched_glyphs[memory["hash"]]
+            results.append(memory)
 
         return results
 
@@ -996,7 +1105,7 @@ class GlyphMemorySystem:
         # Add glyph statistics
         glyph_stats = {
             "total_glyph_bindings": len(self.glyph_index.glyph_bindings),
-            "unique_glyphs_used": len(self.glyph_index.glyph_to_folds),
+            "unique_glyphs_used": len(self.glyph_index.postings),
             "memories_with_glyphs": len(self.glyph_index.fold_to_glyphs),
             "glyph_distribution": {},
             "top_glyph_associations": [],
@@ -1008,7 +1117,7 @@ class GlyphMemorySystem:
         }
 
         # Glyph distribution
-        for glyph, folds in self.glyph_index.glyph_to_folds.items():
+        for glyph, folds in self.glyph_index.postings.items():
             glyph_stats["glyph_distribution"][glyph] = {
                 "count": len(folds),
                 "meaning": get_glyph_meaning(glyph),
@@ -0,0 +1,289 @@
+"""
+Append-only segment log for UnifiedMemoryManager persistence.
+
+Each user's persisted (critical) memories live in one file of length-prefixed
+binary records::
+
+    header: kind (u8) | crc32 (u32) | id length (u16) | meta length (u32) | payload length (u32)
+    body:   memory id (UTF-8) | meta | payload
+
+``meta`` and ``payload`` are opaque to the log; UnifiedMemoryManager packs a
+memory's fields into ``meta`` and its content into ``payload``. Later records
+for a memory supersede earlier ones and tombstones remove it. A
+record that is cut short, or a corrupt last record, marks a torn tail: replay
+stops there and the file is truncated back to the last good record. A corrupt
+record with more data after it is skipped with a warning and replay carries
+on; the next compaction drops it from the file.
+
+Compaction writes the live records to a temporary file and atomically
+replaces the log. Records appended while a compaction runs are replayed onto
+the new file before the swap, so the file work can run in a worker thread
+while the event loop keeps appending.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import zlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"UMM1"
+RECORD_MEMORY = 1
+RECORD_TOMBSTONE = 2
+
+_HEADER = struct.Struct("<BIHII")
+
+# (kind, memory id, meta, payload) of one record
+Record = tuple[int, str, bytes, bytes]
+
+
+def encode_record(kind: int, memory_id: str, meta: bytes = b"", payload: bytes = b"") -> bytes:
+    """Encode one record with its header and checksum."""
+    id_bytes = memory_id.encode("utf-8")
+    body = id_bytes + meta + payload
+    return _HEADER.pack(kind, zlib.crc32(body), len(id_bytes), len(meta), len(payload)) + body
+
+
+def _read_records(f: BinaryIO) -> Iterator[tuple[Optional[Record], int]]:
+    """
+    Stream (record, size) from a log positioned after MAGIC.
+
+    A corrupt record followed by more data is yielded as (None, size) so the
+    caller can skip it. Stops silently at a torn tail: a record cut short, or
+    a corrupt record that ends the file.
+    """
+    file_size = os.fstat(f.fileno()).st_size
+    while True:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return
+        kind, crc, id_len, meta_len, payload_len = _HEADER.unpack(header)
+        body_len = id_len + meta_len + payload_len
+        body = f.read(body_len)
+        if len(body) < body_len:
+            return
+        size = _HEADER.size + body_len
+        try:
+            if zlib.crc32(body) != crc:
+                raise ValueError("checksum mismatch")
+            memory_id = body[:id_len].decode("utf-8")
+        except ValueError:  # Includes UnicodeDecodeError
+            if f.tell() >= file_size:
+                return
+            yield None, size
+            continue
+        meta_end = id_len + meta_len
+        yield (kind, memory_id, body[id_len:meta_end], body[meta_end:]), size
+
+
+class MemorySegmentLog:
+    """Per-user append-only memory log with compaction and torn-tail recovery."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.log_bytes = 0  # Size of the log file
+        self.live_bytes = 0  # Bytes of the latest record per live memory
+        self._record_sizes: dict[str, int] = {}
+        self._pending: Optional[list[tuple[int, str, bytes]]] = None  # Appends during compaction
+        self._compact_end = 0  # Log size when the running compaction began
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._record_sizes
+
+    def __len__(self) -> int:
+        return len(self._record_sizes)
+
+    @property
+    def compacting(self) -> bool:
+        return self._pending is not None
+
+    def append(self, records: Iterable[Record], sync: bool = False) -> int:
+        """
+        Append records to the log.
+
+        Args:
+            records: (kind, memory id, meta, payload) tuples
+            sync: fsync the file after writing
+
+        Returns:
+            Number of bytes written
+        """
+        encoded = [(record[0], record[1], encode_record(*record)) for record in records]
+        if not encoded:
+            return 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        new_file = not self.path.exists() or self.path.stat().st_size == 0
+        with open(self.path, "ab") as f:
+            if new_file:
+                f.write(MAGIC)
+                self.log_bytes = len(MAGIC)
+            f.write(b"".join(data for _, _, data in encoded))
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        written = 0
+        for kind, memory_id, data in encoded:
+            self._account(self._record_sizes, kind, memory_id, len(data))
+            written += len(data)
+        self.log_bytes += written
+        if self._pending is not None:
+            self._pending.extend(encoded)
+        return written
+
+    def replay(self) -> Iterator[Record]:
+        """
+        Stream the log's records in write order, truncating a torn tail.
+
+        Corrupt records in the middle of the log are logged and skipped.
+
+        Yields:
+            (kind, memory id, meta, payload) for every intact record,
+            including superseded ones and tombstones
+        """
+        self._record_sizes = {}
+        self.live_bytes = 0
+        self.log_bytes = 0
+        if not self.path.exists():
+            return
+
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a memory segment log: {self.path}")
+            offset = len(MAGIC)
+            for record, size in _read_records(f):
+                if record is None:
+                    logger.warning(
+                        f"Skipping corrupt memory log record at byte {offset} ({size} bytes): {self.path}"
+                    )
+                    offset += size
+                    continue
+                self._account(self._record_sizes, record[0], record[1], size)
+                offset += size
+                yield record
+            file_size = os.fstat(f.fileno()).st_size
+
+        self.log_bytes = offset
+        if offset < file_size:
+            logger.warning(
+                f"Truncating torn memory log tail at byte {offset} of {file_size}: {self.path}"
+            )
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+
+    def should_compact(self, min_bytes: int = 1 << 20, ratio: float = 2.0) -> bool:
+        """Return True once superseded records and tombstones dominate the log."""
+        return (
+            not self.compacting
+            and self.log_bytes > min_bytes
+            and self.log_bytes > ratio * self.live_bytes
+        )
+
+    def begin_compaction(self) -> None:
+        """Start recording appends so they can be replayed onto the compacted file."""
+        self._pending = []
+        self._compact_end = self.log_bytes
+
+    def write_compacted(
+        self, records: Optional[Iterable[Record]] = None
+    ) -> tuple[Path, dict[str, int]]:
+        """
+        Write a compacted copy of the log to a temporary file.
+
+        Safe to run in a worker thread between begin_compaction and
+        finish_compaction; it does not touch in-memory accounting.
+
+        Args:
+            records: Live memory records to write; if None, the live
+                records the log held at begin_compaction are copied in their
+                original order
+
+        Returns:
+            (temporary path, record sizes by memory id)
+        """
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        sizes: dict[str, int] = {}
+        with open(temp_path, "wb") as out:
+            out.write(MAGIC)
+            if records is None:
+                for memory_id, data in self._live_records():
+                    out.write(data)
+                    sizes[memory_id] = len(data)
+            else:
+                for record in records:
+                    data = encode_record(*record)
+                    out.write(data)
+                    sizes[record[1]] = len(data)
+            out.flush()
+            os.fsync(out.fileno())
+        return temp_path, sizes
+
+    def finish_compaction(self, temp_path: Path, sizes: dict[str, int]) -> None:
+        """Replay appends made during compaction onto temp_path and swap it in."""
+        pending = self._pending or []
+        with open(temp_path, "ab") as out:
+            for kind, memory_id, data in pending:
+                out.write(data)
+                self._account(sizes, kind, memory_id, len(data))
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(temp_path, self.path)
+
+        self._pending = None
+        self._record_sizes = sizes
+        self.live_bytes = sum(sizes.values())
+        self.log_bytes = self.path.stat().st_size
+        logger.info(f"Compacted memory log {self.path} to {self.log_bytes} bytes")
+
+    def abort_compaction(self) -> None:
+        """Discard a failed compaction, keeping the current log."""
+        self._pending = None
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        if temp_path.exists():
+            temp_path.unlink()
+
+    def _live_records(self) -> Iterator[tuple[str, bytes]]:
+        """Stream (memory id, encoded record) for the latest record of each live memory."""
+        if not self.path.exists():
+            return
+
+        # First pass: offset of the latest record per memory; tombstones remove it
+        latest: dict[str, int] = {}
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a memory segment log: {self.path}")
+            start = len(MAGIC)
+            for record, size in _read_records(f):
+                if start + size > self._compact_end:
+                    break  # Appended since begin_compaction: replayed from _pending
+                if record is not None:
+                    kind, memory_id = record[0], record[1]
+                    latest.pop(memory_id, None)
+                    if kind == RECORD_MEMORY:
+                        latest[memory_id] = start
+                start += size
+
+        # Second pass: copy those records byte-for-byte, in log order
+        with open(self.path, "rb") as f:
+            for memory_id, offset in sorted(latest.items(), key=lambda item: item[1]):
+                f.seek(offset)
+                header = f.read(_HEADER.size)
+                _, _, id_len, meta_len, payload_len = _HEADER.unpack(header)
+                yield memory_id, header + f.read(id_len + meta_len + payload_len)
+
+    def _account(self, sizes: dict[str, int], kind: int, memory_id: str, size: int) -> None:
+        """Track the bytes of the latest record per live memory."""
+        previous = sizes.pop(memory_id, 0)
+        if sizes is self._record_sizes:
+            self.live_bytes -= previous
+        if kind == RECORD_MEMORY:
+            sizes[memory_id] = size
+            if sizes is self._record_sizes:
+                self.live_bytes += size
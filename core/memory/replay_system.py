@@ -55,13 +55,18 @@
 from __future__ import annotations
 
 import logging
+import math
 import uuid
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
+import numpy as np
 from core.common import get_logger
 
 # Configure module logger
@@ -142,14 +147,47 @@ class ReplaySession:
     access_count: int
 
 
+def _to_epoch(timestamp: Union[str, datetime, float]) -> float:
+    """Convert an ISO-8601 string or datetime to epoch seconds (naive values are UTC)."""
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp[:-1] + "+00:00" if timestamp.endswith("Z") else timestamp)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
 class TemporalIndex:
-    """Temporal indexing system for efficient memory traversal."""
+    """
+    Temporal indexing system for efficient memory traversal.
+
+    Timestamps are indexed as epoch seconds in a sorted list of
+    ``(epoch, sequence, memory_fold_id)`` keys, so range and nearest-in-time
+    queries are bisect lookups. New keys are buffered and merged into the
+    sorted list on the next query. Causal links are kept as a CSR (compressed
+    sparse row) adjacency over interned memory ids; edges added since the last
+    rebuild live in a small overlay until it is folded back in.
+    """
 
     def __init__(self):
         self.logger = logging.getLogger(f"lukhas.{MODULE_NAME}.temporal_index")
         self.time_index = {}  # timestamp -> [memory_fold_ids]
         self.reverse_index = {}  # memory_fold_id -> timestamp
-        self.causal_chains = defaultdict(list)  # cause_id -> [effect_ids]
+        self._epochs: dict[str, float] = {}  # memory_fold_id -> epoch seconds
+        self._sorted_keys: list[tuple[float, int, str]] = []
+        self._pending_keys: list[tuple[float, int, str]] = []
+        self._sequence = 0
+
+        # Causal adjacency: interned ids, edge log, CSR arrays and overlay
+        self._node_ids: dict[str, int] = {}
+        self._node_names: list[str] = []
+        self._edge_sources = array("q")
+        self._edge_targets = array("q")
+        self._csr_offsets = np.zeros(1, dtype=np.int64)
+        self._csr_targets = np.zeros(0, dtype=np.int64)
+        self._csr_edge_count = 0
+        self._overlay: dict[int, list[int]] = defaultdict(list)
 
     def add_memory_timestamp(
         self,
@@ -159,18 +197,8 @@ class TemporalIndex:
     ) -> bool:
         """Add memory to temporal index."""
         try:
-            # Add to time index
-            if timestamp not in self.time_index:
-                self.time_index[timestamp] = []
-            self.time_index[timestamp].append(memory_fold_id)
-
-            # Add to reverse index
-            self.reverse_index[memory_fold_id] = timestamp
-
-            # Build causal chains
-            if causal_predecessors:
-                for pred_id in causal_predecessors:
-                    self.causal_chains[pred_id].append(memory_fold_id)
+            self._insert(memory_fold_id, timestamp, causal_predecessors)
+            self._maybe_rebuild_csr()
 
             self.logger.debug(f"Added memory to temporal index: {memory_fold_id} at {timestamp}")
             return True
@@ -179,52 +207,245 @@ class TemporalIndex:
             self.logger.error(f"Failed to add memory timestamp: {e}")
             return False
 
+    def import_folds(self, folds: Iterable[Any]) -> int:
+        """
+        Index existing memory folds in one batch.
+
+        Accepts fold objects (``fold_id``/``created_at``/``data`` attributes,
+        as on MemoryFold) or their dict form. Causal predecessors are read from
+        ``data["causal_predecessors"]`` when present. The sorted keys and the
+        causal adjacency are rebuilt once for the whole batch.
+
+        Args:
+            folds: Memory folds to index
+
+        Returns:
+            Number of folds indexed
+        """
+        imported = 0
+        try:
+            for fold in folds:
+                if isinstance(fold, Mapping):
+                    fold_id = fold.get("fold_id") or fold.get("memory_fold_id")
+                    created_at = fold.get("created_at") or fold.get("timestamp")
+                    data = fold.get("data") or {}
+                else:
+                    fold_id = getattr(fold, "fold_id", None)
+                    created_at = getattr(fold, "created_at", None)
+                    data = getattr(fold, "data", None) or {}
+
+                if fold_id is None or created_at is None:
+                    self.logger.warning(f"Skipping fold without id or timestamp: {fold_id}")
+                    continue
+
+                try:
+                    if isinstance(created_at, datetime):
+                        timestamp, epoch = created_at.isoformat(), _to_epoch(created_at)
+                    else:
+                        timestamp, epoch = created_at, None
+                    self._insert(fold_id, timestamp, data.get("causal_predecessors"), epoch, track_overlay=False)
+                except (TypeError, ValueError) as e:
+                    self.logger.warning(f"Skipping fold {fold_id}: {e}")
+                    continue
+                imported += 1
+        finally:
+            self._merge_pending()
+            if len(self._edge_sources) > self._csr_edge_count:
+                self._rebuild_csr()
+        self.logger.info(f"Imported {imported} memory folds into temporal index")
+        return imported
+
     def get_memories_in_range(self, start_time: str, end_time: str) -> list[str]:
         """Get all memories within a time range."""
-        memories = []
-
-        for timestamp in sorted(self.time_index.keys()):
-            if start_time <= timestamp <= end_time:
-                memories.extend(self.time_index[timestamp])
+        try:
+            start, end = _to_epoch(start_time), _to_epoch(end_time)
+        except (TypeError, ValueError) as e:
+            self.logger.warning(f"Invalid time range {start_time!r}..{end_time!r}: {e}")
+            return []
 
-        return memories
+        keys = self._keys()
+        lo = bisect_left(keys, (start,))
+        hi = bisect_right(keys, (end, math.inf))
+        return [key[2] for key in keys[lo:hi]]
+
+    def get_nearest_memories(self, timestamp: str, k: int = 10, exclude: Optional[str] = None) -> list[str]:
+        """
+        Get the ``k`` memories closest in time to ``timestamp``.
+
+        Args:
+            timestamp: ISO-8601 reference time
+            k: Number of memories to return
+            exclude: Optional memory id to leave out (e.g. the reference memory)
+
+        Returns:
+            Memory ids ordered by increasing time distance (earlier wins ties)
+        """
+        target = _to_epoch(timestamp)
+        keys = self._keys()
+        right = bisect_left(keys, (target,))
+        left = right - 1
+        nearest: list[str] = []
+
+        while len(nearest) < k and (left >= 0 or right < len(keys)):
+            if right >= len(keys) or (left >= 0 and target - keys[left][0] <= keys[right][0] - target):
+                memory_id = keys[left][2]
+                left -= 1
+            else:
+                memory_id = keys[right][2]
+                right += 1
+            if memory_id != exclude:
+                nearest.append(memory_id)
+
+        return nearest
 
     def get_causal_sequence(self, root_memory_id: str, max_depth: int = 10) -> list[str]:
         """Get causal sequence starting from a root memory."""
-        sequence = [root_memory_id]
-        queue = deque([root_memory_id])
-        visited = {root_memory_id}
+        root = self._node_ids.get(root_memory_id)
+        if root is None:
+            return [root_memory_id]
+
+        sequence = [root]
+        queue = deque([root])
+        visited = {root}
         depth = 0
 
         while queue and depth < max_depth:
-            current_id = queue.popleft()
+            current = queue.popleft()
 
             # Get causal successors
-            for successor_id in self.causal_chains.get(current_id, []):
-                if successor_id not in visited:
-                    sequence.append(successor_id)
-                    queue.append(successor_id)
-                    visited.add(successor_id)
+            for successor in self._successors(current):
+                if successor not in visited:
+                    sequence.append(successor)
+                    queue.append(successor)
+                    visited.add(successor)
 
             depth += 1
 
-        return sequence
+        names = self._node_names
+        return [names[node] for node in sequence]
+
+    def get_causal_successors(self, memory_fold_id: str) -> list[str]:
+        """Get the direct causal successors of a memory, in insertion order."""
+        node = self._node_ids.get(memory_fold_id)
+        if node is None:
+            return []
+        names = self._node_names
+        return [names[successor] for successor in self._successors(node)]
+
+    @property
+    def causal_chains(self) -> dict[str, list[str]]:
+        """Causal adjacency as a ``cause_id -> [effect_ids]`` mapping (materialized copy)."""
+        chains: dict[str, list[str]] = {}
+        for node, name in enumerate(self._node_names):
+            successors = self._successors(node)
+            if successors:
+                chains[name] = [self._node_names[successor] for successor in successors]
+        return chains
 
     def find_temporal_neighbors(self, memory_fold_id: str, window_minutes: int = 60) -> list[str]:
         """Find memories that occurred near a given memory in time."""
-        if memory_fold_id not in self.reverse_index:
+        if memory_fold_id not in self._epochs:
             return []
 
-        target_time = datetime.fromisoformat(self.reverse_index[memory_fold_id])
-        window_delta = timedelta(minutes=window_minutes)
-
-        start_time = (target_time - window_delta).isoformat()
-        end_time = (target_time + window_delta).isoformat()
+        target = self._epochs[memory_fold_id]
+        window = window_minutes * 60.0
 
-        neighbors = self.get_memories_in_range(start_time, end_time)
+        keys = self._keys()
+        lo = bisect_left(keys, (target - window,))
+        hi = bisect_right(keys, (target + window, math.inf))
 
         # Remove the target memory itself
-        return [mid for mid in neighbors if mid != memory_fold_id]
+        return [key[2] for key in keys[lo:hi] if key[2] != memory_fold_id]
+
+    def epoch_of(self, memory_fold_id: str) -> Optional[float]:
+        """Get the indexed epoch seconds of a memory, if indexed."""
+        return self._epochs.get(memory_fold_id)
+
+    def _insert(
+        self,
+        memory_fold_id: str,
+        timestamp: str,
+        causal_predecessors: Optional[list[str]],
+        epoch: Optional[float] = None,
+        track_overlay: bool = True,
+    ):
+        """Index one memory; batch callers skip the overlay and rebuild the CSR afterwards."""
+        if epoch is None:
+            epoch = _to_epoch(timestamp)
+
+        # Add to time index
+        if timestamp not in self.time_index:
+            self.time_index[timestamp] = []
+        self.time_index[timestamp].append(memory_fold_id)
+
+        # Add to reverse index and sorted keys
+        self.reverse_index[memory_fold_id] = timestamp
+        self._epochs[memory_fold_id] = epoch
+        self._pending_keys.append((epoch, self._sequence, memory_fold_id))
+        self._sequence += 1
+
+        # Build causal chains
+        if causal_predecessors:
+            target = self._intern(memory_fold_id)
+            for pred_id in causal_predecessors:
+                source = self._intern(pred_id)
+                self._edge_sources.append(source)
+                self._edge_targets.append(target)
+                if track_overlay:
+                    self._overlay[source].append(target)
+
+    def _keys(self) -> list[tuple[float, int, str]]:
+        self._merge_pending()
+        return self._sorted_keys
+
+    def _merge_pending(self):
+        if not self._pending_keys:
+            return
+        pending = self._pending_keys
+        self._pending_keys = []
+        pending.sort()
+        if not self._sorted_keys or pending[0] >= self._sorted_keys[-1]:
+            self._sorted_keys.extend(pending)
+        else:
+            # Timsort merges the two sorted runs in linear time
+            self._sorted_keys.extend(pending)
+            self._sorted_keys.sort()
+
+    def _intern(self, memory_fold_id: str) -> int:
+        node = self._node_ids.get(memory_fold_id)
+        if node is None:
+            node = self._node_ids[memory_fold_id] = len(self._node_names)
+            self._node_names.append(memory_fold_id)
+        return node
+
+    def _successors(self, node: int) -> list[int]:
+        successors: list[int] = []
+        if node + 1 < len(self._csr_offsets):
+            successors.extend(self._csr_targets[self._csr_offsets[node] : self._csr_offsets[node + 1]].tolist())
+        overlay = self._overlay.get(node)
+        if overlay:
+            successors.extend(overlay)
+        return successors
+
+    def _maybe_rebuild_csr(self):
+        """Fold the overlay into the CSR arrays once it outgrows a fraction of them."""
+        pending_edges = len(self._edge_sources) - self._csr_edge_count
+        if pending_edges > max(1024, self._csr_edge_count // 4):
+            self._rebuild_csr()
+
+    def _rebuild_csr(self):
+        """Stable-sort the edge log by source; edge order per source is preserved."""
+        sources = np.frombuffer(self._edge_sources, dtype=np.int64)
+        targets = np.frombuffer(self._edge_targets, dtype=np.int64)
+        order = np.argsort(sources, kind="stable")
+
+        offsets = np.zeros(len(self._node_names) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(self._node_names)), out=offsets[1:])
+
+        self._csr_offsets = offsets
+        self._csr_targets = targets[order]
+        self._csr_edge_count = len(sources)
+        self._overlay = defaultdict(list)
 
 
 class MemoryReplayer:
@@ -543,12 +764,14 @@ class MemoryReplayer:
     def _create_memory_snapshots(self, memory_fold_ids: list[str], quality: ReplayQuality) -> list[MemorySnapshot]:
         """Create memory snapshots from fold IDs."""
         snapshots = []
+        indexed_timestamps = self.temporal_index.reverse_index
+        created_at = datetime.now(timezone.utc).isoformat()
 
         for memory_fold_id in memory_fold_ids:
             # Mock snapshot creation (would integrate with actual memory system)
             snapshot = MemorySnapshot(
                 snapshot_id=f"snap_{uuid.uuid4().hex[:6]}",
-                timestamp=datetime.now(timezone.utc).isoformat(),
+                timestamp=indexed_timestamps.get(memory_fold_id, created_at),
                 memory_fold_id=memory_fold_id,
                 content={"mock_content": f"Content for {memory_fold_id}"},
                 emotional_state={"valence": 0.5, "arousal": 0.3},
@@ -568,7 +791,13 @@ class MemoryReplayer:
     ) -> list[MemorySnapshot]:
         """Order snapshots according to replay mode and direction."""
         if mode == ReplayMode.CHRONOLOGICAL:
-            ordered = sorted(snapshots, key=lambda s: s.timestamp)
+            indexed_epochs = self.temporal_index.epoch_of
+
+            def epoch(snapshot: MemorySnapshot) -> float:
+                indexed = indexed_epochs(snapshot.memory_fold_id)
+                return indexed if indexed is not None else _to_epoch(snapshot.timestamp)
+
+            ordered = sorted(snapshots, key=epoch)
         elif mode == ReplayMode.EMOTIONAL:
             ordered = sorted(snapshots, key=lambda s: sum(s.emotional_state.values()), reverse=True)
         elif mode == ReplayMode.SYMBOLIC:
@@ -22,6 +22,7 @@ import gzip
 import json
 import logging
 import mmap
+import struct
 import time
 import uuid
 from collections import OrderedDict
@@ -31,6 +32,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from core.common import get_logger
+from core.memory.memory_segment_log import RECORD_MEMORY, RECORD_TOMBSTONE, MemorySegmentLog
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +40,10 @@ logger = logging.getLogger(__name__)
 
 logger = get_logger(__name__)
 
+# Fixed fields of a persisted memory: timestamp, last_accessed, access_count, gzip content.
+# The memory type and priority values follow, NUL-separated.
+_MEMORY_META = struct.Struct("<ddI?")
+
 
 class MemoryType(Enum):
     """Core memory types (simplified from 8 to 3)"""
@@ -56,13 +62,50 @@ class MemoryPriority(Enum):
     LOW = "low"  # Can be pruned
 
 
+def _decompress_json(data: bytes) -> dict[str, Any]:
+    """Inflate gzip-compressed JSON content"""
+    return json.loads(gzip.decompress(data).decode("utf-8"))
+
+
+class _LazyContent:
+    """
+    Memory content that is decompressed on first read.
+
+    Compressed entries hold gzip-compressed JSON bytes, and entries loaded from
+    a segment log may hold plain JSON bytes; the first read of ``entry.content``
+    decodes and keeps the dict and clears ``entry.compressed``.
+    ``entry.raw_content`` returns compressed content as-is.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = f"_{name}"
+
+    def __get__(self, entry: Optional[MemoryEntry], owner: Optional[type] = None) -> Any:
+        if entry is None:
+            raise AttributeError(self.slot)  # No class-level default for the dataclass field
+        value = entry.__dict__[self.slot]
+        if isinstance(value, bytes):
+            try:
+                value = _decompress_json(value) if entry.compressed else json.loads(value)
+            except Exception as e:
+                # Keep original content if decoding fails
+                logger.error(f"Failed to decode memory {entry.id}: {e}")
+                return value
+            entry.__dict__[self.slot] = value
+            entry.compressed = False
+        return value
+
+    def __set__(self, entry: MemoryEntry, value: Any) -> None:
+        entry.__dict__[self.slot] = value
+
+
 @dataclass
 class MemoryEntry:
     """Simplified memory entry structure"""
 
     id: str
     user_id: str
-    content: dict[str, Any]
+    content: dict[str, Any] = _LazyContent()
     memory_type: MemoryType
     priority: MemoryPriority
     timestamp: float
@@ -70,12 +113,20 @@ class MemoryEntry:
     access_count: int = 0
     compressed: bool = False
 
+    @property
+    def raw_content(self) -> Any:
+        """Stored content, without decompressing it"""
+        value = self.__dict__["_content"]
+        if isinstance(value, bytes) and not self.compressed:
+            return self.content  # Plain JSON loaded from disk is not a storage format
+        return value
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization"""
+        """Convert to dictionary for serialization (content is not decompressed)"""
         return {
             "id": self.id,
             "user_id": self.user_id,
-            "content": self.content,
+            "content": self.raw_content,
             "memory_type": self.memory_type.value,
             "priority": self.priority.value,
             "timestamp": self.timestamp,
@@ -109,6 +160,8 @@ class MemoryConfig:
     storage_path: str = "memory_store"
     enable_compression: bool = True
     compression_threshold: int = 1024  # bytes
+    log_compaction_min_bytes: int = 1 << 20  # Segment logs below this size are never compacted
+    log_compaction_ratio: float = 2.0  # Compact once the log is this many times its live records
 
     # TTL settings (24-hour default as recommended)
     default_ttl_hours: int = 24
@@ -140,8 +193,11 @@ class UnifiedMemoryManager:
     - Parallel querying (working/episodic/semantic)
     - GDPR-compliant user data control
     - Memory garbage collection
+    - Append-only per-user segment logs for critical memories
     """
 
+    SEGMENT_LOG_NAME = "memories.seg"
+
     def __init__(self, config: Optional[MemoryConfig] = None):
         self.config = config or MemoryConfig()
 
@@ -149,13 +205,25 @@ class UnifiedMemoryManager:
         self.storage_path = Path(self.config.storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
-        # LRU cache for fast access (user_id -> OrderedDict of memories)
-        self.lru_cache: dict[str, Ordereddict[str, MemoryEntry]] = {}
+        # LRU cache for fast access (user_id -> OrderedDict of memories, in recency order)
+        self.lru_cache: dict[str, OrderedDict[str, MemoryEntry]] = {}
         self.cache_access_times: dict[str, float] = {}
 
-        # Memory indices for fast querying
-        self.type_index: dict[MemoryType, dict[str, list[str]]] = {memory_type: {} for memory_type in MemoryType}
-        self.priority_index: dict[MemoryPriority, dict[str, list[str]]] = {priority: {} for priority in MemoryPriority}
+        # Eviction order of each user's non-critical memories. Critical memories
+        # are pinned: they never enter this segment, so eviction never sees them.
+        self.evictable: dict[str, OrderedDict[str, None]] = {}
+
+        # Memory indices for fast querying (user_id -> posting of memory IDs).
+        # Type postings are kept in recency order for filtered retrieval.
+        self.type_index: dict[MemoryType, dict[str, OrderedDict[str, None]]] = {
+            memory_type: {} for memory_type in MemoryType
+        }
+        self.priority_index: dict[MemoryPriority, dict[str, set[str]]] = {priority: {} for priority in MemoryPriority}
+
+        # Per-user append-only logs of persisted (critical) memories
+        self.segment_logs: dict[str, MemorySegmentLog] = {}
+        self._compaction_tasks: set[asyncio.Task] = set()
+        self._forced_compactions: set[str] = set()  # Users owed a compaction after the running one
 
         # Shared memory mapping for performance (if enabled)
         self.mmap_files: dict[str, mmap.mmap] = {}
@@ -257,15 +325,15 @@ class UnifiedMemoryManager:
                 memory.content = await self._compress_content(content)
                 memory.compressed = True
 
-            # Add to cache
+            # Add to cache (also updates indices)
             await self._add_to_cache(memory)
 
-            # Update indices
-            await self._update_indices(memory, add=True)
-
             # Persist to disk for critical memories
             if priority == MemoryPriority.CRITICAL:
                 await self._persist_memory(memory)
+            else:
+                # A non-critical replacement must not resurrect a persisted version
+                await self._delete_persisted_memory(memory)
 
             logger.debug(f"Stored memory {memory_id} for user {user_id}")
             return memory_id
@@ -301,45 +369,35 @@ class UnifiedMemoryManager:
                 memory = await self._get_memory_by_id(user_id, memory_id)
                 return [memory] if memory else []
 
-            # Get user memories from cache
-            user_memories = self.lru_cache.get(user_id, OrderedDict())
+            user_memories = self.lru_cache.get(user_id)
+            if not user_memories:
+                return []
 
-            # Filter by type if specified
+            # The user's cache and type postings are kept in last-access order,
+            # so walk from the most recent end and stop after `limit` valid hits
             if memory_type:
-                type_memory_ids = self.type_index.get(memory_type, {}).get(user_id, [])
-                user_memories = OrderedDict(
-                    (mid, memory) for mid, memory in user_memories.items() if mid in type_memory_ids
-                )
-
-            # Filter by TTL unless including old memories
-            if not include_old:
-                current_time = time.time()
-                valid_memories = OrderedDict()
-                for mid, memory in user_memories.items():
-                    if await self._is_memory_valid(memory, current_time):
-                        valid_memories[mid] = memory
-                user_memories = valid_memories
-
-            # Sort by last_accessed (most recent first) and limit
-            sorted_memories = sorted(user_memories.values(), key=lambda m: m.last_accessed, reverse=True)[:limit]
-
-            # Update access times
-            for memory in sorted_memories:
-                memory.last_accessed = time.time()
-                memory.access_count += 1
+                candidate_ids = self.type_index.get(memory_type, {}).get(user_id, ())
+            else:
+                candidate_ids = user_memories
 
-            # Decompress if needed
-            for memory in sorted_memories:
-                if memory.compressed and isinstance(memory.content, bytes):
-                    try:
-                        memory.content = await self._decompress_content(memory.content)
-                        memory.compressed = False
-                    except Exception as decompress_error:
-                        logger.error(f"Failed to decompress memory {memory.id}: {decompress_error}")
-                        # Keep original content if decompression fails
+            current_time = time.time()
+            recent_memories: list[MemoryEntry] = []
+            for mid in reversed(candidate_ids):
+                if len(recent_memories) >= limit:
+                    break
+                memory = user_memories[mid]
+                if include_old or current_time - memory.timestamp < self._ttl_seconds(memory.priority):
+                    recent_memories.append(memory)
+
+            # Update access times; touching in reverse keeps the batch's order at the recent end.
+            # Compressed content is inflated lazily on first access to memory.content.
+            for memory in reversed(recent_memories):
+                memory.last_accessed = current_time
+                memory.access_count += 1
+                self._touch(memory)
 
-            logger.debug(f"Retrieved {len(sorted_memories)} memories for user {user_id}")
-            return sorted_memories
+            logger.debug(f"Retrieved {len(recent_memories)} memories for user {user_id}")
+            return recent_memories
 
         except Exception as e:
             logger.error(f"Failed to retrieve memories: {e}")
@@ -365,8 +423,14 @@ class UnifiedMemoryManager:
                         memory = user_memories.pop(memory_id)
                         await self._update_indices(memory, add=False)
                         await self._delete_persisted_memory(memory)
+
+                # Tombstoned content stays on disk until compaction; reclaim it now
+                log = self.segment_logs.get(user_id)
+                if log is not None:
+                    self._schedule_compaction(user_id, log, force=True)
             else:
-                # Delete all user memories
+                # Delete all user memories, dropping the whole segment log
+                await self._drop_segment_log(user_id)
                 user_memories = self.lru_cache.pop(user_id, OrderedDict())
                 for memory in user_memories.values():
                     await self._update_indices(memory, add=False)
@@ -377,6 +441,7 @@ class UnifiedMemoryManager:
                     type_dict.pop(user_id, None)
                 for priority_dict in self.priority_index.values():
                     priority_dict.pop(user_id, None)
+                self.evictable.pop(user_id, None)
 
             logger.info(f"Deleted memories for user {user_id}")
             return True
@@ -395,11 +460,10 @@ class UnifiedMemoryManager:
                     "user_id": user_id,
                     "total_memories": len(user_memories),
                     "memory_types": {
-                        mem_type.value: len([m for m in user_memories.values() if m.memory_type == mem_type])
-                        for mem_type in MemoryType
+                        mem_type.value: len(self.type_index[mem_type].get(user_id, ())) for mem_type in MemoryType
                     },
                     "memory_priorities": {
-                        priority.value: len([m for m in user_memories.values() if m.priority == priority])
+                        priority.value: len(self.priority_index[priority].get(user_id, ()))
                         for priority in MemoryPriority
                     },
                 }
@@ -421,7 +485,7 @@ class UnifiedMemoryManager:
     # Private methods
 
     async def _add_to_cache(self, memory: MemoryEntry) -> None:
-        """Add memory to LRU cache"""
+        """Add memory to LRU cache and indices"""
         user_id = memory.user_id
 
         # Initialize user cache if needed
@@ -430,52 +494,67 @@ class UnifiedMemoryManager:
 
         user_cache = self.lru_cache[user_id]
 
+        # Replacing an entry may change its type or priority
+        previous = user_cache.get(memory.id)
+        if previous is not None:
+            await self._update_indices(previous, add=False)
+
         # Add memory (this moves it to end of OrderedDict)
         user_cache[memory.id] = memory
         user_cache.move_to_end(memory.id)
+        await self._update_indices(memory, add=True)
 
-        # Enforce cache size limit
-        while len(user_cache) > self.config.max_memories_per_user:
-            # Remove oldest non-critical memory
-            oldest_id, oldest_memory = user_cache.popitem(last=False)
-            if oldest_memory.priority != MemoryPriority.CRITICAL:
-                await self._update_indices(oldest_memory, add=False)
-            else:
-                # Keep critical memories, remove next oldest
-                user_cache[oldest_id] = oldest_memory
-                user_cache.move_to_end(oldest_id, last=False)
+        # Enforce cache size limit by evicting the oldest non-critical memory;
+        # if only critical memories remain the cache may exceed the limit
+        evictable = self.evictable.get(user_id)
+        while len(user_cache) > self.config.max_memories_per_user and evictable:
+            oldest_id = next(iter(evictable))
+            await self._update_indices(user_cache.pop(oldest_id), add=False)
 
         # Update cache access time
         self.cache_access_times[user_id] = time.time()
 
+    def _touch(self, memory: MemoryEntry) -> None:
+        """Mark memory as most recently used in the cache and its postings"""
+        user_id = memory.user_id
+        self.lru_cache[user_id].move_to_end(memory.id)
+        self.type_index[memory.memory_type][user_id].move_to_end(memory.id)
+        if memory.priority != MemoryPriority.CRITICAL:
+            self.evictable[user_id].move_to_end(memory.id)
+
     async def _update_indices(self, memory: MemoryEntry, add: bool) -> None:
-        """Update memory indices for fast querying"""
+        """Update memory indices and the evictable segment"""
         user_id = memory.user_id
         memory_id = memory.id
-
-        # Update type index
         type_dict = self.type_index[memory.memory_type]
-        if user_id not in type_dict:
-            type_dict[user_id] = []
-
-        if add:
-            if memory_id not in type_dict[user_id]:
-                type_dict[user_id].append(memory_id)
-        else:
-            if memory_id in type_dict[user_id]:
-                type_dict[user_id].remove(memory_id)
-
-        # Update priority index
         priority_dict = self.priority_index[memory.priority]
-        if user_id not in priority_dict:
-            priority_dict[user_id] = []
+        pinned = memory.priority == MemoryPriority.CRITICAL
 
         if add:
-            if memory_id not in priority_dict[user_id]:
-                priority_dict[user_id].append(memory_id)
-        else:
-            if memory_id in priority_dict[user_id]:
-                priority_dict[user_id].remove(memory_id)
+            type_dict.setdefault(user_id, OrderedDict())[memory_id] = None
+            priority_dict.setdefault(user_id, set()).add(memory_id)
+            if not pinned:
+                self.evictable.setdefault(user_id, OrderedDict())[memory_id] = None
+            return
+
+        # Remove from postings, dropping postings that become empty
+        type_ids = type_dict.get(user_id)
+        if type_ids is not None:
+            type_ids.pop(memory_id, None)
+            if not type_ids:
+                del type_dict[user_id]
+
+        priority_ids = priority_dict.get(user_id)
+        if priority_ids is not None:
+            priority_ids.discard(memory_id)
+            if not priority_ids:
+                del priority_dict[user_id]
+
+        evictable = self.evictable.get(user_id)
+        if not pinned and evictable is not None:
+            evictable.pop(memory_id, None)
+            if not evictable:
+                del self.evictable[user_id]
 
     async def _compress_content(self, content: dict[str, Any]) -> bytes:
         """Compress memory content using gzip"""
@@ -491,8 +570,7 @@ class UnifiedMemoryManager:
             return compressed_content
 
         try:
-            json_data = gzip.decompress(compressed_content)
-            return json.loads(json_data.decode("utf-8"))
+            return _decompress_json(compressed_content)
         except Exception as e:
             logger.error(f"Failed to decompress content: {e}")
             return {
@@ -500,16 +578,17 @@ class UnifiedMemoryManager:
                 "raw_data": str(compressed_content),
             }
 
-    async def _is_memory_valid(self, memory: MemoryEntry, current_time: float) -> bool:
-        """Check if memory is within TTL"""
-        if memory.priority == MemoryPriority.CRITICAL:
+    def _ttl_seconds(self, priority: MemoryPriority) -> float:
+        """TTL for memories of the given priority"""
+        if priority == MemoryPriority.CRITICAL:
             # Critical memories use longer TTL
-            ttl_seconds = self.config.critical_ttl_days * 24 * 3600
-        else:
-            # Standard memories use default TTL
-            ttl_seconds = self.config.default_ttl_hours * 3600
+            return self.config.critical_ttl_days * 24 * 3600
+        # Standard memories use default TTL
+        return self.config.default_ttl_hours * 3600
 
-        return (current_time - memory.timestamp) < ttl_seconds
+    async def _is_memory_valid(self, memory: MemoryEntry, current_time: float) -> bool:
+        """Check if memory is within TTL"""
+        return (current_time - memory.timestamp) < self._ttl_seconds(memory.priority)
 
     async def _get_memory_by_id(self, user_id: str, memory_id: str) -> Optional[MemoryEntry]:
         """Get specific memory by ID"""
@@ -520,77 +599,207 @@ class UnifiedMemoryManager:
             # Update access info
             memory.last_accessed = time.time()
             memory.access_count += 1
-            user_memories.move_to_end(memory_id)
-
-            # Decompress if needed
-            if memory.compressed and isinstance(memory.content, bytes):
-                try:
-                    memory.content = await self._decompress_content(memory.content)
-                    memory.compressed = False
-                except Exception as decompress_error:
-                    logger.error(f"Failed to decompress memory {memory.id}: {decompress_error}")
-                    # Keep original content if decompression fails
+            self._touch(memory)
 
         return memory
 
+    def _segment_log(self, user_id: str) -> MemorySegmentLog:
+        """Get or create a user's segment log"""
+        log = self.segment_logs.get(user_id)
+        if log is None:
+            path = self.storage_path / user_id / self.SEGMENT_LOG_NAME
+            log = self.segment_logs[user_id] = MemorySegmentLog(path)
+        return log
+
+    @staticmethod
+    def _encode_memory(memory: MemoryEntry) -> tuple[int, str, bytes, bytes]:
+        """Pack a memory into a segment log record"""
+        content = memory.__dict__["_content"]  # Content still serialized is written as-is
+        gzipped = memory.compressed and isinstance(content, bytes)
+        meta = _MEMORY_META.pack(
+            memory.timestamp, memory.last_accessed, memory.access_count, gzipped
+        )
+        meta += f"{memory.memory_type.value}\0{memory.priority.value}".encode()
+        # Compressed content is stored as raw gzip bytes
+        payload = content if isinstance(content, bytes) else json.dumps(content).encode("utf-8")
+        return RECORD_MEMORY, memory.id, meta, payload
+
+    @staticmethod
+    def _decode_memory(user_id: str, memory_id: str, meta: bytes, payload: bytes) -> MemoryEntry:
+        """Rebuild a memory from a segment log record; its content is decoded on first read"""
+        timestamp, last_accessed, access_count, gzipped = _MEMORY_META.unpack_from(meta)
+        memory_type, priority = meta[_MEMORY_META.size :].decode().split("\0")
+        return MemoryEntry(
+            id=memory_id,
+            user_id=user_id,
+            content=payload,
+            memory_type=MemoryType(memory_type),
+            priority=MemoryPriority(priority),
+            timestamp=timestamp,
+            last_accessed=last_accessed,
+            access_count=access_count,
+            compressed=gzipped,
+        )
+
     async def _persist_memory(self, memory: MemoryEntry) -> None:
-        """Persist critical memory to disk"""
+        """Persist critical memory by appending it to the user's segment log"""
         try:
-            user_dir = self.storage_path / memory.user_id
-            user_dir.mkdir(exist_ok=True)
+            log = self._segment_log(memory.user_id)
+            log.append([self._encode_memory(memory)])
+            self._schedule_compaction(memory.user_id, log)
 
-            memory_file = user_dir / f"{memory.id}.json"
+        except Exception as e:
+            logger.error(f"Failed to persist memory {memory.id}: {e}")
 
-            # Create a serializable copy
-            memory_dict = memory.to_dict()
+    async def _delete_persisted_memory(self, memory: MemoryEntry) -> None:
+        """Append a tombstone for a persisted memory"""
+        try:
+            log = self.segment_logs.get(memory.user_id)
+            if log is not None and memory.id in log:
+                log.append([(RECORD_TOMBSTONE, memory.id, b"", b"")])
+                self._schedule_compaction(memory.user_id, log)
+        except Exception as e:
+            logger.error(f"Failed to delete persisted memory {memory.id}: {e}")
 
-            # Handle compressed content
-            if memory.compressed and isinstance(memory.content, bytes):
-                # Convert bytes to base64 for JSON serialization
-                import base64
+    async def _drop_segment_log(self, user_id: str) -> None:
+        """Remove a user's segment log from disk"""
+        try:
+            log = self.segment_logs.pop(user_id, None)
+            if log is not None and log.path.exists():
+                log.path.unlink()
+        except Exception as e:
+            logger.error(f"Failed to drop segment log for user {user_id}: {e}")
 
-                memory_dict["content"] = base64.b64encode(memory.content).decode("utf-8")
-                memory_dict["content_encoding"] = "base64_gzip"
+    def _schedule_compaction(
+        self, user_id: str, log: MemorySegmentLog, force: bool = False
+    ) -> None:
+        """
+        Compact a segment log in the background once superseded records dominate it.
 
-            with open(memory_file, "w") as f:
-                json.dump(memory_dict, f)
+        A forced request that finds a compaction running is queued behind it:
+        the running pass only tombstones records deleted after it started.
+        """
+        if log.compacting:
+            if force:
+                self._forced_compactions.add(user_id)
+            return
+        if not force and not log.should_compact(
+            self.config.log_compaction_min_bytes, self.config.log_compaction_ratio
+        ):
+            return
+
+        log.begin_compaction()
+        task = asyncio.create_task(self._compact_segment_log(user_id, log))
+        self._compaction_tasks.add(task)
+        task.add_done_callback(self._compaction_tasks.discard)
+
+    async def _compact_segment_log(
+        self,
+        user_id: str,
+        log: MemorySegmentLog,
+        records: Optional[list[tuple[int, str, bytes, bytes]]] = None,
+    ) -> None:
+        """
+        Rewrite a segment log with only its live records.
 
-        except Exception as e:
-            logger.error(f"Failed to persist memory {memory.id}: {e}")
+        The caller starts the compaction with log.begin_compaction(). The file
+        work runs in a worker thread; appends made meanwhile are replayed onto
+        the new file before it replaces the old one.
 
-    async def _delete_persisted_memory(self, memory: MemoryEntry) -> None:
-        """Delete persisted memory file"""
+        Args:
+            user_id: Owner of the log
+            log: Segment log to compact
+            records: Encoded live memories to write; if None, they are copied from the log
+        """
         try:
-            memory_file = self.storage_path / memory.user_id / f"{memory.id}.json"
-            if memory_file.exists():
-                memory_file.unlink()
+            temp_path, sizes = await asyncio.to_thread(log.write_compacted, records)
+            if self.segment_logs.get(user_id) is not log:
+                # The user's memories were deleted while compacting
+                self._forced_compactions.discard(user_id)
+                log.abort_compaction()
+                return
+            log.finish_compaction(temp_path, sizes)
         except Exception as e:
-            logger.error(f"Failed to delete persisted memory {memory.id}: {e}")
+            log.abort_compaction()
+            logger.error(f"Failed to compact segment log for user {user_id}: {e}")
+            return
+
+        # Deletes queued behind this pass, or appends replayed onto it, may warrant another
+        force = user_id in self._forced_compactions
+        self._forced_compactions.discard(user_id)
+        self._schedule_compaction(user_id, log, force=force)
+
+    def _replay_segment_log(
+        self, user_id: str, log: MemorySegmentLog, user_dir: Path
+    ) -> list[MemoryEntry]:
+        """
+        Stream a user's live memories out of the segment log.
+
+        Legacy per-memory JSON files in the user directory are loaded too,
+        migrated into the log and removed. Runs in a worker thread.
+
+        Returns:
+            Live memories in last-access order
+        """
+        memories: dict[str, MemoryEntry] = {}
+        for kind, memory_id, meta, payload in log.replay():
+            memories.pop(memory_id, None)
+            if kind == RECORD_MEMORY:
+                memories[memory_id] = self._decode_memory(user_id, memory_id, meta, payload)
+
+        legacy = self._load_legacy_memories(user_dir)
+        if legacy:
+            log.append([self._encode_memory(memory) for _, memory in legacy], sync=True)
+            for memory_file, memory in legacy:
+                memories[memory.id] = memory
+                memory_file.unlink()
+            logger.info(f"Migrated {len(legacy)} legacy memory files into {log.path}")
+
+        # Log order is write order, which is already close to last-access order
+        return sorted(memories.values(), key=lambda m: m.last_accessed)
+
+    def _load_legacy_memories(self, user_dir: Path) -> list[tuple[Path, MemoryEntry]]:
+        """Load memories persisted as one JSON file each by earlier versions"""
+        loaded = []
+        for memory_file in user_dir.glob("*.json"):
+            try:
+                with open(memory_file) as f:
+                    memory_data = json.load(f)
+
+                # Handle compressed content
+                if memory_data.get("content_encoding") == "base64_gzip":
+                    import base64
+
+                    memory_data["content"] = base64.b64decode(memory_data["content"])
+                    memory_data["compressed"] = True
+                    del memory_data["content_encoding"]
+
+                loaded.append((memory_file, MemoryEntry.from_dict(memory_data)))
+
+            except Exception as e:
+                logger.error(f"Failed to load memory {memory_file}: {e}")
+        return loaded
 
     async def _load_existing_memories(self) -> None:
-        """Load existing persisted memories"""
+        """Load existing persisted memories by streaming each user's segment log"""
         try:
             for user_dir in self.storage_path.iterdir():
-                if user_dir.is_dir():
-                    for memory_file in user_dir.glob("*.json"):
-                        try:
-                            with open(memory_file) as f:
-                                memory_data = json.load(f)
+                if not user_dir.is_dir():
+                    continue
 
-                            # Handle compressed content
-                            if memory_data.get("content_encoding") == "base64_gzip":
-                                import base64
-
-                                memory_data["content"] = base64.b64decode(memory_data["content"])
-                                memory_data["compressed"] = True
-                                del memory_data["content_encoding"]
-
-                            memory = MemoryEntry.from_dict(memory_data)
-                            await self._add_to_cache(memory)
-                            await self._update_indices(memory, add=True)
+                user_id = user_dir.name
+                log = self._segment_log(user_id)
+                try:
+                    memories = await asyncio.to_thread(
+                        self._replay_segment_log, user_id, log, user_dir
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to load memories for user {user_dir.name}: {e}")
+                    continue
 
-                        except Exception as e:
-                            logger.error(f"Failed to load memory {memory_file}: {e}")
+                # Insert in last-access order so the user's cache starts in recency order
+                for memory in memories:
+                    await self._add_to_cache(memory)
 
             logger.info(f"Loaded existing memories from {self.storage_path}")
 
@@ -598,12 +807,23 @@ class UnifiedMemoryManager:
             logger.error(f"Failed to load existing memories: {e}")
 
     async def _save_critical_memories(self) -> None:
-        """Save critical memories before shutdown"""
+        """Checkpoint each user's critical memories into a compacted segment log before shutdown"""
         try:
-            for user_memories in self.lru_cache.values():
-                for memory in user_memories.values():
-                    if memory.priority == MemoryPriority.CRITICAL:
-                        await self._persist_memory(memory)
+            # Finishing compactions may schedule queued ones
+            while self._compaction_tasks:
+                await asyncio.gather(*self._compaction_tasks, return_exceptions=True)
+
+            critical = self.priority_index[MemoryPriority.CRITICAL]
+            for user_id in set(self.segment_logs) | set(critical):
+                critical_ids = critical.get(user_id, set())
+                records = [
+                    self._encode_memory(memory)
+                    for memory in self.lru_cache.get(user_id, {}).values()
+                    if memory.id in critical_ids
+                ]
+                log = self._segment_log(user_id)
+                log.begin_compaction()
+                await self._compact_segment_log(user_id, log, records)
         except Exception as e:
             logger.error(f"Failed to save critical memories: {e}")
 
@@ -11,9 +11,10 @@ Phase 3: Guardian enhancements for Redis rate-limit backend integration.
 import ipaddress
 import logging
 import os
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Generic, Optional, TypeVar
 
 import yaml
 
@@ -29,24 +30,89 @@ class Quota:
     description: str = ""
 
 
+T = TypeVar("T")
+
+
+class CIDRMatcher(Generic[T]):
+    """
+    Longest-prefix-match table for IPv4 and IPv6 CIDR ranges.
+
+    Ranges are compiled once into one hash table per (IP version, prefix
+    length), keyed by the integer network address. A lookup masks the
+    address for each configured prefix length, longest first, so its cost
+    depends on the number of distinct prefix lengths rather than the
+    number of ranges.
+    """
+
+    def __init__(self):
+        self._tables: dict[int, dict[int, dict[int, T]]] = {4: {}, 6: {}}
+        self._probes: dict[int, list[tuple[int, dict[int, T]]]] = {4: [], 6: []}
+        self._size = 0
+
+    def add(self, cidr: str, value: T) -> None:
+        """
+        Add a CIDR range. For duplicate networks the first value wins.
+
+        Raises:
+            ValueError: If cidr is not a valid network
+        """
+        network = ipaddress.ip_network(cidr, strict=False)
+        table = self._tables[network.version].setdefault(network.prefixlen, {})
+        if int(network.network_address) in table:
+            return
+        table[int(network.network_address)] = value
+        self._size += 1
+
+        bits = network.max_prefixlen
+        self._probes[network.version] = [
+            (((1 << bits) - 1) ^ ((1 << (bits - prefixlen)) - 1), table)
+            for prefixlen, table in sorted(self._tables[network.version].items(), reverse=True)
+        ]
+
+    def lookup(self, address: str) -> Optional[T]:
+        """
+        Return the value of the most specific range containing address.
+
+        Raises:
+            ValueError: If address is not a valid IP address
+        """
+        ip_addr = ipaddress.ip_address(address)
+        value = int(ip_addr)
+        for mask, table in self._probes[ip_addr.version]:
+            match = table.get(value & mask)
+            if match is not None:
+                return match
+        return None
+
+    def __len__(self) -> int:
+        return self._size
+
+
 class QuotaResolver:
     """
     Resolves rate limit quotas for principals from configuration.
 
     Supports tenant-based, user-based, and IP-based principal lookups
     with fallback to environment variables for principals not in config.
+    IP CIDR ranges are compiled into a longest-prefix-match CIDRMatcher,
+    and resolved quotas are cached per (principal, endpoint) until the
+    config is reloaded.
     """
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, cache_size: int = 65_536):
         """
         Initialize quota resolver.
 
         Args:
             config_path: Path to quotas.yaml config file (optional)
+            cache_size: Maximum cached (principal, endpoint) resolutions
         """
         self.defaults: Quota = Quota(rps=20, burst=40, description="system default")
         self.principals: dict[str, Quota] = {}
         self.endpoint_multipliers: dict[str, float] = {}
+        self.cidr_matcher: CIDRMatcher[Quota] = CIDRMatcher()
+        self.cache_size = cache_size
+        self._resolved: OrderedDict[tuple[str, Optional[str]], Quota] = OrderedDict()
 
         # Load from config file if provided or use default location
         if config_path is None:
@@ -69,9 +135,47 @@ class QuotaResolver:
                 logger.warning(f"Failed to load quotas from {config_path}: {e}, using defaults")
         else:
             logger.warning(f"Quota config not found at {config_path}, using defaults")
+        self.config_path = config_path
 
         # Load environment variable defaults as fallback
         self._load_env_defaults()
+        self._compile()
+
+    def reload(self) -> None:
+        """
+        Reload quotas from the config file and invalidate cached resolutions.
+
+        Keeps the current configuration if the file is missing or invalid.
+        """
+        if not self.config_path or not Path(self.config_path).exists():
+            logger.warning(f"Quota config not found at {self.config_path}, keeping current quotas")
+            return
+
+        previous = (self.defaults, self.principals, self.endpoint_multipliers)
+        self.defaults = Quota(rps=20, burst=40, description="system default")
+        self.principals = {}
+        try:
+            self._load_config(self.config_path)
+            logger.info(f"Reloaded quotas from {self.config_path}: {len(self.principals)} principals")
+        except Exception as e:
+            self.defaults, self.principals, self.endpoint_multipliers = previous
+            logger.warning(f"Failed to reload quotas from {self.config_path}: {e}, keeping current quotas")
+            return
+
+        self._load_env_defaults()
+        self._compile()
+
+    def _compile(self) -> None:
+        """Compile CIDR principals into the prefix matcher and drop cached resolutions."""
+        matcher: CIDRMatcher[Quota] = CIDRMatcher()
+        for key, quota in self.principals.items():
+            if key.startswith("ip:") and "/" in key:
+                try:
+                    matcher.add(key[3:], quota)
+                except ValueError as e:
+                    logger.warning(f"Ignoring invalid CIDR quota principal {key}: {e}")
+        self.cidr_matcher = matcher
+        self._resolved = OrderedDict()
 
     def _load_config(self, config_path: str) -> None:
         """Load quota configuration from YAML file."""
@@ -124,6 +228,18 @@ class QuotaResolver:
         Returns:
             Quota configuration with rps and burst limits
         """
+        cache_key = (principal, endpoint)
+        quota = self._resolved.get(cache_key)
+        if quota is None:
+            quota = self._resolve_uncached(principal, endpoint)
+            if self.cache_size > 0:
+                if len(self._resolved) >= self.cache_size:
+                    self._resolved.popitem(last=False)
+                self._resolved[cache_key] = quota
+        return quota
+
+    def _resolve_uncached(self, principal: str, endpoint: Optional[str]) -> Quota:
+        """Resolve quota without consulting the resolution cache."""
         # Try exact principal match
         quota = self.principals.get(principal)
 
@@ -150,6 +266,8 @@ class QuotaResolver:
         """
         Match IP-based principal against CIDR ranges in config.
 
+        The most specific (longest prefix) matching range wins.
+
         Args:
             principal: IP principal string (format: "ip:1.2.3.4")
 
@@ -160,18 +278,8 @@ class QuotaResolver:
             return None
 
         try:
-            ip_str = principal[3:]  # Remove "ip:" prefix
-            ip_addr = ipaddress.ip_address(ip_str)
-
-            # Check all configured IP ranges
-            for key, quota in self.principals.items():
-                if key.startswith("ip:") and "/" in key:
-                    # CIDR range like "ip:203.0.113.0/24"
-                    cidr_str = key[3:]
-                    network = ipaddress.ip_network(cidr_str, strict=False)
-                    if ip_addr in network:
-                        return quota
-        except (ValueError, KeyError) as e:
+            return self.cidr_matcher.lookup(principal[3:])  # Remove "ip:" prefix
+        except ValueError as e:
             logger.debug(f"Failed to match IP quota for {principal}: {e}")
 
         return None
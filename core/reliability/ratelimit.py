@@ -12,13 +12,17 @@ RateLimiter keying strategy (Phase 3):
   Notes:
   - principal is 'tok:<sha256_16hex>' | 'ip:<addr>' | 'anonymous'
   - raw tokens are never stored (hash only, security)
+
+Bucket state lives in a bounded, lock-striped BucketTable: buckets that have
+fully refilled and sat idle are evicted lazily, and a hard cap falls back to
+LRU eviction, so a scan across many principals cannot grow memory unbounded.
 """
 
 import hashlib
 import math
 import os
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from threading import Lock
 from typing import Any, Dict, Optional
@@ -79,6 +83,123 @@ class TokenBucket:
                 return False, retry_after
 
 
+# Bucket state slots: [tokens, last_refill, capacity, refill_rate]
+_TOKENS, _LAST, _CAPACITY, _RATE = range(4)
+
+
+class BucketTable:
+    """
+    Bounded, lock-striped table of token-bucket state.
+
+    Each bucket is a plain list of floats held in one of ``stripes``
+    LRU-ordered dicts, each guarded by its own lock, so unrelated keys
+    rarely contend. A bucket that has fully refilled is indistinguishable
+    from a new one, so buckets that are full and idle for ``idle_horizon``
+    seconds are evicted lazily whenever a new key is inserted. ``max_buckets``
+    is a hard cap: past it the least recently used bucket is evicted, which
+    at worst hands that key a fresh (full) bucket.
+    """
+
+    # Idle buckets examined per insert; >1 so sweeping outpaces key churn
+    SWEEP_PER_INSERT = 2
+
+    def __init__(self, max_buckets: int = 100_000, idle_horizon: float = 60.0, stripes: int = 16):
+        """
+        Initialize bucket table.
+
+        Args:
+            max_buckets: Hard cap on live buckets across all stripes
+            idle_horizon: Seconds a full bucket must be idle before eviction
+            stripes: Number of independently locked partitions
+        """
+        self.max_buckets = max_buckets
+        self.idle_horizon = idle_horizon
+        stripes = max(1, min(stripes, max_buckets))
+        self._stripe_cap = max(1, max_buckets // stripes)
+        self._stripes: list[OrderedDict[str, list[float]]] = [OrderedDict() for _ in range(stripes)]
+        self._locks = [Lock() for _ in range(stripes)]
+        self.evictions = 0
+
+    def _stripe(self, key: str) -> int:
+        return hash(key) % len(self._stripes)
+
+    def _refill(self, bucket: list[float], now: float) -> None:
+        elapsed = max(0.0, now - bucket[_LAST])
+        bucket[_TOKENS] = min(bucket[_CAPACITY], bucket[_TOKENS] + elapsed * bucket[_RATE])
+        bucket[_LAST] = now
+
+    def _lookup(self, stripe: int, key: str, capacity: float, refill_rate: float, now: float) -> list[float]:
+        """Return the bucket for key, creating (and making room for) it if needed. Caller holds the lock."""
+        buckets = self._stripes[stripe]
+        bucket = buckets.get(key)
+        if bucket is not None:
+            buckets.move_to_end(key)
+            return bucket
+
+        for _ in range(self.SWEEP_PER_INSERT):
+            if not buckets:
+                break
+            oldest = next(iter(buckets.values()))
+            idle = now - oldest[_LAST]
+            if idle < self.idle_horizon or oldest[_TOKENS] + idle * oldest[_RATE] < oldest[_CAPACITY]:
+                break
+            buckets.popitem(last=False)
+            self.evictions += 1
+        while len(buckets) >= self._stripe_cap:
+            buckets.popitem(last=False)
+            self.evictions += 1
+
+        bucket = [float(capacity), now, float(capacity), float(refill_rate)]
+        buckets[key] = bucket
+        return bucket
+
+    def consume(self, key: str, capacity: float, refill_rate: float, tokens: int = 1) -> tuple[bool, float]:
+        """
+        Try to consume tokens from key's bucket.
+
+        capacity and refill_rate only apply when the bucket is created.
+
+        Returns:
+            (success, retry_after_seconds)
+        """
+        stripe = self._stripe(key)
+        with self._locks[stripe]:
+            now = time.time()
+            bucket = self._lookup(stripe, key, capacity, refill_rate, now)
+            self._refill(bucket, now)
+
+            if bucket[_TOKENS] >= tokens:
+                bucket[_TOKENS] -= tokens
+                return True, 0.0
+            # Calculate how long until enough tokens available
+            needed = tokens - bucket[_TOKENS]
+            return False, needed / bucket[_RATE]
+
+    def snapshot(self, key: str, capacity: float, refill_rate: float) -> dict[str, Any]:
+        """Return a copy of key's bucket state, creating the bucket if needed."""
+        stripe = self._stripe(key)
+        with self._locks[stripe]:
+            bucket = self._lookup(stripe, key, capacity, refill_rate, time.time())
+            return {
+                "tokens": bucket[_TOKENS],
+                "ts": bucket[_LAST],
+                "capacity": bucket[_CAPACITY],
+                "refill_rate": bucket[_RATE],
+            }
+
+    def discard(self, key: str) -> None:
+        """Drop key's bucket; it is recreated full on next use."""
+        stripe = self._stripe(key)
+        with self._locks[stripe]:
+            self._stripes[stripe].pop(key, None)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._stripes[self._stripe(key)]
+
+    def __len__(self) -> int:
+        return sum(len(buckets) for buckets in self._stripes)
+
+
 class RateLimiter:
     """
     Rate limiter with per-endpoint, per-principal token buckets.
@@ -88,19 +209,25 @@ class RateLimiter:
     concurrent requests.
     """
 
-    def __init__(self, default_rps: int = 20):
+    def __init__(self, default_rps: int = 20, max_buckets: int = 100_000, idle_horizon_s: float = 60.0):
         """
         Initialize rate limiter.
 
         Args:
             default_rps: Default requests per second for endpoints
+            max_buckets: Hard cap on tracked (route, principal) buckets
+            idle_horizon_s: Seconds a fully refilled bucket may sit idle before eviction
         """
         self.default_rps = default_rps
-        self.buckets: dict[str, TokenBucket] = defaultdict(
-            lambda: TokenBucket(capacity=default_rps * 2, refill_rate=default_rps)
-        )
+        self.buckets = BucketTable(max_buckets=max_buckets, idle_horizon=idle_horizon_s)
+        # Per-key (capacity, refill_rate) overrides from configure_endpoint
+        self.endpoint_limits: dict[str, tuple[int, float]] = {}
         self.lock = Lock()
 
+    def _limits_for(self, key: str) -> tuple[int, float]:
+        """Return (capacity, refill_rate) for buckets created under key."""
+        return self.endpoint_limits.get(key, (self.default_rps * 2, self.default_rps))
+
     def _extract_principal(self, request) -> str:
         """
         Extract principal identifier from request.
@@ -170,10 +297,8 @@ class RateLimiter:
     def configure_endpoint(self, endpoint: str, rps: int) -> None:
         """Configure custom rate limit for endpoint."""
         with self.lock:
-            self.buckets[endpoint] = TokenBucket(
-                capacity=rps * 2,  # Allow 2x burst
-                refill_rate=rps,
-            )
+            self.endpoint_limits[endpoint] = (rps * 2, rps)  # Allow 2x burst
+            self.buckets.discard(endpoint)
 
     def check_limit(self, request) -> tuple[bool, float]:
         """
@@ -186,8 +311,7 @@ class RateLimiter:
             (allowed, retry_after_seconds)
         """
         key = self._key_for_request(request)
-        bucket = self.buckets[key]
-        return bucket.consume(1)
+        return self.buckets.consume(key, *self._limits_for(key))
 
     def key_for_request(self, request) -> str:
         """
@@ -228,19 +352,8 @@ class RateLimiter:
         Returns:
             Bucket dictionary with current state
         """
-        bucket = self.buckets.get(key)
-        if bucket is None:
-            # Create new bucket with default settings
-            bucket = TokenBucket(capacity=self.default_rps * 2, refill_rate=self.default_rps)
-            self.buckets[key] = bucket
-
-        # Return bucket state as dict for window calculations
-        return {
-            "tokens": bucket.tokens,
-            "ts": bucket.last_refill,
-            "capacity": bucket.capacity,
-            "refill_rate": bucket.refill_rate,
-        }
+        # Snapshot is a copy, so window calculations don't mutate the bucket
+        return self.buckets.snapshot(key, *self._limits_for(key))
 
     def _refilled(self, b: dict[str, Any]) -> None:
         """
@@ -11,7 +11,10 @@ Phase 3: Guardian enhancements for production scalability.
 import logging
 import math
 import os
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Sequence
 from typing import Optional
 
 from core.reliability.quota_resolver import QuotaResolver
@@ -39,43 +42,74 @@ class RedisRateLimitBackend:
     - Per-principal quotas from configs/quotas.yaml
     - Fallback to env vars (LUKHAS_DEFAULT_RPS, LUKHAS_DEFAULT_BURST)
     - Atomic operations via Lua scripting for consistency
+    - Several limits (route, principal, org) checked in one script invocation
+    - Optional short-horizon local token leases for hot keys
+
+    Leases: when ``lease_tokens`` > 0, an allowed check also takes up to that
+    many extra tokens from each bucket, capped at what the bucket refills over
+    ``lease_ttl_seconds``. They are kept in-process and spent by later checks
+    of the same key without a Redis round trip, until they expire. Leased
+    tokens are deducted in Redis when granted, so leases never admit more than
+    the buckets allow; they only shift admissions by up to the lease TTL.
+    Over any interval of W seconds a key admits at most
+    ``burst + rps * (W + lease_ttl_seconds)`` requests across all processes.
     """
 
-    LUA_CONSUME_SCRIPT = """
-    local key = KEYS[1]
-    local capacity = tonumber(ARGV[1])
-    local rate = tonumber(ARGV[2])
-    local tokens_requested = tonumber(ARGV[3])
-    local now = tonumber(ARGV[4])
-    local ttl = tonumber(ARGV[5])
-
-    -- Get current bucket state
-    local bucket = redis.call('HMGET', key, 'tokens', 'last_refill')
-    local tokens = tonumber(bucket[1]) or capacity
-    local last_refill = tonumber(bucket[2]) or now
-
-    -- Refill tokens based on elapsed time
-    local elapsed = math.max(0, now - last_refill)
-    tokens = math.min(capacity, tokens + (elapsed * rate))
-
-    -- Try to consume tokens
-    local allowed = 0
+    # KEYS: bucket keys
+    # ARGV[1]: Current timestamp (Unix seconds as float)
+    # ARGV[2]: Key TTL in seconds
+    # ARGV[3..]: (capacity, rate, requested, wanted) per key
+    #
+    # All buckets are refilled, then either every bucket holds its requested
+    # tokens and each is charged up to its wanted amount (never less than
+    # requested), or none is charged. Returns {allowed, retry_after, granted...};
+    # retry_after is a string because Redis truncates Lua numbers to integers.
+    LUA_CHECK_LIMITS_SCRIPT = """
+    local now = tonumber(ARGV[1])
+    local ttl = tonumber(ARGV[2])
+    local available = {}
+    local allowed = 1
     local retry_after = 0
 
-    if tokens >= tokens_requested then
-        tokens = tokens - tokens_requested
-        allowed = 1
-    else
-        -- Calculate retry time
-        local needed = tokens_requested - tokens
-        retry_after = needed / rate
+    -- Refill every bucket and check it can cover its request
+    for i, key in ipairs(KEYS) do
+        local base = 2 + (i - 1) * 4
+        local capacity = tonumber(ARGV[base + 1])
+        local rate = tonumber(ARGV[base + 2])
+        local requested = tonumber(ARGV[base + 3])
+
+        local bucket = redis.call('HMGET', key, 'tokens', 'last_refill')
+        local tokens = tonumber(bucket[1]) or capacity
+        local last_refill = tonumber(bucket[2]) or now
+        local elapsed = math.max(0, now - last_refill)
+        tokens = math.min(capacity, tokens + (elapsed * rate))
+        available[i] = tokens
+
+        if tokens < requested then
+            allowed = 0
+            retry_after = math.max(retry_after, (requested - tokens) / rate)
+        end
     end
 
-    -- Update bucket state
-    redis.call('HMSET', key, 'tokens', tokens, 'last_refill', now)
-    redis.call('EXPIRE', key, ttl)
+    -- Charge all buckets or none
+    local result = {allowed, tostring(retry_after)}
+    for i, key in ipairs(KEYS) do
+        local base = 2 + (i - 1) * 4
+        local requested = tonumber(ARGV[base + 3])
+        local wanted = tonumber(ARGV[base + 4])
+        local granted = 0
+
+        if allowed == 1 then
+            granted = math.max(requested, math.min(wanted, math.floor(available[i])))
+            available[i] = available[i] - granted
+        end
+
+        redis.call('HMSET', key, 'tokens', available[i], 'last_refill', now)
+        redis.call('EXPIRE', key, ttl)
+        result[i + 2] = granted
+    end
 
-    return {allowed, retry_after, tokens, capacity}
+    return result
     """
 
     def __init__(
@@ -84,6 +118,10 @@ class RedisRateLimitBackend:
         quota_resolver: Optional[QuotaResolver] = None,
         key_prefix: str = "lukhas:ratelimit:",
         ttl_seconds: int = 300,
+        lease_tokens: int = 0,
+        lease_ttl_seconds: float = 1.0,
+        max_leases: int = 10_000,
+        client: Optional[Redis] = None,
     ):
         """
         Initialize Redis rate limit backend.
@@ -93,17 +131,28 @@ class RedisRateLimitBackend:
             quota_resolver: QuotaResolver for dynamic quotas (optional)
             key_prefix: Redis key prefix for rate limit keys
             ttl_seconds: TTL for rate limit keys in Redis
+            lease_tokens: Extra tokens to lease per key on each Redis check (0 disables leases)
+            lease_ttl_seconds: How long leased tokens stay usable locally
+            max_leases: Maximum number of keys holding a local lease
+            client: Pre-built Redis client (e.g. fakeredis); skips connecting to redis_url
         """
-        if not REDIS_AVAILABLE:
+        if client is None and not REDIS_AVAILABLE:
             raise RuntimeError("Redis is not installed, cannot use RedisRateLimitBackend")
 
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
         self.key_prefix = key_prefix
         self.ttl_seconds = ttl_seconds
 
+        # Local token leases (key -> [tokens, expires_at]), least recently granted first
+        self.lease_tokens = lease_tokens
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.max_leases = max_leases
+        self._leases: OrderedDict[str, list[float]] = OrderedDict()
+        self._lease_lock = threading.Lock()
+
         # Initialize Redis client
         try:
-            self.redis: Redis = redis.from_url(self.redis_url, decode_responses=True)
+            self.redis: Redis = client or redis.from_url(self.redis_url, decode_responses=True)
             # Test connection
             self.redis.ping()
             logger.info(f"Redis connection established: {self.redis_url}")
@@ -116,8 +165,8 @@ class RedisRateLimitBackend:
 
         # Load Lua script
         try:
-            self.consume_script = self.redis.register_script(self.LUA_CONSUME_SCRIPT)
-            logger.info("Redis Lua consume script registered")
+            self.check_limits_script = self.redis.register_script(self.LUA_CHECK_LIMITS_SCRIPT)
+            logger.info("Redis Lua check-limits script registered")
         except Exception as e:
             logger.error(f"Failed to register Lua script: {e}")
             raise
@@ -133,29 +182,80 @@ class RedisRateLimitBackend:
         Returns:
             (allowed, retry_after_seconds) tuple
         """
-        # Resolve quota for this key
-        rps, burst = self.quota_resolver.get_quota_for_key(key)
+        return self.check_limits([key], tokens)
 
-        # Build Redis key
-        redis_key = f"{self.key_prefix}{key}"
+    def check_limits(self, keys: Sequence[str], tokens: int = 1) -> tuple[bool, float]:
+        """
+        Check several rate limits at once, consuming tokens only if all allow.
+
+        Keys covered by a local lease are charged locally; the rest are
+        evaluated atomically in a single Lua script invocation.
+
+        Args:
+            keys: Rate limit keys (e.g. route, principal and org limits)
+            tokens: Number of tokens to consume from each (default: 1)
+
+        Returns:
+            (allowed, retry_after_seconds) tuple; retry_after is the longest
+            wait among the denying limits
+        """
+        keys = list(dict.fromkeys(keys))
         now = time.time()
 
+        # Charge leased keys locally; these charges are refunded if Redis denies
+        with self._lease_lock:
+            leased = []
+            remote = []
+            for key in keys:
+                lease = self._leases.get(key)
+                if lease is not None and lease[1] <= now:
+                    del self._leases[key]
+                    lease = None
+                if lease is not None and lease[0] >= tokens:
+                    lease[0] -= tokens
+                    leased.append(lease)
+                else:
+                    remote.append(key)
+        if not remote:
+            return True, 0.0
+
+        keys_args = []
+        args: list[float] = [now, self.ttl_seconds]
+        for key in remote:
+            rps, burst = self.quota_resolver.get_quota_for_key(key)
+            extra = min(self.lease_tokens, int(rps * self.lease_ttl_seconds))
+            keys_args.append(f"{self.key_prefix}{key}")
+            args.extend((burst, rps, tokens, tokens + max(0, extra)))
+
         try:
             # Execute Lua script atomically
-            result = self.consume_script(
-                keys=[redis_key], args=[burst, rps, tokens, now, self.ttl_seconds]
-            )
+            result = self.check_limits_script(keys=keys_args, args=args)
 
-            allowed = bool(result[0])
+            allowed = bool(int(result[0]))
             retry_after = float(result[1])
 
-            return allowed, retry_after
-
         except Exception as e:
-            logger.error(f"Redis rate limit check failed for {key}: {e}", exc_info=True)
+            logger.error(f"Redis rate limit check failed for {remote}: {e}", exc_info=True)
             # Fail open on Redis errors (allow request but log)
             return True, 0.0
 
+        with self._lease_lock:
+            if not allowed:
+                for lease in leased:
+                    lease[0] += tokens
+                return False, retry_after
+
+            expires_at = now + self.lease_ttl_seconds
+            for key, granted in zip(remote, result[2:]):
+                extra = int(granted) - tokens
+                if extra > 0:
+                    self._leases[key] = [extra, expires_at]
+                    self._leases.move_to_end(key)
+            while len(self._leases) > self.max_leases:
+                self._leases.popitem(last=False)
+
+        return True, 0.0
+
     def current_window(self, key: str) -> dict:
         """
         Get current token bucket state for a key.
@@ -229,6 +329,7 @@ class RedisRateLimitBackend:
                 "total_keys": key_count,
                 "keyspace_hits": info.get("keyspace_hits", 0),
                 "keyspace_misses": info.get("keyspace_misses", 0),
+                "local_leases": len(self._leases),
             }
         except Exception as e:
             logger.error(f"Failed to get Redis stats: {e}")
@@ -0,0 +1,632 @@
+"""
+Rolling aggregates behind SymbolicAnomalyExplorer.
+
+The anomaly detectors read running state instead of rescanning every session:
+
+- tag occurrence counts, session postings and emotional-intensity moments
+- tag bigram counts, with a running total over the frequent bigrams
+- per-tag appearance timelines and the largest emotional shift between
+  consecutive appearances (motif mutation)
+- the timestamp-ordered drift series, its largest step, steep steps and
+  EWMAs of drift and drift steps
+- narrative element counts and per-emotion moments
+
+``observe`` folds one session in, in time proportional to the session's size
+(sessions arriving out of timestamp order only re-sort the timelines they
+touch). With ``max_sessions`` set, the aggregates cover a rolling window: once
+it is full, each new session evicts the oldest observed one. ``from_sessions``
+builds identical state for a whole batch with NumPy over the interned tag ids.
+
+Tags are interned to dense integer ids. Substring matching against the
+conflict pairs runs once per distinct tag and is cached as a bitmask, so a
+session's conflicts are an OR over its tags' masks.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from core.symbolic.symbolic_anomaly_explorer import DreamSession
+
+# Known conflicting symbol pairs (matched as substrings of lower-cased tags)
+CONFLICT_PAIRS: tuple[tuple[str, str], ...] = (
+    ("light", "dark"),
+    ("order", "chaos"),
+    ("create", "destroy"),
+    ("hope", "fear"),
+    ("rise", "fall"),
+    ("connect", "isolate"),
+)
+
+STEEP_DRIFT_STEP = 0.3  # Drift increase between consecutive sessions flagged as steep
+
+
+@lru_cache(maxsize=65536)
+def conflict_mask(tag: str, pairs: tuple[tuple[str, str], ...] = CONFLICT_PAIRS) -> int:
+    """Bit 2k is set if ``tag`` contains pair k's first term, bit 2k+1 its second."""
+    lowered = tag.lower()
+    mask = 0
+    for k, (first, second) in enumerate(pairs):
+        if first in lowered:
+            mask |= 1 << (2 * k)
+        if second in lowered:
+            mask |= 1 << (2 * k + 1)
+    return mask
+
+
+def emotional_shift(previous: Optional[dict[str, float]], current: Optional[dict[str, float]]) -> Optional[float]:
+    """Mean absolute change over the emotions two states share, if any."""
+    if previous and current:
+        common = set(previous.keys()) & set(current.keys())
+        if common:
+            return float(np.mean([abs(previous[e] - current[e]) for e in common]))
+    return None
+
+
+def _ewma(values: Iterable[float], alpha: float) -> Optional[float]:
+    average = None
+    for value in values:
+        average = value if average is None else alpha * value + (1 - alpha) * average
+    return average
+
+
+class TagVocabulary:
+    """Interns tags to dense integer ids and caches their conflict masks."""
+
+    __slots__ = ("conflict_pairs", "ids", "masks", "tags")
+
+    def __init__(self, conflict_pairs: tuple[tuple[str, str], ...] = CONFLICT_PAIRS):
+        self.ids: dict[str, int] = {}
+        self.tags: list[str] = []
+        self.masks: list[int] = []
+        self.conflict_pairs = conflict_pairs
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def intern(self, tag: str) -> int:
+        tag_id = self.ids.get(tag)
+        if tag_id is None:
+            tag_id = len(self.tags)
+            self.ids[tag] = tag_id
+            self.tags.append(tag)
+            self.masks.append(conflict_mask(tag, self.conflict_pairs))
+        return tag_id
+
+    def intern_many(self, tags: Iterable[str]) -> list[int]:
+        return [self.intern(tag) for tag in tags]
+
+    def conflicts(self, tag_ids: Iterable[int]) -> list[tuple[str, str]]:
+        """Conflict pairs with both terms present among the given tags."""
+        mask = 0
+        for tag_id in tag_ids:
+            mask |= self.masks[tag_id]
+        return [pair for k, pair in enumerate(self.conflict_pairs) if (mask >> (2 * k)) & 3 == 3]
+
+
+class RollingAnomalyAggregates:
+    """Incrementally maintained statistics over observed dream sessions."""
+
+    def __init__(
+        self,
+        min_pattern_frequency: int = 3,
+        ewma_alpha: float = 0.3,
+        conflict_pairs: tuple[tuple[str, str], ...] = CONFLICT_PAIRS,
+        max_sessions: Optional[int] = None,
+    ):
+        """
+        Initialize empty aggregates.
+
+        Args:
+            min_pattern_frequency: Bigram count at which a bigram is frequent
+            ewma_alpha: Smoothing factor for the drift EWMAs
+            conflict_pairs: Symbol pairs treated as conflicting
+            max_sessions: Rolling window size (None keeps every session)
+        """
+        self.vocabulary = TagVocabulary(conflict_pairs)
+        self.min_pattern_frequency = min_pattern_frequency
+        self.ewma_alpha = ewma_alpha
+        self.max_sessions = max_sessions
+
+        # Sessions in the window by observation sequence number, oldest first
+        self.session_ids: dict[int, str] = {}
+        self._sessions: dict[int, DreamSession] = {}
+        self._next_seq = 0
+
+        # Per-tag state, indexed by tag id
+        self.tag_counts: list[int] = []
+        self.tag_sessions: list[list[int]] = []
+        self.tag_first_seen: list[str] = []
+        self.tag_last_seen: list[str] = []
+        self._intensity_n: list[int] = []
+        self._intensity_sum: list[float] = []
+        self._intensity_sumsq: list[float] = []
+        self.tag_timelines: list[list[tuple[datetime, int]]] = []
+        self.tag_max_shift: list[Optional[float]] = []
+
+        # Bigrams keyed by (first_id << 32) | second_id
+        self.bigram_counts: dict[int, int] = {}
+        self.bigram_sessions: dict[int, list[int]] = {}
+        self.bigram_total = 0
+        self.frequent_total = 0
+        self._frequent: set[int] = set()
+
+        # Drift series ordered by timestamp
+        self._drift_times: list[str] = []
+        self._drift_values: list[float] = []
+        self._drift_seqs: list[int] = []
+        self.drift_sum = 0.0
+        self.max_drift_step: Optional[float] = None
+        self.steep_drift_steps: list[tuple[int, int]] = []
+        self.drift_ewma: Optional[float] = None
+        self.drift_step_ewma: Optional[float] = None
+
+        # Narratives and emotions
+        self.narrative_counts: Counter = Counter()
+        self.emotion_moments: dict[str, list[float]] = {}  # emotion -> [n, sum, sumsq]
+        self.session_variance_sum = 0.0
+        self.session_variance_count = 0
+
+    def __len__(self) -> int:
+        return len(self.session_ids)
+
+    # ------------------------------------------------------------------
+    # Streaming updates
+    # ------------------------------------------------------------------
+
+    def observe(self, dream: DreamSession) -> list[DreamSession]:
+        """
+        Fold one session into the aggregates.
+
+        Args:
+            dream: Session to add
+
+        Returns:
+            Sessions evicted from the rolling window to make room
+        """
+        seq = self._next_seq
+        self._next_seq += 1
+        self.session_ids[seq] = dream.session_id
+        self._sessions[seq] = dream
+
+        tag_ids = self.vocabulary.intern_many(dream.symbolic_tags)
+        self._grow_tags()
+
+        intensity = self._intensity(dream)
+        moment = datetime.fromisoformat(dream.timestamp)
+        for tag_id in tag_ids:
+            self.tag_counts[tag_id] += 1
+            postings = self.tag_sessions[tag_id]
+            if not postings or postings[-1] != seq:
+                postings.append(seq)
+            if intensity is not None:
+                self._intensity_n[tag_id] += 1
+                self._intensity_sum[tag_id] += intensity
+                self._intensity_sumsq[tag_id] += intensity * intensity
+            if not self.tag_first_seen[tag_id] or dream.timestamp < self.tag_first_seen[tag_id]:
+                self.tag_first_seen[tag_id] = dream.timestamp
+            if dream.timestamp > self.tag_last_seen[tag_id]:
+                self.tag_last_seen[tag_id] = dream.timestamp
+            self._add_appearance(tag_id, moment, seq)
+
+        for first, second in zip(tag_ids, tag_ids[1:]):
+            self._add_bigram((first << 32) | second, seq)
+
+        self._add_drift(dream.timestamp, dream.drift_score, seq)
+        self.narrative_counts.update(dream.narrative_elements)
+        self._add_emotions(dream.emotional_state)
+
+        evicted = []
+        while self.max_sessions is not None and len(self.session_ids) > self.max_sessions:
+            evicted.append(self.evict_oldest())
+        return evicted
+
+    def evict_oldest(self) -> DreamSession:
+        """
+        Remove the oldest observed session from the aggregates.
+
+        Costs the session's size plus a rescan of the postings and timelines
+        of its tags and of the drift series, all bounded by the window.
+
+        Returns:
+            The evicted session
+        """
+        seq = next(iter(self._sessions))
+        dream = self._sessions.pop(seq)
+        del self.session_ids[seq]
+
+        tag_ids = self.tag_ids(dream.symbolic_tags)
+        intensity = self._intensity(dream)
+        for tag_id in tag_ids:
+            self.tag_counts[tag_id] -= 1
+            if intensity is not None:
+                self._intensity_n[tag_id] -= 1
+                self._intensity_sum[tag_id] -= intensity
+                self._intensity_sumsq[tag_id] -= intensity * intensity
+                if not self._intensity_n[tag_id]:
+                    self._intensity_sum[tag_id] = self._intensity_sumsq[tag_id] = 0.0
+        for tag_id in dict.fromkeys(tag_ids):
+            # Postings are in sequence order, so the oldest session leads
+            postings = self.tag_sessions[tag_id]
+            del postings[0]
+            stamps = [self._sessions[s].timestamp for s in postings]
+            self.tag_first_seen[tag_id] = min(stamps, default="")
+            self.tag_last_seen[tag_id] = max(stamps, default="")
+            timeline = self.tag_timelines[tag_id]
+            timeline[:] = [entry for entry in timeline if entry[1] != seq]
+            self.tag_max_shift[tag_id] = self._timeline_max_shift(timeline, {})
+
+        for first, second in zip(tag_ids, tag_ids[1:]):
+            self._remove_bigram((first << 32) | second, seq)
+
+        position = self._drift_seqs.index(seq)
+        del self._drift_times[position], self._drift_seqs[position]
+        drift = self._drift_values.pop(position)
+        self.drift_sum = self.drift_sum - drift if self._drift_seqs else 0.0
+        self._rebuild_drift_steps()
+
+        for narrative in dream.narrative_elements:
+            self.narrative_counts[narrative] -= 1
+            if self.narrative_counts[narrative] <= 0:
+                del self.narrative_counts[narrative]
+        self._remove_emotions(dream.emotional_state)
+        return dream
+
+    def _grow_tags(self) -> None:
+        for _ in range(len(self.vocabulary) - len(self.tag_counts)):
+            self.tag_counts.append(0)
+            self.tag_sessions.append([])
+            self.tag_first_seen.append("")
+            self.tag_last_seen.append("")
+            self._intensity_n.append(0)
+            self._intensity_sum.append(0.0)
+            self._intensity_sumsq.append(0.0)
+            self.tag_timelines.append([])
+            self.tag_max_shift.append(None)
+
+    @staticmethod
+    def _intensity(dream: DreamSession) -> Optional[float]:
+        if not dream.emotional_state:
+            return None
+        return sum(abs(v) for v in dream.emotional_state.values())
+
+    def _add_appearance(self, tag_id: int, moment: datetime, seq: int) -> None:
+        timeline = self.tag_timelines[tag_id]
+        if not timeline or timeline[-1][0] <= moment:
+            if timeline:
+                shift = emotional_shift(self._sessions[timeline[-1][1]].emotional_state, self._sessions[seq].emotional_state)
+                if shift is not None and (self.tag_max_shift[tag_id] is None or shift > self.tag_max_shift[tag_id]):
+                    self.tag_max_shift[tag_id] = shift
+            timeline.append((moment, seq))
+            return
+
+        # Late arrival: insert after equal timestamps and rescan this tag only
+        timeline.insert(bisect_right(timeline, (moment, float("inf"))), (moment, seq))
+        self.tag_max_shift[tag_id] = self._timeline_max_shift(timeline, {})
+
+    def _timeline_max_shift(
+        self, timeline: list[tuple[datetime, int]], cache: dict[tuple[int, int], Optional[float]]
+    ) -> Optional[float]:
+        best = None
+        for (_, previous), (_, current) in zip(timeline, timeline[1:]):
+            key = (previous, current)
+            if key not in cache:
+                cache[key] = emotional_shift(
+                    self._sessions[previous].emotional_state, self._sessions[current].emotional_state
+                )
+            shift = cache[key]
+            if shift is not None and (best is None or shift > best):
+                best = shift
+        return best
+
+    def _add_bigram(self, code: int, seq: int) -> None:
+        count = self.bigram_counts.get(code, 0) + 1
+        if count == 1:
+            self.bigram_sessions[code] = []
+        self.bigram_counts[code] = count
+        self.bigram_total += 1
+
+        postings = self.bigram_sessions[code]
+        if not postings or postings[-1] != seq:
+            postings.append(seq)
+
+        if count == self.min_pattern_frequency:
+            self.frequent_total += count
+            self._frequent.add(code)
+        elif count > self.min_pattern_frequency:
+            self.frequent_total += 1
+
+    def _remove_bigram(self, code: int, seq: int) -> None:
+        count = self.bigram_counts[code] - 1
+        self.bigram_total -= 1
+
+        postings = self.bigram_sessions[code]
+        if postings and postings[0] == seq:
+            del postings[0]
+
+        if count + 1 == self.min_pattern_frequency:
+            self.frequent_total -= count + 1
+            self._frequent.discard(code)
+        elif count >= self.min_pattern_frequency:
+            self.frequent_total -= 1
+
+        if count:
+            self.bigram_counts[code] = count
+        else:
+            del self.bigram_counts[code], self.bigram_sessions[code]
+
+    def _add_drift(self, timestamp: str, drift: float, seq: int) -> None:
+        self.drift_sum += drift
+        position = bisect_right(self._drift_times, timestamp)
+        self._drift_times.insert(position, timestamp)
+        self._drift_values.insert(position, drift)
+        self._drift_seqs.insert(position, seq)
+
+        if position < len(self._drift_times) - 1:
+            self._rebuild_drift_steps()
+            return
+
+        alpha = self.ewma_alpha
+        self.drift_ewma = drift if self.drift_ewma is None else alpha * drift + (1 - alpha) * self.drift_ewma
+        if position > 0:
+            step = drift - self._drift_values[position - 1]
+            if self.max_drift_step is None or step > self.max_drift_step:
+                self.max_drift_step = step
+            if step > STEEP_DRIFT_STEP:
+                self.steep_drift_steps.append((self._drift_seqs[position - 1], seq))
+            self.drift_step_ewma = (
+                step if self.drift_step_ewma is None else alpha * step + (1 - alpha) * self.drift_step_ewma
+            )
+
+    def _rebuild_drift_steps(self) -> None:
+        values = np.asarray(self._drift_values, dtype=float)
+        steps = np.diff(values)
+        self.drift_ewma = _ewma(self._drift_values, self.ewma_alpha)
+        self.drift_step_ewma = _ewma(steps.tolist(), self.ewma_alpha)
+        self.max_drift_step = float(steps.max()) if steps.size else None
+        steep = np.flatnonzero(steps > STEEP_DRIFT_STEP)
+        self.steep_drift_steps = [(self._drift_seqs[i], self._drift_seqs[i + 1]) for i in steep.tolist()]
+
+    def _add_emotions(self, emotional_state: Optional[dict[str, float]]) -> None:
+        if not emotional_state:
+            return
+        for emotion, value in emotional_state.items():
+            moments = self.emotion_moments.setdefault(emotion, [0, 0.0, 0.0])
+            moments[0] += 1
+            moments[1] += value
+            moments[2] += value * value
+        if len(emotional_state) > 1:
+            self.session_variance_sum += float(np.var(list(emotional_state.values())))
+            self.session_variance_count += 1
+
+    def _remove_emotions(self, emotional_state: Optional[dict[str, float]]) -> None:
+        if not emotional_state:
+            return
+        for emotion, value in emotional_state.items():
+            moments = self.emotion_moments[emotion]
+            moments[0] -= 1
+            if not moments[0]:
+                del self.emotion_moments[emotion]
+                continue
+            moments[1] -= value
+            moments[2] -= value * value
+        if len(emotional_state) > 1:
+            self.session_variance_count -= 1
+            self.session_variance_sum = (
+                self.session_variance_sum - float(np.var(list(emotional_state.values())))
+                if self.session_variance_count
+                else 0.0
+            )
+
+    # ------------------------------------------------------------------
+    # Batch construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_sessions(
+        cls,
+        dreams: Sequence[DreamSession],
+        min_pattern_frequency: int = 3,
+        ewma_alpha: float = 0.3,
+        conflict_pairs: tuple[tuple[str, str], ...] = CONFLICT_PAIRS,
+        max_sessions: Optional[int] = None,
+    ) -> RollingAnomalyAggregates:
+        """
+        Build aggregates for a batch, equal to observing ``dreams`` in order.
+
+        Counts, moments, bigrams and the drift series are computed with NumPy
+        over flat arrays of interned tag ids. With ``max_sessions`` set only
+        the trailing window of ``dreams`` is kept.
+        """
+        aggregates = cls(min_pattern_frequency, ewma_alpha, conflict_pairs, max_sessions)
+        if max_sessions is not None:
+            dreams = dreams[-max_sessions:] if max_sessions else []
+        n = len(dreams)
+        if not n:
+            return aggregates
+
+        aggregates.session_ids = {seq: d.session_id for seq, d in enumerate(dreams)}
+        aggregates._sessions = dict(enumerate(dreams))
+        aggregates._next_seq = n
+        session_tags = [aggregates.vocabulary.intern_many(d.symbolic_tags) for d in dreams]
+        aggregates._grow_tags()
+        vocabulary_size = len(aggregates.vocabulary)
+
+        lengths = np.fromiter((len(tags) for tags in session_tags), dtype=np.int64, count=n)
+        flat = np.fromiter(chain.from_iterable(session_tags), dtype=np.int64, count=int(lengths.sum()))
+        owner = np.repeat(np.arange(n, dtype=np.int64), lengths)
+
+        # Tag counts and emotional-intensity moments
+        aggregates.tag_counts = np.bincount(flat, minlength=vocabulary_size).tolist()
+        intensity = np.array([cls._intensity(d) if d.emotional_state else np.nan for d in dreams], dtype=float)
+        occurrence_intensity = intensity[owner]
+        has_intensity = ~np.isnan(occurrence_intensity)
+        weighted_ids = flat[has_intensity]
+        weights = occurrence_intensity[has_intensity]
+        aggregates._intensity_n = np.bincount(weighted_ids, minlength=vocabulary_size).tolist()
+        aggregates._intensity_sum = np.bincount(weighted_ids, weights=weights, minlength=vocabulary_size).tolist()
+        aggregates._intensity_sumsq = np.bincount(
+            weighted_ids, weights=weights * weights, minlength=vocabulary_size
+        ).tolist()
+
+        # Tag session postings and first/last appearance
+        pairs = np.unique(flat * n + owner)
+        pair_tags, pair_sessions = pairs // n, pairs % n
+        bounds = np.flatnonzero(np.diff(pair_tags)) + 1
+        timestamps = [d.timestamp for d in dreams]
+        if pairs.size:
+            posting_tags = pair_tags[np.r_[0, bounds]].tolist()
+            posting_lists = np.split(pair_sessions, bounds)
+        else:
+            posting_tags, posting_lists = [], []
+        for tag_id, sessions in zip(posting_tags, posting_lists):
+            postings = sessions.tolist()
+            aggregates.tag_sessions[tag_id] = postings
+            stamps = [timestamps[s] for s in postings]
+            aggregates.tag_first_seen[tag_id] = min(stamps)
+            aggregates.tag_last_seen[tag_id] = max(stamps)
+
+        # Appearance timelines: by tag, then timestamp (stable), then occurrence
+        moments = [datetime.fromisoformat(t) for t in timestamps]
+        moment_rank = np.empty(n, dtype=np.int64)
+        moment_rank[sorted(range(n), key=moments.__getitem__)] = np.arange(n)
+        order = np.lexsort((np.arange(flat.size), moment_rank[owner], flat))
+        sorted_tags = flat[order]
+        sorted_owner = owner[order].tolist()
+        tag_bounds = np.flatnonzero(np.diff(sorted_tags)) + 1
+        starts = np.r_[0, tag_bounds].tolist() if flat.size else []
+        ends = np.r_[tag_bounds, flat.size].tolist() if flat.size else []
+        shift_cache: dict[tuple[int, int], Optional[float]] = {}
+        for start, end in zip(starts, ends):
+            tag_id = int(sorted_tags[start])
+            timeline = [(moments[s], s) for s in sorted_owner[start:end]]
+            aggregates.tag_timelines[tag_id] = timeline
+            aggregates.tag_max_shift[tag_id] = aggregates._timeline_max_shift(timeline, shift_cache)
+
+        # Bigrams within each session
+        same_session = owner[1:] == owner[:-1]
+        codes = (flat[:-1][same_session] << 32) | flat[1:][same_session]
+        bigram_owner = owner[1:][same_session]
+        if codes.size:
+            unique_codes, first_index, counts = np.unique(codes, return_index=True, return_counts=True)
+            by_first_seen = np.argsort(first_index, kind="stable")
+            code_sessions = np.unique(np.stack([codes, bigram_owner]), axis=1)
+            session_bounds = np.flatnonzero(np.diff(code_sessions[0])) + 1
+            postings_by_code = dict(
+                zip(code_sessions[0][np.r_[0, session_bounds]].tolist(), np.split(code_sessions[1], session_bounds))
+            )
+            m = min_pattern_frequency
+            for i in by_first_seen.tolist():
+                code, count = int(unique_codes[i]), int(counts[i])
+                aggregates.bigram_counts[code] = count
+                aggregates.bigram_sessions[code] = postings_by_code[code].tolist()
+                if count >= m:
+                    aggregates._frequent.add(code)
+                    aggregates.frequent_total += count
+            aggregates.bigram_total = int(codes.size)
+
+        # Drift series (stable sort by timestamp string)
+        drift = np.array([d.drift_score for d in dreams], dtype=float)
+        drift_order = sorted(range(n), key=timestamps.__getitem__)
+        aggregates._drift_times = [timestamps[i] for i in drift_order]
+        aggregates._drift_values = drift[drift_order].tolist()
+        aggregates._drift_seqs = drift_order
+        aggregates.drift_sum = float(sum(d.drift_score for d in dreams))
+        aggregates._rebuild_drift_steps()
+
+        # Narratives and emotions
+        aggregates.narrative_counts = Counter(chain.from_iterable(d.narrative_elements for d in dreams))
+        for dream in dreams:
+            aggregates._add_emotions(dream.emotional_state)
+
+        return aggregates
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def tag_ids(self, tags: Iterable[str]) -> list[int]:
+        """Ids of known tags, in order, skipping unknown ones."""
+        ids = self.vocabulary.ids
+        return [ids[tag] for tag in tags if tag in ids]
+
+    def tag_intensity(self, tag_id: int) -> tuple[int, float, float]:
+        """(samples, mean, population std) of a tag's emotional intensity."""
+        n = self._intensity_n[tag_id]
+        if not n:
+            return 0, 0.0, 0.0
+        mean = self._intensity_sum[tag_id] / n
+        variance = max(self._intensity_sumsq[tag_id] / n - mean * mean, 0.0)
+        return n, mean, variance**0.5
+
+    def _bigram_first_seen(self, code: int) -> tuple[int, int]:
+        """(sequence, position) of a bigram's first occurrence in the window."""
+        seq = self.bigram_sessions[code][0]
+        tag_ids = self.tag_ids(self._sessions[seq].symbolic_tags)
+        codes = [(first << 32) | second for first, second in zip(tag_ids, tag_ids[1:])]
+        return seq, codes.index(code)
+
+    def frequent_bigrams(self) -> list[tuple[tuple[str, str], int]]:
+        """Bigrams at or above the frequency threshold, in first-seen order."""
+        tags = self.vocabulary.tags
+        return [
+            ((tags[code >> 32], tags[code & 0xFFFFFFFF]), self.bigram_counts[code])
+            for code in sorted(self._frequent, key=self._bigram_first_seen)
+        ]
+
+    def frequent_bigram_sessions(self) -> list[str]:
+        """Sessions containing any frequent bigram, in observation order."""
+        seqs: set[int] = set()
+        for code in self._frequent:
+            seqs.update(self.bigram_sessions[code])
+        return [self.session_ids[seq] for seq in sorted(seqs)]
+
+    @property
+    def mean_drift(self) -> float:
+        return self.drift_sum / len(self.session_ids) if self.session_ids else 0.0
+
+    def top_narratives(self, n: int = 5) -> list[str]:
+        return [narrative for narrative, _ in self.narrative_counts.most_common(n)]
+
+    def emotion_stats(self) -> dict[str, dict[str, float]]:
+        """Mean and population variance per emotion across sessions."""
+        stats = {}
+        for emotion, (count, total, total_sq) in self.emotion_moments.items():
+            mean = total / count
+            stats[emotion] = {"count": count, "mean": mean, "variance": max(total_sq / count - mean * mean, 0.0)}
+        return stats
+
+    def snapshot(self) -> dict[str, Any]:
+        """Plain-data view of the aggregates (for comparison and reporting)."""
+        tags = self.vocabulary.tags
+        ids = self.session_ids
+        live = [i for i, c in enumerate(self.tag_counts) if c]
+        return {
+            "sessions": list(ids.values()),
+            "tag_counts": {tags[i]: self.tag_counts[i] for i in live},
+            "tag_sessions": {tags[i]: [ids[s] for s in self.tag_sessions[i]] for i in live},
+            "tag_intensity": {tags[i]: self.tag_intensity(i) for i in live},
+            "tag_timelines": {tags[i]: [ids[s] for _, s in self.tag_timelines[i]] for i in live},
+            "tag_max_shift": {tags[i]: s for i, s in enumerate(self.tag_max_shift) if s is not None},
+            "bigrams": {(tags[c >> 32], tags[c & 0xFFFFFFFF]): n for c, n in self.bigram_counts.items()},
+            "bigram_total": self.bigram_total,
+            "frequent_total": self.frequent_total,
+            "frequent_bigrams": self.frequent_bigrams(),
+            "drift_sessions": [ids[s] for s in self._drift_seqs],
+            "max_drift_step": self.max_drift_step,
+            "steep_drift_steps": [(ids[a], ids[b]) for a, b in self.steep_drift_steps],
+            "drift_ewma": self.drift_ewma,
+            "drift_step_ewma": self.drift_step_ewma,
+            "mean_drift": self.mean_drift,
+            "narratives": dict(self.narrative_counts),
+            "emotions": self.emotion_stats(),
+        }
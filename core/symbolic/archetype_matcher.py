@@ -0,0 +1,390 @@
+"""
+Compiled archetype matching engine for ΛSAGE.
+
+Every pattern string in the archetypal, mythic and cultural knowledge bases is
+compiled once into a single Aho-Corasick automaton, so finding which patterns
+occur in a symbol or its context is one pass over the text instead of one
+substring check per pattern. Matches carry payloads via dense weight arrays:
+
+- archetype scoring: keyword / symbol / pattern counts per archetype
+- mythic resonance: deity-symbol and direct-symbol counts per mythic system
+- symbolic patterns and cultural variants: per-pattern membership
+
+The reverse test used by the mythic and cultural lookups ("symbol is a
+substring of a pattern") is served by a precomputed substring index.
+
+``classify_batch`` scores a whole list of symbols at once: matched
+(symbol, pattern) pairs form a sparse incidence matrix that is multiplied
+into the weight arrays with NumPy scatter-adds.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+# Context patterns checked for every symbol, and per originating system
+UNIVERSAL_PATTERNS = [
+    "transformation",
+    "journey",
+    "conflict",
+    "union",
+    "separation",
+    "birth",
+    "death",
+    "renewal",
+]
+ORIGIN_PATTERNS = {
+    "dream": ["vision", "nightmare", "lucid", "recurring", "symbolic"],
+    "memory": ["recall", "forgotten", "compressed", "fold", "trace"],
+}
+
+KEYWORD_WEIGHT = 1.0
+SYMBOL_WEIGHT = 0.8
+PATTERN_WEIGHT = 0.6
+DEITY_ARCHETYPE_RESONANCE = 0.5
+DEITY_SYMBOL_RESONANCE = 0.3
+DIRECT_SYMBOL_RESONANCE = 0.7
+
+
+class AhoCorasick:
+    """Multi-pattern substring automaton reporting which patterns occur in a text."""
+
+    __slots__ = ("_goto", "_fail", "_out", "_empty")
+
+    def __init__(self, patterns: Sequence[str]):
+        self._empty = [pattern_id for pattern_id, pattern in enumerate(patterns) if not pattern]
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        outputs: list[list[int]] = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            node = 0
+            for char in pattern:
+                nxt = self._goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = nxt
+            outputs[node].append(pattern_id)
+
+        # Breadth-first failure links; outputs inherit their suffix's outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+        self._out = [tuple(dict.fromkeys(ids)) for ids in outputs]
+
+    def find(self, text: str) -> set[int]:
+        """Ids of all patterns occurring in ``text``."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set(self._empty)
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+@dataclass
+class BatchMatches:
+    """Raw classification results for a batch of symbols."""
+
+    scores: np.ndarray  # (n, archetypes) normalised archetype scores
+    order: np.ndarray  # (n, archetypes) archetype columns, best first (stable)
+    mythic: np.ndarray  # (n, systems) resonance with the primary archetype
+    patterns: list[list[str]]
+    variants: list[dict[str, str]]
+
+    @classmethod
+    def concat(cls, parts: Sequence[BatchMatches]) -> BatchMatches:
+        return cls(
+            scores=np.concatenate([p.scores for p in parts]),
+            order=np.concatenate([p.order for p in parts]),
+            mythic=np.concatenate([p.mythic for p in parts]),
+            patterns=[row for p in parts for row in p.patterns],
+            variants=[row for p in parts for row in p.variants],
+        )
+
+
+class ArchetypeMatcher:
+    """Archetypal, mythic and cultural pattern tables compiled for batch matching."""
+
+    def __init__(
+        self,
+        archetypal_patterns: dict[Any, dict[str, Any]],
+        mythic_databases: dict[Any, dict[str, Any]],
+        cultural_symbols: dict[str, dict[str, Any]],
+    ):
+        """
+        Compile the knowledge bases.
+
+        Args:
+            archetypal_patterns: Archetype -> {"keywords", "symbols", "patterns"}
+            mythic_databases: Mythic system -> {"deities", "symbols"}
+            cultural_symbols: Cultural symbol -> {"cultural_variants", ...}
+        """
+        self.archetypes = list(archetypal_patterns)
+        self.systems = list(mythic_databases)
+        self._patterns: list[str] = []
+        self._pattern_ids: dict[str, int] = {}
+
+        # Archetype scoring counts, accumulated per pattern then packed
+        keyword_counts: dict[tuple[int, int], int] = {}
+        symbol_counts: dict[tuple[int, int], int] = {}
+        pattern_counts: dict[tuple[int, int], int] = {}
+        totals = np.zeros(len(self.archetypes))
+        self._archetype_patterns: list[list[tuple[int, str]]] = []
+        for column, archetype in enumerate(self.archetypes):
+            spec = archetypal_patterns[archetype]
+            for keyword in spec.get("keywords", []):
+                key = (self._intern(keyword), column)
+                keyword_counts[key] = keyword_counts.get(key, 0) + 1
+            for sym in spec.get("symbols", []):
+                key = (self._intern(sym), column)
+                symbol_counts[key] = symbol_counts.get(key, 0) + 1
+            for pattern in spec.get("patterns", []):
+                key = (self._intern(pattern), column)
+                pattern_counts[key] = pattern_counts.get(key, 0) + 1
+            self._archetype_patterns.append(
+                [(self._intern(p), p) for p in spec.get("patterns", [])]
+            )
+            totals[column] = (
+                len(spec.get("keywords", [])) + len(spec.get("symbols", [])) + len(spec.get("patterns", []))
+            )
+        self._totals = totals
+
+        self._universal = [(self._intern(p), p) for p in UNIVERSAL_PATTERNS]
+        self._origin = {
+            origin: [(self._intern(p), p) for p in patterns] for origin, patterns in ORIGIN_PATTERNS.items()
+        }
+
+        # Mythic tables over every archetype the databases mention
+        mythic_archetypes = list(self.archetypes)
+        for database in mythic_databases.values():
+            for deity in database.get("deities", {}).values():
+                mythic_archetypes.extend(a for a in deity.get("archetypes", []) if a not in mythic_archetypes)
+            for archetypes in database.get("symbols", {}).values():
+                mythic_archetypes.extend(a for a in archetypes if a not in mythic_archetypes)
+        self._mythic_column = {archetype: i for i, archetype in enumerate(mythic_archetypes)}
+
+        deity_archetypes = np.zeros((len(self.systems), len(mythic_archetypes)))
+        deity_symbols: dict[tuple[int, int], int] = {}
+        direct_symbols: list[tuple[int, int, int]] = []
+        mythic_strings: list[int] = []
+        for s, system in enumerate(self.systems):
+            database = mythic_databases[system]
+            for deity in database.get("deities", {}).values():
+                for archetype in dict.fromkeys(deity.get("archetypes", [])):
+                    deity_archetypes[s, self._mythic_column[archetype]] += 1
+                for deity_symbol in deity.get("symbols", []):
+                    key = (self._intern(deity_symbol), s)
+                    deity_symbols[key] = deity_symbols.get(key, 0) + 1
+                    mythic_strings.append(key[0])
+            for myth_symbol, archetypes in database.get("symbols", {}).items():
+                pattern_id = self._intern(myth_symbol)
+                mythic_strings.append(pattern_id)
+                for archetype in dict.fromkeys(archetypes):
+                    direct_symbols.append((pattern_id, s, self._mythic_column[archetype]))
+        self._deity_archetypes = deity_archetypes
+
+        self._cultural = [
+            (self._intern(name), data.get("cultural_variants", {})) for name, data in cultural_symbols.items()
+        ]
+        cultural_strings = [pattern_id for pattern_id, _ in self._cultural]
+
+        # Dense payload arrays indexed by pattern id
+        n_patterns = len(self._patterns)
+        self._keyword_weights = np.zeros((n_patterns, len(self.archetypes)))
+        self._symbol_weights = np.zeros((n_patterns, len(self.archetypes)))
+        self._pattern_weights = np.zeros((n_patterns, len(self.archetypes)))
+        for (pattern_id, column), count in keyword_counts.items():
+            self._keyword_weights[pattern_id, column] = count
+        for (pattern_id, column), count in symbol_counts.items():
+            self._symbol_weights[pattern_id, column] = count
+        for (pattern_id, column), count in pattern_counts.items():
+            self._pattern_weights[pattern_id, column] = count
+        self._deity_symbol_weights = np.zeros((n_patterns, len(self.systems)))
+        for (pattern_id, s), count in deity_symbols.items():
+            self._deity_symbol_weights[pattern_id, s] = count
+        self._direct_weights = np.zeros((n_patterns, len(self.systems), len(mythic_archetypes)))
+        for pattern_id, s, column in direct_symbols:
+            self._direct_weights[pattern_id, s, column] = 1
+
+        self._automaton = AhoCorasick(self._patterns)
+
+        # "symbol in pattern" lookups for the mythic and cultural strings
+        self._mythic_mask = np.zeros(n_patterns, dtype=bool)
+        self._mythic_mask[mythic_strings] = True
+        self._cultural_mask = np.zeros(n_patterns, dtype=bool)
+        self._cultural_mask[cultural_strings] = True
+        self._containing: dict[str, list[int]] = {}
+        for pattern_id in dict.fromkeys(mythic_strings + cultural_strings):
+            pattern = self._patterns[pattern_id]
+            substrings = {pattern[i:j] for i in range(len(pattern)) for j in range(i + 1, len(pattern) + 1)}
+            substrings.add("")
+            for substring in substrings:
+                self._containing.setdefault(substring, []).append(pattern_id)
+
+    def _intern(self, pattern: str) -> int:
+        pattern_id = self._pattern_ids.get(pattern)
+        if pattern_id is None:
+            pattern_id = len(self._patterns)
+            self._pattern_ids[pattern] = pattern_id
+            self._patterns.append(pattern)
+        return pattern_id
+
+    @property
+    def pattern_count(self) -> int:
+        return len(self._patterns)
+
+    def classify_batch(
+        self,
+        symbols: Sequence[str],
+        contexts: Sequence[str],
+        origins: Sequence[str],
+    ) -> BatchMatches:
+        """
+        Score a batch of symbols against every archetype in one pass.
+
+        Args:
+            symbols: Symbol texts
+            contexts: Context text per symbol
+            origins: Originating system per symbol (dream, memory, ...)
+
+        Returns:
+            BatchMatches aligned with the inputs
+        """
+        n = len(symbols)
+        any_rows: list[int] = []
+        any_cols: list[int] = []
+        ctx_rows: list[int] = []
+        ctx_cols: list[int] = []
+        mythic_rows: list[int] = []
+        mythic_cols: list[int] = []
+        context_matches: list[set[int]] = []
+        cultural_matches: list[set[int]] = []
+
+        find = self._automaton.find
+        for row, (symbol, context) in enumerate(zip(symbols, contexts)):
+            symbol, context = symbol.lower(), context.lower()
+            in_symbol = find(symbol)
+            in_context = find(context)
+            context_matches.append(in_context)
+
+            for pattern_id in in_symbol | in_context:
+                any_rows.append(row)
+                any_cols.append(pattern_id)
+            for pattern_id in in_context:
+                ctx_rows.append(row)
+                ctx_cols.append(pattern_id)
+
+            # Mythic and cultural strings match in either direction
+            bidirectional = in_symbol.union(self._containing.get(symbol, ()))
+            for pattern_id in bidirectional:
+                if self._mythic_mask[pattern_id]:
+                    mythic_rows.append(row)
+                    mythic_cols.append(pattern_id)
+            cultural_matches.append({p for p in bidirectional if self._cultural_mask[p]})
+
+        # Sparse (symbol x pattern) incidence times the payload arrays
+        n_archetypes = len(self.archetypes)
+        keyword_hits = np.zeros((n, n_archetypes))
+        symbol_hits = np.zeros((n, n_archetypes))
+        pattern_hits = np.zeros((n, n_archetypes))
+        if any_rows:
+            np.add.at(keyword_hits, any_rows, self._keyword_weights[any_cols])
+            np.add.at(symbol_hits, any_rows, self._symbol_weights[any_cols])
+        if ctx_rows:
+            np.add.at(pattern_hits, ctx_rows, self._pattern_weights[ctx_cols])
+        raw = keyword_hits * KEYWORD_WEIGHT + symbol_hits * SYMBOL_WEIGHT + pattern_hits * PATTERN_WEIGHT
+        scores = np.divide(raw, self._totals, out=np.zeros_like(raw), where=self._totals > 0)
+        order = np.argsort(-scores, axis=1, kind="stable")
+
+        mythic = self._mythic_resonances(n, order, mythic_rows, mythic_cols)
+
+        patterns = []
+        variants = []
+        for row in range(n):
+            primary = int(order[row, 0]) if n_archetypes else -1
+            patterns.append(self._symbolic_patterns(context_matches[row], primary, origins[row]))
+            merged: dict[str, str] = {}
+            for pattern_id, cultural_variants in self._cultural:
+                if pattern_id in cultural_matches[row]:
+                    merged.update(cultural_variants)
+            variants.append(merged)
+
+        return BatchMatches(scores=scores, order=order, mythic=mythic, patterns=patterns, variants=variants)
+
+    def _mythic_resonances(
+        self, n: int, order: np.ndarray, rows: list[int], cols: list[int]
+    ) -> np.ndarray:
+        n_systems = len(self.systems)
+        if not self.archetypes:
+            return np.zeros((n, n_systems))
+
+        # Resonance is taken against each symbol's primary archetype
+        primary_columns = np.array(
+            [self._mythic_column[self.archetypes[c]] for c in order[:, 0].tolist()], dtype=np.int64
+        )
+        deity_archetypes = self._deity_archetypes[:, primary_columns].T  # (n, systems)
+        deity_symbols = np.zeros((n, n_systems))
+        direct = np.zeros((n, n_systems))
+        if rows:
+            rows_arr = np.asarray(rows, dtype=np.int64)
+            cols_arr = np.asarray(cols, dtype=np.int64)
+            np.add.at(deity_symbols, rows_arr, self._deity_symbol_weights[cols_arr])
+            np.add.at(direct, rows_arr, self._direct_weights[cols_arr, :, primary_columns[rows_arr]])
+
+        resonance = (
+            deity_archetypes * DEITY_ARCHETYPE_RESONANCE
+            + deity_symbols * DEITY_SYMBOL_RESONANCE
+            + direct * DIRECT_SYMBOL_RESONANCE
+        )
+        matches = deity_archetypes + deity_symbols + direct
+        normalised = np.minimum(1.0, resonance / np.maximum(1.0, matches))
+        return np.where(matches > 0, normalised, 0.0)
+
+    def _symbolic_patterns(self, in_context: set[int], primary: int, origin: str) -> list[str]:
+        groups: list[Iterable[tuple[int, str]]] = []
+        if primary >= 0:
+            groups.append(self._archetype_patterns[primary])
+        groups.append(self._universal)
+        if origin in self._origin:
+            groups.append(self._origin[origin])
+        found = [pattern for group in groups for pattern_id, pattern in group if pattern_id in in_context]
+        return list(dict.fromkeys(found))
+
+
+_worker_matcher: ArchetypeMatcher | None = None
+
+
+def init_worker(matcher: ArchetypeMatcher) -> None:
+    """Process pool initializer: ship the compiled matcher to the worker once."""
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def classify_chunk(chunk: tuple[list[str], list[str], list[str]]) -> BatchMatches:
+    """Process pool task: classify one (symbols, contexts, origins) batch."""
+    return _worker_matcher.classify_batch(*chunk)
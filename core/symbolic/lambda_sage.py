@@ -46,12 +46,20 @@ import json
 import logging
 import re
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
+from core.symbolic.archetype_matcher import (
+    ArchetypeMatcher,
+    BatchMatches,
+    classify_chunk,
+    init_worker,
+)
+
 # ΛTRACE: ΛSAGE Archetypal Resonance Profiler initialization
 # ΛORIGIN_AGENT: Claude Code
 # ΛTASK_ID: Task 3
@@ -60,6 +68,8 @@ from typing import Any, Optional
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
+PARALLEL_CHUNK_SIZE = 2000  # Symbols per worker batch in identify_archetypes
+
 
 class ArchetypalFamily(Enum):
     """Primary archetypal families based on Jungian psychology."""
@@ -240,6 +250,7 @@ class ΛSage:
         self.archetypal_patterns = self._initialize_archetypal_patterns()
         self.mythic_databases = self._initialize_mythic_databases()
         self.cultural_symbols = self._initialize_cultural_symbols()
+        self.rebuild_matcher()
 
         # Analysis parameters
         self.resonance_thresholds = {
@@ -1373,14 +1384,25 @@ class ΛSage:
 
         return elements
 
+    def rebuild_matcher(self) -> None:
+        """Recompile the archetype matcher after editing the knowledge bases."""
+        self._matcher = ArchetypeMatcher(
+            self.archetypal_patterns, self.mythic_databases, self.cultural_symbols
+        )
+
     def identify_archetypes(
-        self, symbols: Optional[list[SymbolicElement]] = None
+        self,
+        symbols: Optional[list[SymbolicElement]] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = PARALLEL_CHUNK_SIZE,
     ) -> dict[str, ArchetypalMapping]:
         """
         Classify symbols by archetypal type using Jungian framework.
 
         Args:
             symbols: Optional list of symbols to analyze (uses loaded symbols if None)
+            workers: Process pool size for large archives (None or 1 runs in-process)
+            chunk_size: Symbols per batch handed to each worker
 
         Returns:
             Dictionary mapping symbols to archetypal classifications
@@ -1390,11 +1412,27 @@ class ΛSage:
 
         self.logger.info(f"Identifying archetypes for {len(symbols)} symbols")
 
-        mappings = {}
+        chunks = [
+            (
+                [elem.symbol for elem in symbols[i : i + chunk_size]],
+                [elem.context for elem in symbols[i : i + chunk_size]],
+                [elem.system_origin for elem in symbols[i : i + chunk_size]],
+            )
+            for i in range(0, len(symbols), chunk_size)
+        ]
+        if workers and workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=init_worker, initargs=(self._matcher,)
+            ) as pool:
+                parts = list(pool.map(classify_chunk, chunks))
+        else:
+            parts = [self._matcher.classify_batch(*chunk) for chunk in chunks]
 
-        for symbol_elem in symbols:
-            mapping = self._classify_symbol(symbol_elem)
-            mappings[symbol_elem.symbol] = mapping
+        mappings = {}
+        if parts:
+            matches = BatchMatches.concat(parts)
+            for row, symbol_elem in enumerate(symbols):
+                mappings[symbol_elem.symbol] = self._build_mapping(symbol_elem, matches, row)
 
         self.archetypal_mappings.update(mappings)
         self.logger.info(f"Classified {len(mappings)} symbols into archetypal patterns")
@@ -1403,69 +1441,36 @@ class ΛSage:
 
     def _classify_symbol(self, symbol_elem: SymbolicElement) -> ArchetypalMapping:
         """Classify a single symbol using archetypal patterns."""
-        symbol = symbol_elem.symbol.lower()
-        context = symbol_elem.context.lower()
-
-        archetype_scores = defaultdict(float)
-
-        # Score against each archetype
-        for archetype, patterns in self.archetypal_patterns.items():
-            score = 0.0
-
-            # Keyword matching
-            for keyword in patterns["keywords"]:
-                if keyword in symbol or keyword in context:
-                    score += 1.0
-
-            # Symbol matching
-            for sym in patterns["symbols"]:
-                if sym in symbol or sym in context:
-                    score += 0.8
-
-            # Pattern matching
-            for pattern in patterns["patterns"]:
-                if pattern in context:
-                    score += 0.6
-
-            # Normalize score
-            total_patterns = (
-                len(patterns["keywords"])
-                + len(patterns["symbols"])
-                + len(patterns["patterns"])
-            )
-            archetype_scores[archetype] = (
-                score / total_patterns if total_patterns > 0 else 0.0
-            )
-
-        # Determine primary and secondary archetypes
-        sorted_archetypes = sorted(
-            archetype_scores.items(), key=lambda x: x[1], reverse=True
+        matches = self._matcher.classify_batch(
+            [symbol_elem.symbol], [symbol_elem.context], [symbol_elem.system_origin]
         )
+        return self._build_mapping(symbol_elem, matches, 0)
 
-        primary_archetype = (
-            sorted_archetypes[0][0] if sorted_archetypes else ArchetypalFamily.INNOCENT
-        )
-        primary_score = sorted_archetypes[0][1] if sorted_archetypes else 0.0
+    def _build_mapping(
+        self, symbol_elem: SymbolicElement, matches: BatchMatches, row: int
+    ) -> ArchetypalMapping:
+        """Assemble an ArchetypalMapping from one row of matcher output."""
+        archetypes = self._matcher.archetypes
+        order = matches.order[row].tolist()
+        scores = matches.scores[row]
+
+        primary_archetype = archetypes[order[0]] if order else ArchetypalFamily.INNOCENT
+        primary_score = float(scores[order[0]]) if order else 0.0
 
         secondary_archetypes = [
-            arch for arch, score in sorted_archetypes[1:4] if score > 0.2
+            archetypes[column] for column in order[1:4] if scores[column] > 0.2
         ]
 
         # Calculate confidence based on score separation
         confidence = min(1.0, primary_score * 2) if primary_score > 0 else 0.1
 
-        # Map to mythic systems
-        mythic_resonances = self._calculate_mythic_resonances(
-            symbol_elem, primary_archetype
-        )
-
-        # Identify symbolic patterns
-        symbolic_patterns = self._identify_symbolic_patterns(
-            symbol_elem, primary_archetype
+        mythic_resonances = dict(
+            zip(self._matcher.systems, matches.mythic[row].tolist())
         )
 
-        # Find cultural variants
-        cultural_variants = self._find_cultural_variants(symbol_elem)
+        cultural_variants = dict(matches.variants[row])
+        if symbol_elem.glyph_lineage:
+            cultural_variants["glyph_form"] = symbol_elem.glyph_lineage
 
         return ArchetypalMapping(
             symbol=symbol_elem.symbol,
@@ -1474,114 +1479,10 @@ class ΛSage:
             resonance_strength=primary_score,
             confidence_score=confidence,
             mythic_resonances=mythic_resonances,
-            symbolic_patterns=symbolic_patterns,
+            symbolic_patterns=list(matches.patterns[row]),
             cultural_variants=cultural_variants,
         )
 
-    def _calculate_mythic_resonances(
-        self, symbol_elem: SymbolicElement, archetype: ArchetypalFamily
-    ) -> dict[MythicSystem, float]:
-        """Calculate resonance strength with different mythic systems."""
-        resonances = {}
-
-        symbol = symbol_elem.symbol.lower()
-
-        for mythic_system, database in self.mythic_databases.items():
-            resonance = 0.0
-            matches = 0
-
-            # Check deity associations
-            for _deity, deity_data in database.get("deities", {}).items():
-                if archetype in deity_data.get("archetypes", []):
-                    resonance += 0.5
-                    matches += 1
-
-                # Check symbol matches
-                for deity_symbol in deity_data.get("symbols", []):
-                    if deity_symbol in symbol or symbol in deity_symbol:
-                        resonance += 0.3
-                        matches += 1
-
-            # Check direct symbol matches
-            for myth_symbol, symbol_archetypes in database.get("symbols", {}).items():
-                if archetype in symbol_archetypes and (myth_symbol in symbol or symbol in myth_symbol):
-                    resonance += 0.7
-                    matches += 1
-
-            # Normalize resonance
-            if matches > 0:
-                resonances[mythic_system] = min(1.0, resonance / max(1, matches))
-            else:
-                resonances[mythic_system] = 0.0
-
-        return resonances
-
-    def _identify_symbolic_patterns(
-        self, symbol_elem: SymbolicElement, archetype: ArchetypalFamily
-    ) -> list[str]:
-        """Identify recurring symbolic patterns."""
-        patterns = []
-
-        context = symbol_elem.context.lower()
-        symbol_elem.symbol.lower()
-
-        # Add archetype-specific patterns
-        if archetype in self.archetypal_patterns:
-            arch_patterns = self.archetypal_patterns[archetype]["patterns"]
-            patterns.extend([p for p in arch_patterns if p in context])
-
-        # Add universal patterns
-        universal_patterns = [
-            "transformation",
-            "journey",
-            "conflict",
-            "union",
-            "separation",
-            "birth",
-            "death",
-            "renewal",
-        ]
-        patterns.extend([p for p in universal_patterns if p in context])
-
-        # Add system-specific patterns
-        if symbol_elem.system_origin == "dream":
-            dream_patterns = [
-                "vision",
-                "nightmare",
-                "lucid",
-                "recurring",
-                "symbolic",
-            ]
-            patterns.extend([p for p in dream_patterns if p in context])
-        elif symbol_elem.system_origin == "memory":
-            memory_patterns = [
-                "recall",
-                "forgotten",
-                "compressed",
-                "fold",
-                "trace",
-            ]
-            patterns.extend([p for p in memory_patterns if p in context])
-
-        return list(set(patterns))  # Remove duplicates
-
-    def _find_cultural_variants(self, symbol_elem: SymbolicElement) -> dict[str, str]:
-        """Find cultural variants of the symbol."""
-        variants = {}
-
-        symbol = symbol_elem.symbol.lower()
-
-        # Check against cultural symbol database
-        for cultural_symbol, symbol_data in self.cultural_symbols.items():
-            if cultural_symbol in symbol or symbol in cultural_symbol:
-                variants.update(symbol_data.get("cultural_variants", {}))
-
-        # Add system-specific variants
-        if symbol_elem.glyph_lineage:
-            variants["glyph_form"] = symbol_elem.glyph_lineage
-
-        return variants
-
     def map_mythic_resonance(
         self, mappings: Optional[dict[str, ArchetypalMapping]] = None
     ) -> dict[MythicSystem, float]:
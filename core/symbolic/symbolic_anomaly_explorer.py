@@ -67,6 +67,7 @@ import hashlib
 import json
 import re
 from collections import Counter, defaultdict, deque
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -76,6 +77,8 @@ from typing import Any, Optional
 import numpy as np
 import structlog
 
+from core.symbolic.anomaly_aggregates import RollingAnomalyAggregates
+
 # Optional ML dependencies (graceful degradation if not available)
 try:
     from sklearn.ensemble import IsolationForest, RandomForestClassifier
@@ -282,6 +285,12 @@ class SymbolicAnomalyExplorer:
         self.session_cache: dict[str, DreamSession] = {}
         self.tag_registry: dict[str, SymbolicTag] = {}
         self.pattern_cache: dict[str, Any] = {}
+        self._registry_sessions: dict[str, set[str]] = {}
+
+        # Rolling aggregates for streaming analysis (see observe_session), and
+        # the ids of the window-level anomalies it last reported per type
+        self.stream_aggregates: Optional[RollingAnomalyAggregates] = None
+        self._stream_window_ids: dict[AnomalyType, str] = {}
 
         # Anomaly detection thresholds
         self.thresholds = {
@@ -502,19 +511,122 @@ class SymbolicAnomalyExplorer:
         """
         logger.info("Analyzing symbolic anomalies", sessions=len(dreams))
 
-        anomalies = []
+        # Batch aggregates over the interned tag vocabulary
+        aggregates = RollingAnomalyAggregates.from_sessions(
+            dreams, min_pattern_frequency=self.min_pattern_frequency
+        )
 
         # Update tag registry
-        self._update_tag_registry(dreams)
+        self._update_tag_registry(aggregates, range(len(aggregates.vocabulary)))
 
         # Run different anomaly detection algorithms
-        anomalies.extend(self._detect_symbolic_conflicts(dreams))
-        anomalies.extend(self._detect_recursive_loops(dreams))
+        anomalies = []
+        anomalies.extend(self._detect_symbolic_conflicts(dreams, aggregates))
+        anomalies.extend(self._detect_recursive_loops(aggregates))
         anomalies.extend(self._detect_emotional_dissonance(dreams))
-        anomalies.extend(self._detect_motif_mutations(dreams))
-        anomalies.extend(self._detect_drift_acceleration(dreams))
-        anomalies.extend(self._detect_narrative_fractures(dreams))
+        anomalies.extend(
+            self._detect_motif_mutations(aggregates, range(len(aggregates.vocabulary)))
+        )
+        anomalies.extend(self._detect_drift_acceleration(aggregates))
+        anomalies.extend(
+            self._detect_narrative_fractures(dreams, aggregates.top_narratives())
+        )
+
+        return self._rank_anomalies(anomalies)
+
+    def observe_session(self, dream: DreamSession) -> list[SymbolicAnomaly]:
+        """
+        Streaming mode: fold one session into the rolling aggregates and scan it.
+
+        Cost is proportional to the session's size, so this can run on every
+        dream cycle. Per-session detectors (conflict, dissonance, fracture)
+        look at the new session; motif mutations are re-checked for its tags;
+        loop and drift detectors read the window-level aggregates over the
+        last ``max_sessions_analyzed`` sessions and are only reported again
+        when their anomaly changes.
+
+        Args:
+            dream: The newly completed dream session
+
+        Returns:
+            Anomalies raised by this session
+        """
+        if self.stream_aggregates is None:
+            self.stream_aggregates = RollingAnomalyAggregates(
+                min_pattern_frequency=self.min_pattern_frequency,
+                max_sessions=self.max_sessions_analyzed,
+            )
+        aggregates = self.stream_aggregates
+        evicted = aggregates.observe(dream)
+        self.session_cache[dream.session_id] = dream
+        self._forget_stream_sessions(aggregates, evicted)
+
+        tag_ids = list(dict.fromkeys(aggregates.tag_ids(dream.symbolic_tags)))
+        self._update_tag_registry(aggregates, tag_ids)
+
+        anomalies = []
+        anomalies.extend(self._detect_symbolic_conflicts([dream], aggregates))
+        anomalies.extend(
+            self._changed_window_anomalies(
+                AnomalyType.RECURSIVE_LOOP, self._detect_recursive_loops(aggregates)
+            )
+        )
+        anomalies.extend(self._detect_emotional_dissonance([dream]))
+        anomalies.extend(self._detect_motif_mutations(aggregates, tag_ids))
+        anomalies.extend(
+            self._changed_window_anomalies(
+                AnomalyType.DRIFT_ACCELERATION,
+                self._detect_drift_acceleration(aggregates),
+            )
+        )
+        anomalies.extend(
+            self._detect_narrative_fractures([dream], aggregates.top_narratives())
+        )
+
+        return self._rank_anomalies(anomalies)
+
+    def reset_stream(self) -> None:
+        """Drop the streaming aggregates (the tag registry is kept)."""
+        self.stream_aggregates = None
+        self._stream_window_ids.clear()
+
+    def _changed_window_anomalies(
+        self, anomaly_type: AnomalyType, anomalies: list[SymbolicAnomaly]
+    ) -> list[SymbolicAnomaly]:
+        """Pass a window-level detector's anomaly through only when its id changes."""
+        if not anomalies:
+            self._stream_window_ids.pop(anomaly_type, None)
+            return anomalies
+        anomaly_id = anomalies[0].anomaly_id
+        if self._stream_window_ids.get(anomaly_type) == anomaly_id:
+            return []
+        self._stream_window_ids[anomaly_type] = anomaly_id
+        return anomalies
+
+    def _forget_stream_sessions(
+        self, aggregates: RollingAnomalyAggregates, evicted: list[DreamSession]
+    ):
+        """Drop sessions that left the streaming window from the caches."""
+        for old in evicted:
+            self.session_cache.pop(old.session_id, None)
+            for tag in dict.fromkeys(old.symbolic_tags):
+                known = self._registry_sessions.get(tag)
+                if known and old.session_id in known:
+                    known.discard(old.session_id)
+                    self.tag_registry[tag].sessions.remove(old.session_id)
+                    if not known:
+                        self.tag_registry[tag].frequency = 0
+        if evicted:
+            self._update_tag_registry(
+                aggregates,
+                dict.fromkeys(
+                    aggregates.tag_ids(
+                        tag for old in evicted for tag in old.symbolic_tags
+                    )
+                ),
+            )
 
+    def _rank_anomalies(self, anomalies: list[SymbolicAnomaly]) -> list[SymbolicAnomaly]:
         # Sort by severity and confidence
         anomalies.sort(
             key=lambda a: (self._severity_rank(a.severity), a.confidence),
@@ -531,71 +643,61 @@ class SymbolicAnomalyExplorer:
 
         return anomalies
 
-    def _update_tag_registry(self, dreams: list[DreamSession]):
-        """Update the symbolic tag registry with session data."""
-        tag_sessions = defaultdict(list)
-        tag_emotions = defaultdict(list)
-
-        for dream in dreams:
-            for tag in dream.symbolic_tags:
-                tag_sessions[tag].append(dream.session_id)
-
-                # Calculate emotional weight for this tag
-                if dream.emotional_state:
-                    emotional_intensity = sum(
-                        abs(v) for v in dream.emotional_state.values()
-                    )
-                    tag_emotions[tag].append(emotional_intensity)
-
-        # Update registry
-        for tag, sessions in tag_sessions.items():
+    def _update_tag_registry(
+        self, aggregates: RollingAnomalyAggregates, tag_ids: Iterable[int]
+    ):
+        """Refresh registry entries for the given tags from the aggregates."""
+        tags = aggregates.vocabulary.tags
+        for tag_id in tag_ids:
+            if not aggregates.tag_counts[tag_id]:
+                continue
+            tag = tags[tag_id]
             if tag not in self.tag_registry:
                 self.tag_registry[tag] = SymbolicTag(
                     tag=tag,
                     frequency=0,
                     emotional_weight=0.0,
                     sessions=[],
-                    first_appearance=dreams[-1].timestamp,
-                    last_appearance=dreams[0].timestamp,
+                    first_appearance=aggregates.tag_first_seen[tag_id],
+                    last_appearance=aggregates.tag_last_seen[tag_id],
                 )
+                self._registry_sessions[tag] = set()
 
             reg_tag = self.tag_registry[tag]
-            reg_tag.frequency = len(sessions)
-            reg_tag.sessions = list(set(reg_tag.sessions + sessions))
-            reg_tag.emotional_weight = (
-                np.mean(tag_emotions[tag]) if tag_emotions[tag] else 0.0
+            reg_tag.frequency = aggregates.tag_counts[tag_id]
+            reg_tag.first_appearance = min(
+                reg_tag.first_appearance, aggregates.tag_first_seen[tag_id]
             )
+            reg_tag.last_appearance = max(
+                reg_tag.last_appearance, aggregates.tag_last_seen[tag_id]
+            )
+
+            # Append unseen sessions only (no full-list merge per update)
+            known = self._registry_sessions.setdefault(tag, set(reg_tag.sessions))
+            for seq in aggregates.tag_sessions[tag_id]:
+                session_id = aggregates.session_ids[seq]
+                if session_id not in known:
+                    known.add(session_id)
+                    reg_tag.sessions.append(session_id)
+
+            samples, mean, std = aggregates.tag_intensity(tag_id)
+            reg_tag.emotional_weight = mean
 
             # Calculate volatility
-            if len(tag_emotions[tag]) > 1:
-                reg_tag.volatility_score = np.std(tag_emotions[tag])
+            if samples > 1:
+                reg_tag.volatility_score = std
 
     def _detect_symbolic_conflicts(
-        self, dreams: list[DreamSession]
+        self, dreams: list[DreamSession], aggregates: RollingAnomalyAggregates
     ) -> list[SymbolicAnomaly]:
         """Detect conflicting symbolic elements."""
         anomalies = []
 
-        # Known conflicting pairs (could be expanded)
-        conflict_pairs = [
-            ("light", "dark"),
-            ("order", "chaos"),
-            ("create", "destroy"),
-            ("hope", "fear"),
-            ("rise", "fall"),
-            ("connect", "isolate"),
-        ]
-
-        # Check for sessions with conflicting symbols
+        # Check for sessions with conflicting symbols (cached per-tag masks)
         for dream in dreams:
-            tags_lower = [tag.lower() for tag in dream.symbolic_tags]
-
-            conflicts = []
-            for pair1, pair2 in conflict_pairs:
-                if any(pair1 in tag for tag in tags_lower) and any(
-                    pair2 in tag for tag in tags_lower
-                ):
-                    conflicts.append((pair1, pair2))
+            conflicts = aggregates.vocabulary.conflicts(
+                aggregates.tag_ids(dream.symbolic_tags)
+            )
 
             if conflicts:
                 # Calculate conflict intensity
@@ -610,78 +712,47 @@ class SymbolicAnomalyExplorer:
                     severity = self._calculate_severity(conflict_score)
 
                     anomaly = SymbolicAnomaly(
-    anomaly_id=f"CONFLICT_{dream.session_id}_{int(conflict_score*1000)}",
-    anomaly_type=AnomalyType.SYMBOLIC_CONFLICT,
-    severity=severity,
-    confidence=min(
-        conflict_score,
-        1.0),
-        description=f"Conflicting symbolic elements detected: {conflicts}",
-        affected_sessions=[
-            dream.session_id],
-            symbolic_elements=[
-                tag for pair in conflicts for tag in pair],
-                metrics={
-                    "conflict_score": conflict_score,
-                    "pairs": len(conflicts),
-                    },
-                    recommendations=[
-                        "Consider symbolic reconciliation",
-                        "Review narrative consistency",
+                        anomaly_id=f"CONFLICT_{dream.session_id}_{int(conflict_score*1000)}",
+                        anomaly_type=AnomalyType.SYMBOLIC_CONFLICT,
+                        severity=severity,
+                        confidence=min(conflict_score, 1.0),
+                        description=f"Conflicting symbolic elements detected: {conflicts}",
+                        affected_sessions=[dream.session_id],
+                        symbolic_elements=[tag for pair in conflicts for tag in pair],
+                        metrics={
+                            "conflict_score": conflict_score,
+                            "pairs": len(conflicts),
+                        },
+                        recommendations=[
+                            "Consider symbolic reconciliation",
+                            "Review narrative consistency",
                         ],
-                         )
+                    )
 
                     anomalies.append(anomaly)
 
         return anomalies
 
     def _detect_recursive_loops(
-        self, dreams: list[DreamSession]
+        self, aggregates: RollingAnomalyAggregates
     ) -> list[SymbolicAnomaly]:
         """Detect recursive patterns in symbolic content."""
         anomalies = []
 
-        # Analyze tag sequences across sessions
-        tag_sequences = []
-        for dream in dreams:
-            if len(dream.symbolic_tags) >= 2:
-                for i in range(len(dream.symbolic_tags) - 1):
-                    tag_sequences.append(
-                        (dream.symbolic_tags[i], dream.symbolic_tags[i + 1])
-                    )
-
-        # Find repeating patterns
-        sequence_counts = Counter(tag_sequences)
-        frequent_patterns = [
-            (seq, count)
-            for seq, count in sequence_counts.items()
-            if count >= self.min_pattern_frequency
-        ]
-
-        if frequent_patterns:
-            # Calculate loop score
-            total_patterns = len(tag_sequences)
-            loop_intensity = (
-                sum(count for _, count in frequent_patterns) / total_patterns
-            )
+        # Running share of bigrams that belong to frequent patterns
+        if aggregates.frequent_total:
+            loop_intensity = aggregates.frequent_total / aggregates.bigram_total
 
             if loop_intensity > self.thresholds["loop_detection"]:
                 severity = self._calculate_severity(loop_intensity)
-
-                affected_sessions = []
-                for dream in dreams:
-                    if any(
-                        seq in zip(dream.symbolic_tags[:-1], dream.symbolic_tags[1:])
-                        for seq, _ in frequent_patterns
-                    ):
-                        affected_sessions.append(dream.session_id)
+                frequent_patterns = aggregates.frequent_bigrams()
 
                 anomaly = SymbolicAnomaly(
                     anomaly_id=f"LOOP_{hashlib.md5(str(frequent_patterns).encode()).hexdigest()[:8]}",
                     anomaly_type=AnomalyType.RECURSIVE_LOOP, severity=severity,
                     confidence=loop_intensity,
                     description=f"Recursive symbolic patterns detected: {frequent_patterns[:3]}",
-                    affected_sessions=affected_sessions,
+                    affected_sessions=aggregates.frequent_bigram_sessions(),
                     symbolic_elements=[tag for seq, _ in frequent_patterns
                                        for tag in seq],
                     metrics={"loop_intensity": loop_intensity,
@@ -754,164 +825,105 @@ class SymbolicAnomalyExplorer:
         return anomalies
 
     def _detect_motif_mutations(
-        self, dreams: list[DreamSession]
+        self, aggregates: RollingAnomalyAggregates, tag_ids: Iterable[int]
     ) -> list[SymbolicAnomaly]:
         """Detect unexpected transformations of stable symbols."""
         anomalies = []
 
-        # Track symbol evolution across sessions
-        symbol_evolution = defaultdict(list)
-
-        for dream in dreams:
-            timestamp = datetime.fromisoformat(dream.timestamp)
-            for tag in dream.symbolic_tags:
-                symbol_evolution[tag].append(
-                    {
-                        "session": dream.session_id,
-                        "timestamp": timestamp,
-                        "context": dream.content[:200],
-                        "emotional_state": dream.emotional_state,
-                    }
-                )
-
-        # Look for sudden changes in symbol usage or context
-        for symbol, appearances in symbol_evolution.items():
-            if len(appearances) < 3:
+        # Each tag's largest emotional shift between consecutive appearances
+        # is maintained as its timeline grows
+        for tag_id in tag_ids:
+            timeline = aggregates.tag_timelines[tag_id]
+            mutation_score = aggregates.tag_max_shift[tag_id]
+            if len(timeline) < 3 or mutation_score is None:
                 continue
 
-            # Sort by timestamp
-            appearances.sort(key=lambda x: x["timestamp"])
-
-            # Look for mutations in emotional context
-            emotional_shifts = []
-            for i in range(1, len(appearances)):
-                prev_emotions = appearances[i - 1]["emotional_state"]
-                curr_emotions = appearances[i]["emotional_state"]
-
-                if prev_emotions and curr_emotions:
-                    # Calculate emotional distance
-                    common_emotions = set(prev_emotions.keys()) & set(
-                        curr_emotions.keys()
-                    )
-                    if common_emotions:
-                        emotional_distance = np.mean(
-                            [
-                                abs(prev_emotions[e] - curr_emotions[e])
-                                for e in common_emotions
-                            ]
-                        )
-                        emotional_shifts.append(emotional_distance)
-
-            if emotional_shifts:
-                mutation_score = max(emotional_shifts)
-                if mutation_score > self.thresholds["motif_mutation"]:
-                    severity = self._calculate_severity(mutation_score)
+            if mutation_score > self.thresholds["motif_mutation"]:
+                symbol = aggregates.vocabulary.tags[tag_id]
+                severity = self._calculate_severity(mutation_score)
 
-                    anomaly = SymbolicAnomaly(
-                        anomaly_id=f"MUTATION_{symbol}_{int(mutation_score*1000)}",
-                        anomaly_type=AnomalyType.MOTIF_MUTATION,
-                        severity=severity,
-                        confidence=mutation_score,
-                        description=f"Motif mutation detected for symbol '{symbol}'",
-                        affected_sessions=[a["session"] for a in appearances],
-                        symbolic_elements=[symbol],
-                        metrics={
-                            "mutation_score": mutation_score,
-                            "appearances": len(appearances),
-                            "max_shift": max(emotional_shifts)
-                        },
-                        recommendations=[
-                            "Monitor symbol stability",
-                            "Review contextual changes",
-                        ],
-                    )
+                anomaly = SymbolicAnomaly(
+                    anomaly_id=f"MUTATION_{symbol}_{int(mutation_score*1000)}",
+                    anomaly_type=AnomalyType.MOTIF_MUTATION,
+                    severity=severity,
+                    confidence=mutation_score,
+                    description=f"Motif mutation detected for symbol '{symbol}'",
+                    affected_sessions=[aggregates.session_ids[seq] for _, seq in timeline],
+                    symbolic_elements=[symbol],
+                    metrics={
+                        "mutation_score": mutation_score,
+                        "appearances": len(timeline),
+                        "max_shift": mutation_score
+                    },
+                    recommendations=[
+                        "Monitor symbol stability",
+                        "Review contextual changes",
+                    ],
+                )
 
-                    anomalies.append(anomaly)
+                anomalies.append(anomaly)
 
         return anomalies
 
     def _detect_drift_acceleration(
-        self, dreams: list[DreamSession]
+        self, aggregates: RollingAnomalyAggregates
     ) -> list[SymbolicAnomaly]:
         """Detect rapid drift score acceleration."""
         anomalies = []
 
-        if len(dreams) < 3:
+        if len(aggregates) < 3:
             return anomalies
 
-        # Sort by timestamp
-        sorted_dreams = sorted(dreams, key=lambda d: d.timestamp)
+        # Largest step along the timestamp-ordered drift series
+        max_acceleration = aggregates.max_drift_step
+        mean_drift = aggregates.mean_drift
+        acceleration_score = max_acceleration + mean_drift * 0.5
 
-        # Calculate drift acceleration
-        drift_changes = []
-        for i in range(1, len(sorted_dreams)):
-            drift_delta = (
-                sorted_dreams[i].drift_score - sorted_dreams[i - 1].drift_score
+        if acceleration_score > self.thresholds["drift_acceleration"]:
+            severity = self._calculate_severity(acceleration_score)
+
+            # Sessions either side of a significant increase
+            affected_sessions = list(
+                dict.fromkeys(
+                    aggregates.session_ids[seq]
+                    for step in aggregates.steep_drift_steps
+                    for seq in step
+                )
             )
-            drift_changes.append(drift_delta)
-
-        if drift_changes:
-            # Look for significant acceleration
-            max_acceleration = max(drift_changes)
-            mean_drift = np.mean([d.drift_score for d in dreams])
-            acceleration_score = max_acceleration + mean_drift * 0.5
-
-            if acceleration_score > self.thresholds["drift_acceleration"]:
-                severity = self._calculate_severity(acceleration_score)
-
-                # Find sessions with high acceleration
-                affected_sessions = []
-                for i, delta in enumerate(drift_changes):
-                    if delta > 0.3:  # Significant increase:
-                        affected_sessions.extend(
-                            [
-                                sorted_dreams[i].session_id,
-                                sorted_dreams[i + 1].session_id,
-                            ]
-                        )
 
-                anomaly = SymbolicAnomaly(
-    anomaly_id=f"DRIFT_ACCEL_{int(acceleration_score*1000)}",
-    anomaly_type=AnomalyType.DRIFT_ACCELERATION,
-    severity=severity,
-    confidence=min(
-        acceleration_score,
-        1.0),
-        description=f"Drift acceleration detected (max: {max_acceleration:.3f})",
-        affected_sessions=list(
-            set(affected_sessions)),
-            symbolic_elements=[],
-            metrics={
-                "acceleration_score": acceleration_score,
-                "max_acceleration": max_acceleration,
-                "mean_drift": mean_drift,
+            anomaly = SymbolicAnomaly(
+                anomaly_id=f"DRIFT_ACCEL_{int(acceleration_score*1000)}",
+                anomaly_type=AnomalyType.DRIFT_ACCELERATION,
+                severity=severity,
+                confidence=min(acceleration_score, 1.0),
+                description=f"Drift acceleration detected (max: {max_acceleration:.3f})",
+                affected_sessions=affected_sessions,
+                symbolic_elements=[],
+                metrics={
+                    "acceleration_score": acceleration_score,
+                    "max_acceleration": max_acceleration,
+                    "mean_drift": mean_drift,
+                    "drift_ewma": aggregates.drift_ewma,
+                    "drift_step_ewma": aggregates.drift_step_ewma,
                 },
                 recommendations=[
                     "Activate drift stabilization",
                     "Review recent symbolic changes",
-                    ],
-                     )
+                ],
+            )
 
-                anomalies.append(anomaly)
+            anomalies.append(anomaly)
 
         return anomalies
 
     def _detect_narrative_fractures(
-        self, dreams: list[DreamSession]
+        self, dreams: list[DreamSession], expected_narratives: list[str]
     ) -> list[SymbolicAnomaly]:
         """Detect breaks in narrative continuity."""
         anomalies = []
 
-        # Analyze narrative element consistency
-        all_narratives = []
-        for dream in dreams:
-            all_narratives.extend(dream.narrative_elements)
-
-        narrative_counts = Counter(all_narratives)
-
         # Look for sudden disappearances of frequent narratives
         for dream in dreams:
-            expected_narratives = [n for n, c in narrative_counts.most_common(5)]
             present_narratives = set(dream.narrative_elements)
             missing_narratives = set(expected_narratives) - present_narratives
 
@@ -927,24 +939,23 @@ class SymbolicAnomalyExplorer:
                     severity = self._calculate_severity(fracture_score)
 
                     anomaly = SymbolicAnomaly(
-    anomaly_id=f"FRACTURE_{dream.session_id}_{int(fracture_score*1000)}",
-    anomaly_type=AnomalyType.NARRATIVE_FRACTURE,
-    severity=severity,
-    confidence=fracture_score,
-    description=f"Narrative fracture detected (missing: {list(missing_narratives)})",
-    affected_sessions=[
-        dream.session_id],
-        symbolic_elements=list(missing_narratives),
-        metrics={
-            "fracture_score": fracture_score,
-            "missing_count": len(missing_narratives),
-            "symbolic_density": symbolic_density,
-            },
-            recommendations=[
-                "Review narrative continuity",
-                "Consider symbolic restoration",
-                ],
-                 )
+                        anomaly_id=f"FRACTURE_{dream.session_id}_{int(fracture_score*1000)}",
+                        anomaly_type=AnomalyType.NARRATIVE_FRACTURE,
+                        severity=severity,
+                        confidence=fracture_score,
+                        description=f"Narrative fracture detected (missing: {list(missing_narratives)})",
+                        affected_sessions=[dream.session_id],
+                        symbolic_elements=list(missing_narratives),
+                        metrics={
+                            "fracture_score": fracture_score,
+                            "missing_count": len(missing_narratives),
+                            "symbolic_density": symbolic_density,
+                        },
+                        recommendations=[
+                            "Review narrative continuity",
+                            "Consider symbolic restoration",
+                        ],
+                    )
 
                     anomalies.append(anomaly)
 
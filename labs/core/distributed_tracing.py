@@ -11,9 +11,10 @@ import threading
 import time
 import uuid
 from collections import defaultdict, deque
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +25,20 @@ logger = logging.getLogger(__name__)
 class TraceSpan:
     """A single span in a distributed trace"""
 
+    __slots__ = (
+        "span_id",
+        "trace_id",
+        "parent_span_id",
+        "operation_name",
+        "service_name",
+        "start_time",
+        "end_time",
+        "duration",
+        "tags",
+        "logs",
+        "status",
+    )
+
     span_id: str
     trace_id: str
     parent_span_id: Optional[str]
@@ -150,54 +165,246 @@ class TraceContext:
         return context
 
 
+# Idle traces are completed after this many seconds without new spans
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_WHEEL_SLOTS = 64
+
+
+class CompletedTrace:
+    """
+    A finished trace held in compact form.
+
+    The TraceSpan objects are kept as-is; the dict returned by the collector
+    API is rendered on first access and cached.
+    """
+
+    __slots__ = ("trace_id", "spans", "completed_at", "total_duration", "_rendered")
+
+    def __init__(self, trace_id: str, spans: tuple[TraceSpan, ...], completed_at: float, total_duration: float):
+        self.trace_id = trace_id
+        self.spans = spans
+        self.completed_at = completed_at
+        self.total_duration = total_duration
+        self._rendered: Optional[dict[str, Any]] = None
+
+    def operation_names(self) -> dict[str, None]:
+        """Distinct operation names in this trace, in span order"""
+        return dict.fromkeys(span.operation_name for span in self.spans)
+
+    def to_dict(self) -> dict[str, Any]:
+        if self._rendered is None:
+            self._rendered = {
+                "trace_id": self.trace_id,
+                "spans": [span.to_dict() for span in self.spans],
+                "completed_at": self.completed_at,
+                "total_duration": self.total_duration,
+                "span_count": len(self.spans),
+            }
+        return self._rendered
+
+
+class CompletedTraceLog(Sequence):
+    """Read-only view over completed traces that renders trace dicts on access"""
+
+    def __init__(self, records: "deque[CompletedTrace]"):
+        self._records = records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[dict[str, Any], list[dict[str, Any]]]:
+        if isinstance(index, slice):
+            return [record.to_dict() for record in list(self._records)[index]]
+        return self._records[index].to_dict()
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for record in list(self._records):
+            yield record.to_dict()
+
+
 class TraceCollector:
     """
     Collects and stores trace spans for analysis
+
+    Each active trace keeps a count of its unfinished spans, so a trace is
+    completed as soon as its last open span is reported finished, without
+    re-walking the trace. Traces that stop receiving spans are completed after
+    ``idle_timeout`` seconds by a hashed timing wheel that is advanced on each
+    collector call. Completed traces are indexed by trace id and by operation
+    name, and their dict form is only rendered when read.
     """
 
-    def __init__(self, max_traces: int = 10000):
+    def __init__(
+        self,
+        max_traces: int = 10000,
+        idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+        wheel_slots: int = DEFAULT_WHEEL_SLOTS,
+    ):
+        """
+        Initialize the collector.
+
+        Args:
+            max_traces: Maximum number of completed traces retained
+            idle_timeout: Seconds without new spans after which an active
+                trace is completed with its open spans marked "timeout"
+                (None disables idle completion)
+            wheel_slots: Number of timing wheel slots spanning idle_timeout
+        """
         self.max_traces = max_traces
+        self.idle_timeout = idle_timeout
         self.traces: dict[str, list[TraceSpan]] = defaultdict(list)
         self.spans: dict[str, TraceSpan] = {}
-        self.completed_traces: deque = deque(maxlen=max_traces)
+        self._completed: deque[CompletedTrace] = deque()
+        self.completed_traces = CompletedTraceLog(self._completed)
         self._lock = threading.Lock()
 
-    def add_span(self, span: TraceSpan):
-        """Add a span to the collector"""
-        with self._lock:
-            self.spans[span.span_id] = span
-            self.traces[span.trace_id].append(span)
+        # Active trace bookkeeping
+        self._open_span_ids: set[str] = set()
+        self._open_counts: dict[str, int] = {}
+        self._last_activity: dict[str, float] = {}
+        self._active_by_operation: dict[str, dict[str, None]] = {}
 
-            # Check if trace is complete
-            if span.end_time is not None:
-                self._check_trace_completion(span.trace_id)
+        # Completed trace indexes
+        self._completed_by_id: dict[str, CompletedTrace] = {}
+        self._completed_by_operation: dict[str, dict[CompletedTrace, None]] = {}
 
-    def _check_trace_completion(self, trace_id: str):
-        """Check if a trace is complete and move to completed traces"""
-        trace_spans = self.traces[trace_id]
+        # Idle timing wheel: slot -> [(trace_id, spans list)]; the spans list
+        # identifies the trace generation so stale entries are skipped
+        self._wheel_slots = max(1, wheel_slots)
+        self._wheel_tick = idle_timeout / self._wheel_slots if idle_timeout else 0.0
+        self._wheel: list[list[tuple[str, list[TraceSpan]]]] = [[] for _ in range(self._wheel_slots)]
+        self._next_tick = int(time.monotonic() / self._wheel_tick) if idle_timeout else 0
 
-        # Simple heuristic: trace is complete if all spans are finished
-        # and no new spans have been added for a while
-        all_finished = all(span.end_time is not None for span in trace_spans)
+    def add_span(self, span: TraceSpan):
+        """Add a span to the collector, or record that a known span finished"""
+        with self._lock:
+            now = time.monotonic()
+            if self.idle_timeout:
+                self._advance_wheel(now)
+
+            trace_id = span.trace_id
+            spans = self.traces.get(trace_id)
+            if spans is None:
+                spans = self.traces[trace_id] = []
+                self._open_counts[trace_id] = 0
+                if self.idle_timeout:
+                    self._schedule(trace_id, spans, now + self.idle_timeout)
+            self._last_activity[trace_id] = now
+
+            span_id = span.span_id
+            known = self.spans.get(span_id)
+            if known is None:
+                spans.append(span)
+                self.spans[span_id] = span
+                self._active_by_operation.setdefault(span.operation_name, {})[trace_id] = None
+                if span.end_time is None:
+                    self._open_span_ids.add(span_id)
+                    self._open_counts[trace_id] += 1
+            elif known is not span:
+                spans[spans.index(known)] = span
+                self.spans[span_id] = span
 
-        if all_finished and len(trace_spans) > 0:
-            # Move to completed traces
-            trace_data = {
-                "trace_id": trace_id,
-                "spans": [span.to_dict() for span in trace_spans],
-                "completed_at": time.time(),
-                "total_duration": self._calculate_trace_duration(trace_spans),
-                "span_count": len(trace_spans),
-            }
+            if span.end_time is not None:
+                if span_id in self._open_span_ids:
+                    self._open_span_ids.discard(span_id)
+                    self._open_counts[trace_id] -= 1
+                if self._open_counts[trace_id] == 0:
+                    self._complete_trace(trace_id)
 
-            self.completed_traces.append(trace_data)
+    def expire_idle_traces(self) -> int:
+        """
+        Complete active traces that have been idle for ``idle_timeout``.
 
-            # Clean up active traces
-            del self.traces[trace_id]
-            for span in trace_spans:
-                # Only delete if the span exists in our spans dict
-                if span.span_id in self.spans:
-                    del self.spans[span.span_id]
+        Returns:
+            Number of traces completed
+        """
+        if not self.idle_timeout:
+            return 0
+        with self._lock:
+            return self._advance_wheel(time.monotonic())
+
+    def _schedule(self, trace_id: str, spans: list[TraceSpan], deadline: float):
+        slot = int(deadline / self._wheel_tick) % self._wheel_slots
+        self._wheel[slot].append((trace_id, spans))
+
+    def _advance_wheel(self, now: float) -> int:
+        """Process every wheel tick that has fully elapsed"""
+        current = int(now / self._wheel_tick)
+        if current - self._next_tick > self._wheel_slots:
+            # One revolution visits every slot; older ticks add nothing
+            self._next_tick = current - self._wheel_slots
+
+        expired = 0
+        while self._next_tick < current:
+            tick = self._next_tick
+            self._next_tick += 1
+            slot = tick % self._wheel_slots
+            bucket = self._wheel[slot]
+            if not bucket:
+                continue
+            self._wheel[slot] = []
+            for trace_id, spans in bucket:
+                if self.traces.get(trace_id) is not spans:
+                    continue  # Completed (and possibly restarted) since scheduling
+                deadline = self._last_activity[trace_id] + self.idle_timeout
+                if int(deadline / self._wheel_tick) <= tick:
+                    self._complete_trace(trace_id, timed_out=True)
+                    expired += 1
+                else:
+                    self._schedule(trace_id, spans, deadline)
+        return expired
+
+    def _complete_trace(self, trace_id: str, timed_out: bool = False):
+        """Move an active trace to the completed traces"""
+        trace_spans = self.traces.pop(trace_id)
+        self._open_counts.pop(trace_id, None)
+        self._last_activity.pop(trace_id, None)
+
+        for span in trace_spans:
+            if self.spans.get(span.span_id) is span:
+                del self.spans[span.span_id]
+            if span.span_id in self._open_span_ids:
+                self._open_span_ids.discard(span.span_id)
+                if timed_out:
+                    span.status = "timeout"
+
+        record = CompletedTrace(
+            trace_id=trace_id,
+            spans=tuple(trace_spans),
+            completed_at=time.time(),
+            total_duration=self._calculate_trace_duration(trace_spans),
+        )
+        operations = record.operation_names()
+        for operation_name in operations:
+            active = self._active_by_operation.get(operation_name)
+            if active is not None:
+                active.pop(trace_id, None)
+                if not active:
+                    del self._active_by_operation[operation_name]
+
+        while self._completed and len(self._completed) >= self.max_traces:
+            self._evict_oldest()
+        if self.max_traces <= 0:
+            return
+
+        self._completed.append(record)
+        self._completed_by_id[trace_id] = record
+        for operation_name in operations:
+            self._completed_by_operation.setdefault(operation_name, {})[record] = None
+
+        if timed_out:
+            logger.debug(f"Trace {trace_id} completed after {self.idle_timeout}s idle")
+
+    def _evict_oldest(self):
+        record = self._completed.popleft()
+        if self._completed_by_id.get(record.trace_id) is record:
+            del self._completed_by_id[record.trace_id]
+        for operation_name in record.operation_names():
+            postings = self._completed_by_operation.get(operation_name)
+            if postings is not None:
+                postings.pop(record, None)
+                if not postings:
+                    del self._completed_by_operation[operation_name]
 
     def _calculate_trace_duration(self, spans: list[TraceSpan]) -> float:
         """Calculate the total duration of a trace"""
@@ -214,51 +421,47 @@ class TraceCollector:
 
     def get_trace(self, trace_id: str) -> Optional[dict[str, Any]]:
         """Get a specific trace"""
-        # Check active traces
-        if trace_id in self.traces:
-            spans = self.traces[trace_id]
-            return {
-                "trace_id": trace_id,
-                "spans": [span.to_dict() for span in spans],
-                "status": "active",
-                "span_count": len(spans),
-            }
+        with self._lock:
+            # Check active traces
+            spans = self.traces.get(trace_id)
+            if spans is not None:
+                return {
+                    "trace_id": trace_id,
+                    "spans": [span.to_dict() for span in spans],
+                    "status": "active",
+                    "span_count": len(spans),
+                }
 
-        # Check completed traces
-        for trace_data in self.completed_traces:
-            if trace_data["trace_id"] == trace_id:
-                return trace_data
+            # Check completed traces
+            record = self._completed_by_id.get(trace_id)
 
-        return None
+        return record.to_dict() if record is not None else None
 
     def get_traces_by_operation(self, operation_name: str) -> list[dict[str, Any]]:
         """Get traces containing a specific operation"""
-        matching_traces = []
-
-        # Check active traces
-        for trace_id, spans in self.traces.items():
-            if any(span.operation_name == operation_name for span in spans):
-                matching_traces.append(
-                    {
-                        "trace_id": trace_id,
-                        "spans": [span.to_dict() for span in spans],
-                        "status": "active",
-                    }
-                )
-
-        # Check completed traces
-        for trace_data in self.completed_traces:
-            spans = trace_data["spans"]
-            if any(span["operation_name"] == operation_name for span in spans):
-                matching_traces.append(trace_data)
-
+        with self._lock:
+            active = [
+                (trace_id, list(self.traces[trace_id]))
+                for trace_id in self._active_by_operation.get(operation_name, ())
+            ]
+            records = list(self._completed_by_operation.get(operation_name, ()))
+
+        matching_traces = [
+            {
+                "trace_id": trace_id,
+                "spans": [span.to_dict() for span in spans],
+                "status": "active",
+            }
+            for trace_id, spans in active
+        ]
+        matching_traces.extend(record.to_dict() for record in records)
         return matching_traces
 
     def get_trace_statistics(self) -> dict[str, Any]:
         """Get statistics about collected traces"""
         with self._lock:
             active_traces = len(self.traces)
-            completed_traces = len(self.completed_traces)
+            completed_traces = len(self._completed)
             total_spans = len(self.spans)  # Active spans
 
             operation_counts = defaultdict(int)
@@ -272,11 +475,11 @@ class TraceCollector:
 
             # Count in completed traces
             completed_span_count = 0
-            for trace_data in self.completed_traces:
-                for span_data in trace_data["spans"]:
-                    operation_counts[span_data["operation_name"]] += 1
-                    service_counts[span_data["service_name"]] += 1
-                    completed_span_count += 1
+            for record in self._completed:
+                for span in record.spans:
+                    operation_counts[span.operation_name] += 1
+                    service_counts[span.service_name] += 1
+                completed_span_count += len(record.spans)
 
             # Total spans includes both active and completed
             total_all_spans = total_spans + completed_span_count
@@ -3,7 +3,7 @@ import contextlib
 import logging
 import time
 import uuid
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -31,6 +31,15 @@ class DreamEventType(Enum):
     DREAM_ERROR_OCCURRED = "dream_error_occurred"
 
 
+DREAM_EVENT_TYPES = frozenset(dt.value for dt in DreamEventType)
+
+DEFAULT_NUM_SHARDS = 4
+DEFAULT_HISTORY_LIMIT = 1000
+DEFAULT_TRACKING_LIMIT = 1000  # Events kept per correlation id / dream session
+DEFAULT_TRACKING_TTL = 3600.0  # Seconds a correlation id / session is kept idle
+DEFAULT_MAX_TRACKED_KEYS = 10000
+
+
 @dataclass
 class Event:
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -45,19 +54,85 @@ class Event:
     user_id: Optional[str] = None  # For user-specific events
 
 
+class _EventTracker:
+    """
+    Bounded per-key event rings with idle expiry.
+
+    Keys are kept in least-recently-touched order so expired keys are popped
+    from the front without scanning.
+    """
+
+    def __init__(self, per_key_limit: int, ttl: float, max_keys: int):
+        self.per_key_limit = per_key_limit
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self._rings: OrderedDict[str, deque] = OrderedDict()
+        self._touched: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+    def append(self, key: str, event: "Event", now: float) -> None:
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = self._rings[key] = deque(maxlen=self.per_key_limit)
+        else:
+            self._rings.move_to_end(key)
+        ring.append(event)
+        self._touched[key] = now
+        self.expire(now)
+
+    def get(self, key: str) -> list["Event"]:
+        ring = self._rings.get(key)
+        return list(ring) if ring is not None else []
+
+    def expire(self, now: float) -> None:
+        cutoff = now - self.ttl
+        while self._rings:
+            oldest = next(iter(self._rings))
+            if len(self._rings) <= self.max_keys and self._touched[oldest] > cutoff:
+                break
+            del self._rings[oldest]
+            del self._touched[oldest]
+
+
 class EventBus:
-    def __init__(self):
+    def __init__(
+        self,
+        num_shards: int = DEFAULT_NUM_SHARDS,
+        history_limit: int = DEFAULT_HISTORY_LIMIT,
+        tracking_limit: int = DEFAULT_TRACKING_LIMIT,
+        tracking_ttl: float = DEFAULT_TRACKING_TTL,
+        max_tracked_keys: int = DEFAULT_MAX_TRACKED_KEYS,
+    ):
+        """
+        Initialize the event bus.
+
+        Events are dispatched by ``num_shards`` workers. An event goes to the
+        shard chosen by its correlation id (falling back to dream id, then
+        event type), so handlers for independent sessions run concurrently
+        while events of one session and priority class are handled in publish
+        order. High-priority events (priority >= 4) are dequeued ahead of
+        regular ones within a shard.
+
+        Args:
+            num_shards: Number of worker shards
+            history_limit: Dream events kept in the dream event history
+            tracking_limit: Events kept per correlation id and per dream session
+            tracking_ttl: Seconds an idle correlation id or session is tracked
+            max_tracked_keys: Maximum correlation ids (and sessions) tracked
+        """
         self._subscribers: dict[str, list[Callable]] = defaultdict(list)
-        self._queue = asyncio.Queue()
-        self._priority_queue = asyncio.PriorityQueue()
-        self._worker_task: Optional[asyncio.Task] = None
-        self._priority_worker_task: Optional[asyncio.Task] = None
+        self._num_shards = max(1, num_shards)
+        self._shard_queues: list[asyncio.PriorityQueue] = [asyncio.PriorityQueue() for _ in range(self._num_shards)]
+        self._shard_tasks: list[asyncio.Task] = []
         self._entry_counter = 0
 
         # Dream-specific enhancements
-        self._dream_event_history: list[Event] = []
-        self._correlation_tracking: dict[str, list[Event]] = defaultdict(list)
-        self._dream_session_events: dict[str, list[Event]] = defaultdict(list)
+        self._dream_event_history: deque[Event] = deque(maxlen=history_limit)
+        self._correlation_tracking = _EventTracker(tracking_limit, tracking_ttl, max_tracked_keys)
+        self._dream_session_events = _EventTracker(tracking_limit, tracking_ttl, max_tracked_keys)
+        self._completion_waiters: dict[str, set[asyncio.Future]] = defaultdict(set)
         self._event_filters: dict[str, Callable] = {}
 
         # Performance metrics
@@ -67,10 +142,8 @@ class EventBus:
 
     async def start(self):
         """Start the event bus workers."""
-        if self._worker_task is None:
-            self._worker_task = asyncio.create_task(self._worker())
-        if self._priority_worker_task is None:
-            self._priority_worker_task = asyncio.create_task(self._priority_worker())
+        if not self._shard_tasks:
+            self._shard_tasks = [asyncio.create_task(self._worker(queue)) for queue in self._shard_queues]
 
     def subscribe(
         self,
@@ -114,27 +187,28 @@ class EventBus:
             user_id=user_id,
         )
 
-        # Route to appropriate queue based on priority
-        if priority >= 4:  # High priority events
-            await self._priority_queue.put((10 - priority, self._entry_counter, event))
-            self._entry_counter += 1
-        else:
-            await self._queue.put(event)
+        # Route to the session's shard; high priority events sort first
+        shard_key = correlation_id or dream_id or event_type
+        queue = self._shard_queues[hash(shard_key) % self._num_shards]
+        rank = 10 - priority if priority >= 4 else 10
+        await queue.put((rank, self._entry_counter, event))
+        self._entry_counter += 1
+
+        now = time.monotonic()
 
         # Track dream-related events
         if dream_id:
-            self._dream_session_events[dream_id].append(event)
+            self._dream_session_events.append(dream_id, event, now)
+            if event_type == DreamEventType.DREAM_CYCLE_COMPLETE.value:
+                self._resolve_completion_waiters(dream_id, event)
 
         # Track correlated events
         if correlation_id:
-            self._correlation_tracking[correlation_id].append(event)
+            self._correlation_tracking.append(correlation_id, event, now)
 
         # Maintain event history for dream processing
-        if event_type.startswith("dream_") or event_type in [dt.value for dt in DreamEventType]:
+        if event_type.startswith("dream_") or event_type in DREAM_EVENT_TYPES:
             self._dream_event_history.append(event)
-            # Keep only recent dream events (last 1000)
-            if len(self._dream_event_history) > 1000:
-                self._dream_event_history = self._dream_event_history[-1000:]
 
     async def publish_dream_event(
         self,
@@ -193,8 +267,8 @@ class EventBus:
     ):
         """Complete coordinated dream processing session."""
         # Gather session statistics
-        session_events = self._dream_session_events.get(dream_id, [])
-        correlation_events = self._correlation_tracking.get(correlation_id, [])
+        session_events = self._dream_session_events.get(dream_id)
+        correlation_events = self._correlation_tracking.get(correlation_id)
 
         session_stats = {
             "total_events": len(session_events),
@@ -239,32 +313,38 @@ class EventBus:
         logger.info(f"Dream coordination completed: {dream_id}")
 
     async def get_dream_session_events(self, dream_id: str) -> list[Event]:
-        """Get all events for a specific dream session."""
-        return self._dream_session_events.get(dream_id, [])
+        """Get the retained events for a specific dream session."""
+        return self._dream_session_events.get(dream_id)
 
     async def get_correlated_events(self, correlation_id: str) -> list[Event]:
-        """Get all events with a specific correlation ID."""
-        return self._correlation_tracking.get(correlation_id, [])
+        """Get the retained events with a specific correlation ID."""
+        return self._correlation_tracking.get(correlation_id)
 
     async def wait_for_dream_completion(self, dream_id: str, timeout_seconds: float = 300.0) -> Optional[Event]:
         """Wait for a dream processing session to complete."""
-        completion_event = None
-        start_time = time.time()
-
-        while time.time() - start_time < timeout_seconds:
-            # Check for completion events
-            session_events = self._dream_session_events.get(dream_id, [])
-            for event in reversed(session_events):
-                if event.event_type == DreamEventType.DREAM_CYCLE_COMPLETE.value:
-                    completion_event = event
-                    break
-
-            if completion_event:
-                break
+        # Check for an already published completion event
+        for event in reversed(self._dream_session_events.get(dream_id)):
+            if event.event_type == DreamEventType.DREAM_CYCLE_COMPLETE.value:
+                return event
 
-            await asyncio.sleep(0.1)  # Small delay
-
-        return completion_event
+        waiter = asyncio.get_running_loop().create_future()
+        self._completion_waiters[dream_id].add(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout_seconds)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters = self._completion_waiters.get(dream_id)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._completion_waiters[dream_id]
+
+    def _resolve_completion_waiters(self, dream_id: str, event: Event):
+        """Wake every coroutine waiting for ``dream_id`` to complete."""
+        for waiter in self._completion_waiters.pop(dream_id, ()):
+            if not waiter.done():
+                waiter.set_result(event)
 
     def subscribe_to_dream_events(
         self,
@@ -291,23 +371,13 @@ class EventBus:
 
             self.subscribe(dream_event_type.value, filtered_callback)
 
-    async def _worker(self):
-        """Worker to process regular priority events from the queue."""
+    async def _worker(self, queue: asyncio.PriorityQueue):
+        """Worker to process the events routed to one shard."""
         while True:
             try:
-                event = await self._queue.get()
+                _rank, _counter, event = await queue.get()
                 await self._process_event(event)
-                self._queue.task_done()
-            except asyncio.CancelledError:
-                break
-
-    async def _priority_worker(self):
-        """Worker to process high priority events from the priority queue."""
-        while True:
-            try:
-                _priority, _counter, event = await self._priority_queue.get()
-                await self._process_event(event)
-                self._priority_queue.task_done()
+                queue.task_done()
             except asyncio.CancelledError:
                 break
 
@@ -339,17 +409,19 @@ class EventBus:
             logger.error(f"Error processing event {event.event_id}: {e}")
             self._events_failed += 1
 
+    async def join(self):
+        """Wait until every published event has been processed."""
+        for queue in self._shard_queues:
+            await queue.join()
+
     async def stop(self):
         """Stop the event bus workers."""
-        if self._worker_task:
-            self._worker_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._worker_task
-
-        if self._priority_worker_task:
-            self._priority_worker_task.cancel()
+        for task in self._shard_tasks:
+            task.cancel()
+        for task in self._shard_tasks:
             with contextlib.suppress(asyncio.CancelledError):
-                await self._priority_worker_task
+                await task
+        self._shard_tasks = []
 
     def get_event_bus_stats(self) -> dict[str, Any]:
         """Get comprehensive statistics about event bus operation."""
@@ -363,6 +435,8 @@ class EventBus:
             "dream_sessions_active": len(self._dream_session_events),
             "correlation_tracking_active": len(self._correlation_tracking),
             "dream_event_history_size": len(self._dream_event_history),
+            "worker_shards": self._num_shards,
+            "queued_events": sum(queue.qsize() for queue in self._shard_queues),
             "subscriber_count": sum(len(callbacks) for callbacks in self._subscribers.values()),
             "unique_event_types": len(self._subscribers),
             "average_events_per_second": self._events_processed / max(1, uptime),
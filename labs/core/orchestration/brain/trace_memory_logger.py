@@ -29,6 +29,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from labs.core.orchestration.brain.trace_segment_store import TraceSegmentStore
+
 # Configure standard logger
 logger = logging.getLogger(__name__)
 
@@ -74,6 +76,14 @@ class TraceMemoryLogger:
         self.recent_traces = []
         self.recent_traces_limit = self.config.get("recent_traces_limit", 100)
 
+        # Buffered, offset-indexed store for the all-traces log
+        self.store = TraceSegmentStore(
+            self.base_log_dir,
+            flush_interval=self.config.get("flush_interval", 1.0),
+            flush_max_records=self.config.get("flush_max_records", 256),
+            on_flush=self._write_level_logs,
+        )
+
         logger.info(f"TraceMemoryLogger initialized with base directory: {self.base_log_dir}")
 
     def _ensure_log_directories(self):
@@ -103,6 +113,7 @@ class TraceMemoryLogger:
         ethical_score: Optional[float] = None,
         tags: Optional[list[str]] = None,
         source_component: Optional[str] = None,
+        user_id: Optional[str] = None,
     ) -> str:
         """
         Log a memory trace with metadata and context.
@@ -115,6 +126,7 @@ class TraceMemoryLogger:
             ethical_score: Ethical evaluation score (0-1)
             tags: List of tags for categorizing the trace
             source_component: Component that generated the trace
+            user_id: Owning user (indexed for per-user retrieval)
 
         Returns:
             trace_id: Unique ID for the trace
@@ -136,6 +148,9 @@ class TraceMemoryLogger:
         }
 
         # Add optional fields if provided
+        if user_id:
+            trace["user_id"] = user_id
+
         if metadata:
             trace["metadata"] = metadata
 
@@ -168,21 +183,25 @@ class TraceMemoryLogger:
         return level_names.get(level, "UNKNOWN")
 
     def _write_trace(self, trace: dict[str, Any]):
-        """Write trace to appropriate log file based on level."""
-        level = trace.get("level", 0)
-        level_name = self._level_to_name(level).lower()
-
-        # Determine log file path
-        log_file = os.path.join(self.base_log_dir, level_name, f"trace_{level_name}.jsonl")
+        """Buffer trace for the segment store; level logs are written on flush."""
+        self.store.append(trace)
+
+    def _write_level_logs(self, batch: list[dict[str, Any]]):
+        """Append a flushed batch to the per-level log files (one open per level)."""
+        by_file: dict[str, list[str]] = {}
+        for trace in batch:
+            level_name = self._level_to_name(trace.get("level", 0)).lower()
+            log_file = os.path.join(self.base_log_dir, level_name, f"trace_{level_name}.jsonl")
+            by_file.setdefault(log_file, []).append(json.dumps(trace) + "\n")
 
-        # Write to file with thread safety
-        with self.log_lock, open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(trace) + "\n")
+        with self.log_lock:
+            for log_file, lines in by_file.items():
+                with open(log_file, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
 
-        # Always write to all_traces log
-        all_traces_log = os.path.join(self.base_log_dir, "all_traces.jsonl")
-        with self.log_lock, open(all_traces_log, "a", encoding="utf-8") as f:
-            f.write(json.dumps(trace) + "\n")
+    def flush(self) -> int:
+        """Flush buffered traces to disk, returning the number written."""
+        return self.store.flush()
 
     def _cache_trace(self, trace: dict[str, Any]):
         """Cache recent trace in memory."""
@@ -196,29 +215,44 @@ class TraceMemoryLogger:
         limit: int = 10,
         level: Optional[int] = None,
         tag: Optional[str] = None,
+        user_id: Optional[str] = None,
     ) -> list[dict[str, Any]]:
         """
         Get recent memory traces from cache.
 
+        When ``user_id`` is given, the cache is topped up from the user's
+        postings in the segment index so older traces are still found.
+
         Args:
             limit: Maximum number of traces to return
             level: Filter by trace level
             tag: Filter by specific tag
+            user_id: Only return traces owned by this user
 
         Returns:
             List of trace entries
         """
-        filtered = self.recent_traces
 
-        # Apply filters
-        if level is not None:
-            filtered = [t for t in filtered if t.get("level") == level]
+        def matches(t: dict[str, Any]) -> bool:
+            if level is not None and t.get("level") != level:
+                return False
+            if tag is not None and tag not in t.get("tags", []):
+                return False
+            return user_id is None or t.get("user_id") == user_id
 
-        if tag is not None:
-            filtered = [t for t in filtered if tag in t.get("tags", [])]
+        filtered = [t for t in self.recent_traces if matches(t)]
+
+        if user_id is not None and len(filtered) < limit:
+            seen = {t.get("trace_id") for t in filtered}
+            for trace in self.store.iter_user_traces(user_id):
+                if len(filtered) >= limit:
+                    break
+                if trace.get("trace_id") not in seen and matches(trace):
+                    seen.add(trace.get("trace_id"))
+                    filtered.append(trace)
 
         # Return most recent traces first
-        return sorted(filtered, key=lambda t: t["unix_time"], reverse=True)[:limit]
+        return sorted(filtered, key=lambda t: t.get("unix_time", 0), reverse=True)[:limit]
 
     def read_traces(
         self,
@@ -241,51 +275,58 @@ class TraceMemoryLogger:
         Returns:
             List of trace entries
         """
-        # Determine which log file to read from
+        # Make buffered traces visible to file readers
+        self.flush()
+
+        # Determine which log to read from
         if level is not None:
             level_name = self._level_to_name(level).lower()
             log_file = os.path.join(self.base_log_dir, level_name, f"trace_{level_name}.jsonl")
             if not os.path.exists(log_file):
                 return []
-            files_to_read = [log_file]
+            source = self._iter_jsonl(log_file)
         else:
-            # Read from all_traces log
-            log_file = os.path.join(self.base_log_dir, "all_traces.jsonl")
-            if not os.path.exists(log_file):
-                return []
-            files_to_read = [log_file]
+            # Read from the all-traces segments (and any legacy all_traces log)
+            source = self._iter_all_traces()
 
         traces = []
-        for file_path in files_to_read:
-            try:
-                with open(file_path, encoding="utf-8") as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-
-                        trace = json.loads(line)
+        for trace in source:
+            # Apply time filters
+            trace_time = trace.get("unix_time", 0)
+            if start_time and trace_time < start_time:
+                continue
+            if end_time and trace_time > end_time:
+                continue
 
-                        # Apply time filters
-                        trace_time = trace.get("unix_time", 0)
-                        if start_time and trace_time < start_time:
-                            continue
-                        if end_time and trace_time > end_time:
-                            continue
+            # Apply tag filters
+            if tags and not any(tag in trace.get("tags", []) for tag in tags):
+                continue
 
-                        # Apply tag filters
-                        if tags and not any(tag in trace.get("tags", []) for tag in tags):
-                            continue
+            traces.append(trace)
 
-                        traces.append(trace)
-
-                        if len(traces) >= limit:
-                            break
-            except Exception as e:
-                logger.error(f"Error reading traces from {file_path}: {e}")
+            if len(traces) >= limit:
+                break
 
         # Return most recent traces first
         return sorted(traces, key=lambda t: t["unix_time"], reverse=True)[:limit]
 
+    def _iter_jsonl(self, file_path: str):
+        """Yield traces from a JSONL log file."""
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        except Exception as e:
+            logger.error(f"Error reading traces from {file_path}: {e}")
+
+    def _iter_all_traces(self):
+        """Yield traces from the legacy all_traces log, then the segment store."""
+        legacy_log = os.path.join(self.base_log_dir, "all_traces.jsonl")
+        if os.path.exists(legacy_log):
+            yield from self._iter_jsonl(legacy_log)
+        yield from self.store.iter_all()
+
     def log_system_event(self, message: str, **kwargs) -> str:
         """Convenience method to log system events."""
         return self.log_trace(self.TraceLevel.SYSTEM, message, **kwargs)
@@ -335,7 +376,12 @@ class TraceMemoryLogger:
             if trace.get("trace_id") == trace_id:
                 return trace
 
-        # If not found, check log files
+        # Seek-and-read via the segment index
+        trace = self.store.get(trace_id)
+        if trace is not None:
+            return trace
+
+        # Fall back to the legacy all_traces log written before segments
         all_traces_log = os.path.join(self.base_log_dir, "all_traces.jsonl")
         if not os.path.exists(all_traces_log):
             return None
@@ -357,8 +403,7 @@ class TraceMemoryLogger:
     def close(self):
         """Perform cleanup operations before shutdown."""
         logger.info("TraceMemoryLogger shutting down")
-        # Any cleanup operations would go here
-        # For example, ensuring all logs are flushed
+        self.store.close()
 
 
 # Example usage
@@ -0,0 +1,264 @@
+"""
+TRACE SEGMENT STORE
+-------------------
+Offset-indexed JSONL storage backing the TraceMemoryLogger.
+
+Traces are buffered in memory and flushed in batches (periodically and when
+the buffer fills) to daily segment files under ``<log_dir>/segments``. Each
+segment has a sidecar ``.idx`` file recording trace_id → (offset, length)
+and the owning user, so lookups by id and "recent traces for user X" are
+seek-and-read operations rather than full-file scans. Stores still open at
+interpreter exit are closed by an ``atexit`` hook so the last batch is kept.
+
+Author: LUKHAS AI Team
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Callable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# (segment file name, byte offset, byte length)
+TraceLocation = tuple[str, int, int]
+
+# Stores with possibly buffered traces, closed at interpreter exit
+_open_stores: "weakref.WeakSet[TraceSegmentStore]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_stores() -> None:
+    for store in list(_open_stores):
+        try:
+            store.close()
+        except Exception as e:
+            logger.error(f"Failed to flush trace store {store.segment_dir} at exit: {e}")
+
+
+class TraceSegmentStore:
+    """
+    Buffered, daily-rotated JSONL trace store with a sidecar offset index.
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        flush_interval: float = 1.0,
+        flush_max_records: int = 256,
+        on_flush: Optional[Callable[[list[dict[str, Any]]], None]] = None,
+        segment_prefix: str = "all_traces",
+    ):
+        """
+        Initialize the store and load existing segment indexes.
+
+        Args:
+            base_dir: Base log directory (segments live in ``base_dir/segments``)
+            flush_interval: Seconds between background flushes (<= 0 disables
+                the background flusher; traces are flushed when the buffer fills)
+            flush_max_records: Buffered traces that trigger an immediate flush
+            on_flush: Optional hook receiving each flushed batch (under the lock)
+            segment_prefix: File name prefix for segment files
+        """
+        self.segment_dir = Path(base_dir) / "segments"
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.flush_max_records = flush_max_records
+        self.segment_prefix = segment_prefix
+        self._on_flush = on_flush
+
+        self._lock = threading.RLock()
+        self._pending: list[dict[str, Any]] = []
+        self._pending_by_id: dict[str, dict[str, Any]] = {}
+        self._index: dict[str, TraceLocation] = {}
+        self._user_postings: dict[str, list[TraceLocation]] = {}
+
+        self._load_indexes()
+
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_loop, name="trace-segment-flusher", daemon=True)
+            self._flusher.start()
+        _open_stores.add(self)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index) + len(self._pending)
+
+    def append(self, trace: dict[str, Any]) -> None:
+        """Buffer a trace for the next flush."""
+        with self._lock:
+            self._pending.append(trace)
+            self._pending_by_id[trace["trace_id"]] = trace
+            if len(self._pending) >= self.flush_max_records:
+                self.flush()
+
+    def flush(self) -> int:
+        """
+        Write buffered traces to their daily segments and sidecar indexes.
+
+        Returns:
+            Number of traces flushed
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            batch = self._pending
+            self._pending = []
+            try:
+                self._write_batch(batch)
+            except OSError:
+                # Keep the batch buffered so the next flush retries it
+                self._pending = batch + self._pending
+                raise
+
+            if self._on_flush is not None:
+                try:
+                    self._on_flush(batch)
+                except Exception as e:
+                    logger.error(f"Trace flush hook failed: {e}")
+
+            for trace in batch:
+                self._pending_by_id.pop(trace["trace_id"], None)
+            return len(batch)
+
+    def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        by_segment: dict[str, list[dict[str, Any]]] = {}
+        for trace in batch:
+            by_segment.setdefault(self._segment_name(trace.get("unix_time")), []).append(trace)
+
+        for segment, traces in by_segment.items():
+            lines = [(json.dumps(trace) + "\n").encode("utf-8") for trace in traces]
+            with open(self.segment_dir / segment, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(b"".join(lines))
+
+            index_lines = []
+            for trace, line in zip(traces, lines):
+                user_id = trace.get("user_id")
+                self._record(trace["trace_id"], user_id, (segment, offset, len(line)))
+                index_lines.append(json.dumps({"t": trace["trace_id"], "o": offset, "n": len(line), "u": user_id}))
+                offset += len(line)
+            with open(self._index_path(segment), "a", encoding="utf-8") as f:
+                f.write("\n".join(index_lines) + "\n")
+
+    def get(self, trace_id: str) -> Optional[dict[str, Any]]:
+        """Return a trace by id via the offset index (buffered traces included)."""
+        with self._lock:
+            trace = self._pending_by_id.get(trace_id)
+            if trace is not None:
+                return trace
+            location = self._index.get(trace_id)
+        if location is None:
+            return None
+        return self._read(location)
+
+    def iter_user_traces(self, user_id: str) -> Iterator[dict[str, Any]]:
+        """Yield a user's traces newest first, reading each record by offset."""
+        with self._lock:
+            pending = [t for t in reversed(self._pending) if t.get("user_id") == user_id]
+            postings = list(self._user_postings.get(user_id, ()))
+        yield from pending
+        for location in reversed(postings):
+            trace = self._read(location)
+            if trace is not None:
+                yield trace
+
+    def iter_all(self) -> Iterator[dict[str, Any]]:
+        """Yield every stored trace in segment order (oldest first), then buffered ones."""
+        for segment in sorted(self.segment_dir.glob(f"{self.segment_prefix}-*.jsonl")):
+            try:
+                with open(segment, encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            yield json.loads(line)
+            except (OSError, ValueError) as e:
+                logger.error(f"Error reading trace segment {segment}: {e}")
+        with self._lock:
+            pending = list(self._pending)
+        yield from pending
+
+    def close(self) -> None:
+        """Stop the background flusher and flush remaining traces."""
+        _open_stores.discard(self)
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5.0)
+            self._flusher = None
+        self.flush()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Background trace flush failed: {e}")
+
+    def _record(self, trace_id: str, user_id: Optional[str], location: TraceLocation) -> None:
+        self._index[trace_id] = location
+        if user_id:
+            self._user_postings.setdefault(user_id, []).append(location)
+
+    def _read(self, location: TraceLocation) -> Optional[dict[str, Any]]:
+        segment, offset, length = location
+        try:
+            with open(self.segment_dir / segment, "rb") as f:
+                f.seek(offset)
+                return json.loads(f.read(length))
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading trace at {segment}:{offset}: {e}")
+            return None
+
+    def _segment_name(self, unix_time: Optional[float]) -> str:
+        moment = datetime.fromtimestamp(unix_time, tz=timezone.utc) if unix_time else datetime.now(timezone.utc)
+        return f"{self.segment_prefix}-{moment:%Y%m%d}.jsonl"
+
+    def _index_path(self, segment: str) -> Path:
+        return self.segment_dir / (segment[: -len(".jsonl")] + ".idx")
+
+    def _load_indexes(self) -> None:
+        """Load sidecar indexes, re-indexing any segment tail the index missed."""
+        for segment_path in sorted(self.segment_dir.glob(f"{self.segment_prefix}-*.jsonl")):
+            segment = segment_path.name
+            indexed_end = 0
+            index_path = self._index_path(segment)
+            if index_path.exists():
+                with open(index_path, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        self._record(entry["t"], entry.get("u"), (segment, entry["o"], entry["n"]))
+                        indexed_end = max(indexed_end, entry["o"] + entry["n"])
+
+            if segment_path.stat().st_size > indexed_end:
+                self._reindex_tail(segment_path, indexed_end)
+
+    def _reindex_tail(self, segment_path: Path, start: int) -> None:
+        segment = segment_path.name
+        index_lines = []
+        with open(segment_path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                try:
+                    trace = json.loads(line)
+                except ValueError:
+                    offset += len(line)
+                    continue
+                user_id = trace.get("user_id")
+                self._record(trace["trace_id"], user_id, (segment, offset, len(line)))
+                index_lines.append(json.dumps({"t": trace["trace_id"], "o": offset, "n": len(line), "u": user_id}))
+                offset += len(line)
+        if index_lines:
+            with open(self._index_path(segment), "a", encoding="utf-8") as f:
+                f.write("\n".join(index_lines) + "\n")
+            logger.info(f"Re-indexed {len(index_lines)} traces in {segment}")
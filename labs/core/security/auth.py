@@ -5,6 +5,9 @@ Production-ready authentication with real MFA, JWT, and session management
 
 import json
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -131,6 +134,7 @@ except ImportError:
 
 
 import base64
+import copy
 import hashlib
 import io
 import logging
@@ -202,6 +206,15 @@ class EnhancedAuthenticationSystem:
         self.jwt_algorithm = "HS256"
         self.jwt_expiry_hours = 24
 
+        # Verified-token cache: skips signature verification and the Redis
+        # revocation lookup for recently verified tokens. Revocations made by
+        # other processes take effect here within the TTL; 0 disables the cache.
+        self.jwt_cache_ttl_seconds = 30
+        self.jwt_cache_max_entries = 10_000
+        self._verified_jwts: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._verified_jwts_by_jti: dict[str, set[bytes]] = defaultdict(set)
+        self._verified_jwts_lock = threading.Lock()
+
         # Session configuration
         self.session_timeout_minutes = 30
         self.max_concurrent_sessions = 5
@@ -229,8 +242,10 @@ class EnhancedAuthenticationSystem:
 
         # In-memory fallback stores
         self._api_keys_mem: dict[str, dict[str, Any]] = {}
-        # In-memory revoked JWT tracking (fallback when Redis not available)
-        self._revoked_jtis: set[str] = set()
+        # In-memory revoked JWT tracking (fallback when Redis not available,
+        # and a local front for Redis revocations made by this process):
+        # jti -> time the revocation lapses, in revocation order
+        self._revoked_jtis: dict[str, float] = {}
         # Temporary storage for MFA verification
         self.pending_mfa: dict[str, dict[str, Any]] = {}
 
@@ -257,6 +272,11 @@ class EnhancedAuthenticationSystem:
 
     def verify_jwt(self, token: str) -> Optional[dict[str, Any]]:
         """Verify and decode JWT token"""
+        digest = self._jwt_digest(token)
+        cached = self._get_verified_jwt(digest)
+        if cached is not None:
+            return cached
+
         try:
             payload = jwt.decode(token, self.jwt_secret, algorithms=[self.jwt_algorithm])
             # Manual expiry check to support environments without full JWT lib behavior
@@ -277,6 +297,7 @@ class EnhancedAuthenticationSystem:
             if self._is_token_revoked(payload.get("jti")):
                 return None
 
+            self._cache_verified_jwt(digest, payload)
             return payload
 
         except jwt.ExpiredSignatureError:
@@ -286,6 +307,21 @@ class EnhancedAuthenticationSystem:
 
     def revoke_jwt(self, jti: str):
         """Revoke JWT by ID"""
+        # Local front first, so cached and local checks see the revocation at once.
+        # Revocations outlive any token issued before them by jwt_expiry_hours,
+        # like the Redis keys below, so lapsed ones are pruned on insert.
+        now = time.time()
+        with self._verified_jwts_lock:
+            self._revoked_jtis.pop(jti, None)
+            self._revoked_jtis[jti] = now + self.jwt_expiry_hours * 3600
+            while True:
+                oldest = next(iter(self._revoked_jtis))
+                if self._revoked_jtis[oldest] > now:
+                    break
+                del self._revoked_jtis[oldest]
+            for digest in self._verified_jwts_by_jti.pop(jti, ()):
+                self._verified_jwts.pop(digest, None)
+
         # Store in Redis with expiry matching token expiry
         if self.redis_client:
             self.redis_client.setex(
@@ -293,17 +329,68 @@ class EnhancedAuthenticationSystem:
                 timedelta(hours=self.jwt_expiry_hours),
                 "1",
             )
-        else:
-            self._revoked_jtis.add(jti)
 
     def _is_token_revoked(self, jti: str) -> bool:
         """Check if JWT is revoked"""
         if not jti:
             return False
 
+        if self._is_locally_revoked(jti):
+            return True
         if self.redis_client:
             return self.redis_client.exists(f"revoked_jwt:{jti}") > 0
-        return jti in self._revoked_jtis
+        return False
+
+    def _is_locally_revoked(self, jti: str) -> bool:
+        lapses_at = self._revoked_jtis.get(jti)
+        return lapses_at is not None and time.time() < lapses_at
+
+    @staticmethod
+    def _jwt_digest(token: str) -> bytes:
+        raw = token if isinstance(token, bytes) else str(token).encode()
+        return hashlib.sha256(raw).digest()
+
+    def _get_verified_jwt(self, digest: bytes) -> Optional[dict[str, Any]]:
+        """Return a copy of a cached payload that is unexpired and not revoked"""
+        with self._verified_jwts_lock:
+            entry = self._verified_jwts.get(digest)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            jti = payload.get("jti")
+            if time.time() >= expires_at or (jti and self._is_locally_revoked(jti)):
+                self._drop_verified_jwt(digest, jti)
+                return None
+            self._verified_jwts.move_to_end(digest)
+        return copy.deepcopy(payload)
+
+    def _cache_verified_jwt(self, digest: bytes, payload: dict[str, Any]) -> None:
+        """Cache a verified payload until min(exp, now + TTL)"""
+        if self.jwt_cache_ttl_seconds <= 0 or self.jwt_cache_max_entries <= 0:
+            return
+        expires_at = time.time() + self.jwt_cache_ttl_seconds
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+
+        jti = payload.get("jti")
+        with self._verified_jwts_lock:
+            self._verified_jwts[digest] = (expires_at, copy.deepcopy(payload))
+            self._verified_jwts.move_to_end(digest)
+            if jti:
+                self._verified_jwts_by_jti[jti].add(digest)
+            while len(self._verified_jwts) > self.jwt_cache_max_entries:
+                oldest, (_, evicted) = self._verified_jwts.popitem(last=False)
+                self._drop_verified_jwt(oldest, evicted.get("jti"))
+
+    def _drop_verified_jwt(self, digest: bytes, jti: Optional[str]) -> None:
+        # Caller holds _verified_jwts_lock
+        self._verified_jwts.pop(digest, None)
+        if jti and jti in self._verified_jwts_by_jti:
+            digests = self._verified_jwts_by_jti[jti]
+            digests.discard(digest)
+            if not digests:
+                del self._verified_jwts_by_jti[jti]
 
     # Session Management
     async def create_session(self, user_id: str, ip_address: str, user_agent: str) -> AuthSession:
@@ -117,6 +117,9 @@ from typing import Any, Optional
 logger = logging.getLogger("ΛTRACE.core.advanced.brain.spine.memory_fold")
 logger.info("ΛTRACE: Initializing enhanced memory_fold module.")
 
+# Hashes per IN (...) lookup, kept under SQLite's default bound parameter limit
+_HASH_LOOKUP_CHUNK = 900
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION MANAGEMENT
@@ -245,6 +248,12 @@ class MemoryFoldDatabase:
                 ON memory_folds(user_id, timestamp DESC)
             """
             )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_hash
+                ON memory_folds(hash)
+            """
+            )
             conn.execute(
                 """
                 CREATE INDEX IF NOT EXISTS idx_emotion
@@ -352,60 +361,105 @@ class MemoryFoldDatabase:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.execute(query, params)
 
-                folds = []
-                for row in cursor:
-                    fold = {
-                        "id": row["id"],
-                        "timestamp": row["timestamp"],
-                        "emotion": row["emotion"],
-                        "context": row["context"],
-                        "hash": row["hash"],
-                        "user_id": row["user_id"],
-                        "relevance_score": row["relevance_score"],
-                        "access_count": row["access_count"],
-                    }
+                folds = [self._row_to_fold(row) for row in cursor]
 
-                    # Deserialize emotion vector
-                    if row["emotion_vector"]:
-                        fold["emotion_vector"] = np.array(json.loads(row["emotion_vector"]))
+                # Update access count and last accessed time
+                self._touch_folds(conn, [f["id"] for f in folds])
 
-                    # Deserialize metadata
-                    if row["metadata"]:
-                        fold["metadata"] = json.loads(row["metadata"])
+                return folds
 
-                    folds.append(fold)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to retrieve folds: {e}")
+            return []
 
-                # Update access count and last accessed time
-                if folds:
-                    # CLAUDE_EDIT_v0.13: Fixed SQL injection vulnerability - use
-                    # individual updates in transaction
-                    fold_ids = [f["id"] for f in folds]
-                    timestamp = datetime.now(timezone.utc).isoformat()
-
-                    # Execute updates in a transaction for efficiency
-                    conn.execute("BEGIN TRANSACTION")
-                    try:
-                        for fold_id in fold_ids:
-                            conn.execute(
-                                """
-                                UPDATE memory_folds
-                                SET access_count = access_count + 1,
-                                    last_accessed = ?
-                                WHERE id = ?
-                            """,
-                                (timestamp, fold_id),
-                            )
-                        conn.commit()
-                    except Exception:
-                        conn.rollback()
-                        raise
+    def get_folds_by_hash(self, hashes: list[str], user_id: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        Retrieve many memory folds by hash in one pass.
+
+        Hashes are looked up in chunks that stay under SQLite's bound
+        parameter limit, and access counts are bumped in a single batch.
+
+        Args:
+            hashes: Fold hashes to fetch
+            user_id: Optional user filter (system folds always match)
 
+        Returns:
+            Folds in the order of ``hashes``; unknown hashes are skipped
+        """
+        wanted = list(dict.fromkeys(hashes))
+        if not wanted:
+            return []
+
+        by_hash: dict[str, dict[str, Any]] = {}
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                for start in range(0, len(wanted), _HASH_LOOKUP_CHUNK):
+                    chunk = wanted[start : start + _HASH_LOOKUP_CHUNK]
+                    query = f"SELECT * FROM memory_folds WHERE hash IN ({','.join('?' * len(chunk))})"
+                    params: list[Any] = list(chunk)
+                    if user_id:
+                        query += " AND (user_id = ? OR user_id = 'system')"
+                        params.append(user_id)
+                    for row in conn.execute(query, params):
+                        # A hash may exist for several users; keep the most relevant
+                        current = by_hash.get(row["hash"])
+                        if current is None or row["relevance_score"] > current["relevance_score"]:
+                            by_hash[row["hash"]] = self._row_to_fold(row)
+
+                folds = [by_hash[h] for h in wanted if h in by_hash]
+                self._touch_folds(conn, [f["id"] for f in folds])
                 return folds
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to retrieve folds: {e}")
+            logger.error(f"Failed to retrieve folds by hash: {e}")
             return []
 
+    @staticmethod
+    def _row_to_fold(row: sqlite3.Row) -> dict[str, Any]:
+        fold = {
+            "id": row["id"],
+            "timestamp": row["timestamp"],
+            "emotion": row["emotion"],
+            "context": row["context"],
+            "hash": row["hash"],
+            "user_id": row["user_id"],
+            "relevance_score": row["relevance_score"],
+            "access_count": row["access_count"],
+        }
+
+        # Deserialize emotion vector
+        if row["emotion_vector"]:
+            fold["emotion_vector"] = np.array(json.loads(row["emotion_vector"]))
+
+        # Deserialize metadata
+        if row["metadata"]:
+            fold["metadata"] = json.loads(row["metadata"])
+
+        return fold
+
+    @staticmethod
+    def _touch_folds(conn: sqlite3.Connection, fold_ids: list[int]) -> None:
+        """Bump access count and last accessed time for fetched folds."""
+        if not fold_ids:
+            return
+        # Parameterised updates in one transaction
+        timestamp = datetime.now(timezone.utc).isoformat()
+        try:
+            conn.executemany(
+                """
+                UPDATE memory_folds
+                SET access_count = access_count + 1,
+                    last_accessed = ?
+                WHERE id = ?
+            """,
+                [(timestamp, fold_id) for fold_id in fold_ids],
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
     def update_relevance_scores(self, decay_factor: float = 0.95):
         """Apply time-based decay to relevance scores."""
         try:
@@ -882,20 +936,7 @@ class MemoryFoldSystem:
         folds = self.database.get_folds(user_id=user_id, filter_emotion=filter_emotion, limit=limit)
 
         # Process each fold
-        processed_folds = []
-        for fold in folds:
-            # Add vision prompt
-            vision_data = self.vision_manager.get_prompt_for_fold(fold, user_tier)
-            fold.update(vision_data)
-
-            # Calculate temporal relevance
-            fold_time = datetime.fromisoformat(fold["timestamp"].replace("Z", "+00:00"))
-            time_diff = (datetime.now(timezone.utc).replace(tzinfo=fold_time.tzinfo) - fold_time).total_seconds()
-            fold["relevance_score_time"] = max(0.0, 1.0 - (time_diff / (60 * 60 * 24 * 7)))
-
-            # Apply tier-based filtering
-            filtered_fold = self.tier_manager.filter_data_by_tier(fold, user_tier)
-            processed_folds.append(filtered_fold)
+        processed_folds = [self._prepare_recalled_fold(fold, user_tier) for fold in folds]
 
         # Sort by relevance
         processed_folds.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
@@ -903,6 +944,43 @@ class MemoryFoldSystem:
         logger.info(f"Recalled {len(processed_folds)} memory folds")
         return processed_folds
 
+    def recall_memory_folds_by_hash(
+        self,
+        hashes: list[str],
+        user_id: Optional[str] = None,
+        user_tier: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Recall specific memory folds by hash with tier-based access.
+
+        Args:
+            hashes: Fold hashes to recall
+            user_id: User ID for filtering
+            user_tier: User's access tier
+
+        Returns:
+            Folds in the order of ``hashes`` with appropriate data filtering
+        """
+        if not self.tier_manager.validate_access(1, user_tier, "recall_memory_folds"):
+            return []
+
+        folds = self.database.get_folds_by_hash(hashes, user_id=user_id)
+        return [self._prepare_recalled_fold(fold, user_tier) for fold in folds]
+
+    def _prepare_recalled_fold(self, fold: dict[str, Any], user_tier: int) -> dict[str, Any]:
+        """Attach vision prompt and temporal relevance, then filter by tier."""
+        # Add vision prompt
+        vision_data = self.vision_manager.get_prompt_for_fold(fold, user_tier)
+        fold.update(vision_data)
+
+        # Calculate temporal relevance
+        fold_time = datetime.fromisoformat(fold["timestamp"].replace("Z", "+00:00"))
+        time_diff = (datetime.now(timezone.utc).replace(tzinfo=fold_time.tzinfo) - fold_time).total_seconds()
+        fold["relevance_score_time"] = max(0.0, 1.0 - (time_diff / (60 * 60 * 24 * 7)))
+
+        # Apply tier-based filtering
+        return self.tier_manager.filter_data_by_tier(fold, user_tier)
+
     def enhanced_recall_memory_folds(
         self,
         user_id: Optional[str] = None,
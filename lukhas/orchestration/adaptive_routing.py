@@ -6,13 +6,20 @@ Provides a routing mechanism that can dynamically select the best "node"
 real-time performance metrics like latency and load. This allows the system
 to be more resilient and efficient, automatically favoring healthier or
 faster nodes.
+
+The router counts in-flight requests per node around each dispatch and keeps
+a peak-EWMA of latency (jumps up to a slower sample, decays back over time),
+so load- and latency-aware strategies route on live data.
 """
 
 import asyncio
+import math
+import random
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Dict, List, Optional, Type
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Type, TypeVar
 
 # Mock for a common LUKHAS utility, as per instructions
 try:
@@ -23,27 +30,43 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class Node:
     """Represents a destination for routing, e.g., a service instance."""
 
-    def __init__(self, node_id: str, capacity: int = 100):
+    # Default time constant (seconds) over which the peak-EWMA latency decays
+    LATENCY_DECAY_S = 10.0
+
+    def __init__(self, node_id: str, capacity: int = 100, latency_decay_s: Optional[float] = None):
         self.node_id = node_id
         self.capacity = capacity
+        self.latency_decay_s = latency_decay_s or self.LATENCY_DECAY_S
         self.last_seen = time.monotonic()
 
         # Metrics for routing decisions
-        self.current_load = 0
+        self.current_load = 0  # In-flight requests
         self.average_latency_ms = 0.0
+        self.latency_ewma_ms = 0.0  # Peak-EWMA, used for routing
         self.error_rate = 0.0
 
     def update_metrics(self, success: bool, latency_ms: float):
         """Update the node's performance metrics after a request."""
-        self.last_seen = time.monotonic()
+        now = time.monotonic()
+        elapsed = now - self.last_seen
+        self.last_seen = now
 
         # Simple moving average for latency
         self.average_latency_ms = (self.average_latency_ms + latency_ms) / 2
 
+        # Peak-EWMA: adopt slower samples at once, decay toward faster ones over time
+        if latency_ms > self.latency_ewma_ms:
+            self.latency_ewma_ms = latency_ms
+        else:
+            weight = math.exp(-elapsed / self.latency_decay_s)
+            self.latency_ewma_ms = self.latency_ewma_ms * weight + latency_ms * (1 - weight)
+
         # Simple error rate calculation
         current_error_value = 1 if not success else 0
         self.error_rate = (self.error_rate + current_error_value) / 2
@@ -55,6 +78,7 @@ class Node:
             "capacity": self.capacity,
             "current_load": self.current_load,
             "average_latency_ms": self.average_latency_ms,
+            "latency_ewma_ms": self.latency_ewma_ms,
             "error_rate": self.error_rate,
             "last_seen": self.last_seen
         }
@@ -79,27 +103,67 @@ class LeastLoadedStrategy(RoutingStrategy):
 
 
 class LowestLatencyStrategy(RoutingStrategy):
-    """Routes to the node with the lowest average latency."""
+    """Routes to the node with the lowest (peak-EWMA) latency."""
 
     def select_node(self, nodes: List[Node]) -> Optional[Node]:
         if not nodes:
             return None
-        return min(nodes, key=lambda n: n.average_latency_ms)
+        return min(nodes, key=lambda n: n.latency_ewma_ms)
+
+
+class PowerOfTwoChoicesStrategy(RoutingStrategy):
+    """
+    Samples two healthy nodes and routes to the cheaper one.
+
+    Cost is ``(in-flight + 1) x peak-EWMA latency``. A node with no latency
+    sample yet but requests in flight costs ``UNMEASURED_PENALTY`` plus its
+    load, so new nodes are probed without absorbing a whole burst. Nodes
+    whose error rate exceeds ``max_error_rate`` are skipped unless fewer than
+    two remain. Sampling avoids herding every request onto the single
+    best-looking node.
+    """
+
+    UNMEASURED_PENALTY = 1e6
+
+    def __init__(self, max_error_rate: float = 0.5, rng: Optional[random.Random] = None):
+        self.max_error_rate = max_error_rate
+        self._rng = rng or random.Random()
+
+    @staticmethod
+    def cost(node: Node) -> float:
+        if node.latency_ewma_ms == 0 and node.current_load:
+            return PowerOfTwoChoicesStrategy.UNMEASURED_PENALTY + node.current_load
+        return (node.current_load + 1) * node.latency_ewma_ms
+
+    def select_node(self, nodes: List[Node]) -> Optional[Node]:
+        if not nodes:
+            return None
+        healthy = [n for n in nodes if n.error_rate <= self.max_error_rate]
+        candidates = healthy if len(healthy) >= 2 else nodes
+        if len(candidates) == 1:
+            return candidates[0]
+        first, second = self._rng.sample(candidates, 2)
+        return second if self.cost(second) < self.cost(first) else first
 
 
 class Router:
     """A dynamic router for selecting the best node for a request."""
 
-    def __init__(self, strategy: Type[RoutingStrategy] = LeastLoadedStrategy):
+    def __init__(
+        self,
+        strategy: Type[RoutingStrategy] = LeastLoadedStrategy,
+        latency_decay_s: Optional[float] = None,
+    ):
         self._nodes: Dict[str, Node] = {}
         self._strategy = strategy()
+        self._latency_decay_s = latency_decay_s
         self._lock = asyncio.Lock()
 
     async def register_node(self, node_id: str, capacity: int = 100):
         """Add or update a node in the router's registry."""
         async with self._lock:
             if node_id not in self._nodes:
-                self._nodes[node_id] = Node(node_id, capacity)
+                self._nodes[node_id] = Node(node_id, capacity, self._latency_decay_s)
                 logger.info(f"Registered new node: {node_id}")
             else:
                 self._nodes[node_id].capacity = capacity
@@ -130,6 +194,34 @@ class Router:
 
         return selected_node
 
+    @asynccontextmanager
+    async def track(self, node: Node) -> AsyncIterator[Node]:
+        """
+        Count a request as in flight on ``node`` and record its outcome.
+
+        The request is recorded as failed if the body raises.
+        """
+        async with self._lock:
+            node.current_load += 1
+        start = time.perf_counter()
+        success = False
+        try:
+            yield node
+            success = True
+        finally:
+            latency_ms = (time.perf_counter() - start) * 1000
+            async with self._lock:
+                node.current_load -= 1
+                node.update_metrics(success, latency_ms)
+
+    async def dispatch(self, call: Callable[[Node], Awaitable[T]]) -> T:
+        """Select a node, run ``call`` against it and track load and latency."""
+        node = await self.select_node()
+        if node is None:
+            raise RuntimeError("No nodes available for routing.")
+        async with self.track(node):
+            return await call(node)
+
     async def update_node_metrics(self, node_id: str, success: bool, latency_ms: float):
         """Update the metrics for a specific node."""
         async with self._lock:
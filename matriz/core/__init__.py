@@ -25,11 +25,13 @@ from .async_orchestrator import AsyncCognitiveOrchestrator  # Export async orche
 from .memory_system import MemorySystem  # Export memory system
 from .node_interface import (  # (relative imports in __init__.py are idiomatic)
     CognitiveNode,
+    CompactMatrizNode,
     NodeLink,
     NodeProvenance,
     NodeReflection,
     NodeState,
     NodeTrigger,
+    ProcessingHistory,
 )
 from .orchestrator import (  # (relative imports in __init__.py are idiomatic)
     CognitiveOrchestrator,
@@ -40,6 +42,7 @@ __all__ = [
     "AsyncCognitiveOrchestrator",
     "CognitiveNode",
     "CognitiveOrchestrator",
+    "CompactMatrizNode",
     "ExecutionTrace",
     "MemorySystem",
     "NodeLink",
@@ -47,6 +50,7 @@ __all__ = [
     "NodeReflection",
     "NodeState",
     "NodeTrigger",
+    "ProcessingHistory",
 ]
 
 __version__ = "1.0.0"
@@ -12,12 +12,28 @@ The MATRIZ format ensures:
 - Causal chain reconstruction for interpretability
 """
 
+import sys
 import time
 import uuid
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from typing import Any, Optional, Union
 
+# Default number of MATRIZ nodes retained per cognitive node
+DEFAULT_HISTORY_LIMIT = 1000
+
+_SCHEMA_REF = "lukhas://schemas/matriz_node_v1.json"
+_DEFAULT_CONSENT_SCOPES = ("cognitive_processing",)
+_interned_tuples: dict[tuple, tuple] = {}
+
+
+def _intern_tuple(values: Iterable[str]) -> tuple:
+    """Return a shared tuple instance for equal sequences of strings."""
+    key = tuple(sys.intern(value) if isinstance(value, str) else value for value in values)
+    return _interned_tuples.setdefault(key, key)
+
 
 @dataclass
 class NodeState:
@@ -83,6 +99,163 @@ class NodeProvenance:
     colony: Optional[dict] = None  # Colony/swarm metadata
 
 
+class CompactMatrizNode:
+    """
+    Compact in-memory record of an emitted MATRIZ node.
+
+    Provenance strings and capability/consent tuples are interned and shared
+    across records; the matriz_node_v1 dict is only rendered on demand.
+    """
+
+    __slots__ = (
+        "additional_data",
+        "capabilities",
+        "consent_scopes",
+        "created_ts",
+        "evolves_to",
+        "id",
+        "links",
+        "producer",
+        "reflections",
+        "state",
+        "tenant",
+        "trace_id",
+        "triggers",
+        "type",
+    )
+
+    def __init__(self, node: dict[str, Any]):
+        provenance = node["provenance"]
+        self.id = node["id"]
+        self.type = sys.intern(node["type"])
+        self.state = node["state"]
+        self.created_ts = node["timestamps"]["created_ts"]
+        self.producer = sys.intern(provenance["producer"])
+        self.capabilities = _intern_tuple(provenance["capabilities"])
+        self.tenant = sys.intern(provenance["tenant"])
+        self.trace_id = provenance["trace_id"]
+        self.consent_scopes = _intern_tuple(provenance["consent_scopes"])
+        self.links = node["links"]
+        self.evolves_to = node["evolves_to"]
+        self.triggers = node["triggers"]
+        self.reflections = node["reflections"]
+        self.additional_data = node.get("additional_data")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Render the record in matriz_node_v1 format."""
+        matriz_node = {
+            "version": 1,
+            "id": self.id,
+            "type": self.type,
+            "state": self.state,
+            "timestamps": {"created_ts": self.created_ts},
+            "provenance": {
+                "producer": self.producer,
+                "capabilities": list(self.capabilities),
+                "tenant": self.tenant,
+                "trace_id": self.trace_id,
+                "consent_scopes": list(self.consent_scopes),
+            },
+            "links": self.links,
+            "evolves_to": self.evolves_to,
+            "triggers": self.triggers,
+            "reflections": self.reflections,
+            "schema_ref": _SCHEMA_REF,
+        }
+        if self.additional_data:
+            matriz_node["additional_data"] = self.additional_data
+        return matriz_node
+
+
+class ProcessingHistory(Sequence):
+    """
+    Bounded ring buffer of MATRIZ nodes emitted by a cognitive node.
+
+    Oldest entries are dropped once ``maxlen`` is reached. In compact mode
+    entries are stored as CompactMatrizNode records and rendered back to
+    matriz_node_v1 dicts when read.
+    """
+
+    def __init__(self, maxlen: Optional[int] = DEFAULT_HISTORY_LIMIT, compact: bool = False):
+        """
+        Initialize the history buffer.
+
+        Args:
+            maxlen: Maximum retained entries (None for unbounded)
+            compact: Store entries as CompactMatrizNode records
+        """
+        self._entries: deque = deque(maxlen=maxlen)
+        self.compact = compact
+        self.total_recorded = 0
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        return self._entries.maxlen
+
+    def append(self, node: dict[str, Any]) -> None:
+        """Record an emitted MATRIZ node, evicting the oldest when full."""
+        self._entries.append(CompactMatrizNode(node) if self.compact else node)
+        self.total_recorded += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if not self.compact:
+            return iter(self._entries)
+        return (entry.to_dict() if isinstance(entry, CompactMatrizNode) else entry for entry in self._entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._render(self._entries[i]) for i in range(*index.indices(len(self._entries)))]
+        return self._render(self._entries[index])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ProcessingHistory, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ProcessingHistory(len={len(self)}, maxlen={self.maxlen}, compact={self.compact})"
+
+    @staticmethod
+    def _render(entry: Any) -> dict[str, Any]:
+        return entry.to_dict() if isinstance(entry, CompactMatrizNode) else entry
+
+
+class ProcessingTraceView(Sequence):
+    """Read-only live view over a ProcessingHistory."""
+
+    __slots__ = ("_history",)
+
+    def __init__(self, history: ProcessingHistory):
+        self._history = history
+
+    def __len__(self) -> int:
+        return len(self._history)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self._history)
+
+    def __getitem__(self, index):
+        return self._history[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ProcessingTraceView, ProcessingHistory, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ProcessingTraceView(len={len(self)})"
+
+
 class CognitiveNode(ABC):
     """
     Abstract base class for all MATRIZ cognitive nodes.
@@ -96,7 +269,14 @@ class CognitiveNode(ABC):
     The MATRIZ format ensures complete auditability and governance.
     """
 
-    def __init__(self, node_name: str, capabilities: list[str], tenant: str = "default"):
+    def __init__(
+        self,
+        node_name: str,
+        capabilities: list[str],
+        tenant: str = "default",
+        history_limit: Optional[int] = DEFAULT_HISTORY_LIMIT,
+        compact_history: bool = False,
+    ):
         """
         Initialize the cognitive node.
 
@@ -104,11 +284,15 @@ class CognitiveNode(ABC):
             node_name: Unique identifier for this node type
             capabilities: List of capabilities this node provides
             tenant: Tenant identifier for multi-tenancy
+            history_limit: Number of MATRIZ nodes retained for tracing
+                (None keeps every node)
+            compact_history: Store history as compact records rendered
+                to matriz_node_v1 dicts on demand
         """
         self.node_name = node_name
         self.capabilities = capabilities
         self.tenant = tenant
-        self.processing_history: list[dict] = []
+        self.processing_history = ProcessingHistory(maxlen=history_limit, compact=compact_history)
 
     @abstractmethod
     def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
@@ -150,14 +334,15 @@ class CognitiveNode(ABC):
             True if valid, False otherwise
         """
 
-    def get_trace(self) -> list[dict]:
+    def get_trace(self) -> ProcessingTraceView:
         """
-        Return the complete processing trace for interpretability.
+        Return the retained processing trace for interpretability.
 
         Returns:
-            List of all MATRIZ nodes created by this processor
+            Read-only view of the MATRIZ nodes retained by this processor
+            (oldest first); use list() for a detached snapshot
         """
-        return self.processing_history.copy()
+        return ProcessingTraceView(self.processing_history)
 
     def create_matriz_node(
         self,
@@ -244,7 +429,7 @@ class CognitiveNode(ABC):
             capabilities=self.capabilities,
             tenant=self.tenant,
             trace_id=trace_id or str(uuid.uuid4()),
-            consent_scopes=["cognitive_processing"],  # Default scope
+            consent_scopes=list(_DEFAULT_CONSENT_SCOPES),  # Default scope
         )
 
         # Build the MATRIZ node
@@ -273,13 +458,13 @@ class CognitiveNode(ABC):
                 refl.__dict__ if isinstance(refl, NodeReflection) else refl
                 for refl in (reflections or [])
             ],
-            "schema_ref": "lukhas://schemas/matriz_node_v1.json",
+            "schema_ref": _SCHEMA_REF,
         }
 
         if additional_data:
             matriz_node["additional_data"] = additional_data
 
-        # Store in processing history
+        # Store in bounded processing history
         self.processing_history.append(matriz_node)
 
         return matriz_node
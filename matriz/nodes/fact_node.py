@@ -17,9 +17,11 @@ All responses include confidence scoring and complete provenance tracking.
 import difflib
 import re
 import time
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Optional, Union
 
 from matriz.core.node_interface import CognitiveNode, NodeState, NodeTrigger
+from matriz.nodes.knowledge_index import KnowledgeIndex, load_knowledge_base
 
 
 class FactNode(CognitiveNode):
@@ -42,12 +44,18 @@ class FactNode(CognitiveNode):
     - Common general knowledge
     """
 
-    def __init__(self, tenant: str = "default"):
+    def __init__(
+        self,
+        tenant: str = "default",
+        knowledge_base_path: Optional[Union[str, Path]] = None,
+    ):
         """
         Initialize the factual knowledge node.
 
         Args:
             tenant: Tenant identifier for multi-tenancy
+            knowledge_base_path: Optional JSON/JSONL knowledge base merged
+                over the built-in facts
         """
         super().__init__(
             node_name="matriz_fact_node",
@@ -62,8 +70,11 @@ class FactNode(CognitiveNode):
             tenant=tenant,
         )
 
-        # Initialize knowledge base
+        # Initialize knowledge base and its candidate index
         self.knowledge_base = self._build_knowledge_base()
+        self._kb_index = KnowledgeIndex(self.knowledge_base)
+        if knowledge_base_path is not None:
+            self.load_knowledge_base(knowledge_base_path)
 
         # Fuzzy matching threshold (0.0-1.0)
         self.match_threshold = 0.4
@@ -336,6 +347,31 @@ class FactNode(CognitiveNode):
         except Exception:
             return False
 
+    def load_knowledge_base(self, path: Union[str, Path], replace: bool = False) -> int:
+        """
+        Load facts from disk and rebuild the knowledge base index.
+
+        Args:
+            path: JSON or JSONL knowledge base file
+            replace: Replace the current knowledge base instead of merging
+
+        Returns:
+            Number of facts loaded from the file
+        """
+        loaded = load_knowledge_base(path)
+        if replace:
+            self.knowledge_base = loaded
+        else:
+            self.knowledge_base.update(loaded)
+        self._kb_index = KnowledgeIndex(self.knowledge_base)
+        return len(loaded)
+
+    def _knowledge_index(self) -> KnowledgeIndex:
+        """Return the knowledge base index, rebuilding it if the KB was mutated directly."""
+        if len(self._kb_index) != len(self.knowledge_base):
+            self._kb_index = KnowledgeIndex(self.knowledge_base)
+        return self._kb_index
+
     def _build_knowledge_base(self) -> dict[str, dict]:
         """
         Build the comprehensive factual knowledge base.
@@ -560,6 +596,9 @@ class FactNode(CognitiveNode):
         """
         Search knowledge base for answers using fuzzy matching.
 
+        Candidates are shortlisted through the knowledge base index (exact
+        hash, keyword postings, character n-grams) and only those are scored.
+
         Args:
             question: Normalized question to search for
 
@@ -567,14 +606,18 @@ class FactNode(CognitiveNode):
             List of matching results sorted by confidence
         """
         results = []
+        question_words = set(question.split())
+
+        for kb_question in self._knowledge_index().candidates(question):
+            kb_data = self.knowledge_base.get(kb_question)
+            if kb_data is None:
+                continue
 
-        for kb_question, kb_data in self.knowledge_base.items():
             # Calculate similarity scores
             exact_match = question == kb_question
             similarity_score = difflib.SequenceMatcher(None, question, kb_question).ratio()
 
             # Check keyword matches
-            question_words = set(question.split())
             keyword_matches = sum(
                 1
                 for keyword in kb_data["keywords"]
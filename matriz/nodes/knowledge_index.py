@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+MATRIZ Knowledge Base Index
+
+Precomputed lookup structures shared by FactNode and ValidatorNode so that
+question matching no longer scores every knowledge-base entry:
+- Exact-match hash of normalized questions
+- Keyword inverted index (keyword tokens -> entry ordinals)
+- Character n-gram inverted index for fuzzy candidate generation
+
+Only the shortlisted candidates are scored with difflib.SequenceMatcher by
+the nodes. Knowledge bases small enough to score exhaustively are returned
+in full, so results for the built-in knowledge bases are unchanged.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import re
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any, Optional, Union
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def load_knowledge_base(path: Union[str, Path]) -> dict[str, dict]:
+    """
+    Load a factual knowledge base from disk.
+
+    Supported formats:
+    - ``.json``: either a mapping of question -> entry, or a list of entries
+    - ``.jsonl``: one entry per line
+
+    List/line entries must carry a ``question`` field. Every entry needs an
+    ``answer``; ``category`` (default ``"general"``), ``certainty`` (default
+    ``0.9``) and ``keywords`` (default ``[]``) are optional.
+
+    Args:
+        path: Path to the knowledge base file
+
+    Returns:
+        Dict mapping lowercased questions to entry metadata
+
+    Raises:
+        ValueError: If the file contents do not describe a knowledge base
+    """
+    path = Path(path)
+
+    if path.suffix == ".jsonl":
+        with path.open(encoding="utf-8") as handle:
+            raw: Any = [json.loads(line) for line in handle if line.strip()]
+    else:
+        with path.open(encoding="utf-8") as handle:
+            raw = json.load(handle)
+
+    if isinstance(raw, Mapping):
+        items: Iterable[tuple[Any, Any]] = raw.items()
+    elif isinstance(raw, list):
+        items = ((entry.get("question") if isinstance(entry, Mapping) else None, entry) for entry in raw)
+    else:
+        raise ValueError(f"Unsupported knowledge base format in {path}")
+
+    knowledge: dict[str, dict] = {}
+    for question, entry in items:
+        if not question or not isinstance(entry, Mapping) or "answer" not in entry:
+            raise ValueError(f"Invalid knowledge base entry in {path}: {question!r}")
+        knowledge[str(question).lower().strip()] = {
+            "answer": entry["answer"],
+            "category": entry.get("category", "general"),
+            "certainty": float(entry.get("certainty", 0.9)),
+            "keywords": list(entry.get("keywords", [])),
+        }
+
+    return knowledge
+
+
+class KnowledgeIndex:
+    """
+    Candidate-generation index over a question -> entry knowledge base.
+
+    Entries are addressed by insertion ordinal so candidate lists can be
+    returned in the knowledge base's original iteration order.
+    """
+
+    def __init__(
+        self,
+        knowledge: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        ngram_size: int = 3,
+        max_candidates: int = 64,
+        max_posting_ratio: float = 0.05,
+        keyword_weight: int = 3,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            knowledge: Optional knowledge base to index immediately
+            ngram_size: Character n-gram length used for fuzzy candidates
+            max_candidates: Shortlist size; knowledge bases at or below this
+                size are always returned in full
+            max_posting_ratio: Postings covering more than this fraction of
+                the knowledge base are treated as stop-grams and skipped
+            keyword_weight: Score contribution of a keyword hit relative to
+                a single shared n-gram
+        """
+        self.ngram_size = ngram_size
+        self.max_candidates = max_candidates
+        self.max_posting_ratio = max_posting_ratio
+        self.keyword_weight = keyword_weight
+
+        self._questions: list[str] = []
+        self._ordinals: dict[str, int] = {}
+        self._keyword_postings: dict[str, list[int]] = {}
+        self._ngram_postings: dict[str, list[int]] = {}
+
+        if knowledge:
+            for question, entry in knowledge.items():
+                self.add(question, entry.get("keywords", ()))
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def __contains__(self, question: object) -> bool:
+        return question in self._ordinals
+
+    def add(self, question: str, keywords: Iterable[str] = ()) -> None:
+        """Index a question and its keywords (re-adding a question is a no-op)."""
+        if question in self._ordinals:
+            return
+
+        ordinal = len(self._questions)
+        self._questions.append(question)
+        self._ordinals[question] = ordinal
+
+        for gram in self._ngrams(question):
+            self._ngram_postings.setdefault(gram, []).append(ordinal)
+
+        tokens = {token for keyword in keywords for token in _WORD_RE.findall(str(keyword).lower())}
+        for token in tokens:
+            self._keyword_postings.setdefault(token, []).append(ordinal)
+
+    def exact(self, question: str) -> Optional[str]:
+        """Return the indexed question equal to ``question``, if any."""
+        return question if question in self._ordinals else None
+
+    def candidates(self, question: str) -> list[str]:
+        """
+        Shortlist indexed questions that may match ``question``.
+
+        Args:
+            question: Normalized question text
+
+        Returns:
+            Candidate questions in knowledge-base insertion order
+        """
+        if len(self._questions) <= self.max_candidates:
+            return list(self._questions)
+
+        max_postings = max(self.max_candidates, int(len(self._questions) * self.max_posting_ratio))
+        scores: Counter[int] = Counter()
+
+        for gram in self._ngrams(question):
+            postings = self._ngram_postings.get(gram)
+            if postings and len(postings) <= max_postings:
+                scores.update(postings)
+
+        for word in set(_WORD_RE.findall(question)):
+            postings = self._keyword_postings.get(word)
+            if postings and len(postings) <= max_postings:
+                for ordinal in postings:
+                    scores[ordinal] += self.keyword_weight
+
+        shortlist = {
+            ordinal for ordinal, _ in heapq.nlargest(self.max_candidates, scores.items(), key=lambda item: item[1])
+        }
+
+        exact_ordinal = self._ordinals.get(question)
+        if exact_ordinal is not None:
+            shortlist.add(exact_ordinal)
+
+        return [self._questions[ordinal] for ordinal in sorted(shortlist)]
+
+    def _ngrams(self, text: str) -> set[str]:
+        """Character n-grams of ``text`` padded with a single space."""
+        padded = f" {text} "
+        size = self.ngram_size
+        if len(padded) <= size:
+            return {padded}
+        return {padded[i : i + size] for i in range(len(padded) - size + 1)}
@@ -25,6 +25,7 @@ import time
 from typing import Any
 
 from matriz.core.node_interface import CognitiveNode, NodeState, NodeTrigger
+from matriz.nodes.knowledge_index import KnowledgeIndex
 
 
 class ValidatorNode(CognitiveNode):
@@ -97,6 +98,7 @@ class ValidatorNode(CognitiveNode):
 
         # Known facts for verification
         self.known_facts = self._build_validation_knowledge_base()
+        self._facts_index = KnowledgeIndex(self.known_facts)
 
     def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -995,8 +997,14 @@ class ValidatorNode(CognitiveNode):
             question_lower = question.lower().strip()
             answer_lower = answer.lower().strip()
 
-            # Check against known facts
-            for known_q, known_data in self.known_facts.items():
+            # Check against indexed candidates (in known-fact order)
+            if len(self._facts_index) != len(self.known_facts):
+                self._facts_index = KnowledgeIndex(self.known_facts)
+
+            for known_q in self._facts_index.candidates(question_lower):
+                known_data = self.known_facts.get(known_q)
+                if known_data is None:
+                    continue
                 if self._questions_similar(question_lower, known_q):
                     known_answer = known_data["answer"].lower()
                     if self._answers_consistent(answer_lower, known_answer):
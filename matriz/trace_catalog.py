@@ -0,0 +1,267 @@
+"""
+MATRIZ Trace Catalog
+
+Incremental catalog of trace JSON files used by the traces router so that
+id lookups and paged listings do not re-open and parse every trace file.
+
+Each catalog covers one trace directory and maintains:
+- an id → file map (first file in scan order wins, matching the router)
+- a sorted (mtime desc, name asc) index for paging
+- per-file (mtime_ns, size) signatures so only changed files are re-parsed
+
+A rescan is skipped while the directory mtime is unchanged and outside the
+filesystem-timestamp "racy" window, and forced once the catalog is older
+than ``max_age`` seconds so in-place rewrites are picked up. Catalogs can
+optionally be persisted to a small SQLite side file (``db_path``) and
+refreshed from a background thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Directory mtimes closer than this to the last scan start may hide new files
+RACY_WINDOW_SECONDS = 1.0
+DEFAULT_MAX_AGE_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class TraceCatalogEntry:
+    """Catalogued metadata for one trace file."""
+
+    name: str
+    path: Path
+    trace_id: Optional[str]
+    mtime: float
+    mtime_ns: int
+    size: int
+
+    @property
+    def ident(self) -> str:
+        """Trace id when the file is a valid trace, otherwise the filename stem."""
+        return self.trace_id if self.trace_id is not None else self.path.stem
+
+
+class TraceCatalog:
+    """Incrementally maintained index over the trace files in one directory."""
+
+    def __init__(
+        self,
+        root: Path,
+        iter_files: Callable[[Path], Iterable[Path]],
+        read_trace_id: Callable[[Path], Optional[str]],
+        db_path: Optional[Path] = None,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        """
+        Initialize the catalog.
+
+        Args:
+            root: Trace directory covered by this catalog
+            iter_files: Path-safe iterator over trace files under a root
+            read_trace_id: Returns the validated trace_id of a file, or None
+            db_path: Optional SQLite side file used to persist the catalog
+            max_age: Seconds after which a rescan is forced
+        """
+        self.root = root
+        self.max_age = max_age
+        self._iter_files = iter_files
+        self._read_trace_id = read_trace_id
+        self._db_path = db_path
+        self._root_key = str(root.resolve())
+
+        self._lock = threading.RLock()
+        self._entries: dict[str, TraceCatalogEntry] = {}
+        self._by_id: dict[str, TraceCatalogEntry] = {}
+        self._sorted: list[TraceCatalogEntry] = []
+        self._dir_mtime_ns: Optional[int] = None
+        self._scanned_at = 0.0
+
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop = threading.Event()
+
+        if db_path is not None:
+            self._load_side_file()
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Bring the catalog up to date with the directory.
+
+        Args:
+            force: Rescan even if the directory looks unchanged
+
+        Returns:
+            True if a rescan was performed
+        """
+        with self._lock:
+            try:
+                dir_stat = self.root.stat()
+            except OSError:
+                self._replace({})
+                return True
+
+            now = time.time()
+            if (
+                not force
+                and dir_stat.st_mtime_ns == self._dir_mtime_ns
+                and self._scanned_at - dir_stat.st_mtime > RACY_WINDOW_SECONDS
+                and now - self._scanned_at < self.max_age
+            ):
+                return False
+
+            entries: dict[str, TraceCatalogEntry] = {}
+            for path in self._iter_files(self.root):
+                try:
+                    file_stat = path.stat()
+                except OSError:
+                    continue
+                previous = self._entries.get(path.name)
+                if (
+                    previous is not None
+                    and previous.mtime_ns == file_stat.st_mtime_ns
+                    and previous.size == file_stat.st_size
+                ):
+                    entries[path.name] = previous
+                    continue
+                entries[path.name] = TraceCatalogEntry(
+                    name=path.name,
+                    path=path,
+                    trace_id=self._read_trace_id(path),
+                    mtime=file_stat.st_mtime,
+                    mtime_ns=file_stat.st_mtime_ns,
+                    size=file_stat.st_size,
+                )
+
+            changed = entries != self._entries
+            self._replace(entries)
+            self._dir_mtime_ns = dir_stat.st_mtime_ns
+            self._scanned_at = now
+
+            if changed and self._db_path is not None:
+                self._save_side_file()
+            return True
+
+    def lookup(self, trace_id: str) -> Optional[TraceCatalogEntry]:
+        """Return the catalogued file holding ``trace_id``, if any (O(1))."""
+        return self._by_id.get(trace_id)
+
+    def get(self, name: str) -> Optional[TraceCatalogEntry]:
+        """Return the catalogued entry for a filename, if any."""
+        return self._entries.get(name)
+
+    def is_current(self, entry: TraceCatalogEntry) -> bool:
+        """Return True if the file behind ``entry`` is unchanged on disk."""
+        try:
+            file_stat = entry.path.stat()
+        except OSError:
+            return False
+        return file_stat.st_mtime_ns == entry.mtime_ns and file_stat.st_size == entry.size
+
+    def entries(self) -> list[TraceCatalogEntry]:
+        """Entries ordered by mtime desc, then filename asc."""
+        return self._sorted
+
+    def start_background_refresh(self, interval: float = 1.0) -> None:
+        """Refresh the catalog from a daemon thread every ``interval`` seconds."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+
+        self._refresh_stop.clear()
+
+        def _run() -> None:
+            while not self._refresh_stop.wait(interval):
+                try:
+                    self.refresh(force=True)
+                except Exception as e:
+                    logger.warning(f"Trace catalog refresh failed for {self.root}: {e}")
+
+        self._refresh_thread = threading.Thread(
+            target=_run, name=f"trace-catalog:{self.root.name}", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self) -> None:
+        """Stop the background refresh thread, if running."""
+        self._refresh_stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=5.0)
+            self._refresh_thread = None
+
+    def _replace(self, entries: dict[str, TraceCatalogEntry]) -> None:
+        by_id: dict[str, TraceCatalogEntry] = {}
+        for entry in entries.values():
+            if entry.trace_id is not None:
+                by_id.setdefault(entry.trace_id, entry)
+        self._entries = entries
+        self._by_id = by_id
+        self._sorted = sorted(entries.values(), key=lambda e: (-e.mtime, e.name))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self._db_path))
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS trace_catalog (
+                root TEXT NOT NULL,
+                name TEXT NOT NULL,
+                trace_id TEXT,
+                mtime REAL NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                PRIMARY KEY (root, name)
+            )
+            """
+        )
+        return conn
+
+    def _load_side_file(self) -> None:
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT name, trace_id, mtime, mtime_ns, size FROM trace_catalog WHERE root = ?",
+                    (self._root_key,),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Ignoring unreadable trace catalog {self._db_path}: {e}")
+            return
+
+        self._replace(
+            {
+                name: TraceCatalogEntry(
+                    name=name,
+                    path=self.root / name,
+                    trace_id=trace_id,
+                    mtime=mtime,
+                    mtime_ns=mtime_ns,
+                    size=size,
+                )
+                for name, trace_id, mtime, mtime_ns, size in rows
+            }
+        )
+
+    def _save_side_file(self) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM trace_catalog WHERE root = ?", (self._root_key,))
+                conn.executemany(
+                    "INSERT INTO trace_catalog (root, name, trace_id, mtime, mtime_ns, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (self._root_key, e.name, e.trace_id, e.mtime, e.mtime_ns, e.size)
+                        for e in self._entries.values()
+                    ],
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to persist trace catalog {self._db_path}: {e}")
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import json
 import logging
 import os
 import re
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Literal, TypedDict, Union
 
 from fastapi import APIRouter, HTTPException, Query, Response, status
+from matriz.trace_catalog import TraceCatalog, TraceCatalogEntry
 
 """
 MATRIZ Traces Router
@@ -20,11 +24,34 @@ Environment:
   source for traces. When unset, the router checks live traces under
   `reports/matriz/traces` first, then falls back to goldens under
   `tests/golden/tier1`.
+- `MATRIZ_TRACE_CATALOG_DB` (optional): SQLite side file persisting the
+  trace catalog across restarts.
+- `MATRIZ_TRACE_CATALOG_REFRESH_SECONDS` (optional, default 1.0): interval of
+  the background catalog refresh started with the app; 0 disables it.
 """
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/traces", tags=["traces"])
+@asynccontextmanager
+async def _catalog_refresh_lifespan(_: Any) -> AsyncIterator[None]:
+    """Keep each trace root's catalog fresh from a background thread while the app runs."""
+    interval = float(os.getenv("MATRIZ_TRACE_CATALOG_REFRESH_SECONDS", "1.0") or 0)
+    roots: list[Path] = []
+    if interval > 0:
+        try:
+            roots = _iter_trace_dirs()
+        except HTTPException:
+            logger.warning("Invalid MATRIZ_TRACES_DIR; trace catalogs refresh on request only")
+    for root in roots:
+        _catalog_for(root).start_background_refresh(interval)
+
+    yield
+
+    for catalog in _catalogs.values():
+        catalog.stop_background_refresh()
+
+
+router = APIRouter(prefix="/traces", tags=["traces"], lifespan=_catalog_refresh_lifespan)
 
 # Base paths for trace data
 TRACES_BASE_PATH = Path("reports/matriz/traces")
@@ -88,23 +115,6 @@ def _iter_json_files(root: Path) -> Iterable[Path]:
             break
 
 
-def _sorted_files_in(root: Path) -> list[Path]:
-    files = [(p, p.stat().st_mtime) for p in _iter_json_files(root)]
-    # Latest first by mtime desc, tiebreak by filename asc
-    files.sort(key=lambda t: (-t[1], t[0].name))
-    return [p for p, _ in files]
-
-
-def _sorted_all_files() -> list[Path]:
-    files: list[Path] = []
-    for root in _iter_trace_dirs():
-        files.extend(_iter_json_files(root))
-    # Sort across all for list endpoint; not used for latest selection
-    items = [(p, p.stat().st_mtime) for p in files]
-    items.sort(key=lambda t: (-t[1], t[0].name))
-    return [p for p, _ in items]
-
-
 def _classify_root(p: Path) -> str:
     """Classify a path as env/live/golden/unknown based on root containment."""
     env_dir = os.getenv("MATRIZ_TRACES_DIR", "").strip()
@@ -122,6 +132,48 @@ def _classify_root(p: Path) -> str:
     return "unknown"
 
 
+_catalogs: dict[str, TraceCatalog] = {}
+
+
+def _read_trace_id(p: Path) -> str | None:
+    """Return the validated trace_id of a file, or None if it is not a valid trace."""
+    try:
+        data = load_trace_file(p)
+    except HTTPException:
+        return None
+    return str(data["trace_id"]) if data and "trace_id" in data else None
+
+
+def _catalog_for(root: Path) -> TraceCatalog:
+    """Return the refreshed trace catalog for a root directory."""
+    key = str(root.resolve())
+    catalog = _catalogs.get(key)
+    if catalog is None:
+        db_path = os.getenv("MATRIZ_TRACE_CATALOG_DB", "").strip()
+        catalog = TraceCatalog(
+            root,
+            iter_files=_iter_json_files,
+            read_trace_id=_read_trace_id,
+            db_path=Path(db_path) if db_path else None,
+        )
+        _catalogs[key] = catalog
+    catalog.refresh()
+    return catalog
+
+
+def _lookup_cataloged(catalog: TraceCatalog, trace_id: str) -> TraceCatalogEntry | None:
+    """Resolve trace_id via the catalog, rescanning once if the entry is stale.
+
+    Misses are answered from the catalog as refreshed by ``_catalog_for``, so an
+    unknown id does not stat every trace file.
+    """
+    entry = catalog.lookup(trace_id)
+    if entry is None or catalog.is_current(entry):
+        return entry
+    catalog.refresh(force=True)
+    return catalog.lookup(trace_id)
+
+
 def load_trace_file(file_path: Path) -> dict[str, Any] | None:
     """Load and validate a trace JSON file."""
     try:
@@ -163,10 +215,10 @@ async def get_latest_trace() -> Response:
     try:
         # Determine prioritized search directories (ENV → LIVE → GOLD)
         for root in _iter_trace_dirs():
-            files = _sorted_files_in(root)
-            if not files:
+            entries = _catalog_for(root).entries()
+            if not entries:
                 continue
-            latest_file = files[0]
+            latest_file = entries[0].path
             trace_data = load_trace_file(latest_file)
             # Source hint when using goldens
             if root == GOLDEN_TRACES_PATH:
@@ -213,11 +265,12 @@ async def get_trace_by_id(trace_id: str) -> Response:
         # Build prioritized search set (ENV → LIVE → GOLD)
         dirs = _iter_trace_dirs()
 
-        # Pass 1: match by trace_id in JSON
+        # Pass 1: match by trace_id in JSON (catalog id → path map)
         for base in dirs:
-            for trace_file in _iter_json_files(base):
+            entry = _lookup_cataloged(_catalog_for(base), trace_id)
+            if entry is not None:
                 try:
-                    trace_data = load_trace_file(trace_file)
+                    trace_data = load_trace_file(entry.path)
                 except HTTPException:
                     continue
                 if str(trace_data.get("trace_id")) == str(trace_id):
@@ -279,44 +332,37 @@ async def list_traces(
     Return a paged, filtered list of traces with metadata.
     """
     try:
-        files = _sorted_all_files()
-        items: list[dict[str, Any]] = []
-
-        for p in files:
-            try:
-                size = p.stat().st_size
-                mtime = int(p.stat().st_mtime)
-            except OSError:
-                continue
-
-            src = _classify_root(p)
+        # Catalog entries are pre-sorted per root; merge them lazily across roots
+        sources: list[tuple[str, list[TraceCatalogEntry]]] = []
+        for root in _iter_trace_dirs():
+            src = _classify_root(root)
             if source and src != source:
                 continue
+            sources.append((src, _catalog_for(root).entries()))
 
-            # Best-effort id from JSON, fallback to filename stem if invalid JSON/too-large
-            try:
-                data = load_trace_file(p)
-                ident = str(data["trace_id"]) if data and "trace_id" in data else p.stem
-            except HTTPException:
-                ident = p.stem
-
-            if q:
-                ql = q.lower()
-                if ql not in (ident.lower() + " " + p.name.lower()):
-                    continue
-
-            items.append(
-                {
-                    "id": ident,
-                    "source": src,
-                    "size_bytes": size,
-                    "mtime": mtime,
-                    "path": str(p),
-                }
-            )
-
-        total = len(items)
-        slice_items = items[offset : offset + limit]
+        merged = heapq.merge(
+            *(zip(itertools.repeat(src), entries) for src, entries in sources),
+            key=lambda t: (-t[1].mtime, t[1].name),
+        )
+        if q:
+            ql = q.lower()
+            matched = [t for t in merged if ql in (t[1].ident.lower() + " " + t[1].name.lower())]
+            total = len(matched)
+            page = matched[offset : offset + limit]
+        else:
+            total = sum(len(entries) for _, entries in sources)
+            page = list(itertools.islice(merged, offset, offset + limit))
+
+        slice_items = [
+            {
+                "id": entry.ident,
+                "source": src,
+                "size_bytes": entry.size,
+                "mtime": int(entry.mtime),
+                "path": str(entry.path),
+            }
+            for src, entry in page
+        ]
         next_offset = offset + limit if (offset + limit) < total else None
 
         payload = {
@@ -0,0 +1,678 @@
+"""
+Columnar lineage graph store backing the FoldLineageTracker.
+
+The tracker's JSONL lineage log stays the append-only source of truth and
+doubles as this store's journal. On top of it the store keeps a compact
+snapshot of the graph the log describes:
+
+- fold keys interned to integer ids (``keys.json``)
+- per-fold drift and importance (float64) plus the journal offset and length
+  of the fold's latest state record
+- per-link source, target, strength, causation code and journal offset
+- forward and backward CSR adjacency (link ids grouped by source / target)
+
+Snapshot arrays are ``.npy`` files memory-mapped the first time the graph is
+queried, so constructing a tracker does no I/O. Journal records written after
+the snapshot are replayed into an in-memory overlay. Once the overlay passes
+``merge_threshold`` records it is merged into a new snapshot on a background
+thread. Full records (metadata, timestamps) are read back from the journal
+by offset only when a caller materializes them.
+
+Link ids are global and stable (snapshot links first, then overlay links in
+journal order), so merging never renumbers anything a caller holds.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MERGE_THRESHOLD = 50_000
+
+_CURRENT_FILE = "CURRENT"
+_NODE_COLUMNS = ("drift", "importance", "node_offset", "node_length")
+_EDGE_COLUMNS = ("src", "dst", "strength", "ctype", "edge_offset", "edge_length")
+_CSR_COLUMNS = ("fwd_indptr", "fwd_edges", "bwd_indptr", "bwd_edges", "first_out")
+# Overlay link tuple positions: (src, dst, strength, ctype, offset, length, record)
+_OVERLAY_COLUMNS = {"src": 0, "dst": 1, "strength": 2, "ctype": 3, "edge_offset": 4, "edge_length": 5}
+_COLUMN_DTYPES = {
+    "src": np.int64,
+    "dst": np.int64,
+    "strength": np.float64,
+    "ctype": np.int8,
+    "edge_offset": np.int64,
+    "edge_length": np.int64,
+}
+_EMPTY_IDS = np.empty(0, dtype=np.int64)
+
+
+def _id_dtype(count: int) -> type:
+    return np.int32 if count < 2**31 else np.int64
+
+
+def _load_array(path: Path) -> np.ndarray:
+    try:
+        return np.load(path, mmap_mode="r")
+    except ValueError:
+        # Zero-length arrays cannot be memory-mapped
+        return np.load(path)
+
+
+def _build_csr(keys: np.ndarray, num_nodes: int) -> tuple[np.ndarray, np.ndarray]:
+    """Group edge ids by key; edges keep their id order within a group."""
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=num_nodes), out=indptr[1:])
+    edges = np.argsort(keys, kind="stable").astype(_id_dtype(len(keys)))
+    return indptr, edges
+
+
+class LineageGraphStore:
+    """Memory-mapped lineage graph snapshot plus an in-memory journal overlay."""
+
+    def __init__(
+        self,
+        journal_path: Path,
+        causation_types: Sequence[str],
+        merge_threshold: int = DEFAULT_MERGE_THRESHOLD,
+        background_merge: bool = True,
+    ):
+        """
+        Initialize the store (nothing is read until the graph is first used).
+
+        Args:
+            journal_path: The lineage JSONL log
+            causation_types: Causation type values; a link's code is its index
+            merge_threshold: Overlay records that trigger a snapshot merge
+            background_merge: Merge on a daemon thread instead of inline
+        """
+        self.journal_path = Path(journal_path)
+        self.snapshot_root = self.journal_path.with_name(self.journal_path.name + ".graph")
+        self.merge_threshold = merge_threshold
+        self.background_merge = background_merge
+        self.causation_types = list(causation_types)
+        self._type_codes = {value: code for code, value in enumerate(self.causation_types)}
+
+        self._lock = threading.RLock()
+        self._opened = False
+        self._merge_thread: Optional[threading.Thread] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._keys: list[str] = []
+        self._key_ids: dict[str, int] = {}
+        self._base: dict[str, np.ndarray] = {}
+        self._base_nodes = 0
+        self._base_edges = 0
+        self.snapshot_offset = 0  # Journal bytes covered by the snapshot
+        self._journal_end = 0
+        self._needs_newline = False
+
+        self._ov_nodes: dict[int, tuple[dict[str, Any], int, int]] = {}  # id -> (record, offset, length)
+        self._ov_edges: list[tuple[int, int, float, int, int, int, dict[str, Any]]] = []
+        self._ov_out: dict[int, list[int]] = {}
+        self._ov_in: dict[int, list[int]] = {}
+        self._ov_first_out: dict[int, int] = {}
+        self._ov_column_cache: dict[str, tuple[int, np.ndarray]] = {}
+
+    # Lifecycle
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened
+
+    def open(self) -> None:
+        """Map the snapshot and replay the journal tail (idempotent)."""
+        with self._lock:
+            if self._opened:
+                return
+            self._reset()
+            self._load_snapshot()
+            self._replay_journal()
+            self._opened = True
+        self._maybe_merge()
+
+    def close(self) -> None:
+        """Wait for a running merge."""
+        thread = self._merge_thread
+        if thread is not None:
+            thread.join()
+
+    def _ensure_open(self) -> None:
+        if not self._opened:
+            self.open()
+
+    def _load_snapshot(self) -> None:
+        current = self.snapshot_root / _CURRENT_FILE
+        if not current.exists():
+            return
+        try:
+            snapshot_dir = self.snapshot_root / current.read_text(encoding="utf-8").strip()
+            manifest = json.loads((snapshot_dir / "manifest.json").read_text(encoding="utf-8"))
+            keys = json.loads((snapshot_dir / "keys.json").read_text(encoding="utf-8"))
+            arrays = {
+                name: _load_array(snapshot_dir / f"{name}.npy")
+                for name in _NODE_COLUMNS + _EDGE_COLUMNS + _CSR_COLUMNS
+            }
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable lineage snapshot in {self.snapshot_root}: {e}")
+            return
+
+        journal_size = self.journal_path.stat().st_size if self.journal_path.exists() else 0
+        if manifest["journal_offset"] > journal_size:
+            logger.warning(f"Lineage snapshot is ahead of {self.journal_path}; rebuilding from the journal")
+            return
+
+        self._keys = keys
+        self._key_ids = {key: node_id for node_id, key in enumerate(keys)}
+        self._base = arrays
+        self._base_nodes = manifest["num_nodes"]
+        self._base_edges = manifest["num_edges"]
+        self.snapshot_offset = manifest["journal_offset"]
+
+    def _replay_journal(self) -> None:
+        offset = self.snapshot_offset
+        if self.journal_path.exists():
+            with open(self.journal_path, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Torn final write; the next append starts a fresh line
+                        self._needs_newline = True
+                        offset += len(line)
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        record = None
+                    if isinstance(record, dict):
+                        self._apply(record, offset, len(line))
+                    offset += len(line)
+        self._journal_end = offset
+
+    # Writes
+
+    def append(self, record: dict[str, Any]) -> None:
+        """
+        Append a record to the journal and apply it to the graph.
+
+        Raises:
+            OSError: If the journal cannot be written; the record is not applied
+        """
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        with self._lock:
+            self._ensure_open()
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, "ab") as f:
+                f.seek(0, os.SEEK_END)
+                if self._needs_newline:
+                    f.write(b"\n")
+                offset = f.tell()
+                f.write(line)
+            self._needs_newline = False
+            self._journal_end = offset + len(line)
+            self._apply(record, offset, len(line))
+        self._maybe_merge()
+
+    def _intern(self, key: str) -> int:
+        node_id = self._key_ids.get(key)
+        if node_id is None:
+            node_id = len(self._keys)
+            self._keys.append(key)
+            self._key_ids[key] = node_id
+        return node_id
+
+    def _apply(self, record: dict[str, Any], offset: int, length: int) -> None:
+        event_type = record.get("event_type")
+        if event_type == "causal_link":
+            try:
+                source, target = record["source_fold_key"], record["target_fold_key"]
+                strength = float(record["strength"])
+                code = self._type_codes[record["causation_type"]]
+            except (KeyError, TypeError, ValueError):
+                return
+            src, dst = self._intern(source), self._intern(target)
+            edge_id = self._base_edges + len(self._ov_edges)
+            self._ov_edges.append((src, dst, strength, code, offset, length, record))
+            self._ov_out.setdefault(src, []).append(edge_id)
+            self._ov_in.setdefault(dst, []).append(edge_id)
+            if src not in self._ov_first_out and not self._base_first_out(src) >= 0:
+                self._ov_first_out[src] = edge_id
+        elif event_type == "fold_state":
+            try:
+                node_id = self._intern(record["fold_key"])
+                float(record["drift_score"]), float(record["importance_score"])
+            except (KeyError, TypeError, ValueError):
+                return
+            self._ov_nodes[node_id] = (record, offset, length)
+
+    # Merging
+
+    def _maybe_merge(self) -> None:
+        if len(self._ov_edges) + len(self._ov_nodes) < self.merge_threshold:
+            return
+        if not self.background_merge:
+            self.merge()
+            return
+        with self._lock:
+            if self._merge_thread is not None and self._merge_thread.is_alive():
+                return
+            self._merge_thread = threading.Thread(
+                target=self._merge_in_background, name="lineage-graph-merge", daemon=True
+            )
+            self._merge_thread.start()
+
+    def _merge_in_background(self) -> None:
+        try:
+            self.merge()
+        except Exception as e:
+            logger.error(f"Lineage graph merge failed for {self.journal_path}: {e}")
+
+    def merge(self) -> bool:
+        """
+        Fold the overlay into a new snapshot.
+
+        The new arrays are built and written without holding the lock;
+        records appended meanwhile stay in the overlay.
+
+        Returns:
+            True if a snapshot was written
+        """
+        with self._lock:
+            self._ensure_open()
+            if not self._ov_edges and not self._ov_nodes:
+                return False
+            keys = list(self._keys)
+            base, base_nodes, base_edges = self._base, self._base_nodes, self._base_edges
+            ov_edges = list(self._ov_edges)
+            ov_nodes = dict(self._ov_nodes)
+            journal_offset = self._journal_end
+
+        num_nodes, num_edges = len(keys), base_edges + len(ov_edges)
+        arrays = self._build_arrays(base, base_nodes, base_edges, num_nodes, ov_edges, ov_nodes)
+        name = f"snap-{journal_offset:016x}"
+        self._write_snapshot(name, keys, arrays, num_nodes, num_edges, journal_offset)
+
+        snapshot_dir = self.snapshot_root / name
+        mapped = {column: _load_array(snapshot_dir / f"{column}.npy") for column in arrays}
+        with self._lock:
+            self._base = mapped
+            self._base_nodes, self._base_edges = num_nodes, num_edges
+            self.snapshot_offset = journal_offset
+            del self._ov_edges[: len(ov_edges)]
+            for node_id, entry in ov_nodes.items():
+                if self._ov_nodes.get(node_id) is entry:
+                    del self._ov_nodes[node_id]
+            self._rebuild_overlay_adjacency()
+
+        for stale in self.snapshot_root.glob("snap-*"):
+            if stale.name != name:
+                shutil.rmtree(stale, ignore_errors=True)
+        logger.info(f"Merged lineage graph snapshot {name}: {num_nodes} folds, {num_edges} links")
+        return True
+
+    def _build_arrays(
+        self,
+        base: dict[str, np.ndarray],
+        base_nodes: int,
+        base_edges: int,
+        num_nodes: int,
+        ov_edges: list[tuple],
+        ov_nodes: dict[int, tuple[dict[str, Any], int, int]],
+    ) -> dict[str, np.ndarray]:
+        arrays: dict[str, np.ndarray] = {}
+
+        drift = np.full(num_nodes, np.nan)
+        importance = np.full(num_nodes, np.nan)
+        node_offset = np.full(num_nodes, -1, dtype=np.int64)
+        node_length = np.zeros(num_nodes, dtype=np.int64)
+        if base_nodes:
+            drift[:base_nodes] = base["drift"]
+            importance[:base_nodes] = base["importance"]
+            node_offset[:base_nodes] = base["node_offset"]
+            node_length[:base_nodes] = base["node_length"]
+        for node_id, (record, offset, length) in ov_nodes.items():
+            drift[node_id] = float(record["drift_score"])
+            importance[node_id] = float(record["importance_score"])
+            node_offset[node_id] = offset
+            node_length[node_id] = length
+        arrays.update(drift=drift, importance=importance, node_offset=node_offset, node_length=node_length)
+
+        id_dtype = _id_dtype(num_nodes)
+        for column, position in _OVERLAY_COLUMNS.items():
+            overlay = np.array([edge[position] for edge in ov_edges], dtype=_COLUMN_DTYPES[column])
+            combined = np.concatenate([np.asarray(base[column]), overlay]) if base_edges else overlay
+            if column in ("src", "dst"):
+                combined = combined.astype(id_dtype)
+            arrays[column] = combined
+
+        arrays["fwd_indptr"], arrays["fwd_edges"] = _build_csr(arrays["src"], num_nodes)
+        arrays["bwd_indptr"], arrays["bwd_edges"] = _build_csr(arrays["dst"], num_nodes)
+
+        first_out = np.full(num_nodes, -1, dtype=np.int64)
+        has_out = np.diff(arrays["fwd_indptr"]) > 0
+        first_out[has_out] = arrays["fwd_edges"][arrays["fwd_indptr"][:-1][has_out]]
+        arrays["first_out"] = first_out
+        return arrays
+
+    def _write_snapshot(
+        self,
+        name: str,
+        keys: list[str],
+        arrays: dict[str, np.ndarray],
+        num_nodes: int,
+        num_edges: int,
+        journal_offset: int,
+    ) -> None:
+        self.snapshot_root.mkdir(parents=True, exist_ok=True)
+        temp_dir = self.snapshot_root / f".{name}.tmp"
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        temp_dir.mkdir()
+        for column, array in arrays.items():
+            np.save(temp_dir / f"{column}.npy", array)
+        (temp_dir / "keys.json").write_text(json.dumps(keys), encoding="utf-8")
+        manifest = {"num_nodes": num_nodes, "num_edges": num_edges, "journal_offset": journal_offset}
+        (temp_dir / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+        snapshot_dir = self.snapshot_root / name
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+        os.replace(temp_dir, snapshot_dir)
+
+        current_tmp = self.snapshot_root / f"{_CURRENT_FILE}.tmp"
+        current_tmp.write_text(name, encoding="utf-8")
+        os.replace(current_tmp, self.snapshot_root / _CURRENT_FILE)
+
+    def _rebuild_overlay_adjacency(self) -> None:
+        self._ov_out, self._ov_in, self._ov_first_out = {}, {}, {}
+        self._ov_column_cache.clear()
+        for position, edge in enumerate(self._ov_edges):
+            edge_id = self._base_edges + position
+            src, dst = edge[0], edge[1]
+            self._ov_out.setdefault(src, []).append(edge_id)
+            self._ov_in.setdefault(dst, []).append(edge_id)
+            if src not in self._ov_first_out and not self._base_first_out(src) >= 0:
+                self._ov_first_out[src] = edge_id
+
+    # Key and fold queries
+
+    def __len__(self) -> int:
+        """Number of interned fold keys."""
+        with self._lock:
+            self._ensure_open()
+            return len(self._keys)
+
+    @property
+    def num_links(self) -> int:
+        with self._lock:
+            self._ensure_open()
+            return self._base_edges + len(self._ov_edges)
+
+    def id_of(self, key: str) -> Optional[int]:
+        with self._lock:
+            self._ensure_open()
+            return self._key_ids.get(key)
+
+    def ids_of(self, keys: Iterable[str]) -> np.ndarray:
+        """Ids of the known keys among ``keys``, in order (unknown keys are dropped)."""
+        with self._lock:
+            self._ensure_open()
+            ids = [self._key_ids.get(key) for key in keys]
+        return np.array([node_id for node_id in ids if node_id is not None], dtype=np.int64)
+
+    def key_of(self, node_id: int) -> str:
+        return self._keys[node_id]
+
+    def has_fold(self, key: str) -> bool:
+        node_id = self.id_of(key)
+        return node_id is not None and bool(self.has_state(np.array([node_id]))[0])
+
+    def has_state(self, ids: np.ndarray) -> np.ndarray:
+        """Mask of ids that have a recorded fold state."""
+        with self._lock:
+            self._ensure_open()
+            mask = np.zeros(len(ids), dtype=bool)
+            in_base = ids < self._base_nodes
+            if in_base.any():
+                mask[in_base] = self._base["node_offset"][ids[in_base]] >= 0
+            if self._ov_nodes:
+                mask |= np.fromiter((int(i) in self._ov_nodes for i in ids), dtype=bool, count=len(ids))
+            return mask
+
+    def node_drift(self, key: str) -> Optional[float]:
+        """Drift score of a fold's latest state, or None if it has none."""
+        with self._lock:
+            self._ensure_open()
+            node_id = self._key_ids.get(key)
+            if node_id is None:
+                return None
+            entry = self._ov_nodes.get(node_id)
+            if entry is not None:
+                return float(entry[0]["drift_score"])
+            if node_id < self._base_nodes and self._base["node_offset"][node_id] >= 0:
+                return float(self._base["drift"][node_id])
+            return None
+
+    def node_record(self, key: str) -> Optional[dict[str, Any]]:
+        """The latest fold_state record for a fold, read from the journal if needed."""
+        node_id = self.id_of(key)
+        return None if node_id is None else self.node_records(np.array([node_id]))[0]
+
+    def node_records(self, ids: np.ndarray) -> list[Optional[dict[str, Any]]]:
+        with self._lock:
+            self._ensure_open()
+            records: list[Optional[dict[str, Any]]] = []
+            spans: dict[int, tuple[int, int]] = {}  # position -> journal (offset, length)
+            for node_id in ids.tolist():
+                entry = self._ov_nodes.get(node_id)
+                if entry is None and node_id < self._base_nodes and self._base["node_offset"][node_id] >= 0:
+                    spans[len(records)] = (int(self._base["node_offset"][node_id]), int(self._base["node_length"][node_id]))
+                records.append(None if entry is None else entry[0])
+            for position, record in zip(spans, self._read_records(list(spans.values()))):
+                records[position] = record
+            return records
+
+    def fold_keys(self) -> Iterator[str]:
+        """Keys of folds with a recorded state (snapshot folds first)."""
+        with self._lock:
+            self._ensure_open()
+            base_ids = np.nonzero(np.asarray(self._base["node_offset"]) >= 0)[0] if self._base_nodes else _EMPTY_IDS
+            overlay_ids = [i for i in self._ov_nodes if not (i < self._base_nodes and self._base["node_offset"][i] >= 0)]
+            keys = [self._keys[i] for i in base_ids.tolist()] + [self._keys[i] for i in overlay_ids]
+        return iter(keys)
+
+    def source_keys(self) -> Iterator[str]:
+        """Keys of folds with outgoing links, in order of their first link."""
+        with self._lock:
+            self._ensure_open()
+            if self._base_nodes:
+                first_out = np.asarray(self._base["first_out"])
+                base_ids = np.nonzero(first_out >= 0)[0]
+                base_ids = base_ids[np.argsort(first_out[base_ids], kind="stable")]
+            else:
+                base_ids = _EMPTY_IDS
+            keys = [self._keys[i] for i in base_ids.tolist()] + [self._keys[i] for i in self._ov_first_out]
+        return iter(keys)
+
+    # Link queries
+
+    def out_edges(self, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Outgoing link ids of ``ids`` and the position of their owner, ordered by (owner, link id)."""
+        return self._gather(ids, "fwd_indptr", "fwd_edges", self._ov_out)
+
+    def in_edges(self, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Incoming link ids of ``ids`` and the position of their owner, ordered by (owner, link id)."""
+        return self._gather(ids, "bwd_indptr", "bwd_edges", self._ov_in)
+
+    def out_degree(self, ids: np.ndarray) -> np.ndarray:
+        with self._lock:
+            self._ensure_open()
+            degree = np.zeros(len(ids), dtype=np.int64)
+            in_base = ids < self._base_nodes
+            if in_base.any():
+                indptr = self._base["fwd_indptr"]
+                degree[in_base] = indptr[ids[in_base] + 1] - indptr[ids[in_base]]
+            if self._ov_out:
+                degree += np.fromiter((len(self._ov_out.get(int(i), ())) for i in ids), dtype=np.int64, count=len(ids))
+            return degree
+
+    def first_out(self, ids: np.ndarray) -> np.ndarray:
+        """Id of each fold's first outgoing link (-1 if none); orders sources as first seen."""
+        with self._lock:
+            result = np.full(len(ids), -1, dtype=np.int64)
+            in_base = ids < self._base_nodes
+            if in_base.any():
+                result[in_base] = self._base["first_out"][ids[in_base]]
+            if self._ov_first_out:
+                missing = np.nonzero(result < 0)[0]
+                for position in missing.tolist():
+                    result[position] = self._ov_first_out.get(int(ids[position]), -1)
+            return result
+
+    def edge_column(self, column: str, edge_ids: np.ndarray) -> np.ndarray:
+        """Values of a link column (src, dst, strength, ctype, ...) for ``edge_ids``."""
+        with self._lock:
+            values = np.empty(len(edge_ids), dtype=_COLUMN_DTYPES[column])
+            in_base = edge_ids < self._base_edges
+            if in_base.any():
+                values[in_base] = self._base[column][edge_ids[in_base]]
+            if not in_base.all():
+                values[~in_base] = self._overlay_column(column)[edge_ids[~in_base] - self._base_edges]
+            return values
+
+    def link_records(self, edge_ids: np.ndarray) -> list[Optional[dict[str, Any]]]:
+        """Full causal_link records for ``edge_ids``, read from the journal if needed."""
+        with self._lock:
+            records: list[Optional[dict[str, Any]]] = []
+            spans: dict[int, tuple[int, int]] = {}  # position -> journal (offset, length)
+            for edge_id in edge_ids.tolist():
+                if edge_id >= self._base_edges:
+                    records.append(self._ov_edges[edge_id - self._base_edges][6])
+                else:
+                    spans[len(records)] = (int(self._base["edge_offset"][edge_id]), int(self._base["edge_length"][edge_id]))
+                    records.append(None)
+            for position, record in zip(spans, self._read_records(list(spans.values()))):
+                records[position] = record
+            return records
+
+    def trace_backwards(self, key: str, max_depth: int) -> list[str]:
+        """
+        Breadth-first walk over causal predecessors of ``key``.
+
+        Each level's frontier is expanded with one CSR gather. Predecessors
+        are visited in the order of their owner in the frontier, then of each
+        source's first link, and every fold is visited once.
+
+        Args:
+            key: Fold to start from
+            max_depth: Maximum levels walked and maximum folds returned
+
+        Returns:
+            Keys of visited folds that have a recorded state, in visit order
+        """
+        with self._lock:
+            self._ensure_open()
+            start = self._key_ids.get(key)
+            if start is None or max_depth <= 0:
+                return []
+
+            visited = np.zeros(len(self._keys), dtype=bool)
+            frontier = np.array([start], dtype=np.int64)
+            trace: list[int] = []
+            depth = 0
+            while frontier.size and depth < max_depth:
+                visited[frontier] = True
+                trace.extend(frontier[self.has_state(frontier)][: max_depth - len(trace)].tolist())
+                if len(trace) >= max_depth:
+                    break
+
+                edge_ids, owners = self.in_edges(frontier)
+                sources = self.edge_column("src", edge_ids)
+                fresh = ~visited[sources]
+                sources, owners = sources[fresh], owners[fresh]
+                sources = sources[np.lexsort((self.first_out(sources), owners))]
+                _, first_seen = np.unique(sources, return_index=True)
+                frontier = sources[np.sort(first_seen)]
+                depth += 1
+
+            return [self._keys[node_id] for node_id in trace]
+
+    # Internals
+
+    def _base_first_out(self, node_id: int) -> int:
+        if node_id < self._base_nodes:
+            return int(self._base["first_out"][node_id])
+        return -1
+
+    def _overlay_column(self, column: str) -> np.ndarray:
+        cached = self._ov_column_cache.get(column)
+        if cached is not None and cached[0] == len(self._ov_edges):
+            return cached[1]
+        position = _OVERLAY_COLUMNS[column]
+        values = np.array([edge[position] for edge in self._ov_edges], dtype=_COLUMN_DTYPES[column])
+        self._ov_column_cache[column] = (len(self._ov_edges), values)
+        return values
+
+    def _gather(
+        self, ids: np.ndarray, indptr_name: str, edges_name: str, overlay: dict[int, list[int]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        with self._lock:
+            self._ensure_open()
+            ids = np.asarray(ids, dtype=np.int64)
+            edge_parts, owner_parts = [], []
+
+            base_positions = np.nonzero(ids < self._base_nodes)[0]
+            if base_positions.size:
+                indptr = self._base[indptr_name]
+                base_ids = ids[base_positions]
+                starts = indptr[base_ids]
+                counts = indptr[base_ids + 1] - starts
+                total = int(counts.sum())
+                if total:
+                    within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                    edge_parts.append(np.asarray(self._base[edges_name][np.repeat(starts, counts) + within], dtype=np.int64))
+                    owner_parts.append(np.repeat(base_positions, counts))
+
+            if overlay:
+                if len(overlay) <= ids.size:
+                    hits = np.nonzero(np.isin(ids, np.fromiter(overlay, dtype=np.int64, count=len(overlay))))[0].tolist()
+                else:
+                    hits = [position for position, node_id in enumerate(ids.tolist()) if node_id in overlay]
+                for position in hits:
+                    edge_ids = overlay[int(ids[position])]
+                    edge_parts.append(np.asarray(edge_ids, dtype=np.int64))
+                    owner_parts.append(np.full(len(edge_ids), position, dtype=np.int64))
+
+            if not edge_parts:
+                return _EMPTY_IDS, _EMPTY_IDS
+            edge_ids = np.concatenate(edge_parts)
+            owners = np.concatenate(owner_parts)
+            order = np.lexsort((edge_ids, owners))
+            return edge_ids[order], owners[order]
+
+    def _read_records(self, spans: list[tuple[int, int]]) -> list[Optional[dict[str, Any]]]:
+        """Read journal records by (offset, length), opening the journal once per batch."""
+        if not spans:
+            return []
+        records: list[Optional[dict[str, Any]]] = []
+        try:
+            with open(self.journal_path, "rb") as f:
+                for offset, length in spans:
+                    f.seek(offset)
+                    try:
+                        records.append(json.loads(f.read(length)))
+                    except ValueError as e:
+                        logger.error(f"Error reading lineage record at {self.journal_path}:{offset}: {e}")
+                        records.append(None)
+        except OSError as e:
+            logger.error(f"Error reading lineage records from {self.journal_path}: {e}")
+        return records + [None] * (len(spans) - len(records))
+
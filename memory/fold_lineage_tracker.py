@@ -63,13 +63,18 @@ import json
 import logging
 import os
 import re
-from collections import defaultdict, deque
-from dataclasses import asdict, dataclass
+from collections import defaultdict
+from collections.abc import Iterator, Mapping
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
+
+from memory.fold_lineage_store import DEFAULT_MERGE_THRESHOLD, LineageGraphStore
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -175,6 +180,75 @@ class LineageChain:
     dominant_causation_type: CausationType
 
 
+_CAUSATION_TYPES = list(CausationType)
+_LINK_FIELDS = tuple(f.name for f in fields(CausalLink))
+_NODE_FIELDS = tuple(f.name for f in fields(FoldLineageNode))
+
+
+def _link_from_record(record: Optional[dict[str, Any]]) -> Optional[CausalLink]:
+    """Build a CausalLink from a causal_link log record."""
+    if record is None:
+        return None
+    try:
+        values = {name: record[name] for name in _LINK_FIELDS}
+        values["causation_type"] = CausationType(values["causation_type"])
+    except (KeyError, ValueError):
+        return None
+    return CausalLink(**values)
+
+
+def _node_from_record(record: Optional[dict[str, Any]]) -> Optional[FoldLineageNode]:
+    """Build a FoldLineageNode from a fold_state log record."""
+    if record is None:
+        return None
+    try:
+        return FoldLineageNode(**{name: record[name] for name in _NODE_FIELDS})
+    except KeyError:
+        return None
+
+
+class _FoldNodeView(Mapping):
+    """Read-only fold_key -> FoldLineageNode view over the graph store."""
+
+    def __init__(self, graph: LineageGraphStore):
+        self._graph = graph
+
+    def __getitem__(self, fold_key: str) -> FoldLineageNode:
+        node = _node_from_record(self._graph.node_record(fold_key))
+        if node is None:
+            raise KeyError(fold_key)
+        return node
+
+    def __contains__(self, fold_key: object) -> bool:
+        return isinstance(fold_key, str) and self._graph.has_fold(fold_key)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._graph.fold_keys()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._graph.fold_keys())
+
+
+class _LineageGraphView(Mapping):
+    """Read-only source fold_key -> outgoing CausalLinks view over the graph store."""
+
+    def __init__(self, graph: LineageGraphStore):
+        self._graph = graph
+
+    def __getitem__(self, fold_key: str) -> list[CausalLink]:
+        node_id = self._graph.id_of(fold_key)
+        edge_ids = self._graph.out_edges(np.array([node_id]))[0] if node_id is not None else np.empty(0)
+        if not edge_ids.size:
+            raise KeyError(fold_key)
+        return [link for link in map(_link_from_record, self._graph.link_records(edge_ids)) if link]
+
+    def __iter__(self) -> Iterator[str]:
+        return self._graph.source_keys()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._graph.source_keys())
+
+
 # LUKHAS_TAG: fold_lineage_core
 class FoldLineageTracker:
     """
@@ -182,28 +256,55 @@ class FoldLineageTracker:
 
     This module provides sophisticated lineage tracking for memory folds,
     enabling comprehensive genealogy analysis and evolution patterns.
+
+    The lineage log is indexed by a LineageGraphStore, a memory-mapped
+    columnar snapshot plus a replay of the log's tail. The store is opened
+    on first use, so construction does no I/O.
     """
 
     def __init__(
         self,
         max_drift_rate: float = MAX_DRIFT_RATE,  # JULES05_NOTE: Loop-safe guard added
         log_directory: str | Path | None = None,
+        merge_threshold: int = DEFAULT_MERGE_THRESHOLD,
     ):
         log_dir = _resolve_log_directory(str(log_directory) if isinstance(log_directory, Path) else log_directory)
 
         self.log_directory: Path = log_dir
+        self.merge_threshold = merge_threshold
         self.lineage_log_path: Path = log_dir / _LINEAGE_FILENAME
         self.causal_map_path: Path = log_dir / _CAUSAL_FILENAME
         self.lineage_graph_path: Path = log_dir / _GRAPH_FILENAME
         self.max_drift_rate = max_drift_rate  # JULES05_NOTE: Loop-safe guard added
 
-        # In-memory lineage graph for fast queries
-        self.lineage_graph: dict[str, list[CausalLink]] = defaultdict(list)
-        self.fold_nodes: dict[str, FoldLineageNode] = {}
         self.lineage_chains: dict[str, LineageChain] = {}
 
-        # Load existing lineage data
-        self._load_existing_lineage()
+    @property
+    def lineage_log_path(self) -> Path:
+        return self._graph.journal_path
+
+    @lineage_log_path.setter
+    def lineage_log_path(self, path: str | Path) -> None:
+        previous = getattr(self, "_graph", None)
+        if previous is not None:
+            previous.close()
+        self._graph = LineageGraphStore(
+            Path(path), [ctype.value for ctype in _CAUSATION_TYPES], merge_threshold=self.merge_threshold
+        )
+
+    @property
+    def fold_nodes(self) -> Mapping[str, FoldLineageNode]:
+        """Latest state per fold (read-only view)."""
+        return _FoldNodeView(self._graph)
+
+    @property
+    def lineage_graph(self) -> Mapping[str, list[CausalLink]]:
+        """Outgoing causal links per source fold (read-only view)."""
+        return _LineageGraphView(self._graph)
+
+    def close(self) -> None:
+        """Wait for a pending graph merge."""
+        self._graph.close()
 
     # ΛDVNT: Compatibility method for tests expecting add_lineage_entry
     def add_lineage_entry(self, fold_key: str, event_type: str, metadata: Optional[dict[str, Any]] = None):
@@ -292,11 +393,12 @@ class FoldLineageTracker:
             )
             return ""
 
-        if self.fold_nodes.get(source_fold_key) and self.fold_nodes[source_fold_key].drift_score > self.max_drift_rate:
+        source_drift = self._graph.node_drift(source_fold_key)
+        if source_drift is not None and source_drift > self.max_drift_rate:
             logger.warning(
                 "FoldCausation: Drift rate exceeded, halting tracking",
                 source=source_fold_key,
-                drift_score=self.fold_nodes[source_fold_key].drift_score,
+                drift_score=source_drift,
             )
             return ""
 
@@ -316,10 +418,7 @@ class FoldLineageTracker:
             metadata={**metadata, "causation_id": causation_id},
         )
 
-        # Add to in-memory graph
-        self.lineage_graph[source_fold_key].append(causal_link)
-
-        # Log causation event
+        # Log causation event (this also adds it to the graph store)
         self._log_causation_event(causal_link)
 
         # Update lineage chains
@@ -361,9 +460,7 @@ class FoldLineageTracker:
             causative_events=causative_events,
         )
 
-        self.fold_nodes[fold_key] = node
-
-        # Log fold state
+        # Log fold state (this also records it in the graph store)
         self._log_fold_state(node)
 
         logger.debug(
@@ -385,7 +482,7 @@ class FoldLineageTracker:
         - Critical decision points
         - Stability indicators
         """
-        if fold_key not in self.fold_nodes:
+        if not self._graph.has_fold(fold_key):
             return {"error": f"Fold {fold_key} not found in lineage tracking"}
 
         # Trace lineage backwards
@@ -406,7 +503,7 @@ class FoldLineageTracker:
             "fold_key": fold_key,
             "analysis_timestamp": datetime.now(timezone.utc).isoformat(),
             "lineage_depth": len(lineage_trace),
-            "total_causal_links": sum(len(self.lineage_graph.get(node.fold_key, [])) for node in lineage_trace),
+            "total_causal_links": int(self._graph.out_degree(self._trace_ids(lineage_trace)).sum()),
             "lineage_trace": [asdict(node) for node in lineage_trace],
             "causation_analysis": causation_analysis,
             "critical_points": critical_points,
@@ -429,41 +526,38 @@ class FoldLineageTracker:
         return analysis
 
     def _trace_lineage_backwards(self, fold_key: str, max_depth: int) -> list[FoldLineageNode]:
-        """Trace fold lineage backwards to find causal origins."""
-        visited = set()
-        lineage_trace = []
-        queue = deque([(fold_key, 0)])
-
-        while queue and len(lineage_trace) < max_depth:
-            current_key, depth = queue.popleft()
-
-            if current_key in visited or depth >= max_depth:
-                continue
-
-            visited.add(current_key)
-
-            if current_key in self.fold_nodes:
-                lineage_trace.append(self.fold_nodes[current_key])
-
-            # Find causal predecessors
-            for source_key, causal_links in self.lineage_graph.items():
-                for link in causal_links:
-                    if link.target_fold_key == current_key and source_key not in visited:
-                        queue.append((source_key, depth + 1))
-
-        return lineage_trace
+        """Trace fold lineage backwards to find causal origins (frontier-at-a-time BFS)."""
+        trace_keys = self._graph.trace_backwards(fold_key, max_depth)
+        trace_ids = self._graph.ids_of(trace_keys)
+        nodes = map(_node_from_record, self._graph.node_records(trace_ids))
+        return [node for node in nodes if node is not None]
+
+    def _trace_ids(self, lineage_trace: list[FoldLineageNode]) -> np.ndarray:
+        return self._graph.ids_of(node.fold_key for node in lineage_trace)
+
+    def _links_in_source_order(self, edge_ids: np.ndarray) -> list[CausalLink]:
+        """Materialize links ordered by source (first-seen order), then link order."""
+        first_out = self._graph.first_out(self._graph.edge_column("src", edge_ids))
+        edge_ids = edge_ids[np.lexsort((edge_ids, first_out))]
+        links = map(_link_from_record, self._graph.link_records(edge_ids))
+        return [link for link in links if link is not None]
 
     def _analyze_causation_patterns(self, lineage_trace: list[FoldLineageNode]) -> dict[str, Any]:
         """Analyze causation patterns in the lineage trace."""
-        causation_counts = defaultdict(int)
-        causation_strengths = defaultdict(list)
-        total_links = 0
-
-        for node in lineage_trace:
-            for link in self.lineage_graph.get(node.fold_key, []):
-                causation_counts[link.causation_type.value] += 1
-                causation_strengths[link.causation_type.value].append(link.strength)
-                total_links += 1
+        causation_counts: dict[str, int] = {}
+        causation_strengths: dict[str, list[float]] = {}
+
+        edge_ids, _ = self._graph.out_edges(self._trace_ids(lineage_trace))
+        total_links = int(edge_ids.size)
+        if total_links:
+            codes = self._graph.edge_column("ctype", edge_ids)
+            strengths = self._graph.edge_column("strength", edge_ids)
+            _, first_seen = np.unique(codes, return_index=True)
+            for code in codes[np.sort(first_seen)].tolist():
+                mask = codes == code
+                value = _CAUSATION_TYPES[code].value
+                causation_counts[value] = int(mask.sum())
+                causation_strengths[value] = strengths[mask].tolist()
 
         if not causation_counts:
             return {
@@ -596,29 +690,27 @@ class FoldLineageTracker:
             node.fold_key: self._extract_dream_ids(node.causative_events) for node in lineage_trace
         }
 
-        entanglement_links: list[CausalLink] = []
         dream_correlations: dict[str, dict[str, Any]] = defaultdict(
             lambda: {"folds": set(), "strengths": [], "events": set()}
         )
 
-        for _source_key, links in self.lineage_graph.items():
-            for link in links:
-                if link.causation_type != CausationType.QUANTUM_ENTANGLEMENT:
-                    continue
-                if link.source_fold_key not in lineage_keys and link.target_fold_key not in lineage_keys:
-                    continue
-
-                entanglement_links.append(link)
+        # Entanglement links touching the lineage, from its out- and in-adjacency
+        lineage_ids = self._graph.ids_of(lineage_keys)
+        edge_ids = np.union1d(self._graph.out_edges(lineage_ids)[0], self._graph.in_edges(lineage_ids)[0])
+        qe_code = _CAUSATION_TYPES.index(CausationType.QUANTUM_ENTANGLEMENT)
+        edge_ids = edge_ids[self._graph.edge_column("ctype", edge_ids) == qe_code]
+        entanglement_links = self._links_in_source_order(edge_ids)
 
-                source_dreams = fold_dream_index.get(link.source_fold_key, set())
-                target_dreams = fold_dream_index.get(link.target_fold_key, set())
-                dream_id = self._resolve_dream_reference(link.metadata, source_dreams, target_dreams)
+        for link in entanglement_links:
+            source_dreams = fold_dream_index.get(link.source_fold_key, set())
+            target_dreams = fold_dream_index.get(link.target_fold_key, set())
+            dream_id = self._resolve_dream_reference(link.metadata, source_dreams, target_dreams)
 
-                if dream_id:
-                    record = dream_correlations[dream_id]
-                    record["folds"].update([link.source_fold_key, link.target_fold_key])
-                    record["strengths"].append(self._extract_entanglement_strength(link))
-                    record["events"].update(source_dreams | target_dreams)
+            if dream_id:
+                record = dream_correlations[dream_id]
+                record["folds"].update([link.source_fold_key, link.target_fold_key])
+                record["strengths"].append(self._extract_entanglement_strength(link))
+                record["events"].update(source_dreams | target_dreams)
 
         if not entanglement_links:
             logger.debug(
@@ -737,19 +829,21 @@ class FoldLineageTracker:
                 }
             )
 
-        # Add edges from causal links
-        for causal_links in self.lineage_graph.values():
-            for link in causal_links:
-                edges.append(
-                    {
-                        "source": link.source_fold_key,
-                        "target": link.target_fold_key,
-                        "type": link.causation_type.value,
-                        "strength": link.strength,
-                        "timestamp": link.timestamp_utc,
-                        "width": max(1, int(link.strength * 5)),
-                    }
-                )
+        # Add edges from causal links between the lineage folds
+        trace_ids = self._graph.ids_of(node["fold_key"] for node in analysis["lineage_trace"])
+        edge_ids, _ = self._graph.out_edges(trace_ids)
+        edge_ids = edge_ids[np.isin(self._graph.edge_column("dst", edge_ids), trace_ids)]
+        for link in self._links_in_source_order(edge_ids):
+            edges.append(
+                {
+                    "source": link.source_fold_key,
+                    "target": link.target_fold_key,
+                    "type": link.causation_type.value,
+                    "strength": link.strength,
+                    "timestamp": link.timestamp_utc,
+                    "width": max(1, int(link.strength * 5)),
+                }
+            )
 
         graph_data = {
             "format": output_format,
@@ -774,49 +868,28 @@ class FoldLineageTracker:
         return graph_data
 
     def _load_existing_lineage(self):
-        """Load existing lineage data from persistent storage."""
+        """Open the lineage graph store now instead of on first use."""
         try:
-            lineage_path = Path(self.lineage_log_path)
-            if lineage_path.exists():
-                with lineage_path.open(encoding="utf-8") as f:
-                    for line in f:
-                        try:
-                            data = json.loads(line.strip())
-                            if data.get("event_type") == "causal_link":
-                                link = CausalLink(**{k: v for k, v in data.items() if k != "event_type"})
-                                self.lineage_graph[link.source_fold_key].append(link)
-                            elif data.get("event_type") == "fold_state":
-                                node = FoldLineageNode(**{k: v for k, v in data.items() if k != "event_type"})
-                                self.fold_nodes[node.fold_key] = node
-                        except (json.JSONDecodeError, TypeError):
-                            continue
+            self._graph.open()
         except Exception as e:
-            logger.error("LineageLoad_failed", error=str(e))
+            logger.error(f"LineageLoad_failed: {e}")
 
     def _log_causation_event(self, causal_link: CausalLink):
         """Log a causation event to persistent storage."""
         try:
-            path = Path(self.lineage_log_path)
-            path.parent.mkdir(parents=True, exist_ok=True)
             entry = {"event_type": "causal_link", **asdict(causal_link)}
             entry["causation_type"] = causal_link.causation_type.value  # Convert enum to string
-
-            with path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
+            self._graph.append(entry)
         except Exception as e:
-            logger.error("CausationLog_failed", error=str(e))
+            logger.error(f"CausationLog_failed: {e}")
 
     def _log_fold_state(self, node: FoldLineageNode):
         """Log fold state to persistent storage."""
         try:
-            path = Path(self.lineage_log_path)
-            path.parent.mkdir(parents=True, exist_ok=True)
             entry = {"event_type": "fold_state", **asdict(node)}
-
-            with path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
+            self._graph.append(entry)
         except Exception as e:
-            logger.error("FoldStateLog_failed", error=str(e))
+            logger.error(f"FoldStateLog_failed: {e}")
 
     def _update_lineage_chains(self, causal_link: CausalLink):
         """Update lineage chains based on new causal link."""
@@ -1094,12 +1167,15 @@ class FoldLineageTracker:
         importance_factor = node["importance_score"]
 
         # Count outgoing causal connections
-        connections = len(self.lineage_graph.get(node["fold_key"], []))
+        connections = self._out_degree(node["fold_key"])
         connection_factor = min(1.0, connections / 5.0)
 
         leverage = recency_factor * 0.4 + importance_factor * 0.4 + connection_factor * 0.2
         return leverage
 
+    def _out_degree(self, fold_key: str) -> int:
+        return int(self._graph.out_degree(self._graph.ids_of([fold_key])).sum())
+
     def _suggest_intervention_type(self, node: dict) -> str:
         """Suggest appropriate intervention type for a node."""
         drift_score = node["drift_score"]
@@ -1116,7 +1192,7 @@ class FoldLineageTracker:
 
     def _estimate_intervention_impact(self, node: dict, lineage_trace: list) -> str:
         """Estimate the impact of intervention at this node."""
-        connections = len(self.lineage_graph.get(node["fold_key"], []))
+        connections = self._out_degree(node["fold_key"])
 
         if connections > 10:
             return "high"
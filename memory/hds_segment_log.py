@@ -0,0 +1,181 @@
+"""
+Binary segment log backing HierarchicalDataStore checkpoints.
+
+The log is an append-only file of length-prefixed records::
+
+    header: kind (u8) | crc32 (u32) | meta length (u32) | payload length (u32)
+    body:   meta (UTF-8 JSON) | payload (raw bytes)
+
+``meta`` carries a node's fields and ``payload`` its compressed bytes, stored
+as-is rather than hex-encoded. Later records for a node supersede earlier
+ones and tombstones remove it. A record whose checksum does not match, or
+that is cut short, marks a torn tail: loading stops there and the file is
+truncated back to the last good record. Compaction rewrites only the live
+records into a new file and atomically replaces the log.
+
+All methods are synchronous and meant to run in a worker thread.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"HDS1"
+RECORD_NODE = 1
+RECORD_TOMBSTONE = 2
+RECORD_METRICS = 3
+
+_HEADER = struct.Struct("<BIII")
+
+# (kind, meta, payload) as produced by the store's snapshot
+LogRecord = tuple[int, dict[str, Any], Optional[bytes]]
+
+
+def encode_record(kind: int, meta: dict[str, Any], payload: Optional[bytes] = None) -> bytes:
+    """Encode one record with its header and checksum."""
+    meta_bytes = json.dumps(meta, separators=(",", ":"), default=str).encode("utf-8")
+    payload = payload or b""
+    crc = zlib.crc32(payload, zlib.crc32(meta_bytes))
+    return _HEADER.pack(kind, crc, len(meta_bytes), len(payload)) + meta_bytes + payload
+
+
+class HDSSegmentLog:
+    """Append-only checkpoint log with compaction and torn-tail recovery."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.log_bytes = 0  # Size of the log file
+        self.live_bytes = 0  # Bytes of the latest record per live node
+        self._record_sizes: dict[str, int] = {}
+
+    def append(self, records: Iterable[LogRecord]) -> int:
+        """
+        Append encoded records and fsync the log.
+
+        Args:
+            records: (kind, meta, payload) tuples; node and tombstone meta
+                must carry the node id under ``"id"``
+
+        Returns:
+            Number of bytes written
+        """
+        chunks = []
+        for kind, meta, payload in records:
+            data = encode_record(kind, meta, payload)
+            chunks.append(data)
+            self._account(kind, meta, len(data))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        new_file = not self.path.exists() or self.path.stat().st_size == 0
+        with open(self.path, "ab") as f:
+            if new_file:
+                f.write(MAGIC)
+                self.log_bytes = len(MAGIC)
+            f.write(b"".join(chunks))
+            f.flush()
+            os.fsync(f.fileno())
+
+        written = sum(len(chunk) for chunk in chunks)
+        self.log_bytes += written
+        return written
+
+    def should_compact(self, min_bytes: int = 1 << 20, ratio: float = 2.0) -> bool:
+        """Return True once superseded records dominate the log."""
+        return self.log_bytes > min_bytes and self.log_bytes > ratio * self.live_bytes
+
+    def compact(self, records: Iterable[LogRecord]) -> None:
+        """Rewrite the log to contain exactly ``records`` (the live state)."""
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        self._record_sizes = {}
+        self.live_bytes = 0
+        size = len(MAGIC)
+        with open(temp_path, "wb") as f:
+            f.write(MAGIC)
+            for kind, meta, payload in records:
+                data = encode_record(kind, meta, payload)
+                f.write(data)
+                size += len(data)
+                self._account(kind, meta, len(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self.log_bytes = size
+        logger.info(f"Compacted HDS segment log {self.path} to {size} bytes")
+
+    def load(self) -> tuple[dict[str, tuple[dict[str, Any], bytes]], dict[str, Any]]:
+        """
+        Replay the log into its live state.
+
+        Returns:
+            (nodes, metrics) where nodes maps node id -> (meta, payload)
+        """
+        nodes: dict[str, tuple[dict[str, Any], bytes]] = {}
+        metrics: dict[str, Any] = {}
+        self._record_sizes = {}
+        self.live_bytes = 0
+        self.log_bytes = 0
+        if not self.path.exists():
+            return nodes, metrics
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        if not data.startswith(MAGIC):
+            raise ValueError(f"Not an HDS segment log: {self.path}")
+
+        offset = len(MAGIC)
+        while offset < len(data):
+            record = self._decode_at(data, offset)
+            if record is None:
+                logger.warning(f"Truncating torn HDS segment tail at byte {offset} of {len(data)}: {self.path}")
+                with open(self.path, "r+b") as f:
+                    f.truncate(offset)
+                break
+            kind, meta, payload, size = record
+            offset += size
+
+            if kind == RECORD_NODE:
+                nodes[meta["id"]] = (meta, payload)
+            elif kind == RECORD_TOMBSTONE:
+                nodes.pop(meta["id"], None)
+            elif kind == RECORD_METRICS:
+                metrics = meta
+            self._account(kind, meta, size)
+
+        self.log_bytes = offset
+        return nodes, metrics
+
+    def _decode_at(self, data: bytes, offset: int) -> Optional[tuple[int, dict[str, Any], bytes, int]]:
+        end = offset + _HEADER.size
+        if end > len(data):
+            return None
+        kind, crc, meta_len, payload_len = _HEADER.unpack_from(data, offset)
+        body_end = end + meta_len + payload_len
+        if body_end > len(data):
+            return None
+        meta_bytes = data[end : end + meta_len]
+        payload = data[end + meta_len : body_end]
+        if zlib.crc32(payload, zlib.crc32(meta_bytes)) != crc:
+            return None
+        try:
+            meta = json.loads(meta_bytes)
+        except ValueError:
+            return None
+        return kind, meta, payload, body_end - offset
+
+    def _account(self, kind: int, meta: dict[str, Any], size: int) -> None:
+        """Track the bytes of the latest record per node (metrics count as a node)."""
+        key = meta["id"] if kind in (RECORD_NODE, RECORD_TOMBSTONE) else "\x00metrics"
+        self.live_bytes -= self._record_sizes.pop(key, 0)
+        if kind != RECORD_TOMBSTONE:
+            self._record_sizes[key] = size
+            self.live_bytes += size
@@ -43,10 +43,12 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import heapq
 import json
 import logging
 import zlib
-from collections import defaultdict, deque
+from bisect import bisect_right, insort
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -54,6 +56,8 @@ from pathlib import Path
 from typing import Any, Optional
 from uuid import uuid4
 
+from memory.hds_segment_log import RECORD_METRICS, RECORD_NODE, RECORD_TOMBSTONE, HDSSegmentLog, LogRecord
+
 # Initialize structured logger
 logger = logging.getLogger(__name__)
 
@@ -126,6 +130,7 @@ class HierarchicalDataStore:
         max_memory_mb: int = 1024,
         compression_threshold: float = 0.7,
         prune_interval_seconds: int = 3600,
+        flush_interval_seconds: float = 60.0,
     ):
         """
         Initialize the Hierarchical Data Store
@@ -134,11 +139,15 @@ class HierarchicalDataStore:
         - Storage path is optional; defaults to in-memory storage
         - Compression threshold determines when nodes get compressed
         - Pruning runs periodically to remove low-importance memories
+        - With a storage path, changed nodes are checkpointed every
+          flush_interval_seconds to a binary segment log next to it
+          (``<storage_path>.seg``); 0 disables background flushing
         """
         self.storage_path = storage_path
         self.max_memory_mb = max_memory_mb
         self.compression_threshold = compression_threshold
         self.prune_interval = prune_interval_seconds
+        self.flush_interval = flush_interval_seconds
 
         # Core storage structures
         self.nodes: dict[str, MemoryNode] = {}
@@ -161,9 +170,23 @@ class HierarchicalDataStore:
             "compression_ratio": 0.0,
         }
 
+        # Ordered indexes: importance (highest first) and last access (oldest first)
+        self._importance_order: list[tuple[float, int, str]] = []
+        self._importance_keys: dict[str, tuple[float, int, str]] = {}
+        self._recency: OrderedDict[str, float] = OrderedDict()  # node_id -> last access epoch
+        self._created_ts: dict[str, float] = {}
+        self._index_seq = 0
+
+        # Incremental persistence
+        self._segment_log = HDSSegmentLog(storage_path.with_suffix(".seg")) if storage_path else None
+        self._dirty: set[str] = set()
+        self._deleted: set[str] = set()
+        self._flush_lock: Optional[asyncio.Lock] = None
+
         # Background tasks
         self._pruning_task = None
         self._compression_task = None
+        self._flush_task = None
         self._running = False
 
         logger.info(
@@ -177,6 +200,8 @@ class HierarchicalDataStore:
         self._running = True
         self._pruning_task = asyncio.create_task(self._prune_loop())
         self._compression_task = asyncio.create_task(self._compression_loop())
+        if self._segment_log and self.flush_interval > 0:
+            self._flush_task = asyncio.create_task(self._flush_loop())
         logger.info("ΛHDS: Background tasks started")
 
     async def stop(self):
@@ -186,6 +211,8 @@ class HierarchicalDataStore:
             self._pruning_task.cancel()
         if self._compression_task:
             self._compression_task.cancel()
+        if self._flush_task:
+            self._flush_task.cancel()
         await self.flush_to_disk()
         logger.info("ΛHDS: Stopped and flushed to disk")
 
@@ -219,11 +246,14 @@ class HierarchicalDataStore:
         # Add to storage
         self.nodes[node.node_id] = node
         self.tier_indices[tier].add(node.node_id)
+        self._index_node(node)
+        self._dirty.add(node.node_id)
 
         # Update parent-child relationships
         if parent_id and parent_id in self.nodes:
             self.nodes[parent_id].children_ids.append(node.node_id)
             self.parent_child_map[parent_id].add(node.node_id)
+            self._dirty.add(parent_id)
 
         # Update metrics
         self.metrics["total_nodes"] += 1
@@ -250,16 +280,19 @@ class HierarchicalDataStore:
         - Uses hierarchical search with configurable depth
         - Applies importance and time filters
         - Includes cross-references if requested
+        - Start nodes are visited from the importance index, highest first,
+          stopping below the importance threshold
         """
         results = []
         visited = set()
 
-        # Start with tier-filtered nodes or all nodes
-        start_nodes = self.tier_indices[context.tier_filter] if context.tier_filter else set(self.nodes.keys())
+        # Start with tier-filtered nodes or all nodes, most important first
+        tier_nodes = self.tier_indices[context.tier_filter] if context.tier_filter else None
+        start_nodes = self._nodes_above_importance(context.importance_threshold)
 
         # Apply filters and search
         for node_id in start_nodes:
-            if node_id in visited:
+            if node_id in visited or (tier_nodes is not None and node_id not in tier_nodes):
                 continue
 
             node = await self._get_node(node_id)
@@ -289,6 +322,8 @@ class HierarchicalDataStore:
         node = self.nodes[node_id]
         old_importance = node.importance_score
         node.importance_score = max(0.0, min(10.0, node.importance_score + delta))
+        self._index_node(node)
+        self._dirty.add(node_id)
 
         logger.debug(
             "ΛHDS: Importance updated",
@@ -302,6 +337,7 @@ class HierarchicalDataStore:
         if node_id1 in self.nodes and node_id2 in self.nodes:
             self.nodes[node_id1].cross_refs.add(node_id2)
             self.nodes[node_id2].cross_refs.add(node_id1)
+            self._dirty.update((node_id1, node_id2))
             logger.debug("ΛHDS: Cross-reference added", node1=node_id1, node2=node_id2)
 
     async def get_hierarchy(self, root_id: str, max_depth: int = 3) -> dict[str, Any]:
@@ -333,6 +369,9 @@ class HierarchicalDataStore:
         # Update access metrics
         node.access_count += 1
         node.last_accessed = datetime.now(timezone.utc)
+        self._recency[node_id] = node.last_accessed.timestamp()
+        self._recency.move_to_end(node_id)
+        self._dirty.add(node_id)
         self.metrics["total_accesses"] += 1
 
         # Check cache
@@ -395,6 +434,7 @@ class HierarchicalDataStore:
         self.compression_cache[node.node_id] = compressed
         node.is_compressed = True
         node.content = None  # Clear original content
+        self._dirty.add(node.node_id)
 
         # Update metrics
         self.metrics["compressed_nodes"] += 1
@@ -427,6 +467,7 @@ class HierarchicalDataStore:
             node.content = await self._reconstruct_from_compressed(compressed_data, node.compression_level)
 
         node.is_compressed = False
+        self._dirty.add(node.node_id)
 
     async def _semantic_compress(self, content: Any) -> bytes:
         """Extract semantic meaning from content"""
@@ -540,26 +581,32 @@ class HierarchicalDataStore:
     async def _prune_memories(self) -> int:
         """Prune low-importance, old memories"""
         pruned = 0
-        current_time = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc).timestamp()
 
-        # Collect candidates for pruning
+        # Collect candidates for pruning, least recently accessed first. A
+        # node accessed within the last day scores 0, and so does every node
+        # after it in recency order.
         candidates = []
-        for node_id, node in self.nodes.items():
-            # Skip important or recently accessed nodes
+        for node_id, accessed_ts in self._recency.items():
+            access_days = int((now - accessed_ts) // 86400)
+            if access_days < 1:
+                break
+
+            # Skip important or frequently accessed nodes
+            node = self.nodes[node_id]
             if node.importance_score > 3.0 or node.access_count > 5:
                 continue
 
             # Calculate pruning score
-            age_days = (current_time - node.created_at).days
-            access_days = (current_time - node.last_accessed).days
-            prune_score = (age_days * access_days) / (node.importance_score * (node.access_count + 1))
+            age_days = int((now - self._created_ts[node_id]) // 86400)
+            weight = node.importance_score * (node.access_count + 1)
+            prune_score = (age_days * access_days) / weight if weight > 0 else float("inf")
 
             if prune_score > 1000:  # Threshold for pruning
                 candidates.append((prune_score, node_id))
 
-        # Sort by prune score and remove highest scoring (least valuable)
-        candidates.sort(reverse=True)
-        for _, node_id in candidates[:100]:  # Limit pruning per cycle
+        # Remove highest scoring (least valuable), limited per cycle
+        for _, node_id in heapq.nlargest(100, candidates):
             await self._remove_node(node_id)
             pruned += 1
 
@@ -573,19 +620,24 @@ class HierarchicalDataStore:
 
         node = self.nodes[node_id]
 
-        # Remove from tier index
+        # Remove from tier and ordered indexes
         self.tier_indices[node.tier].discard(node_id)
+        self._unindex_node(node_id)
+        self._dirty.discard(node_id)
+        self._deleted.add(node_id)
 
         # Update parent's children list
         if node.parent_id and node.parent_id in self.nodes:
             parent = self.nodes[node.parent_id]
             parent.children_ids.remove(node_id)
             self.parent_child_map[node.parent_id].discard(node_id)
+            self._dirty.add(node.parent_id)
 
         # Remove cross-references
         for ref_id in node.cross_refs:
             if ref_id in self.nodes:
                 self.nodes[ref_id].cross_refs.discard(node_id)
+                self._dirty.add(ref_id)
 
         # Clean up caches
         self.access_cache.pop(node_id, None)
@@ -623,99 +675,225 @@ class HierarchicalDataStore:
 
         return compressed
 
+    async def _flush_loop(self):
+        """Background task for checkpointing changed memories"""
+        while self._running:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush_to_disk()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"ΛHDS: Background flush error: {e}")
+
     async def flush_to_disk(self):
-        """Persist current state to disk if storage path configured"""
-        if not self.storage_path:
+        """
+        Checkpoint changed nodes to the segment log if storage path configured
+
+        # Notes:
+        - Only nodes changed since the last flush are written, plus tombstones
+          for removed nodes; the log is compacted once superseded records
+          dominate it
+        - Node fields are snapshotted on the event loop; JSON encoding and
+          file I/O run in a worker thread
+        """
+        if not self._segment_log:
             return
 
-        try:
-            state = {
-                "nodes": {
-                    node_id: {
-                        "tier": node.tier.value,
-                        "metadata": node.metadata,
-                        "parent_id": node.parent_id,
-                        "children_ids": node.children_ids,
-                        "cross_refs": list(node.cross_refs),
-                        "importance_score": node.importance_score,
-                        "access_count": node.access_count,
-                        "compression_level": node.compression_level.value,
-                        "is_compressed": node.is_compressed,
-                        "checksum": node.checksum,
-                        "created_at": node.created_at.isoformat(),
-                        "last_accessed": node.last_accessed.isoformat(),
-                    }
-                    for node_id, node in self.nodes.items()
-                },
-                "compression_cache": {node_id: data.hex() for node_id, data in self.compression_cache.items()},
-                "metrics": self.metrics,
-            }
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
 
-            # Write to temporary file first for atomicity
-            temp_path = self.storage_path.with_suffix(".tmp")
-            with open(temp_path, "w") as f:
-                json.dump(state, f, indent=2)
+        async with self._flush_lock:
+            dirty, deleted = self._dirty, self._deleted
+            self._dirty, self._deleted = set(), set()
 
-            # Atomic rename
-            temp_path.rename(self.storage_path)
+            compact = self._segment_log.should_compact()
+            if compact:
+                records = [self._node_record(node) for node in self.nodes.values()]
+            else:
+                records = [self._node_record(self.nodes[node_id]) for node_id in dirty if node_id in self.nodes]
+                records.extend((RECORD_TOMBSTONE, {"id": node_id}, None) for node_id in deleted)
+            records.append((RECORD_METRICS, dict(self.metrics), None))
 
-            logger.info(
-                "ΛHDS: State persisted to disk",
-                path=str(self.storage_path),
-                nodes=len(self.nodes),
-            )
+            try:
+                if compact:
+                    await asyncio.to_thread(self._segment_log.compact, records)
+                else:
+                    await asyncio.to_thread(self._segment_log.append, records)
+            except Exception as e:
+                # Keep the changes pending so the next flush retries them
+                self._dirty |= dirty
+                self._deleted |= deleted
+                logger.error(f"ΛHDS: Failed to persist state: {e}")
+                return
 
-        except Exception as e:
-            logger.error("ΛHDS: Failed to persist state", error=str(e))
+        logger.info(f"ΛHDS: State persisted to disk ({len(records) - 1} records, {len(self.nodes)} nodes)")
 
     async def load_from_disk(self):
         """Load state from disk if available"""
-        if not self.storage_path or not self.storage_path.exists():
+        if not self.storage_path:
             return
 
         try:
-            with open(self.storage_path) as f:
-                state = json.load(f)
-
-            # Reconstruct nodes
-            for node_id, node_data in state["nodes"].items():
-                node = MemoryNode(
-                    node_id=node_id,
-                    tier=MemoryTier(node_data["tier"]),
-                    metadata=node_data["metadata"],
-                    parent_id=node_data["parent_id"],
-                    children_ids=node_data["children_ids"],
-                    cross_refs=set(node_data["cross_refs"]),
-                    importance_score=node_data["importance_score"],
-                    access_count=node_data["access_count"],
-                    compression_level=CompressionLevel(node_data["compression_level"]),
-                    is_compressed=node_data["is_compressed"],
-                    checksum=node_data["checksum"],
-                    created_at=datetime.fromisoformat(node_data["created_at"]),
-                    last_accessed=datetime.fromisoformat(node_data["last_accessed"]),
-                )
-                self.nodes[node_id] = node
-                self.tier_indices[node.tier].add(node_id)
-
-                if node.parent_id:
-                    self.parent_child_map[node.parent_id].add(node_id)
-
-            # Restore compression cache
-            self.compression_cache = {
-                node_id: bytes.fromhex(data) for node_id, data in state["compression_cache"].items()
-            }
+            if self._segment_log.path.exists():
+                nodes, metrics = await asyncio.to_thread(self._segment_log.load)
+                for meta, payload in nodes.values():
+                    self._restore_node(meta, payload)
+                self.metrics.update(metrics)
+            elif self.storage_path.exists():
+                await self._load_legacy_json()
+            else:
+                return
+
+            self._rebuild_ordered_indexes()
+            logger.info(f"ΛHDS: State loaded from disk ({len(self.nodes)} nodes)")
 
-            # Restore metrics
-            self.metrics.update(state["metrics"])
+        except Exception as e:
+            logger.error(f"ΛHDS: Failed to load state: {e}")
 
-            logger.info(
-                "ΛHDS: State loaded from disk",
-                path=str(self.storage_path),
-                nodes=len(self.nodes),
+    async def _load_legacy_json(self):
+        """Load a JSON state file written before the segment log existed"""
+
+        def read_state() -> dict[str, Any]:
+            with open(self.storage_path) as f:
+                return json.load(f)
+
+        state = await asyncio.to_thread(read_state)
+
+        # Reconstruct nodes
+        for node_id, node_data in state["nodes"].items():
+            node = MemoryNode(
+                node_id=node_id,
+                tier=MemoryTier(node_data["tier"]),
+                metadata=node_data["metadata"],
+                parent_id=node_data["parent_id"],
+                children_ids=node_data["children_ids"],
+                cross_refs=set(node_data["cross_refs"]),
+                importance_score=node_data["importance_score"],
+                access_count=node_data["access_count"],
+                compression_level=CompressionLevel(node_data["compression_level"]),
+                is_compressed=node_data["is_compressed"],
+                checksum=node_data["checksum"],
+                created_at=datetime.fromisoformat(node_data["created_at"]),
+                last_accessed=datetime.fromisoformat(node_data["last_accessed"]),
             )
+            self.nodes[node_id] = node
+            self.tier_indices[node.tier].add(node_id)
+
+            if node.parent_id:
+                self.parent_child_map[node.parent_id].add(node_id)
+
+        # Restore compression cache
+        self.compression_cache = {node_id: bytes.fromhex(data) for node_id, data in state["compression_cache"].items()}
+
+        # Restore metrics
+        self.metrics.update(state["metrics"])
+
+        # Write everything to the segment log on the next flush
+        self._dirty.update(self.nodes)
+
+    def _node_record(self, node: MemoryNode) -> LogRecord:
+        """Snapshot a node into a segment log record (containers are shallow-copied)"""
+        meta = {
+            "id": node.node_id,
+            "tier": node.tier.value,
+            "metadata": dict(node.metadata),
+            "parent_id": node.parent_id,
+            "children_ids": list(node.children_ids),
+            "cross_refs": list(node.cross_refs),
+            "importance_score": node.importance_score,
+            "access_count": node.access_count,
+            "compression_level": node.compression_level.value,
+            "is_compressed": node.is_compressed,
+            "checksum": node.checksum,
+            "created_at": node.created_at.isoformat(),
+            "last_accessed": node.last_accessed.isoformat(),
+            "decay_rate": node.decay_rate,
+            "collapse_trace_id": node.collapse_trace_id,
+            "collapse_score_history": [(ts.isoformat(), score) for ts, score in node.collapse_score_history],
+            "collapse_alert_level": node.collapse_alert_level,
+            "collapse_metadata": dict(node.collapse_metadata),
+        }
+        if not node.is_compressed:
+            meta["content"] = node.content
+        return RECORD_NODE, meta, self.compression_cache.get(node.node_id)
 
-        except Exception as e:
-            logger.error("ΛHDS: Failed to load state", error=str(e))
+    def _restore_node(self, meta: dict[str, Any], payload: bytes):
+        """Rebuild a node from its segment log record"""
+        node = MemoryNode(
+            node_id=meta["id"],
+            tier=MemoryTier(meta["tier"]),
+            content=meta.get("content"),
+            metadata=meta["metadata"],
+            parent_id=meta["parent_id"],
+            children_ids=meta["children_ids"],
+            cross_refs=set(meta["cross_refs"]),
+            compression_level=CompressionLevel(meta["compression_level"]),
+            importance_score=meta["importance_score"],
+            access_count=meta["access_count"],
+            last_accessed=datetime.fromisoformat(meta["last_accessed"]),
+            created_at=datetime.fromisoformat(meta["created_at"]),
+            decay_rate=meta.get("decay_rate", 0.1),
+            is_compressed=meta["is_compressed"],
+            checksum=meta["checksum"],
+            collapse_trace_id=meta.get("collapse_trace_id"),
+            collapse_score_history=[
+                (datetime.fromisoformat(ts), score) for ts, score in meta.get("collapse_score_history", [])
+            ],
+            collapse_alert_level=meta.get("collapse_alert_level"),
+            collapse_metadata=meta.get("collapse_metadata", {}),
+        )
+        self.nodes[node.node_id] = node
+        self.tier_indices[node.tier].add(node.node_id)
+        if node.parent_id:
+            self.parent_child_map[node.parent_id].add(node.node_id)
+        if payload:
+            self.compression_cache[node.node_id] = payload
+
+    # Ordered index maintenance
+
+    def _index_node(self, node: MemoryNode):
+        """Insert or re-position a node in the importance and recency indexes"""
+        old_key = self._importance_keys.get(node.node_id)
+        if old_key is not None:
+            if -old_key[0] == node.importance_score:
+                return
+            del self._importance_order[bisect_right(self._importance_order, old_key) - 1]
+        else:
+            self._recency[node.node_id] = node.last_accessed.timestamp()
+            self._created_ts[node.node_id] = node.created_at.timestamp()
+
+        key = (-node.importance_score, self._index_seq, node.node_id)
+        self._index_seq += 1
+        insort(self._importance_order, key)
+        self._importance_keys[node.node_id] = key
+
+    def _unindex_node(self, node_id: str):
+        key = self._importance_keys.pop(node_id, None)
+        if key is not None:
+            del self._importance_order[bisect_right(self._importance_order, key) - 1]
+        self._recency.pop(node_id, None)
+        self._created_ts.pop(node_id, None)
+
+    def _rebuild_ordered_indexes(self):
+        """Rebuild the ordered indexes from scratch (after loading)"""
+        self._importance_order = []
+        self._importance_keys = {}
+        self._recency = OrderedDict()
+        self._created_ts = {}
+        for seq, node in enumerate(sorted(self.nodes.values(), key=lambda n: n.last_accessed)):
+            key = (-node.importance_score, seq, node.node_id)
+            self._importance_order.append(key)
+            self._importance_keys[node.node_id] = key
+            self._recency[node.node_id] = node.last_accessed.timestamp()
+            self._created_ts[node.node_id] = node.created_at.timestamp()
+        self._importance_order.sort()
+        self._index_seq = len(self._importance_order)
+
+    def _nodes_above_importance(self, threshold: float) -> list[str]:
+        """Node ids with importance >= threshold, most important first"""
+        end = bisect_right(self._importance_order, (-threshold, float("inf")))
+        return [key[2] for key in self._importance_order[:end]]
 
     # Collapse state management methods (Task 6 - Claude Code)
     async def update_collapse_state(
@@ -746,6 +924,7 @@ class HierarchicalDataStore:
 
         # Add to collapse score history
         node.collapse_score_history.append((datetime.now(timezone.utc), collapse_score))
+        self._dirty.add(node_id)
 
         # Limit history size to prevent memory bloat
         if len(node.collapse_score_history) > 100:
@@ -180,6 +180,58 @@ class TraceSpan:
         }
 
 
+_SEVERITY_INDEX = {severity: index for index, severity in enumerate(SeverityLevel)}
+
+
+class RollingWindowCounter:
+    """
+    Counts over a sliding time window, kept in fixed-width ring buckets.
+
+    Each bucket holds one count per slot (e.g. per severity level). The
+    window spans the current bucket and the ``window_sec / bucket_sec - 1``
+    buckets before it, so its trailing edge is accurate to one bucket.
+    """
+
+    def __init__(self, slots: int = 1, window_sec: float = 300.0, bucket_sec: float = 5.0):
+        self.slots = slots
+        self.bucket_sec = bucket_sec
+        self.num_buckets = max(1, round(window_sec / bucket_sec))
+        self._bucket_ids: list[Optional[int]] = [None] * self.num_buckets
+        self._counts: list[list[int]] = [[0] * slots for _ in range(self.num_buckets)]
+
+    def add(self, timestamp: float, slot: int = 0) -> None:
+        """Count one occurrence at timestamp."""
+        bucket_id = int(timestamp // self.bucket_sec)
+        index = bucket_id % self.num_buckets
+        if self._bucket_ids[index] != bucket_id:
+            if self._bucket_ids[index] is not None and self._bucket_ids[index] > bucket_id:
+                return  # Older than the window already held in this ring slot
+            self._bucket_ids[index] = bucket_id
+            self._counts[index] = [0] * self.slots
+        self._counts[index][slot] += 1
+
+    def discard(self, timestamp: float, slot: int = 0) -> None:
+        """Uncount one occurrence at timestamp, if its bucket is still held."""
+        bucket_id = int(timestamp // self.bucket_sec)
+        index = bucket_id % self.num_buckets
+        if self._bucket_ids[index] == bucket_id and self._counts[index][slot] > 0:
+            self._counts[index][slot] -= 1
+
+    def counts(self, now: float) -> list[int]:
+        """Per-slot counts inside the window ending at now."""
+        current = int(now // self.bucket_sec)
+        totals = [0] * self.slots
+        for bucket_id, counts in zip(self._bucket_ids, self._counts):
+            if bucket_id is not None and current - bucket_id < self.num_buckets:
+                for slot, count in enumerate(counts):
+                    totals[slot] += count
+        return totals
+
+    def total(self, now: float) -> int:
+        """Count across all slots inside the window ending at now."""
+        return sum(self.counts(now))
+
+
 class TelemetryCollector:
     """Central telemetry collection and processing system."""
 
@@ -187,7 +239,9 @@ class TelemetryCollector:
                  max_events: int = 10000,
                  max_metrics: int = 50000,
                  max_spans: int = 5000,
-                 flush_interval_sec: float = 30.0):
+                 flush_interval_sec: float = 30.0,
+                 health_window_sec: float = 300.0,
+                 health_bucket_sec: float = 5.0):
         """
         Initialize telemetry collector.
 
@@ -196,6 +250,8 @@ class TelemetryCollector:
             max_metrics: Maximum number of metrics to keep in memory
             max_spans: Maximum number of spans to keep in memory
             flush_interval_sec: Interval for flushing data to external systems
+            health_window_sec: Window for component health and recent activity counts
+            health_bucket_sec: Resolution of the rolling health window
         """
 
         # Event storage
@@ -208,6 +264,17 @@ class TelemetryCollector:
         self.metric_aggregations: dict[str, dict[str, Any]] = defaultdict(dict)
         self.component_health: dict[str, dict[str, Any]] = defaultdict(dict)
 
+        # Rolling window counts, updated as data arrives and is evicted so
+        # health and overview queries count exactly the stored items in the
+        # window without rescanning them
+        self.health_window_sec = health_window_sec
+        self.health_bucket_sec = health_bucket_sec
+        self._component_windows: dict[str, RollingWindowCounter] = {}
+        self._component_retained: dict[str, int] = {}  # Events per component in self.events
+        self._event_window = self._new_window()
+        self._metric_window = self._new_window()
+        self._span_window = self._new_window()
+
         # Event subscribers
         self.event_subscribers: list[Callable] = []
         self.metric_subscribers: list[Callable] = []
@@ -220,6 +287,33 @@ class TelemetryCollector:
         if PROMETHEUS_AVAILABLE:
             self._setup_prometheus_metrics()
 
+    def _new_window(self, slots: int = 1) -> RollingWindowCounter:
+        return RollingWindowCounter(slots, self.health_window_sec, self.health_bucket_sec)
+
+    def _track_event(self, event: TelemetryEvent) -> None:
+        """Update rolling counts for an event about to be stored."""
+        if self.events.maxlen is not None and len(self.events) == self.events.maxlen:
+            evicted = self.events[0]
+            self._event_window.discard(evicted.timestamp)
+            remaining = self._component_retained.get(evicted.component, 0) - 1
+            if remaining > 0:
+                self._component_retained[evicted.component] = remaining
+                self._component_windows[evicted.component].discard(
+                    evicted.timestamp, _SEVERITY_INDEX[evicted.severity]
+                )
+            else:
+                # No stored events left: the component drops out of the overview
+                self._component_retained.pop(evicted.component, None)
+                self._component_windows.pop(evicted.component, None)
+
+        component = event.component
+        self._component_retained[component] = self._component_retained.get(component, 0) + 1
+        window = self._component_windows.get(component)
+        if window is None:
+            window = self._component_windows[component] = self._new_window(len(_SEVERITY_INDEX))
+        window.add(event.timestamp, _SEVERITY_INDEX[event.severity])
+        self._event_window.add(event.timestamp)
+
     def _setup_prometheus_metrics(self) -> None:
         """Setup Prometheus metrics."""
 
@@ -267,6 +361,7 @@ class TelemetryCollector:
         )
 
         # Store event
+        self._track_event(event)
         self.events.append(event)
 
         # Update Prometheus metrics
@@ -312,7 +407,10 @@ class TelemetryCollector:
         )
 
         # Store metric
+        if self.metrics.maxlen is not None and len(self.metrics) == self.metrics.maxlen:
+            self._metric_window.discard(self.metrics[0].timestamp)
         self.metrics.append(metric)
+        self._metric_window.add(metric.timestamp)
 
         # Update aggregations
         self._update_metric_aggregations(metric)
@@ -360,7 +458,13 @@ class TelemetryCollector:
         # Move to completed spans
         if span.span_id in self.spans:
             del self.spans[span.span_id]
+        if self.completed_spans.maxlen is not None and len(self.completed_spans) == self.completed_spans.maxlen:
+            evicted = self.completed_spans[0]
+            if evicted.end_time is not None:
+                self._span_window.discard(evicted.end_time)
         self.completed_spans.append(span)
+        if span.end_time is not None:
+            self._span_window.add(span.end_time)
 
         # Update Prometheus metrics
         if PROMETHEUS_AVAILABLE and span.duration_ms is not None:
@@ -422,23 +526,21 @@ class TelemetryCollector:
     def get_component_health(self, component: str) -> dict[str, Any]:
         """Get health metrics for a component."""
 
-        # Calculate health based on recent events and metrics
-        recent_events = [
-            e for e in list(self.events)[-1000:]  # Last 1000 events
-            if e.component == component and (time.time() - e.timestamp) < 300  # Last 5 minutes
-        ]
+        # Calculate health based on events in the rolling window (last 5 minutes)
+        window = self._component_windows.get(component)
+        counts = window.counts(time.time()) if window else [0] * len(_SEVERITY_INDEX)
+        recent_count = sum(counts)
 
-        error_count = sum(1 for e in recent_events if e.severity in [SeverityLevel.ERROR, SeverityLevel.CRITICAL])
-        warning_count = sum(1 for e in recent_events if e.severity == SeverityLevel.WARNING)
+        error_count = counts[_SEVERITY_INDEX[SeverityLevel.ERROR]] + counts[_SEVERITY_INDEX[SeverityLevel.CRITICAL]]
+        warning_count = counts[_SEVERITY_INDEX[SeverityLevel.WARNING]]
 
         # Calculate health score (0-1)
-        error_count + warning_count
-        if len(recent_events) == 0:
+        if recent_count == 0:
             health_score = 1.0  # No recent events, assume healthy
         else:
             # Health decreases with errors (weight 3x) and warnings (weight 1x)
             weighted_issues = (error_count * 3) + warning_count
-            health_score = max(0.0, 1.0 - (weighted_issues / len(recent_events)))
+            health_score = max(0.0, 1.0 - (weighted_issues / recent_count))
 
         # Update Prometheus gauge
         if PROMETHEUS_AVAILABLE:
@@ -448,7 +550,7 @@ class TelemetryCollector:
             "component": component,
             "health_score": health_score,
             "status": "healthy" if health_score > 0.8 else "degraded" if health_score > 0.5 else "unhealthy",
-            "recent_events": len(recent_events),
+            "recent_events": recent_count,
             "error_count": error_count,
             "warning_count": warning_count,
             "last_update": time.time()
@@ -460,11 +562,10 @@ class TelemetryCollector:
     def get_system_overview(self) -> dict[str, Any]:
         """Get comprehensive system overview."""
 
-        # Component health
-        components = {e.component for e in self.events}
+        # Component health for every component with stored events
         component_health = {
             comp: self.get_component_health(comp)
-            for comp in components
+            for comp in self._component_retained
         }
 
         # Overall system health
@@ -476,8 +577,8 @@ class TelemetryCollector:
         # Active spans
         active_operations = len(self.spans)
 
-        # Recent activity
-        recent_events = [e for e in self.events if (time.time() - e.timestamp) < 300]  # Last 5 minutes
+        # Recent activity (last 5 minutes)
+        now = time.time()
 
         return {
             "timestamp": time.time(),
@@ -486,9 +587,9 @@ class TelemetryCollector:
             "components": component_health,
             "active_operations": active_operations,
             "recent_activity": {
-                "events_5min": len(recent_events),
-                "metrics_5min": len([m for m in self.metrics if (time.time() - m.timestamp) < 300]),
-                "completed_spans_5min": len([s for s in self.completed_spans if s.end_time and (time.time() - s.end_time) < 300])
+                "events_5min": self._event_window.total(now),
+                "metrics_5min": self._metric_window.total(now),
+                "completed_spans_5min": self._span_window.total(now)
             },
             "storage": {
                 "events": len(self.events),
@@ -15,7 +15,10 @@ from typing import Any, Optional
 try:
     from core.orchestration.brain.trace_memory_logger import TraceMemoryLogger
 except ImportError:
-    TraceMemoryLogger = None
+    try:
+        from labs.core.orchestration.brain.trace_memory_logger import TraceMemoryLogger
+    except ImportError:
+        TraceMemoryLogger = None
 
 logger = logging.getLogger(__name__)
 
@@ -212,10 +215,10 @@ class FileTraceStorageProvider(TraceStorageProvider):
                 raise ValueError("user_id is required for data isolation")
 
             trace_logger = self._get_trace_logger()
-            all_traces = trace_logger.get_recent_traces(limit=limit * 2, level=level, tag=tag)
+            all_traces = trace_logger.get_recent_traces(limit=limit, level=level, tag=tag, user_id=user_id)
 
-            # Filter by user ownership
-            # Only return traces belonging to this user
+            # Filter by user ownership (defence in depth; the logger already
+            # reads the user's postings from the segment index)
             user_traces = [
                 t for t in all_traces
                 if t.get("user_id") == user_id
@@ -240,9 +243,10 @@ class FileTraceStorageProvider(TraceStorageProvider):
             # Check if storage directory is accessible
             storage_accessible = os.path.isdir(self.storage_location) and os.access(self.storage_location, os.W_OK)
 
-            # Check if all_traces.jsonl exists and is readable
+            # Check for trace segments (or a legacy all_traces.jsonl)
             all_traces_file = os.path.join(self.storage_location, "all_traces.jsonl")
-            traces_file_exists = os.path.exists(all_traces_file)
+            segments_dir = Path(self.storage_location) / "segments"
+            traces_file_exists = os.path.exists(all_traces_file) or any(segments_dir.glob("*.jsonl"))
 
             # Get metrics
             recent_count = len(trace_logger.recent_traces)
@@ -69,6 +69,63 @@ class TestEventBus:
 
         callback.assert_called_once()
 
+    async def test_tracking_is_bounded(self):
+        bus = EventBus(tracking_limit=3, max_tracked_keys=2, history_limit=5)
+
+        for i in range(10):
+            await bus.publish(DreamEventType.DREAM_INSIGHT_GENERATED.value, {"i": i}, correlation_id="c1", dream_id="d1")
+        await bus.publish("other_event", {}, correlation_id="c2")
+        await bus.publish("other_event", {}, correlation_id="c3")
+
+        assert [e.payload["i"] for e in await bus.get_dream_session_events("d1")] == [7, 8, 9]
+        assert await bus.get_correlated_events("c1") == []  # Evicted as least recently used
+        assert len(await bus.get_correlated_events("c3")) == 1
+        assert bus.get_event_bus_stats()["dream_event_history_size"] == 5
+
+    async def test_tracking_expires_idle_keys(self):
+        bus = EventBus(tracking_ttl=0.05)
+        await bus.publish("test_event", {}, correlation_id="old")
+        await asyncio.sleep(0.1)
+        await bus.publish("test_event", {}, correlation_id="new")
+
+        assert await bus.get_correlated_events("old") == []
+        assert len(await bus.get_correlated_events("new")) == 1
+
+    async def test_wait_for_dream_completion_wakes_on_publish(self, event_bus):
+        waiter = asyncio.create_task(event_bus.wait_for_dream_completion("dream-1", timeout_seconds=5.0))
+        await asyncio.sleep(0)
+        await event_bus.publish_dream_event(DreamEventType.DREAM_CYCLE_COMPLETE, "dream-1", {"ok": True})
+
+        event = await asyncio.wait_for(waiter, 0.05)
+        assert event.payload == {"ok": True}
+        assert not event_bus._completion_waiters
+
+        # Already completed sessions return immediately; unknown ones time out
+        assert (await event_bus.wait_for_dream_completion("dream-1", 0.01)) is event
+        assert await event_bus.wait_for_dream_completion("dream-2", 0.01) is None
+
+    async def test_shards_preserve_session_order_and_run_in_parallel(self):
+        bus = EventBus(num_shards=8)
+        await bus.start()
+        seen = {}
+
+        async def handler(event):
+            await asyncio.sleep(0.01)
+            seen.setdefault(event.correlation_id, []).append(event.payload["seq"])
+
+        bus.subscribe("work", handler)
+        start = asyncio.get_running_loop().time()
+        for seq in range(5):
+            for session in range(8):
+                await bus.publish("work", {"seq": seq}, correlation_id=f"session-{session}")
+        await bus.join()
+        elapsed = asyncio.get_running_loop().time() - start
+        await bus.stop()
+
+        assert all(order == [0, 1, 2, 3, 4] for order in seen.values())
+        assert len(seen) == 8
+        assert elapsed < 40 * 0.01  # Serial processing would take 0.4s
+
     async def test_global_event_bus(self):
         bus = await get_global_event_bus()
         assert isinstance(bus, EventBus)
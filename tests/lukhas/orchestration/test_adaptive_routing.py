@@ -3,8 +3,11 @@ Unit tests for the adaptive_routing module.
 """
 
 import asyncio
+import heapq
+import random
 import sys
 import unittest
+from collections import deque
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,6 +19,7 @@ from lukhas.orchestration.adaptive_routing import (
     LeastLoadedStrategy,
     LowestLatencyStrategy,
     Node,
+    PowerOfTwoChoicesStrategy,
     Router,
 )
 
@@ -55,6 +59,27 @@ class TestNode(unittest.TestCase):
         self.assertEqual(node.average_latency_ms, 175.0)
         self.assertEqual(node.error_rate, 0.25)
 
+    @patch('lukhas.orchestration.adaptive_routing.time.monotonic')
+    def test_peak_ewma_latency(self, mock_monotonic):
+        """Peak-EWMA jumps to slower samples and decays toward faster ones."""
+        mock_monotonic.return_value = 0.0
+        node = Node("node-1")
+
+        node.update_metrics(success=True, latency_ms=100.0)
+        self.assertEqual(node.latency_ewma_ms, 100.0)
+
+        # No time elapsed: a faster sample does not pull the peak down
+        node.update_metrics(success=True, latency_ms=10.0)
+        self.assertEqual(node.latency_ewma_ms, 100.0)
+
+        # One time constant later the faster sample carries 1 - 1/e of the weight
+        mock_monotonic.return_value = Node.LATENCY_DECAY_S
+        node.update_metrics(success=True, latency_ms=10.0)
+        self.assertAlmostEqual(node.latency_ewma_ms, 10.0 + 90.0 / 2.718281828459045)
+
+        node.update_metrics(success=True, latency_ms=500.0)
+        self.assertEqual(node.latency_ewma_ms, 500.0)
+
     def test_to_dict(self):
         """Test the dictionary representation of a Node."""
         node = Node("node-1")
@@ -131,3 +156,187 @@ class TestRouter:
         # Ensure other nodes are unaffected
         node_info = await router.get_all_nodes()
         assert node_info[0]['average_latency_ms'] == 0
+
+    async def test_track_counts_in_flight_requests(self):
+        """Load is incremented for the duration of a tracked request."""
+        router = Router()
+        await router.register_node("node-1")
+        node = router._nodes["node-1"]
+
+        async with router.track(node):
+            async with router.track(node):
+                assert node.current_load == 2
+            assert node.current_load == 1
+
+        assert node.current_load == 0
+        assert node.latency_ewma_ms > 0
+        assert node.error_rate == 0.0
+
+    async def test_track_records_failures(self):
+        """A request that raises is recorded as an error and released."""
+        router = Router()
+        await router.register_node("node-1")
+        node = router._nodes["node-1"]
+
+        with pytest.raises(ValueError):
+            async with router.track(node):
+                raise ValueError("backend failed")
+
+        assert node.current_load == 0
+        assert node.error_rate == 0.5
+
+    async def test_dispatch_routes_around_busy_node(self):
+        """LeastLoaded sees in-flight requests started through dispatch."""
+        router = Router(strategy=LeastLoadedStrategy)
+        await router.register_node("node-1")
+        await router.register_node("node-2")
+        release = asyncio.Event()
+
+        async def hold(node):
+            await release.wait()
+            return node.node_id
+
+        pending = asyncio.create_task(router.dispatch(hold))
+        await asyncio.sleep(0)
+        assert router._nodes["node-1"].current_load == 1
+
+        async def echo(node):
+            return node.node_id
+
+        assert await router.dispatch(echo) == "node-2"
+        release.set()
+        assert await pending == "node-1"
+
+    async def test_dispatch_without_nodes_raises(self):
+        router = Router()
+
+        async def echo(node):
+            return node.node_id
+
+        with pytest.raises(RuntimeError):
+            await router.dispatch(echo)
+
+
+class TestPowerOfTwoChoices:
+
+    def make_nodes(self, specs):
+        nodes = []
+        for node_id, load, latency, error_rate in specs:
+            node = Node(node_id)
+            node.current_load = load
+            node.latency_ewma_ms = latency
+            node.error_rate = error_rate
+            nodes.append(node)
+        return nodes
+
+    def test_picks_lower_load_latency_cost(self):
+        """Of the two sampled nodes, the lower (load + 1) x latency wins."""
+        strategy = PowerOfTwoChoicesStrategy(rng=random.Random(0))
+        # Slow but idle (1 x 40) is cheaper than fast but busy (5 x 10)
+        nodes = self.make_nodes([("fast-busy", 4, 10.0, 0.0), ("slow-idle", 0, 40.0, 0.0)])
+
+        for _ in range(10):
+            assert strategy.select_node(nodes).node_id == "slow-idle"
+
+    def test_skips_unhealthy_nodes(self):
+        strategy = PowerOfTwoChoicesStrategy(max_error_rate=0.5, rng=random.Random(1))
+        nodes = self.make_nodes(
+            [("a", 0, 10.0, 0.0), ("b", 0, 20.0, 0.1), ("broken", 0, 1.0, 0.9)]
+        )
+
+        selected = {strategy.select_node(nodes).node_id for _ in range(50)}
+        assert selected == {"a"}
+
+    def test_falls_back_when_too_few_healthy(self):
+        strategy = PowerOfTwoChoicesStrategy(rng=random.Random(2))
+        nodes = self.make_nodes([("a", 0, 10.0, 0.9), ("b", 0, 5.0, 0.0)])
+
+        assert strategy.select_node(nodes).node_id == "b"
+        assert strategy.select_node(nodes[:1]).node_id == "a"
+        assert strategy.select_node([]) is None
+
+    def test_spreads_load_across_equal_nodes(self):
+        """Sampling avoids herding onto a single node."""
+        strategy = PowerOfTwoChoicesStrategy(rng=random.Random(3))
+        nodes = self.make_nodes([(f"n{i}", 0, 10.0, 0.0) for i in range(4)])
+
+        for _ in range(400):
+            strategy.select_node(nodes).current_load += 1
+
+        loads = [node.current_load for node in nodes]
+        assert max(loads) - min(loads) <= 4
+
+
+class TestRoutingSimulation:
+    """
+    Discrete-event simulation of heterogeneous backends in virtual time.
+
+    Poisson arrivals are routed by each strategy to four backends with four
+    FIFO worker slots each; one backend is 15x slower than the fast ones.
+    In-flight counts and latency samples are fed back exactly as
+    Router.track does, with the module clock driven by simulated time.
+    """
+
+    BACKEND_MS = {"degraded": 15.0, "medium": 2.0, "fast-1": 1.0, "fast-2": 1.0}
+    SLOTS = 4
+
+    class Clock:
+        now = 0.0
+
+        def monotonic(self):
+            return self.now
+
+    def simulate(self, strategy, utilisation=0.7, requests=20_000, seed=0):
+        clock = self.Clock()
+        with patch("lukhas.orchestration.adaptive_routing.time", clock):
+            nodes = [Node(node_id) for node_id in self.BACKEND_MS]
+            capacity = sum(self.SLOTS * 1000 / ms for ms in self.BACKEND_MS.values())
+            rng = random.Random(seed)
+
+            arrivals, t = [], 0.0
+            for _ in range(requests):
+                t += rng.expovariate(utilisation * capacity)
+                arrivals.append((t, rng.expovariate(1.0)))  # Arrival time, unit service demand
+
+            events = [(arrival, 0, i) for i, (arrival, _) in enumerate(arrivals)]
+            heapq.heapify(events)
+            busy = {node_id: 0 for node_id in self.BACKEND_MS}
+            queued = {node_id: deque() for node_id in self.BACKEND_MS}
+            assigned, latencies = {}, []
+
+            def start(node, i):
+                busy[node.node_id] += 1
+                service_s = arrivals[i][1] * self.BACKEND_MS[node.node_id] / 1000
+                heapq.heappush(events, (clock.now + service_s, 1, i))
+
+            while events:
+                clock.now, completed, i = heapq.heappop(events)
+                if not completed:
+                    node = strategy.select_node(nodes)
+                    node.current_load += 1
+                    assigned[i] = node
+                    if busy[node.node_id] < self.SLOTS:
+                        start(node, i)
+                    else:
+                        queued[node.node_id].append(i)
+                else:
+                    node = assigned.pop(i)
+                    busy[node.node_id] -= 1
+                    node.current_load -= 1
+                    latency_ms = (clock.now - arrivals[i][0]) * 1000
+                    latencies.append(latency_ms)
+                    node.update_metrics(True, latency_ms)
+                    if queued[node.node_id]:
+                        start(node, queued[node.node_id].popleft())
+
+        latencies.sort()
+        return latencies[int(len(latencies) * 0.99) - 1]
+
+    def test_p2c_has_lower_tail_latency_than_existing_strategies(self):
+        least_loaded = self.simulate(LeastLoadedStrategy())
+        lowest_latency = self.simulate(LowestLatencyStrategy())
+        p2c = self.simulate(PowerOfTwoChoicesStrategy(rng=random.Random(1)))
+
+        # Load-only routing keeps feeding the slow backend; latency-only routing herds
+        assert p2c < least_loaded / 2
+        assert p2c < lowest_latency / 2
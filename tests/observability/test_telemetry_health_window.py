@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test Suite: Rolling health windows in TelemetryCollector
+
+Compares the incrementally maintained component health and recent-activity
+counts with the brute-force rescan of stored events on randomised streams.
+"""
+
+import random
+
+import pytest
+from observability.telemetry_system import (
+    RollingWindowCounter,
+    SeverityLevel,
+    TelemetryCollector,
+)
+
+from observability import telemetry_system
+
+WINDOW = 300.0
+BUCKET = 5.0
+COMPONENTS = ["api", "memory", "guardian", "bridge", "matriz"]
+SEVERITIES = list(SeverityLevel)
+
+
+class Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(telemetry_system.time, "time", clock)
+    return clock
+
+
+def in_window(now, timestamp, aligned):
+    if aligned:
+        return now // BUCKET - timestamp // BUCKET < WINDOW / BUCKET
+    return now - timestamp < WINDOW
+
+
+def brute_force_health(collector, component, now, aligned=False):
+    """The original per-component rescan of the last 1000 stored events."""
+    recent = [
+        e for e in list(collector.events)[-1000:]
+        if e.component == component and in_window(now, e.timestamp, aligned)
+    ]
+    errors = sum(1 for e in recent if e.severity in (SeverityLevel.ERROR, SeverityLevel.CRITICAL))
+    warnings = sum(1 for e in recent if e.severity == SeverityLevel.WARNING)
+    score = 1.0 if not recent else max(0.0, 1.0 - (errors * 3 + warnings) / len(recent))
+    return {"health_score": score, "recent_events": len(recent), "error_count": errors, "warning_count": warnings}
+
+
+def brute_force_activity(collector, now, aligned=False):
+    return {
+        "events_5min": sum(1 for e in collector.events if in_window(now, e.timestamp, aligned)),
+        "metrics_5min": sum(1 for m in collector.metrics if in_window(now, m.timestamp, aligned)),
+        "completed_spans_5min": sum(
+            1 for s in collector.completed_spans if s.end_time and in_window(now, s.end_time, aligned)
+        ),
+    }
+
+
+def drive(collector, clock, rng, steps, advance):
+    """Emit a random mix of events, metrics and spans; yield after each step."""
+    for _ in range(steps):
+        clock.now += advance(rng)
+        for _ in range(rng.randrange(9)):
+            collector.emit_event(rng.choice(COMPONENTS), "tick", "event", rng.choice(SEVERITIES))
+        for _ in range(rng.randrange(4)):
+            collector.emit_metric(rng.choice(COMPONENTS), "latency_ms", rng.random())
+        if rng.random() < 0.5:
+            collector.finish_span(collector.start_span("op", rng.choice(COMPONENTS)))
+        yield
+
+
+def assert_matches_brute_force(collector, now, aligned):
+    overview = collector.get_system_overview()
+
+    assert set(overview["components"]) == {e.component for e in collector.events}
+    for component, health in overview["components"].items():
+        expected = brute_force_health(collector, component, now, aligned)
+        assert {key: health[key] for key in expected} == pytest.approx(expected)
+    assert overview["recent_activity"] == brute_force_activity(collector, now, aligned)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force_on_bucket_aligned_stream(clock, seed):
+    """With timestamps on bucket boundaries the rolling window is exact."""
+    rng = random.Random(seed)
+    # At most 8 events per 5 s step keeps every in-window event stored
+    collector = TelemetryCollector(max_events=500, max_metrics=10_000, max_spans=10_000)
+
+    for _ in drive(collector, clock, rng, steps=400, advance=lambda r: BUCKET * r.randint(1, 3)):
+        assert_matches_brute_force(collector, clock.now, aligned=False)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_bucket_aligned_brute_force_on_random_stream(clock, seed):
+    """With arbitrary timestamps the window's trailing edge is rounded to a bucket."""
+    rng = random.Random(100 + seed)
+    collector = TelemetryCollector(max_events=500, max_metrics=10_000, max_spans=10_000)
+
+    for _ in drive(collector, clock, rng, steps=400, advance=lambda r: r.uniform(1.0, 15.0)):
+        assert_matches_brute_force(collector, clock.now, aligned=True)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_counts_drop_items_evicted_from_storage(clock, seed):
+    """Small stores evict in-window items; the windows count only what is stored."""
+    rng = random.Random(200 + seed)
+    collector = TelemetryCollector(max_events=40, max_metrics=15, max_spans=5)
+
+    for _ in drive(collector, clock, rng, steps=200, advance=lambda r: BUCKET * r.randint(0, 2)):
+        assert_matches_brute_force(collector, clock.now, aligned=False)
+
+
+def test_component_leaves_overview_with_its_last_stored_event(clock):
+    collector = TelemetryCollector(max_events=3)
+    collector.emit_event("old", "tick", "event", SeverityLevel.ERROR)
+    for _ in range(3):
+        collector.emit_event("new", "tick", "event")
+
+    overview = collector.get_system_overview()
+
+    assert set(overview["components"]) == {"new"}
+    assert collector.get_component_health("old")["recent_events"] == 0
+
+
+def test_rolling_counter_expires_and_ignores_stale_buckets():
+    counter = RollingWindowCounter(slots=2, window_sec=20.0, bucket_sec=5.0)
+    counter.add(100.0, 0)
+    counter.add(104.0, 1)
+    counter.add(112.0, 1)
+
+    assert counter.counts(114.0) == [1, 2]
+    assert counter.counts(124.9) == [0, 1]
+    assert counter.total(140.0) == 0
+
+    counter.add(200.0)
+    counter.add(180.0)  # Shares a ring slot with a newer bucket: outside the window
+    assert counter.counts(200.0) == [1, 0]
+
+    counter.discard(180.0)  # Its bucket is gone: nothing to uncount
+    counter.discard(200.0)
+    counter.discard(200.0)
+    assert counter.counts(200.0) == [0, 0]
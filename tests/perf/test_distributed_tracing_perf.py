@@ -0,0 +1,51 @@
+# tests/perf/test_distributed_tracing_perf.py
+"""
+Performance benchmark for TraceCollector span ingestion (env-gated).
+"""
+
+import os
+import time
+
+import pytest
+from labs.core.distributed_tracing import TraceCollector, TraceSpan
+
+TOTAL_SPANS = 100_000
+
+
+def _ingest(spans_per_trace: int) -> float:
+    """Add and finish TOTAL_SPANS spans; return spans per second."""
+    collector = TraceCollector()
+    spans = [
+        TraceSpan(f"s{i}", f"t{i // spans_per_trace}", None, f"op{i % 16}", "svc", 0.0, None, None, {}, [], "active")
+        for i in range(TOTAL_SPANS)
+    ]
+
+    start = time.perf_counter()
+    for offset in range(0, TOTAL_SPANS, spans_per_trace):
+        batch = spans[offset : offset + spans_per_trace]
+        for span in batch:
+            collector.add_span(span)
+        for span in batch:
+            span.end_time = 1.0
+            span.duration = 1.0
+            span.status = "ok"
+            collector.add_span(span)
+    elapsed = time.perf_counter() - start
+
+    assert not collector.traces
+    assert len(collector.completed_traces) == TOTAL_SPANS // spans_per_trace
+    return TOTAL_SPANS / elapsed
+
+
+@pytest.mark.skipif(
+    os.getenv("LUKHAS_PERF") != "1",
+    reason="Performance tests only run with LUKHAS_PERF=1"
+)
+def test_trace_collector_overhead_flat_in_trace_size():
+    """Per-span cost does not grow with the number of spans per trace."""
+    small = _ingest(10)
+    large = _ingest(5_000)
+    print(f"\nTraceCollector ingest: 10 spans/trace={small:,.0f} spans/s, 5000 spans/trace={large:,.0f} spans/s")
+
+    assert large > small / 2, "span ingestion slows down as traces grow"
+    assert large > 100_000, f"span ingestion {large:,.0f} spans/s below 100k spans/s"
@@ -0,0 +1,89 @@
+# tests/perf/test_event_bus_perf.py
+"""
+Throughput and latency benchmarks for the sharded EventBus (env-gated).
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+from labs.core.event_bus import EventBus
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("LUKHAS_PERF") != "1",
+    reason="Performance tests only run with LUKHAS_PERF=1"
+)
+
+
+async def test_event_bus_publish_throughput():
+    """Publishing and dispatching to a trivial handler sustains high throughput."""
+    bus = EventBus()
+    await bus.start()
+    handled = 0
+
+    def handler(event):
+        nonlocal handled
+        handled += 1
+
+    bus.subscribe("bench", handler)
+    total = 50_000
+    start = time.perf_counter()
+    for i in range(total):
+        await bus.publish("bench", {"i": i}, correlation_id=f"session-{i % 256}")
+    await bus.join()
+    elapsed = time.perf_counter() - start
+    await bus.stop()
+
+    print(f"\nEventBus throughput: {total / elapsed:,.0f} events/s")
+    assert handled == total
+    assert total / elapsed > 10_000
+
+
+async def test_event_bus_dispatch_latency():
+    """Publish-to-handler latency stays low with many live sessions."""
+    bus = EventBus()
+    await bus.start()
+    latencies = []
+
+    def handler(event):
+        latencies.append((time.perf_counter() - event.payload["sent"]) * 1000)
+
+    bus.subscribe("bench", handler)
+    for i in range(2_000):
+        await bus.publish("bench", {"sent": time.perf_counter()}, correlation_id=f"session-{i % 64}")
+        if i % 50 == 0:
+            await bus.join()
+    await bus.join()
+    await bus.stop()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"\nEventBus dispatch latency: p50={p50:.3f}ms p99={p99:.3f}ms")
+    assert p99 < 50.0
+
+
+async def test_event_bus_sharding_speedup():
+    """Slow handlers for independent sessions overlap across shards."""
+
+    async def run(num_shards: int) -> float:
+        bus = EventBus(num_shards=num_shards)
+        await bus.start()
+
+        async def handler(event):
+            await asyncio.sleep(0.002)
+
+        bus.subscribe("bench", handler)
+        start = time.perf_counter()
+        for i in range(400):
+            await bus.publish("bench", {}, correlation_id=f"session-{i % 32}")
+        await bus.join()
+        elapsed = time.perf_counter() - start
+        await bus.stop()
+        return elapsed
+
+    serial = await run(1)
+    sharded = await run(8)
+    print(f"\nEventBus 400 slow events: 1 shard={serial:.3f}s 8 shards={sharded:.3f}s")
+    assert sharded < serial / 2
@@ -0,0 +1,54 @@
+# tests/perf/test_fact_node_index_perf.py
+"""
+Performance benchmark for FactNode indexed knowledge-base lookup (env-gated).
+"""
+
+import os
+import time
+
+import pytest
+from matriz.nodes.fact_node import FactNode
+from matriz.nodes.knowledge_index import KnowledgeIndex
+
+KB_SIZE = 100_000
+
+
+@pytest.fixture(scope="module")
+def large_fact_node():
+    """FactNode carrying a 100k-entry synthetic knowledge base."""
+    node = FactNode()
+    node.knowledge_base.update(
+        {
+            f"what is the registered code of station {i}": {
+                "answer": f"Station {i} is registered as ST-{i:06d}.",
+                "category": "general",
+                "certainty": 0.9,
+                "keywords": [f"station{i}", "registered", "code"],
+            }
+            for i in range(KB_SIZE)
+        }
+    )
+    node._kb_index = KnowledgeIndex(node.knowledge_base)
+    return node
+
+
+@pytest.mark.skipif(
+    os.getenv("LUKHAS_PERF") != "1",
+    reason="Performance tests only run with LUKHAS_PERF=1"
+)
+def test_fact_node_100k_lookup_latency(large_fact_node):
+    """Indexed lookups over 100k facts stay in the low-millisecond range."""
+    questions = [f"What is the registered code of station {i}?" for i in range(0, KB_SIZE, KB_SIZE // 50)]
+
+    latencies = []
+    for question in questions:
+        start = time.perf_counter()
+        result = large_fact_node.process({"question": question})
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert result["answer"].startswith("Station")
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"\nFactNode 100k KB lookup: p50={latencies[len(latencies) // 2]:.2f}ms p95={p95:.2f}ms")
+
+    assert p95 < 50.0, f"p95 lookup latency {p95:.2f}ms exceeds 50ms budget"
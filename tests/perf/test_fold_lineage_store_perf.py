@@ -0,0 +1,62 @@
+# tests/perf/test_fold_lineage_store_perf.py
+"""
+Performance benchmark for the fold lineage graph store (env-gated).
+"""
+
+import json
+import os
+import random
+import time
+
+import pytest
+from memory.fold_lineage_store import LineageGraphStore
+from memory.fold_lineage_tracker import CausationType
+
+FOLD_COUNT = 200_000
+LINK_COUNT = 600_000
+
+
+@pytest.mark.skipif(
+    os.getenv("LUKHAS_PERF") != "1",
+    reason="Performance tests only run with LUKHAS_PERF=1"
+)
+def test_lineage_store_reopen_and_trace(tmp_path):
+    """Reopening from a snapshot skips the journal replay; deep traces stay fast."""
+    rng = random.Random(5)
+    types = [ctype.value for ctype in CausationType]
+    journal = tmp_path / "fold_lineage_log.jsonl"
+    with open(journal, "w", encoding="utf-8") as f:
+        for i in range(FOLD_COUNT):
+            f.write(json.dumps({
+                "event_type": "fold_state", "fold_key": f"f{i}", "timestamp_utc": "2025-01-01T00:00:00+00:00",
+                "importance_score": rng.random(), "drift_score": rng.random(), "collapse_hash": None,
+                "content_hash": f"h{i}", "causative_events": [],
+            }) + "\n")
+        for _ in range(LINK_COUNT):
+            target = rng.randrange(1, FOLD_COUNT)
+            f.write(json.dumps({
+                "event_type": "causal_link", "source_fold_key": f"f{rng.randrange(target)}",
+                "target_fold_key": f"f{target}", "causation_type": rng.choice(types),
+                "timestamp_utc": "2025-01-01T00:00:00+00:00", "strength": rng.random(), "metadata": {},
+            }) + "\n")
+
+    store = LineageGraphStore(journal, types, merge_threshold=10**9)
+    start = time.perf_counter()
+    store.open()
+    replay_seconds = time.perf_counter() - start
+    store.merge()
+    store.close()
+
+    reopened = LineageGraphStore(journal, types, merge_threshold=10**9)
+    start = time.perf_counter()
+    reopened.open()
+    reopen_seconds = time.perf_counter() - start
+    print(f"\nfull replay: {replay_seconds:.2f}s, reopen from snapshot: {reopen_seconds:.2f}s")
+    assert reopen_seconds < replay_seconds / 3
+
+    start = time.perf_counter()
+    for i in range(200):
+        reopened.trace_backwards(f"f{FOLD_COUNT - 1 - i}", 1_000)
+    per_trace_ms = (time.perf_counter() - start) / 200 * 1000
+    print(f"trace_backwards(max_depth=1000): {per_trace_ms:.2f} ms")
+    assert per_trace_ms < 50
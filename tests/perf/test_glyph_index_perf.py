@@ -0,0 +1,49 @@
+# tests/perf/test_glyph_index_perf.py
+"""
+Performance benchmark for bitmap glyph postings (env-gated).
+"""
+
+import os
+import random
+import time
+
+import numpy as np
+import pytest
+from core.glyph.glyph_memory_integration import GlyphMemoryIndex
+
+FOLD_COUNT = 100_000
+GLYPHS = ["💡", "🔗", "🌱", "🪞", "☯", "🔁", "🛡️", "❓"]
+
+
+@pytest.mark.skipif(
+    os.getenv("LUKHAS_PERF") != "1",
+    reason="Performance tests only run with LUKHAS_PERF=1"
+)
+def test_glyph_query_over_100k_folds():
+    """AND / OR / NOT over 100k folds and strongest-first top-k stay in milliseconds."""
+    rng = random.Random(11)
+    index = GlyphMemoryIndex()
+    affect = np.zeros(3)
+    expected: dict[str, set[str]] = {glyph: set() for glyph in GLYPHS}
+    for i in range(FOLD_COUNT):
+        for glyph in rng.sample(GLYPHS, 3):
+            index.bind_glyph_to_fold(glyph, f"f{i}", affect, rng.random())
+            expected[glyph].add(f"f{i}")
+
+    start = time.perf_counter()
+    for _ in range(20):
+        matches = index.query(all_of=["💡", "🔗"], any_of=["🌱", "🪞"], none_of=["❓"])
+    query_ms = (time.perf_counter() - start) / 20 * 1000
+
+    brute = (expected["💡"] & expected["🔗"] & (expected["🌱"] | expected["🪞"])) - expected["❓"]
+    assert set(index.fold_keys_for(matches)) == brute
+
+    start = time.perf_counter()
+    for _ in range(20):
+        top = index.get_folds_by_glyph("💡", limit=50)
+    top_ms = (time.perf_counter() - start) / 20 * 1000
+    assert len(top) == 50
+
+    print(f"\nquery: {query_ms:.2f} ms, top-50: {top_ms:.3f} ms over {FOLD_COUNT} folds")
+    assert query_ms < 50
+    assert top_ms < 5
@@ -0,0 +1,50 @@
+# tests/perf/test_jwt_cache_perf.py
+"""
+Cached versus cold JWT verification throughput (env-gated).
+"""
+
+import os
+import time
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("LUKHAS_PERF") != "1",
+    reason="Performance tests only run with LUKHAS_PERF=1"
+)
+
+jwt = pytest.importorskip("jwt")
+
+
+@pytest.fixture
+def auth_system(monkeypatch):
+    from labs.core.security import auth
+
+    monkeypatch.setattr(auth, "jwt", jwt)
+    monkeypatch.setattr(auth, "JWT_AVAILABLE", True)
+    return auth.EnhancedAuthenticationSystem()
+
+
+def _throughput(auth_system, tokens, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for token in tokens:
+            assert auth_system.verify_jwt(token) is not None
+    return rounds * len(tokens) / (time.perf_counter() - start)
+
+
+def test_cached_verification_beats_cold_decode(auth_system):
+    """Repeat verification of live tokens is served from the verified-token cache."""
+    tokens = [auth_system.generate_jwt(f"user-{i}", {"roles": ["reader"]}) for i in range(256)]
+    rounds = 40
+
+    auth_system.jwt_cache_ttl_seconds = 0
+    cold = _throughput(auth_system, tokens, rounds)
+
+    auth_system.jwt_cache_ttl_seconds = 30
+    _throughput(auth_system, tokens, 1)
+    cached = _throughput(auth_system, tokens, rounds)
+
+    print(f"\nverify_jwt cold: {cold:,.0f} tokens/s, cached: {cached:,.0f} tokens/s ({cached / cold:.1f}x)")
+    assert len(auth_system._verified_jwts) == len(tokens)
+    assert cached > cold * 1.5
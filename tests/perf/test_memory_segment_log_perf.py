@@ -0,0 +1,74 @@
+# tests/perf/test_memory_segment_log_perf.py
+"""
+UnifiedMemoryManager cold start from segment logs vs a per-file directory scan (env-gated).
+"""
+
+import json
+import os
+import time
+
+import pytest
+from core.memory.simple_store import (
+    MemoryConfig,
+    MemoryEntry,
+    MemoryPriority,
+    MemoryType,
+    UnifiedMemoryManager,
+)
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("LUKHAS_PERF") != "1",
+    reason="Performance tests only run with LUKHAS_PERF=1"
+)
+
+MEMORIES = 100_000
+USERS = 10
+
+
+async def _directory_scan_start(manager):
+    """The previous loader: glob and parse one JSON file per memory, then sort."""
+    loaded = []
+    for user_dir in manager.storage_path.iterdir():
+        if user_dir.is_dir():
+            for memory_file in user_dir.glob("*.json"):
+                with open(memory_file) as f:
+                    loaded.append(MemoryEntry.from_dict(json.load(f)))
+    for memory in sorted(loaded, key=lambda m: m.last_accessed):
+        await manager._add_to_cache(memory)
+
+
+async def test_cold_start_over_100k_critical_memories(tmp_path):
+    """Streaming one log per user beats opening and parsing a file per memory."""
+    config = MemoryConfig(
+        storage_path=str(tmp_path / "log"), max_memories_per_user=MEMORIES, gc_interval_minutes=0
+    )
+    legacy_path = tmp_path / "legacy"
+    writer = UnifiedMemoryManager(config)
+    types = list(MemoryType)
+    for i in range(MEMORIES):
+        user_id = f"u{i % USERS}"
+        content = {"i": i, "text": f"memory {i}"}
+        memory_id = await writer.store_memory(
+            user_id, content, types[i % len(types)], MemoryPriority.CRITICAL, memory_id=f"m{i}"
+        )
+        memory = writer.lru_cache[user_id][memory_id]
+        (legacy_path / user_id).mkdir(parents=True, exist_ok=True)
+        with open(legacy_path / user_id / f"{memory_id}.json", "w") as f:
+            json.dump(memory.to_dict(), f)
+
+    legacy_config = MemoryConfig(storage_path=str(legacy_path), max_memories_per_user=MEMORIES)
+    legacy = UnifiedMemoryManager(legacy_config)
+    start = time.perf_counter()
+    await _directory_scan_start(legacy)
+    scan_s = time.perf_counter() - start
+
+    reloaded = UnifiedMemoryManager(config)
+    start = time.perf_counter()
+    await reloaded.start()
+    log_s = time.perf_counter() - start
+
+    print(f"\ncold start over {MEMORIES:,} critical memories: {log_s:.2f} s log, {scan_s:.2f} s scan")
+    assert sum(len(cache) for cache in reloaded.lru_cache.values()) == MEMORIES
+    for user_id, cache in legacy.lru_cache.items():
+        assert list(reloaded.lru_cache[user_id]) == list(cache)
+    assert log_s * 2 < scan_s
@@ -0,0 +1,62 @@
+# tests/perf/test_precedent_index_perf.py
+"""
+Performance benchmark for indexed VIVOX precedent search (env-gated).
+"""
+
+import asyncio
+import os
+import random
+import time
+
+import pytest
+from vivox.moral_alignment.vivox_mae_core import ActionProposal, EthicalPrecedentDatabase
+
+ACTION_TYPES = [f"action_{i}" for i in range(200)] + ["data_access", "read_data", "compute"]
+CONTEXT_KEYS = ["user_consent", "data_sensitivity", "situation", "urgency"]
+
+
+def _fill(database, rng, count):
+    for _ in range(count):
+        database.feature_index.add(
+            rng.choice(ACTION_TYPES),
+            {key: rng.random() for key in rng.sample(CONTEXT_KEYS, 2)},
+            {f"field_{rng.randrange(50)}": 1},
+            valence=rng.random(),
+            resolution_action=rng.choice(["proceed", "deny"]),
+        )
+        database.precedents.append({"outcome": {}})
+
+
+def _analysis_ms(database, action):
+    loop = asyncio.new_event_loop()
+    try:
+        start = time.perf_counter()
+        for _ in range(20):
+            loop.run_until_complete(database.analyze_precedents(action, {"urgency": 0.5}))
+        return (time.perf_counter() - start) / 20 * 1000
+    finally:
+        loop.close()
+
+
+@pytest.mark.skipif(
+    os.getenv("LUKHAS_PERF") != "1",
+    reason="Performance tests only run with LUKHAS_PERF=1"
+)
+def test_precedent_analysis_latency_stays_flat():
+    """Analysis cost tracks matching precedents, not database size."""
+    rng = random.Random(3)
+    database = EthicalPrecedentDatabase()
+    action = ActionProposal(
+        action_type="data_access",
+        content={"field_7": 1},
+        context={"user_consent": 0.4},
+    )
+
+    _fill(database, rng, 100_000)
+    small_ms = _analysis_ms(database, action)
+    _fill(database, rng, 900_000)
+    large_ms = _analysis_ms(database, action)
+
+    print(f"\nanalyze_precedents: {small_ms:.2f}ms @100k, {large_ms:.2f}ms @1M precedents")
+    # Ten times the precedents, roughly ten times the matches: stays far below a linear scan
+    assert large_ms < 100
@@ -0,0 +1,58 @@
+# tests/perf/test_ratelimit_perf.py
+"""
+Memory and throughput of the RateLimiter bucket table under a principal scan (env-gated).
+"""
+
+import gc
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+from core.reliability.ratelimit import RateLimiter
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("LUKHAS_PERF") != "1",
+    reason="Performance tests only run with LUKHAS_PERF=1"
+)
+
+psutil = pytest.importorskip("psutil")
+
+PRINCIPALS = 1_000_000
+MAX_BUCKETS = 50_000
+
+
+def _request(ip):
+    return SimpleNamespace(url=SimpleNamespace(path="/v1/embeddings"), headers={}, client=SimpleNamespace(host=ip))
+
+
+def test_million_principal_scan_has_bounded_rss(monkeypatch):
+    """A scan across 1M distinct principals keeps the bucket table and RSS bounded."""
+    monkeypatch.delenv("LUKHAS_RL_KEYING", raising=False)
+    limiter = RateLimiter(default_rps=5, max_buckets=MAX_BUCKETS)
+    process = psutil.Process()
+    abuser = _request("203.0.113.9")
+
+    def scan(start, stop):
+        denied = 0
+        for i in range(start, stop):
+            assert limiter.check_limit(_request(f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}:{i}"))[0]
+            if i % 1_000 == 0:
+                denied += not limiter.check_limit(abuser)[0]
+        return denied
+
+    scan(0, 2 * MAX_BUCKETS)
+    gc.collect()
+    warm_rss = process.memory_info().rss
+
+    start = time.perf_counter()
+    denied = scan(2 * MAX_BUCKETS, PRINCIPALS)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    growth_mb = (process.memory_info().rss - warm_rss) / 2**20
+
+    print(f"\nRateLimiter scan: {(PRINCIPALS - 2 * MAX_BUCKETS) / elapsed:,.0f} checks/s, RSS growth {growth_mb:.1f} MiB")
+    assert len(limiter.buckets) <= MAX_BUCKETS
+    assert growth_mb < 32
+    # The abuser's bucket stays hot in the LRU, so it keeps being limited
+    assert denied > 0.9 * (PRINCIPALS - 2 * MAX_BUCKETS) / 1_000 - 10
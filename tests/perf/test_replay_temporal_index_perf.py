@@ -0,0 +1,57 @@
+# tests/perf/test_replay_temporal_index_perf.py
+"""
+Performance benchmark for the replay system's temporal index (env-gated).
+"""
+
+import os
+import random
+import time
+
+import pytest
+from core.memory.replay_system import MemoryReplayer, ReplayMode
+
+MEMORY_COUNT = 1_000_000
+BASE_EPOCH = 1_735_689_600  # 2025-01-01T00:00:00Z
+
+
+@pytest.mark.skipif(
+    os.getenv("LUKHAS_PERF") != "1",
+    reason="Performance tests only run with LUKHAS_PERF=1"
+)
+def test_temporal_index_million_memories():
+    """Batched import of 1M folds, then range queries stay sub-millisecond."""
+    from datetime import datetime, timezone
+
+    rng = random.Random(11)
+    folds = [
+        {
+            "fold_id": f"m{i}",
+            "created_at": datetime.fromtimestamp(BASE_EPOCH + rng.randrange(86_400 * 365), tz=timezone.utc),
+            "data": {"causal_predecessors": [f"m{i - 1}"]} if i else {},
+        }
+        for i in range(MEMORY_COUNT)
+    ]
+    replayer = MemoryReplayer()
+    index = replayer.temporal_index
+
+    start = time.perf_counter()
+    assert index.import_folds(folds) == MEMORY_COUNT
+    import_seconds = time.perf_counter() - start
+
+    ids = [f"m{rng.randrange(MEMORY_COUNT)}" for _ in range(200)]
+    start = time.perf_counter()
+    for memory_id in ids:
+        index.find_temporal_neighbors(memory_id, window_minutes=5)
+        index.get_causal_sequence(memory_id)
+    query_ms = (time.perf_counter() - start) * 1000 / len(ids)
+
+    start = time.perf_counter()
+    sequence_id = replayer.create_replay_sequence(ids * 50, ReplayMode.CHRONOLOGICAL)
+    sequence_seconds = time.perf_counter() - start
+
+    print(
+        f"\nTemporalIndex 1M: import={import_seconds:.2f}s query={query_ms:.3f}ms "
+        f"10k-snapshot sequence={sequence_seconds:.2f}s"
+    )
+    assert sequence_id is not None
+    assert query_ms < 5.0
@@ -0,0 +1,53 @@
+# tests/perf/test_simple_store_perf.py
+"""
+UnifiedMemoryManager top-k retrieval over a large per-user cache (env-gated).
+"""
+
+import os
+import time
+
+import pytest
+from core.memory.simple_store import MemoryConfig, MemoryType, UnifiedMemoryManager
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("LUKHAS_PERF") != "1",
+    reason="Performance tests only run with LUKHAS_PERF=1"
+)
+
+MEMORIES = 100_000
+LIMIT = 20
+
+
+async def _full_sort_retrieve(manager, user_id, limit):
+    """The previous strategy: validate every memory, then sort all of them by last access."""
+    current_time = time.time()
+    valid = [m for m in manager.lru_cache[user_id].values() if await manager._is_memory_valid(m, current_time)]
+    return sorted(valid, key=lambda m: m.last_accessed, reverse=True)[:limit]
+
+
+async def test_retrieve_top_k_from_100k_memories(tmp_path):
+    """Walking from the recent end touches ~limit entries instead of sorting all of them."""
+    manager = UnifiedMemoryManager(MemoryConfig(storage_path=str(tmp_path), max_memories_per_user=MEMORIES))
+    types = list(MemoryType)
+    for i in range(MEMORIES):
+        await manager.store_memory("u1", {"i": i}, types[i % len(types)], memory_id=f"m{i}")
+
+    expected = await _full_sort_retrieve(manager, "u1", LIMIT)
+    assert [m.id for m in await manager.retrieve_memory("u1", limit=LIMIT)] == [m.id for m in expected]
+
+    rounds = 20
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await _full_sort_retrieve(manager, "u1", LIMIT)
+    full_sort_ms = (time.perf_counter() - start) / rounds * 1000
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = await manager.retrieve_memory("u1", limit=LIMIT)
+        typed = await manager.retrieve_memory("u1", memory_type=MemoryType.SEMANTIC, limit=LIMIT)
+    walk_ms = (time.perf_counter() - start) / (2 * rounds) * 1000
+
+    print(f"\nretrieve_memory limit={LIMIT} over {MEMORIES:,}: {walk_ms:.3f} ms vs {full_sort_ms:.1f} ms full sort")
+    assert len(result) == LIMIT
+    assert len(typed) == LIMIT and all(m.memory_type == MemoryType.SEMANTIC for m in typed)
+    assert walk_ms * 50 < full_sort_ms
@@ -0,0 +1,258 @@
+import asyncio
+import random
+import time
+
+import pytest
+from bridge.llm_wrappers.base import LLMProvider, LLMWrapper
+from bridge.orchestration.hedging import HedgeBudget, HedgingPolicy, LatencyTracker
+from bridge.orchestration.multi_ai_orchestrator import ModelOrchestrator
+
+OPENAI = LLMProvider.OPENAI
+ANTHROPIC = LLMProvider.ANTHROPIC
+
+
+class ScriptedWrapper(LLMWrapper):
+    """Fake wrapper whose latency is drawn from a scripted distribution."""
+
+    def __init__(self, name, latency=lambda: 0.0, error=None):
+        self.name = name
+        self.latency = latency
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+        self.in_flight = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    async def generate_response(self, prompt: str, model: str, **kwargs) -> tuple[str, str]:
+        self.calls += 1
+        self.in_flight += 1
+        try:
+            delay = self.latency()
+            if delay is None:
+                await asyncio.Event().wait()  # Never answers
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        if self.error:
+            raise self.error
+        return f"{self.name}: {prompt}", f"{self.name}-model"
+
+
+def make_orchestrator(primary, backup, **policy):
+    policy = {"default_delay_s": 0.01, "min_delay_s": 0.001, **policy}
+    return ModelOrchestrator(HedgingPolicy(**policy), wrappers={OPENAI: primary, ANTHROPIC: backup})
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    primary = ScriptedWrapper("openai", latency=lambda: None)
+    backup = ScriptedWrapper("anthropic")
+    orchestrator = make_orchestrator(primary, backup)
+
+    response, provider, model = await orchestrator.generate_response("hi")
+
+    assert (response, provider, model) == ("anthropic: hi", "anthropic", "anthropic-model")
+    assert primary.cancelled == 1 and primary.in_flight == 0
+    assert orchestrator.get_hedging_stats()["hedges"] == 1
+    assert orchestrator.get_hedging_stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_primary_that_loses_a_race_keeps_a_lower_bound_latency():
+    primary = ScriptedWrapper("openai", latency=lambda: None)
+    backup = ScriptedWrapper("anthropic")
+    orchestrator = make_orchestrator(primary, backup)
+
+    await orchestrator.generate_response("hi")
+
+    assert orchestrator.latency.count(OPENAI) == 1
+    assert orchestrator.latency.quantile(OPENAI, 0.5) >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_backup_cancelled_before_its_hedge_delay_is_not_sampled():
+    primary = ScriptedWrapper("openai", latency=lambda: 0.06)
+    backup = ScriptedWrapper("anthropic", latency=lambda: 1.0)
+    orchestrator = make_orchestrator(primary, backup, default_delay_s=0.05)
+
+    assert (await orchestrator.generate_response("hi"))[1] == "openai"
+    assert backup.cancelled == 1
+    assert orchestrator.latency.count(ANTHROPIC) == 0
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_sends_no_backup():
+    primary = ScriptedWrapper("openai")
+    backup = ScriptedWrapper("anthropic")
+    orchestrator = make_orchestrator(primary, backup, default_delay_s=1.0)
+
+    assert (await orchestrator.generate_response("hi"))[1] == "openai"
+    assert backup.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_waits_for_primary():
+    primary = ScriptedWrapper("openai", latency=lambda: 0.05)
+    backup = ScriptedWrapper("anthropic")
+    orchestrator = make_orchestrator(primary, backup, budget_percent=0.0, budget_burst=0.0)
+
+    assert (await orchestrator.generate_response("hi"))[1] == "openai"
+    assert backup.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_fails_over_without_waiting():
+    primary = ScriptedWrapper("openai", error=RuntimeError("boom"))
+    backup = ScriptedWrapper("anthropic")
+    orchestrator = make_orchestrator(primary, backup, default_delay_s=10.0)
+
+    start = time.perf_counter()
+    assert (await orchestrator.generate_response("hi"))[1] == "anthropic"
+    assert time.perf_counter() - start < 1.0
+    assert orchestrator.get_hedging_stats()["failovers"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_provider_is_demoted_until_its_cooldown_expires():
+    primary = ScriptedWrapper("openai", error=RuntimeError("bad key"))
+    backup = ScriptedWrapper("anthropic")
+    orchestrator = make_orchestrator(primary, backup, failure_cooldown_s=0.2)
+
+    for _ in range(10):
+        assert (await orchestrator.generate_response("hi"))[1] == "anthropic"
+    assert primary.calls == 1 and backup.calls == 10
+    assert orchestrator.get_hedging_stats()["failovers"] == 1
+    assert orchestrator.get_hedging_stats()["failing"] == {"openai": 1}
+
+    # Once the cooldown lapses the provider is probed again; unmeasured, it ranks first
+    await asyncio.sleep(0.2)
+    assert orchestrator.get_hedging_stats()["failing"] == {}
+    assert (await orchestrator.generate_response("hi"))[1] == "anthropic"
+    assert primary.calls == 2
+    assert orchestrator.get_hedging_stats()["failing"] == {"openai": 2}
+
+
+@pytest.mark.asyncio
+async def test_all_providers_failing_raises_last_error():
+    primary = ScriptedWrapper("openai", error=RuntimeError("primary down"))
+    backup = ScriptedWrapper("anthropic", error=RuntimeError("backup down"))
+    orchestrator = make_orchestrator(primary, backup)
+
+    with pytest.raises(RuntimeError, match="backup down"):
+        await orchestrator.generate_response("hi")
+
+
+@pytest.mark.asyncio
+async def test_requested_provider_is_never_hedged():
+    primary = ScriptedWrapper("openai")
+    backup = ScriptedWrapper("anthropic", latency=lambda: 0.05)
+    orchestrator = make_orchestrator(primary, backup)
+
+    assert (await orchestrator.generate_response("hi", provider=ANTHROPIC))[1] == "anthropic"
+    assert primary.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_caller_cancels_provider_calls():
+    primary = ScriptedWrapper("openai", latency=lambda: None)
+    backup = ScriptedWrapper("anthropic", latency=lambda: None)
+    orchestrator = make_orchestrator(primary, backup)
+
+    task = asyncio.create_task(orchestrator.generate_response("hi"))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert primary.in_flight == backup.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_hedging_cuts_p99_at_bounded_extra_requests():
+    """A 5% slow tail on the primary dominates p99 unless backups race it."""
+    requests, batch = 400, 20
+    # Hedging at p90 fires for ~10% of fast calls plus the 5% tail; batches of
+    # 20 keep each burst of hedges within the saved budget
+    budget_percent = 20.0
+
+    def primary_latency(rng):
+        return lambda: 0.2 if rng.random() < 0.05 else rng.uniform(0.010, 0.020)
+
+    def backup_latency(rng):
+        return lambda: 0.2 if rng.random() < 0.01 else rng.uniform(0.015, 0.030)
+
+    async def run(policy):
+        primary = ScriptedWrapper("openai", latency=primary_latency(random.Random(1)))
+        backup = ScriptedWrapper("anthropic", latency=backup_latency(random.Random(2)))
+        orchestrator = ModelOrchestrator(policy, wrappers={OPENAI: primary, ANTHROPIC: backup})
+
+        async def timed():
+            start = time.perf_counter()
+            await orchestrator.generate_response("hi")
+            return time.perf_counter() - start
+
+        latencies = []
+        for _ in range(requests // batch):
+            latencies += await asyncio.gather(*(timed() for _ in range(batch)))
+        assert primary.in_flight == backup.in_flight == 0
+        p99 = sorted(latencies)[int(0.99 * len(latencies))]
+        return p99, primary.calls + backup.calls - requests, orchestrator
+
+    baseline_p99, baseline_extra, _ = await run(HedgingPolicy(enabled=False))
+    policy = HedgingPolicy(
+        budget_percent=budget_percent, default_delay_s=0.05, min_delay_s=0.005, min_samples=50
+    )
+    hedged_p99, extra, orchestrator = await run(policy)
+
+    stats = orchestrator.get_hedging_stats()
+    assert baseline_extra == 0
+    assert extra == stats["hedges"] <= policy.budget_burst + budget_percent / 100 * requests
+    assert stats["hedge_wins"] > 0
+    assert 0.005 <= stats["hedge_delay_s"]["openai"] < 0.1
+    assert hedged_p99 < baseline_p99 / 2
+
+
+def test_latency_tracker_quantiles_use_recent_window():
+    tracker = LatencyTracker(window=10)
+    assert tracker.quantile(OPENAI, 0.9) is None
+
+    for latency in range(100):
+        tracker.record(OPENAI, float(latency))
+
+    assert tracker.count(OPENAI) == 10
+    assert tracker.quantile(OPENAI, 0.5) == 95.0
+    assert tracker.quantile(OPENAI, 0.9) == 99.0
+
+
+def test_latency_tracker_failures_expire_and_reset_on_success():
+    tracker = LatencyTracker()
+    tracker.record_failure(OPENAI, now=100.0)
+    tracker.record_failure(OPENAI, now=101.0)
+
+    assert tracker.failing(OPENAI, now=105.0, cooldown_s=10.0) == 2
+    assert tracker.failing(OPENAI, now=111.0, cooldown_s=10.0) == 0
+    assert tracker.failing(ANTHROPIC, now=105.0, cooldown_s=10.0) == 0
+
+    tracker.record_lower_bound(OPENAI, 5.0)
+    assert tracker.failing(OPENAI, now=105.0, cooldown_s=10.0) == 2
+
+    tracker.record(OPENAI, 0.1)
+    assert tracker.failing(OPENAI, now=105.0, cooldown_s=10.0) == 0
+    assert tracker.count(OPENAI) == 2
+
+
+def test_hedge_budget_caps_hedges_at_percentage_of_requests():
+    budget = HedgeBudget(percent=10.0, burst=2.0)
+    spent = 0
+    for _ in range(1_000):
+        budget.record_request()
+        spent += budget.try_spend()
+        spent += budget.try_spend()
+
+    # Float credit may land a hair under the 100th hedge
+    assert 2 + 99 <= spent <= 2 + 100
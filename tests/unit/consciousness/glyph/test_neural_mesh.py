@@ -128,6 +128,7 @@ def mock_memory_system():
     mock_system.emotion_vectors = {"joy": np.array([0.8, 0.6, 0.4])}
     # Mock the database attribute for retrieve_by_glyph_affect
     mock_system.database.get_folds.return_value = [TEST_MEMORY_FOLD_1]
+    mock_system.database.get_folds_by_hash.return_value = [TEST_MEMORY_FOLD_1]
 
     return mock_system
 
@@ -182,7 +183,8 @@ class TestGlyphMemoryIndex:
         return glyph_module.GlyphMemoryIndex()
 
     def test_init(self, index):
-        assert isinstance(index.glyph_to_folds, defaultdict)
+        assert index.postings == {}
+        assert len(index.glyph_to_folds) == 0
         assert isinstance(index.fold_to_glyphs, defaultdict)
         assert index.glyph_bindings == {}
 
@@ -415,32 +417,47 @@ class TestGlyphMemorySystem:
         )
         system.glyph_index.bind_glyph_to_fold.assert_called()
 
-    def test_recall_by_glyph_pattern_any(self, system):
-        system.glyph_index.get_folds_by_glyph.side_effect = [
-            [("fold1", MagicMock())],
-            [("fold2", MagicMock())],
-        ]
-        system.memory_system.recall_memory_folds.return_value = [
-            TEST_MEMORY_FOLD_1,
-            TEST_MEMORY_FOLD_2,
-        ]
-
-        results = system.recall_by_glyph_pattern(["💡", "🔗"], mode="any")
-        assert len(results) == 2
-        assert {r["hash"] for r in results} == {"fold1", "fold2"}
+    @pytest.fixture
+    def real_index(self, glyph_module):
+        # Built before ``system`` patches the class out
+        return glyph_module.GlyphMemoryIndex()
 
-    def test_recall_by_glyph_pattern_all(self, system):
-        system.glyph_index.get_folds_by_glyph.side_effect = [
-            [("fold1", MagicMock()), ("fold2", MagicMock())],
-            [("fold1", MagicMock())],
+    @pytest.fixture
+    def indexed_system(self, real_index, system):
+        system.glyph_index = real_index
+        system.glyph_index.bind_glyph_to_fold("💡", "fold1", TEST_AFFECT_VECTOR_1)
+        system.glyph_index.bind_glyph_to_fold("💡", "fold2", TEST_AFFECT_VECTOR_1)
+        system.glyph_index.bind_glyph_to_fold("🔗", "fold1", TEST_AFFECT_VECTOR_1)
+        system.glyph_index.bind_glyph_to_fold("🔗", "fold3", TEST_AFFECT_VECTOR_1)
+        folds = {f["hash"]: dict(f) for f in (TEST_MEMORY_FOLD_1, TEST_MEMORY_FOLD_2, TEST_MEMORY_FOLD_3)}
+        system.memory_system.recall_memory_folds_by_hash.side_effect = lambda keys, user_tier: [
+            folds[k] for k in keys if k in folds
         ]
+        return system
+
+    def test_recall_by_glyph_pattern_any(self, indexed_system):
+        results = indexed_system.recall_by_glyph_pattern(["💡", "🔗"], mode="any")
+        assert len(results) == 3
+        assert {r["hash"] for r in results} == {"fold1", "fold2", "fold3"}
+        matched = {r["hash"]: r["matched_glyphs"] for r in results}
+        assert matched == {"fold1": ["💡", "🔗"], "fold2": ["💡"], "fold3": ["🔗"]}
+        # Fetched in a single batch
+        indexed_system.memory_system.recall_memory_folds_by_hash.assert_called_once()
+        indexed_system.memory_system.recall_memory_folds.assert_not_called()
+
+    def test_recall_by_glyph_pattern_all(self, indexed_system):
         # Intersection should be "fold1"
-        system.memory_system.recall_memory_folds.return_value = [TEST_MEMORY_FOLD_1]
-
-        results = system.recall_by_glyph_pattern(["💡", "🔗"], mode="all")
+        results = indexed_system.recall_by_glyph_pattern(["💡", "🔗"], mode="all")
         assert len(results) == 1
         assert results[0]["hash"] == "fold1"
 
+        assert indexed_system.recall_by_glyph_pattern(["💡", "🌱"], mode="all") == []
+
+    def test_recall_by_glyph_pattern_limit(self, indexed_system):
+        # Most recently indexed folds first
+        results = indexed_system.recall_by_glyph_pattern(["💡", "🔗"], mode="any", limit=2)
+        assert [r["hash"] for r in results] == ["fold3", "fold2"]
+
     def test_perform_temporal_folding(self, system):
         system.folding_engine.identify_foldable_memories.return_value = [
             [TEST_MEMORY_FOLD_1, TEST_MEMORY_FOLD_2]
@@ -0,0 +1,91 @@
+"""Tests for the roaring-style glyph postings bitmap and its use in GlyphMemoryIndex."""
+
+import random
+
+import numpy as np
+import pytest
+
+from core.glyph.glyph_bitmap import ARRAY_MAX, GlyphBitmap
+from core.glyph.glyph_memory_integration import GlyphMemoryIndex
+
+
+def _random_set(rng: random.Random, size: int, span: int) -> set[int]:
+    return {rng.randrange(span) for _ in range(size)}
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_set_algebra_matches_python_sets(seed):
+    rng = random.Random(seed)
+    # Mix sparse (array) and dense (bitmap) chunks across several chunk keys
+    a = _random_set(rng, rng.choice([50, ARRAY_MAX * 3, 120_000]), 300_000)
+    b = _random_set(rng, rng.choice([50, ARRAY_MAX * 3, 120_000]), 300_000)
+    bitmap_a, bitmap_b = GlyphBitmap(a), GlyphBitmap()
+    for value in b:
+        bitmap_b.add(value)
+
+    assert len(bitmap_a) == len(a) and len(bitmap_b) == len(b)
+    assert set(bitmap_a & bitmap_b) == a & b
+    assert set(bitmap_a | bitmap_b) == a | b
+    assert set(bitmap_a - bitmap_b) == a - b
+    assert bitmap_a.intersection_cardinality(bitmap_b) == len(a & b)
+
+    probes = np.array([rng.randrange(300_000) for _ in range(2_000)])
+    assert bitmap_a.contains_many(probes).tolist() == [int(p) in a for p in probes]
+    assert all((int(p) in bitmap_a) == (int(p) in a) for p in probes[:200])
+
+
+def test_containers_convert_both_ways():
+    bitmap = GlyphBitmap(range(ARRAY_MAX + 10))
+    assert len(bitmap) == ARRAY_MAX + 10
+    for value in range(20):
+        bitmap.discard(value)
+    assert len(bitmap) == ARRAY_MAX - 10
+    assert bitmap.to_array()[0] == 20
+    for value in range(20, ARRAY_MAX + 10):
+        bitmap.discard(value)
+    assert not bitmap
+
+
+def test_intersect_all_does_not_alias_inputs():
+    source = GlyphBitmap(range(ARRAY_MAX * 2))
+    result = GlyphBitmap.intersect_all([source])
+    result.discard(0)
+    assert 0 in source
+
+
+def test_get_folds_by_glyph_is_strength_ordered_top_k():
+    index = GlyphMemoryIndex()
+    strengths = [0.3, 0.9, 0.5, 0.9, 0.1]
+    for i, strength in enumerate(strengths):
+        index.bind_glyph_to_fold("💡", f"fold{i}", np.zeros(3), strength)
+
+    ranked = [key for key, _ in index.get_folds_by_glyph("💡")]
+    assert ranked == ["fold1", "fold3", "fold2", "fold0", "fold4"]
+    assert [key for key, _ in index.get_folds_by_glyph("💡", limit=2)] == ["fold1", "fold3"]
+    assert [key for key, _ in index.get_folds_by_glyph("💡", min_strength=0.5)] == ["fold1", "fold3", "fold2"]
+
+    # Rebinding replaces the old rank entry
+    index.bind_glyph_to_fold("💡", "fold4", np.zeros(3), 1.0)
+    ranked = index.get_folds_by_glyph("💡")
+    assert [key for key, _ in ranked][:2] == ["fold4", "fold1"]
+    assert len(ranked) == 5
+    assert ranked[0][1].binding_strength == 1.0
+
+
+def test_query_and_or_not():
+    index = GlyphMemoryIndex()
+    bindings = {"a": ["💡", "🔗"], "b": ["💡"], "c": ["🔗", "🌱"], "d": ["🌱"]}
+    for fold_key, glyphs in bindings.items():
+        for glyph in glyphs:
+            index.bind_glyph_to_fold(glyph, fold_key, np.zeros(3))
+
+    def keys(bitmap):
+        return set(index.fold_keys_for(bitmap))
+
+    assert keys(index.query(all_of=["💡", "🔗"])) == {"a"}
+    assert keys(index.query(any_of=["💡", "🌱"])) == {"a", "b", "c", "d"}
+    assert keys(index.query(any_of=["💡", "🌱"], none_of=["🔗"])) == {"b", "d"}
+    assert keys(index.query(all_of=["🔗"], any_of=["🌱", "❓"])) == {"c"}
+    assert keys(index.query(all_of=["❓"])) == set()
+    assert index.glyph_to_folds["🌱"] == {"c", "d"}
+    assert index.glyph_to_folds.get("❓") is None
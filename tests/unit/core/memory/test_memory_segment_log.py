@@ -0,0 +1,244 @@
+"""Tests for the append-only segment log behind UnifiedMemoryManager persistence."""
+
+import json
+
+import pytest
+from core.memory.memory_segment_log import MAGIC, RECORD_MEMORY, RECORD_TOMBSTONE, MemorySegmentLog
+from core.memory.simple_store import MemoryConfig, MemoryPriority, UnifiedMemoryManager
+
+CRITICAL = MemoryPriority.CRITICAL
+
+
+def _record(memory_id, value):
+    return RECORD_MEMORY, memory_id, b"meta", json.dumps({"v": value}).encode()
+
+
+def _live(log):
+    live = {}
+    for kind, memory_id, meta, payload in log.replay():
+        live.pop(memory_id, None)
+        if kind == RECORD_MEMORY:
+            assert meta == b"meta"
+            live[memory_id] = json.loads(payload)["v"]
+    return live
+
+
+@pytest.fixture
+def log(tmp_path):
+    return MemorySegmentLog(tmp_path / "u1" / "memories.seg")
+
+
+def test_replay_applies_supersedes_and_tombstones(log):
+    log.append([_record("a", 1), _record("b", 2)])
+    log.append([_record("a", 3), (RECORD_TOMBSTONE, "b", b"", b"")])
+
+    assert _live(MemorySegmentLog(log.path)) == {"a": 3}
+    assert "a" in log and "b" not in log
+
+
+@pytest.mark.parametrize("cut", [1, 5, 13, 20])
+def test_torn_tail_is_detected_and_truncated(log, cut):
+    log.append([_record("a", 1), _record("b", 2)])
+    intact = log.path.stat().st_size
+    log.append([_record("c", 3)])
+    with open(log.path, "r+b") as f:
+        f.truncate(intact + cut)
+
+    reopened = MemorySegmentLog(log.path)
+    assert _live(reopened) == {"a": 1, "b": 2}
+    assert log.path.stat().st_size == intact == reopened.log_bytes
+
+    reopened.append([_record("d", 4)])
+    assert _live(MemorySegmentLog(log.path)) == {"a": 1, "b": 2, "d": 4}
+
+
+def test_checksum_mismatch_stops_replay(log):
+    log.append([_record("a", 1)])
+    intact = log.path.stat().st_size
+    log.append([_record("b", 2)])
+    data = bytearray(log.path.read_bytes())
+    data[-2] ^= 0xFF
+    log.path.write_bytes(bytes(data))
+
+    assert _live(MemorySegmentLog(log.path)) == {"a": 1}
+    assert log.path.stat().st_size == intact
+
+
+@pytest.mark.parametrize("flip", [-2, 15])
+def test_corrupt_record_mid_log_is_skipped(log, flip, caplog):
+    log.append([_record("a", 1)])
+    start = log.path.stat().st_size
+    log.append([_record("b", 2)])
+    end = log.path.stat().st_size
+    log.append([_record("c", 3), _record("a", 4)])
+    data = bytearray(log.path.read_bytes())
+    data[(end if flip < 0 else start) + flip] ^= 0xFF  # Last payload byte or the id of "b"
+    log.path.write_bytes(bytes(data))
+
+    reopened = MemorySegmentLog(log.path)
+    assert _live(reopened) == {"a": 4, "c": 3}
+    assert "Skipping corrupt memory log record" in caplog.text
+    assert log.path.stat().st_size == len(data) == reopened.log_bytes
+
+    # Compaction drops the skipped record from the file
+    reopened.begin_compaction()
+    reopened.finish_compaction(*reopened.write_compacted())
+    assert _live(MemorySegmentLog(log.path)) == {"a": 4, "c": 3}
+    assert b'"v": 2' not in log.path.read_bytes()
+
+
+def test_foreign_file_is_rejected(log):
+    log.path.parent.mkdir(parents=True)
+    log.path.write_bytes(b"nope" + b"\0" * 32)
+
+    with pytest.raises(ValueError):
+        list(log.replay())
+
+
+def test_compaction_keeps_live_records_in_order(log):
+    for i in range(50):
+        log.append([_record(f"m{i % 5}", i)])
+    log.append([(RECORD_TOMBSTONE, "m0", b"", b"")])
+    before = log.log_bytes
+    assert log.should_compact(min_bytes=0)
+
+    log.begin_compaction()
+    temp_path, sizes = log.write_compacted()
+    log.append([_record("m9", 99), (RECORD_TOMBSTONE, "m1", b"", b"")])  # Lands mid-compaction
+    log.finish_compaction(temp_path, sizes)
+
+    assert log.log_bytes < before and not log.compacting
+    assert not log.should_compact(min_bytes=0)
+    live = _live(MemorySegmentLog(log.path))
+    assert list(live.items()) == [("m2", 47), ("m3", 48), ("m4", 49), ("m9", 99)]
+
+
+@pytest.fixture
+def config(tmp_path):
+    return MemoryConfig(storage_path=str(tmp_path), compression_threshold=64, gc_interval_minutes=0)
+
+
+async def _reload(config):
+    manager = UnifiedMemoryManager(config)
+    await manager.start()
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_manager_restores_critical_memories_in_recency_order(config):
+    manager = UnifiedMemoryManager(config)
+    for i in range(4):
+        content = {"i": i, "pad": "x" * 100 * (i % 2)}
+        await manager.store_memory("u1", content, priority=CRITICAL, memory_id=f"c{i}")
+    await manager.store_memory("u1", {"k": "plain"}, memory_id="m0")
+    await manager.delete_user_memories("u1", ["c2"])
+    await manager.store_memory("u1", {"k": "demoted"}, memory_id="c3")
+
+    reloaded = await _reload(config)
+
+    assert list(reloaded.lru_cache["u1"]) == ["c0", "c1"]
+    assert reloaded.lru_cache["u1"]["c1"].compressed
+    assert reloaded.lru_cache["u1"]["c0"].to_dict()["content"] == {"i": 0, "pad": ""}
+    assert [m.content["i"] for m in await reloaded.retrieve_memory("u1")] == [1, 0]
+
+
+@pytest.mark.asyncio
+async def test_stop_checkpoints_access_stats_into_a_compacted_log(config):
+    manager = await _reload(config)
+    for i in range(3):
+        await manager.store_memory("u1", {"i": i}, priority=CRITICAL, memory_id=f"c{i}")
+        await manager.store_memory("u1", {"i": i}, priority=CRITICAL, memory_id=f"c{i}")
+    await manager.retrieve_memory("u1", memory_id="c0")
+    await manager.stop()
+
+    log = MemorySegmentLog(config.storage_path + "/u1/memories.seg")
+    assert [memory_id for _, memory_id, _, _ in log.replay()] == ["c1", "c2", "c0"]
+
+    reloaded = await _reload(config)
+    assert reloaded.lru_cache["u1"]["c0"].access_count == 1
+    assert list(reloaded.lru_cache["u1"]) == ["c1", "c2", "c0"]
+
+
+@pytest.mark.asyncio
+async def test_background_compaction_reclaims_superseded_records(config):
+    config.log_compaction_min_bytes = 4096
+    manager = UnifiedMemoryManager(config)
+    for i in range(400):
+        await manager.store_memory("u1", {"i": i}, priority=CRITICAL, memory_id=f"c{i % 4}")
+    while manager._compaction_tasks:
+        await next(iter(manager._compaction_tasks))
+
+    log = manager.segment_logs["u1"]
+    assert log.log_bytes < 4096 * 2
+    records = MemorySegmentLog(log.path).replay()
+    latest = {memory_id: json.loads(payload)["i"] for _, memory_id, _, payload in records}
+    assert latest == {"c0": 396, "c1": 397, "c2": 398, "c3": 399}
+
+
+@pytest.mark.asyncio
+async def test_delete_during_compaction_is_scrubbed_from_disk(config, tmp_path):
+    manager = UnifiedMemoryManager(config)
+    for memory_id, word in (("a", "ALPHA"), ("b", "BRAVO"), ("c", "CHARLIE")):
+        await manager.store_memory("u1", {"k": word}, priority=CRITICAL, memory_id=memory_id)
+
+    await manager.delete_user_memories("u1", ["a"])
+    assert manager.segment_logs["u1"].compacting
+    await manager.delete_user_memories("u1", ["b"])  # Arrives while "a" is being compacted
+    while manager._compaction_tasks:
+        await next(iter(manager._compaction_tasks))
+
+    data = (tmp_path / "u1" / "memories.seg").read_bytes()
+    assert b"ALPHA" not in data and b"BRAVO" not in data
+    assert b"CHARLIE" in data
+    assert list((await _reload(config)).lru_cache["u1"]) == ["c"]
+
+
+@pytest.mark.asyncio
+async def test_deleting_all_user_memories_removes_the_log(config, tmp_path):
+    manager = UnifiedMemoryManager(config)
+    await manager.store_memory("u1", {"k": "v"}, priority=CRITICAL, memory_id="c0")
+    assert (tmp_path / "u1" / "memories.seg").exists()
+
+    await manager.delete_user_memories("u1")
+
+    assert not (tmp_path / "u1" / "memories.seg").exists()
+    assert "u1" not in (await _reload(config)).lru_cache
+
+
+@pytest.mark.asyncio
+async def test_torn_write_is_dropped_on_cold_start(config, tmp_path):
+    manager = UnifiedMemoryManager(config)
+    await manager.store_memory("u1", {"k": "a"}, priority=CRITICAL, memory_id="c0")
+    await manager.store_memory("u1", {"k": "b"}, priority=CRITICAL, memory_id="c1")
+    path = tmp_path / "u1" / "memories.seg"
+    path.write_bytes(path.read_bytes()[:-3])
+
+    reloaded = await _reload(config)
+
+    assert list(reloaded.lru_cache["u1"]) == ["c0"]
+    assert path.read_bytes().startswith(MAGIC)
+
+
+@pytest.mark.asyncio
+async def test_legacy_json_files_are_migrated(config, tmp_path):
+    import base64
+    import gzip
+
+    user_dir = tmp_path / "u1"
+    user_dir.mkdir()
+    base = {"user_id": "u1", "memory_type": "episodic", "priority": "critical", "access_count": 2}
+    base = {**base, "timestamp": 1.0, "last_accessed": 1.0}
+    (user_dir / "old.json").write_text(json.dumps({**base, "id": "old", "content": {"k": "v"}}))
+    packed = base64.b64encode(gzip.compress(json.dumps({"k": "z"}).encode())).decode()
+    zipped = {"content": packed, "content_encoding": "base64_gzip", "compressed": True}
+    (user_dir / "zip.json").write_text(
+        json.dumps({**base, **zipped, "id": "zip", "timestamp": 2.0, "last_accessed": 2.0})
+    )
+
+    manager = await _reload(config)
+
+    assert list(manager.lru_cache["u1"]) == ["old", "zip"]
+    assert not list(user_dir.glob("*.json"))
+    restored = await _reload(config)
+    memories = await restored.retrieve_memory("u1", include_old=True)
+    assert [m.content for m in memories] == [{"k": "z"}, {"k": "v"}]
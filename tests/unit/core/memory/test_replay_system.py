@@ -0,0 +1,79 @@
+"""Tests for the sorted temporal index behind core.memory.replay_system."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from core.memory.folds import MemoryFold
+from core.memory.replay_system import MemoryReplayer, ReplayMode, TemporalIndex
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _ts(minutes: float) -> str:
+    return (BASE + timedelta(minutes=minutes)).isoformat()
+
+
+@pytest.fixture
+def shuffled_index():
+    index = TemporalIndex()
+    minutes = list(range(0, 500, 5))
+    random.Random(7).shuffle(minutes)
+    for minute in minutes:
+        assert index.add_memory_timestamp(f"m{minute}", _ts(minute))
+    return index
+
+
+def test_range_query_matches_string_scan(shuffled_index):
+    start, end = _ts(42), _ts(137)
+    expected = [
+        mid for ts in sorted(shuffled_index.time_index) if start <= ts <= end for mid in shuffled_index.time_index[ts]
+    ]
+    assert shuffled_index.get_memories_in_range(start, end) == expected
+    assert expected[0] == "m45" and expected[-1] == "m135"
+
+
+def test_incremental_insert_after_query(shuffled_index):
+    shuffled_index.get_memories_in_range(_ts(0), _ts(10))
+    shuffled_index.add_memory_timestamp("late", _ts(7))
+    assert shuffled_index.get_memories_in_range(_ts(0), _ts(10)) == ["m0", "m5", "late", "m10"]
+
+
+def test_temporal_neighbors_and_nearest(shuffled_index):
+    assert shuffled_index.find_temporal_neighbors("m100", window_minutes=10) == ["m90", "m95", "m105", "m110"]
+    assert shuffled_index.find_temporal_neighbors("unknown") == []
+    assert shuffled_index.get_nearest_memories(_ts(101), k=3) == ["m100", "m105", "m95"]
+    assert shuffled_index.get_nearest_memories(_ts(100), k=2, exclude="m100") == ["m95", "m105"]
+
+
+def test_invalid_timestamp_is_rejected():
+    index = TemporalIndex()
+    assert index.add_memory_timestamp("bad", "not-a-time") is False
+    assert index.reverse_index == {}
+
+
+def test_causal_sequence_across_csr_rebuilds():
+    index = TemporalIndex()
+    # Enough edges to force CSR rebuilds while the overlay keeps taking new edges
+    for i in range(1, 3000):
+        index.add_memory_timestamp(f"n{i}", _ts(i), causal_predecessors=[f"n{(i - 1) // 2}"])
+    index.add_memory_timestamp("n0-extra", _ts(0), causal_predecessors=["n0"])
+
+    assert index.get_causal_successors("n0") == ["n1", "n2", "n0-extra"]
+    assert index.get_causal_sequence("n0", max_depth=3) == ["n0", "n1", "n2", "n0-extra", "n3", "n4", "n5", "n6"]
+    assert index.get_causal_sequence("leaf-only") == ["leaf-only"]
+    assert index.causal_chains["n1"] == ["n3", "n4"]
+
+
+def test_import_folds_and_chronological_replay():
+    folds = [MemoryFold(f"fold{i}", {"causal_predecessors": [f"fold{i - 1}"]} if i else {}) for i in range(5)]
+    for i, fold in enumerate(folds):
+        fold.created_at = (BASE + timedelta(minutes=10 * (5 - i))).replace(tzinfo=None)
+    replayer = MemoryReplayer()
+
+    assert replayer.temporal_index.import_folds(folds + [{"fold_id": "dict-fold", "created_at": _ts(0)}]) == 6
+    assert replayer.temporal_index.get_causal_sequence("fold0") == [f"fold{i}" for i in range(5)]
+
+    sequence_id = replayer.create_replay_sequence(["fold0", "fold3", "dict-fold"], ReplayMode.CHRONOLOGICAL)
+    snapshots = replayer.sequence_cache[sequence_id].snapshots
+    assert [s.memory_fold_id for s in snapshots] == ["dict-fold", "fold3", "fold0"]
@@ -0,0 +1,157 @@
+"""Tests for the indices and critical-aware eviction of core.memory.simple_store."""
+
+import pytest
+from core.memory.simple_store import MemoryConfig, MemoryPriority, MemoryType, UnifiedMemoryManager
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return UnifiedMemoryManager(MemoryConfig(storage_path=str(tmp_path), max_memories_per_user=5))
+
+
+@pytest.mark.timeout(5)
+async def test_all_critical_cache_does_not_spin(manager):
+    """Regression: eviction used to loop forever once only critical memories remained."""
+    for i in range(8):
+        await manager.store_memory("u1", {"i": i}, priority=MemoryPriority.CRITICAL, memory_id=f"c{i}")
+
+    assert len(manager.lru_cache["u1"]) == 8
+    assert "u1" not in manager.evictable
+
+
+async def test_eviction_skips_pinned_critical_memories(manager):
+    await manager.store_memory("u1", {"k": "critical"}, priority=MemoryPriority.CRITICAL, memory_id="c0")
+    for i in range(6):
+        await manager.store_memory("u1", {"i": i}, memory_id=f"m{i}")
+
+    assert list(manager.lru_cache["u1"]) == ["c0", "m2", "m3", "m4", "m5"]
+    assert list(manager.evictable["u1"]) == ["m2", "m3", "m4", "m5"]
+    assert manager.priority_index[MemoryPriority.CRITICAL]["u1"] == {"c0"}
+    assert manager.priority_index[MemoryPriority.MEDIUM]["u1"] == {"m2", "m3", "m4", "m5"}
+
+
+async def test_eviction_follows_access_order(manager):
+    for i in range(5):
+        await manager.store_memory("u1", {"i": i}, memory_id=f"m{i}")
+    await manager.retrieve_memory("u1", memory_id="m0")
+    await manager.store_memory("u1", {"i": 5}, memory_id="m5")
+
+    assert "m0" in manager.lru_cache["u1"]
+    assert "m1" not in manager.lru_cache["u1"]
+
+
+async def test_type_filter_reads_posting(manager):
+    await manager.store_memory("u1", {"k": "a"}, MemoryType.SEMANTIC, memory_id="s0")
+    await manager.store_memory("u1", {"k": "b"}, MemoryType.EPISODIC, memory_id="e0")
+    await manager.store_memory("u1", {"k": "c"}, MemoryType.SEMANTIC, memory_id="s1")
+
+    semantic = await manager.retrieve_memory("u1", memory_type=MemoryType.SEMANTIC)
+    emotional = await manager.retrieve_memory("u1", memory_type=MemoryType.EMOTIONAL)
+
+    assert {m.id for m in semantic} == {"s0", "s1"}
+    assert emotional == []
+
+
+async def test_replacing_memory_moves_it_between_postings(manager):
+    await manager.store_memory("u1", {"k": "a"}, MemoryType.SEMANTIC, memory_id="m0")
+    await manager.store_memory("u1", {"k": "a"}, MemoryType.EMOTIONAL, MemoryPriority.CRITICAL, memory_id="m0")
+
+    assert "u1" not in manager.type_index[MemoryType.SEMANTIC]
+    assert "u1" not in manager.priority_index[MemoryPriority.MEDIUM]
+    assert "u1" not in manager.evictable
+    stats = await manager.get_memory_stats("u1")
+    assert stats["memory_types"] == {"episodic": 0, "semantic": 0, "emotional": 1}
+    assert stats["memory_priorities"]["critical"] == 1
+
+
+async def test_deletes_clean_up_postings(manager):
+    await manager.store_memory("u1", {"k": "a"}, memory_id="m0")
+    await manager.store_memory("u1", {"k": "b"}, memory_id="m1")
+
+    await manager.delete_user_memories("u1", ["m0"])
+    assert manager.type_index[MemoryType.EPISODIC]["u1"] == {"m1": None}
+
+    await manager.delete_user_memories("u1")
+    assert all("u1" not in postings for postings in manager.type_index.values())
+    assert all("u1" not in postings for postings in manager.priority_index.values())
+    assert "u1" not in manager.evictable
+
+
+async def test_retrieval_matches_full_sort_on_random_workload(manager, monkeypatch):
+    """Walking from the recent end returns what sorting every memory by last access would."""
+    import random
+
+    from core.memory import simple_store
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(simple_store.time, "time", lambda: now[0])
+    manager.config.max_memories_per_user = 500
+    manager.config.default_ttl_hours = 1
+    rng = random.Random(3)
+
+    for step in range(600):
+        now[0] += rng.uniform(0, 120)
+        action = rng.random()
+        if action < 0.5:
+            await manager.store_memory(
+                "u1", {"step": step}, rng.choice(list(MemoryType)), rng.choice(list(MemoryPriority))
+            )
+        elif action < 0.7 and manager.lru_cache.get("u1"):
+            await manager.retrieve_memory("u1", memory_id=rng.choice(list(manager.lru_cache["u1"])))
+        else:
+            memory_type = rng.choice([None, *MemoryType])
+            limit = rng.randint(1, 30)
+            # A retrieved batch shares one access time; ties go to the most recently touched
+            candidates = [
+                m
+                for m in reversed(manager.lru_cache.get("u1", {}).values())
+                if (memory_type is None or m.memory_type == memory_type)
+                and await manager._is_memory_valid(m, now[0])
+            ]
+            expected = sorted(candidates, key=lambda m: m.last_accessed, reverse=True)[:limit]
+
+            result = await manager.retrieve_memory("u1", memory_type=memory_type, limit=limit)
+
+            assert [m.id for m in result] == [m.id for m in expected]
+
+
+async def test_expired_memories_are_skipped_unless_requested(manager, monkeypatch):
+    from core.memory import simple_store
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(simple_store.time, "time", lambda: now[0])
+    await manager.store_memory("u1", {"k": "old"}, memory_id="old")
+    now[0] += 25 * 3600
+    await manager.store_memory("u1", {"k": "new"}, memory_id="new")
+
+    assert [m.id for m in await manager.retrieve_memory("u1")] == ["new"]
+    assert [m.id for m in await manager.retrieve_memory("u1", include_old=True)] == ["new", "old"]
+
+
+async def test_compressed_content_is_inflated_on_first_access(tmp_path):
+    manager = UnifiedMemoryManager(MemoryConfig(storage_path=str(tmp_path), compression_threshold=16))
+    content = {"text": "x" * 200}
+    await manager.store_memory("u1", content, memory_id="m0")
+
+    [memory] = await manager.retrieve_memory("u1")
+
+    assert memory.compressed and isinstance(memory.raw_content, bytes)
+    assert memory.to_dict()["content"] == memory.raw_content
+    assert memory.content == content
+    assert not memory.compressed and memory.raw_content == content
+
+
+async def test_compressed_critical_memory_round_trips_through_disk(tmp_path):
+    config = MemoryConfig(storage_path=str(tmp_path), compression_threshold=16, gc_interval_minutes=0)
+    content = {"text": "y" * 200}
+    manager = UnifiedMemoryManager(config)
+    await manager.store_memory("u1", content, priority=MemoryPriority.CRITICAL, memory_id="c0")
+
+    reloaded = UnifiedMemoryManager(config)
+    await reloaded.start()
+    [memory] = await reloaded.retrieve_memory("u1", memory_id="c0")
+    await reloaded.stop()
+
+    assert memory.content == content
@@ -0,0 +1,205 @@
+"""Tests for rolling anomaly aggregates and streaming SymbolicAnomalyExplorer scans."""
+import math
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from core.symbolic.anomaly_aggregates import RollingAnomalyAggregates, TagVocabulary
+from core.symbolic.symbolic_anomaly_explorer import (
+    AnomalyType,
+    DreamSession,
+    SymbolicAnomalyExplorer,
+)
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+TAGS = ["light_orb", "dark_sea", "order", "chaos_wind", "hope", "mirror", "spiral", "echo"]
+EMOTIONS = ["joy", "fear", "calm", "anger", "sadness"]
+
+
+def make_session(i, tags, emotions=None, drift=0.2, hours=None, narratives=()):
+    return DreamSession(
+        session_id=f"s{i}",
+        timestamp=(BASE_TIME + timedelta(hours=i if hours is None else hours)).isoformat(),
+        symbolic_tags=list(tags),
+        emotional_state=dict(emotions or {}),
+        content="dream content " * 3,
+        drift_score=drift,
+        narrative_elements=list(narratives),
+    )
+
+
+def random_sessions(n, seed):
+    rng = random.Random(seed)
+    return [
+        make_session(
+            i,
+            [rng.choice(TAGS) for _ in range(rng.randrange(0, 7))],
+            {e: rng.random() for e in rng.sample(EMOTIONS, rng.randrange(0, 4))},
+            drift=rng.random(),
+            # Some sessions arrive out of timestamp order
+            hours=rng.choice([i, rng.randrange(n)]),
+            narratives=rng.sample(TAGS, rng.randrange(0, 4)),
+        )
+        for i in range(n)
+    ]
+
+
+def assert_close(a, b, abs_tol=1e-12):
+    if isinstance(a, dict):
+        assert a.keys() == b.keys()
+        for key in a:
+            assert_close(a[key], b[key], abs_tol)
+    elif isinstance(a, (list, tuple)):
+        assert len(a) == len(b)
+        for x, y in zip(a, b):
+            assert_close(x, y, abs_tol)
+    elif isinstance(a, float):
+        assert math.isclose(a, b, rel_tol=1e-9, abs_tol=abs_tol)
+    else:
+        assert a == b
+
+
+@pytest.fixture
+def explorer(tmp_path):
+    return SymbolicAnomalyExplorer(
+        storage_path=str(tmp_path), drift_integration=False, enable_ml_prediction=False
+    )
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_batch_aggregates_match_streaming_replay(seed):
+    dreams = random_sessions(random.Random(seed).randrange(1, 60), seed)
+
+    streamed = RollingAnomalyAggregates()
+    for dream in dreams:
+        streamed.observe(dream)
+
+    assert_close(RollingAnomalyAggregates.from_sessions(dreams).snapshot(), streamed.snapshot())
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_rolling_window_matches_batch_over_window(seed):
+    dreams = random_sessions(random.Random(seed).randrange(1, 60), seed)
+    window = 10
+
+    streamed = RollingAnomalyAggregates(max_sessions=window)
+    evicted = []
+    for dream in dreams:
+        evicted.extend(streamed.observe(dream))
+
+    assert [d.session_id for d in evicted] == [d.session_id for d in dreams[:-window]]
+    assert len(streamed) == min(window, len(dreams))
+    # Evictions subtract running sums, so moments only match to rounding
+    assert_close(
+        RollingAnomalyAggregates.from_sessions(dreams, max_sessions=window).snapshot(),
+        streamed.snapshot(),
+        abs_tol=1e-6,
+    )
+
+
+def test_conflict_masks_are_substring_matches():
+    vocabulary = TagVocabulary()
+    ids = vocabulary.intern_many(["Moonlight", "DARKNESS", "hopeful", "order"])
+    assert vocabulary.conflicts(ids) == [("light", "dark")]
+    assert vocabulary.conflicts(ids[:1]) == []
+
+
+def test_frequent_bigram_total_tracks_threshold():
+    aggregates = RollingAnomalyAggregates(min_pattern_frequency=3)
+    for i in range(4):
+        aggregates.observe(make_session(i, ["mirror", "echo", "spiral"]))
+
+    assert aggregates.bigram_total == 8
+    assert aggregates.frequent_total == 8
+    assert aggregates.frequent_bigrams() == [(("mirror", "echo"), 4), (("echo", "spiral"), 4)]
+    assert aggregates.frequent_bigram_sessions() == ["s0", "s1", "s2", "s3"]
+
+
+def test_late_session_reorders_drift_series():
+    aggregates = RollingAnomalyAggregates()
+    aggregates.observe(make_session(0, [], drift=0.1, hours=0))
+    aggregates.observe(make_session(1, [], drift=0.2, hours=2))
+    # Arrives last but belongs between the two: 0.1 -> 0.9 -> 0.2
+    aggregates.observe(make_session(2, [], drift=0.9, hours=1))
+
+    assert aggregates.max_drift_step == pytest.approx(0.8)
+    assert aggregates.steep_drift_steps == [(0, 2)]
+    assert aggregates.mean_drift == pytest.approx(0.4)
+
+
+def test_streaming_scan_flags_new_session(explorer):
+    calm = {"joy": 0.5, "calm": 0.5}
+    for i in range(3):
+        explorer.observe_session(make_session(i, ["mirror", "echo"], calm))
+
+    anomalies = explorer.observe_session(
+        make_session(3, ["light_orb", "dark_sea", "hope", "fear_spike"], {"joy": 0.9, "fear": 0.1})
+    )
+    conflicts = [a for a in anomalies if a.anomaly_type == AnomalyType.SYMBOLIC_CONFLICT]
+    assert len(conflicts) == 1
+    assert conflicts[0].affected_sessions == ["s3"]
+    assert conflicts[0].metrics["pairs"] == 2
+
+    registry = explorer.tag_registry["mirror"]
+    assert registry.frequency == 3
+    assert registry.sessions == ["s0", "s1", "s2"]
+
+
+def test_streaming_window_detectors_match_batch(explorer, tmp_path):
+    dreams = [
+        make_session(i, ["mirror", "echo", "spiral"], {"joy": 0.1 * i, "fear": 0.9 - 0.2 * i}, drift=0.1 + 0.25 * i)
+        for i in range(5)
+    ]
+    batch_explorer = SymbolicAnomalyExplorer(
+        storage_path=str(tmp_path / "batch"), drift_integration=False, enable_ml_prediction=False
+    )
+    batch = batch_explorer.detect_symbolic_anomalies(dreams)
+
+    # Window-level anomalies are reported when they change; keep the latest
+    latest = {}
+    for dream in dreams:
+        for anomaly in explorer.observe_session(dream):
+            latest.setdefault(anomaly.anomaly_type, {})
+            if anomaly.anomaly_type != AnomalyType.MOTIF_MUTATION:
+                latest[anomaly.anomaly_type].clear()
+            latest[anomaly.anomaly_type][anomaly.anomaly_id] = anomaly.affected_sessions
+
+    def by_type(anomalies, anomaly_type):
+        return {a.anomaly_id: a.affected_sessions for a in anomalies if a.anomaly_type == anomaly_type}
+
+    for anomaly_type in (AnomalyType.RECURSIVE_LOOP, AnomalyType.DRIFT_ACCELERATION, AnomalyType.MOTIF_MUTATION):
+        assert latest.get(anomaly_type, {}) == by_type(batch, anomaly_type)
+    assert by_type(batch, AnomalyType.RECURSIVE_LOOP)
+    assert by_type(batch, AnomalyType.DRIFT_ACCELERATION)
+
+    explorer.reset_stream()
+    assert explorer.stream_aggregates is None
+
+
+def test_streaming_reports_window_anomalies_only_on_change(explorer):
+    loops = []
+    for i in range(4):
+        anomalies = explorer.observe_session(make_session(i, ["mirror", "echo"], drift=0.2))
+        loops.append([a for a in anomalies if a.anomaly_type == AnomalyType.RECURSIVE_LOOP])
+    assert loops[2] and loops[3]
+    assert loops[2][0].anomaly_id != loops[3][0].anomaly_id
+
+    # No new bigrams: the loop anomaly is unchanged and not repeated
+    anomalies = explorer.observe_session(make_session(4, ["mirror"], drift=0.2))
+    assert not [a for a in anomalies if a.anomaly_type == AnomalyType.RECURSIVE_LOOP]
+
+    anomalies = explorer.observe_session(make_session(5, ["mirror", "echo"], drift=0.2))
+    assert [a for a in anomalies if a.anomaly_type == AnomalyType.RECURSIVE_LOOP]
+
+
+def test_streaming_caches_are_bounded_by_window(explorer):
+    explorer.max_sessions_analyzed = 3
+    for i in range(6):
+        explorer.observe_session(make_session(i, ["mirror", f"tag{i}"]))
+
+    assert len(explorer.stream_aggregates) == 3
+    assert sorted(explorer.session_cache) == ["s3", "s4", "s5"]
+    assert explorer.tag_registry["mirror"].sessions == ["s3", "s4", "s5"]
+    assert explorer.tag_registry["mirror"].frequency == 3
+    assert explorer.tag_registry["tag0"].sessions == []
+    assert explorer.tag_registry["tag0"].frequency == 0
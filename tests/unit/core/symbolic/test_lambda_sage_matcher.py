@@ -0,0 +1,175 @@
+"""Tests for the compiled ΛSAGE archetype matcher against the per-pattern scan it replaced."""
+import random
+
+import pytest
+
+from core.symbolic.archetype_matcher import AhoCorasick, ArchetypeMatcher
+from core.symbolic.lambda_sage import ArchetypalFamily, SymbolicElement, ΛSage
+
+FILLER = ["the", "a", "quiet", "ran", "through", "over", "xyz", "light", "under"]
+ORIGINS = ["dream", "memory", "ethics", "glyph"]
+
+
+def reference_classification(sage, elem):
+    """Straight per-archetype, per-pattern scan used before the matcher existed."""
+    symbol, context = elem.symbol.lower(), elem.context.lower()
+    scores = {}
+    for archetype, patterns in sage.archetypal_patterns.items():
+        score = 0.0
+        score += sum(1.0 for k in patterns["keywords"] if k in symbol or k in context)
+        score += sum(0.8 for s in patterns["symbols"] if s in symbol or s in context)
+        score += sum(0.6 for p in patterns["patterns"] if p in context)
+        total = len(patterns["keywords"]) + len(patterns["symbols"]) + len(patterns["patterns"])
+        scores[archetype] = score / total if total else 0.0
+    ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    primary, primary_score = ranked[0]
+
+    resonances = {}
+    for system, database in sage.mythic_databases.items():
+        resonance, matches = 0.0, 0
+        for deity in database.get("deities", {}).values():
+            if primary in deity.get("archetypes", []):
+                resonance += 0.5
+                matches += 1
+            for ds in deity.get("symbols", []):
+                if ds in symbol or symbol in ds:
+                    resonance += 0.3
+                    matches += 1
+        for ms, archetypes in database.get("symbols", {}).items():
+            if primary in archetypes and (ms in symbol or symbol in ms):
+                resonance += 0.7
+                matches += 1
+        resonances[system] = min(1.0, resonance / max(1, matches)) if matches else 0.0
+
+    variants = {}
+    for name, data in sage.cultural_symbols.items():
+        if name in symbol or symbol in name:
+            variants.update(data.get("cultural_variants", {}))
+    return scores, primary, primary_score, resonances, variants
+
+
+def random_elements(sage, n, seed):
+    rng = random.Random(seed)
+    vocabulary = sorted(
+        {
+            word
+            for patterns in sage.archetypal_patterns.values()
+            for key in ("keywords", "symbols", "patterns")
+            for word in patterns[key]
+        }
+        | {s for db in sage.mythic_databases.values() for s in db.get("symbols", {})}
+        | set(sage.cultural_symbols)
+    )
+    words = vocabulary + FILLER + ["vision", "recall", "fold", "journey", "renewal"]
+    elements = []
+    for i in range(n):
+        symbol = rng.choice(words)
+        if rng.random() < 0.3:
+            symbol = symbol[: rng.randrange(1, len(symbol) + 1)]
+        context = " ".join(rng.choice(words) for _ in range(rng.randrange(0, 12)))
+        elements.append(
+            SymbolicElement(
+                symbol=f"{symbol.upper() if rng.random() < 0.2 else symbol}",
+                source_file=f"f{i}.json",
+                context=context,
+                timestamp="2025-01-01T00:00:00+00:00",
+                system_origin=rng.choice(ORIGINS),
+                glyph_lineage="Λ" if rng.random() < 0.1 else None,
+            )
+        )
+    return elements
+
+
+@pytest.fixture(scope="module")
+def sage(tmp_path_factory):
+    return ΛSage(base_directory=str(tmp_path_factory.mktemp("sage")))
+
+
+class TestAhoCorasick:
+    def test_matches_naive_substring_search(self):
+        rng = random.Random(3)
+        patterns = ["he", "she", "his", "hers", "e", "", "sh", "ushers"]
+        automaton = AhoCorasick(patterns)
+        for _ in range(200):
+            text = "".join(rng.choice("hesiur ") for _ in range(rng.randrange(0, 15)))
+            expected = {i for i, p in enumerate(patterns) if p in text}
+            assert automaton.find(text) == expected
+
+    def test_unicode_patterns(self):
+        automaton = AhoCorasick(["λ", "ΛSAGE", "sage"])
+        assert automaton.find("the λ of ΛSAGE") == {0, 1}
+
+
+class TestArchetypeMatcher:
+    def test_matches_reference_scan(self, sage):
+        for elem in random_elements(sage, 400, seed=11):
+            mapping = sage._classify_symbol(elem)
+            scores, primary, primary_score, resonances, variants = reference_classification(sage, elem)
+
+            assert mapping.resonance_strength == pytest.approx(primary_score)
+            assert scores[mapping.primary_archetype] == pytest.approx(primary_score)
+            for archetype in mapping.secondary_archetypes:
+                assert scores[archetype] > 0.2
+            if primary_score > 0:
+                assert mapping.confidence_score == pytest.approx(min(1.0, primary_score * 2))
+            else:
+                assert mapping.confidence_score == 0.1
+
+            if mapping.primary_archetype == primary:
+                assert mapping.mythic_resonances == pytest.approx(resonances)
+            if elem.glyph_lineage:
+                variants["glyph_form"] = elem.glyph_lineage
+            assert mapping.cultural_variants == variants
+
+    def test_symbolic_patterns_follow_context_and_origin(self, sage):
+        elem = SymbolicElement(
+            symbol="ocean",
+            source_file="x",
+            context="A lucid vision of renewal and a journey; recall the fold",
+            timestamp="t",
+            system_origin="dream",
+        )
+        patterns = sage._classify_symbol(elem).symbolic_patterns
+        assert {"lucid", "vision", "renewal", "journey"} <= set(patterns)
+        assert "recall" not in patterns and "fold" not in patterns
+        assert len(patterns) == len(set(patterns))
+
+    def test_empty_knowledge_base_defaults_to_innocent(self, sage):
+        matcher = ArchetypeMatcher({}, {}, {})
+        sage_matcher, sage._matcher = sage._matcher, matcher
+        try:
+            mapping = sage._classify_symbol(random_elements(sage, 1, seed=0)[0])
+        finally:
+            sage._matcher = sage_matcher
+        assert mapping.primary_archetype is ArchetypalFamily.INNOCENT
+        assert mapping.resonance_strength == 0.0
+        assert mapping.confidence_score == 0.1
+
+    def test_rebuild_picks_up_new_patterns(self, tmp_path):
+        local = ΛSage(base_directory=str(tmp_path))
+        elem = SymbolicElement("zorblax", "x", "", "t", "dream")
+        local.archetypal_patterns[ArchetypalFamily.TRICKSTER]["keywords"].append("zorblax")
+        assert local._classify_symbol(elem).resonance_strength == 0.0
+        local.rebuild_matcher()
+        assert local._classify_symbol(elem).primary_archetype is ArchetypalFamily.TRICKSTER
+
+
+class TestIdentifyArchetypes:
+    def test_batch_matches_single_classification(self, sage):
+        elements = random_elements(sage, 150, seed=5)
+        batched = sage.identify_archetypes(elements, chunk_size=32)
+        latest = {elem.symbol: elem for elem in elements}
+        assert batched.keys() == latest.keys()
+        for symbol, elem in latest.items():
+            assert batched[symbol].to_dict() == sage._classify_symbol(elem).to_dict()
+
+    def test_process_pool_matches_in_process(self, sage):
+        elements = random_elements(sage, 120, seed=9)
+        serial = sage.identify_archetypes(elements, chunk_size=25)
+        parallel = sage.identify_archetypes(elements, workers=2, chunk_size=25)
+        assert {k: v.to_dict() for k, v in parallel.items()} == {
+            k: v.to_dict() for k, v in serial.items()
+        }
+
+    def test_empty_input(self, sage):
+        assert sage.identify_archetypes([]) == {}
@@ -243,8 +243,8 @@ class TestTraceCollector:
 
         completed_trace = collector.completed_traces[0]
         assert completed_trace["trace_id"] == "t1"
-        # This asserts the buggy behavior where spans are duplicated.
-        assert len(completed_trace["spans"]) == 4
+        # Re-adding a finished span updates it instead of duplicating it
+        assert len(completed_trace["spans"]) == 2
 
     def test_get_trace_statistics(self):
         """Tests the calculation of trace statistics."""
@@ -293,6 +293,66 @@ class TestTraceCollector:
         assert len(op1_traces) == 2
         assert {t["trace_id"] for t in op1_traces} == {"t1", "t2"}
 
+    def test_completion_waits_for_open_spans_without_duplicates(self):
+        """Tests that re-adding finished spans counts down open spans exactly once."""
+        collector = TraceCollector(idle_timeout=None)
+        spans = [TraceSpan(f"s{i}", "t1", None, "op", "svc", 100.0, None, None, {}, [], "active") for i in range(50)]
+        for span in spans:
+            collector.add_span(span)
+
+        for span in spans[:-1]:
+            span.finish()
+            collector.add_span(span)
+            collector.add_span(span)  # Duplicate finish reports are ignored
+        assert "t1" in collector.traces
+        assert len(collector.traces["t1"]) == 50
+
+        spans[-1].finish()
+        collector.add_span(spans[-1])
+        assert "t1" not in collector.traces
+        assert collector.get_trace("t1")["span_count"] == 50
+        assert collector.spans == {}
+
+    def test_idle_trace_is_completed_with_timeout_status(self):
+        """Tests that traces with open spans are completed once idle."""
+        collector = TraceCollector(idle_timeout=0.05, wheel_slots=4)
+        finished = TraceSpan("s1", "t1", None, "op1", "svc", 100.0, None, None, {}, [], "active")
+        open_span = TraceSpan("s2", "t1", "s1", "op2", "svc", 100.0, None, None, {}, [], "active")
+        collector.add_span(finished)
+        collector.add_span(open_span)
+        finished.finish()
+        collector.add_span(finished)
+
+        assert collector.expire_idle_traces() == 0
+        time.sleep(0.15)
+        assert collector.expire_idle_traces() == 1
+
+        trace = collector.get_trace("t1")
+        assert [span["status"] for span in trace["spans"]] == ["ok", "timeout"]
+        assert "t1" not in collector.traces
+        assert collector.spans == {}
+
+    def test_operation_index_follows_eviction(self):
+        """Tests that the operation index drops traces evicted from completed_traces."""
+        collector = TraceCollector(max_traces=2, idle_timeout=None)
+        for i in range(3):
+            collector.add_span(TraceSpan(f"s{i}", f"t{i}", None, "op", "svc", 100.0, 100.1, 0.1, {}, [], "ok"))
+
+        assert len(collector.completed_traces) == 2
+        assert [t["trace_id"] for t in collector.completed_traces] == ["t1", "t2"]
+        assert [t["trace_id"] for t in collector.get_traces_by_operation("op")] == ["t1", "t2"]
+        assert collector.get_trace("t0") is None
+
+    def test_completed_trace_dict_is_rendered_once(self):
+        """Tests that completed trace dicts are rendered lazily and cached."""
+        collector = TraceCollector()
+        collector.add_span(TraceSpan("s1", "t1", None, "op", "svc", 100.0, 100.1, 0.1, {"k": "v"}, [], "ok"))
+
+        first = collector.completed_traces[0]
+        assert first is collector.get_trace("t1")
+        assert first is collector.get_traces_by_operation("op")[0]
+        assert first["spans"][0]["tags"] == {"k": "v"}
+
 
 @pytest.mark.tier3
 @pytest.mark.tracing
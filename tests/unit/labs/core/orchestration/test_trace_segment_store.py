@@ -0,0 +1,104 @@
+"""
+Tests for the offset-indexed trace segment store behind TraceMemoryLogger.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("labs.core.orchestration.brain.trace_memory_logger")
+
+from labs.core.orchestration.brain import trace_segment_store
+from labs.core.orchestration.brain.trace_memory_logger import TraceMemoryLogger
+from labs.core.orchestration.brain.trace_segment_store import TraceSegmentStore
+
+
+@pytest.fixture
+def trace_logger(tmp_path):
+    trace_logger = TraceMemoryLogger(
+        config={"log_dir": str(tmp_path), "flush_interval": 0, "recent_traces_limit": 2}
+    )
+    yield trace_logger
+    trace_logger.close()
+
+
+def test_traces_are_buffered_until_flush(trace_logger, tmp_path):
+    trace_id = trace_logger.log_system_event("boot")
+
+    assert not list((tmp_path / "segments").glob("*.jsonl"))
+    assert trace_logger.get_trace_by_id(trace_id)["message"] == "boot"
+
+    assert trace_logger.flush() == 1
+    assert len(list((tmp_path / "segments").glob("*.jsonl"))) == 1
+    assert (tmp_path / "system" / "trace_system.jsonl").read_text().count("\n") == 1
+
+
+def test_lookup_by_id_seeks_past_recent_cache(trace_logger):
+    ids = [trace_logger.log_core_event(f"event {i}") for i in range(10)]
+    trace_logger.flush()
+
+    # Only the last two traces remain in the in-memory cache
+    assert trace_logger.get_trace_by_id(ids[0])["message"] == "event 0"
+    assert trace_logger.get_trace_by_id("missing") is None
+
+
+def test_recent_traces_for_user_use_postings(trace_logger):
+    for i in range(6):
+        trace_logger.log_interaction(f"a{i}", user_id="user_a")
+        trace_logger.log_interaction(f"b{i}", user_id="user_b")
+    trace_logger.flush()
+
+    traces = trace_logger.get_recent_traces(limit=4, user_id="user_a")
+
+    assert [t["message"] for t in traces] == ["a5", "a4", "a3", "a2"]
+    assert all(t["user_id"] == "user_a" for t in traces)
+
+
+def test_segments_rotate_daily(tmp_path):
+    store = TraceSegmentStore(str(tmp_path), flush_interval=0)
+    store.append({"trace_id": "t1", "unix_time": 1730000000.0})
+    store.append({"trace_id": "t2", "unix_time": 1730000000.0 + 86400})
+    store.flush()
+
+    segments = sorted(p.name for p in (tmp_path / "segments").glob("*.jsonl"))
+    assert segments == ["all_traces-20241027.jsonl", "all_traces-20241028.jsonl"]
+    assert store.get("t2")["unix_time"] == 1730086400.0
+
+
+def test_index_reloads_and_recovers_unindexed_tail(tmp_path):
+    store = TraceSegmentStore(str(tmp_path), flush_interval=0)
+    store.append({"trace_id": "t1", "unix_time": 1730000000.0, "user_id": "u"})
+    store.flush()
+
+    # Simulate a crash after the segment write but before the index write
+    segment = next((tmp_path / "segments").glob("*.jsonl"))
+    with open(segment, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"trace_id": "t2", "unix_time": 1730000001.0, "user_id": "u"}) + "\n")
+
+    reopened = TraceSegmentStore(str(tmp_path), flush_interval=0)
+
+    assert reopened.get("t1")["trace_id"] == "t1"
+    assert reopened.get("t2")["trace_id"] == "t2"
+    assert [t["trace_id"] for t in reopened.iter_user_traces("u")] == ["t2", "t1"]
+
+
+def test_read_traces_includes_legacy_log(trace_logger, tmp_path):
+    legacy = {"trace_id": "legacy", "unix_time": 1.0, "level": 0, "tags": []}
+    (tmp_path / "all_traces.jsonl").write_text(json.dumps(legacy) + "\n")
+    trace_logger.log_system_event("new")
+
+    messages = {t["trace_id"] for t in trace_logger.read_traces()}
+
+    assert "legacy" in messages
+    assert len(messages) == 2
+    assert trace_logger.get_trace_by_id("legacy")["unix_time"] == 1.0
+
+
+def test_exit_hook_flushes_unclosed_stores(tmp_path):
+    trace_logger = TraceMemoryLogger(config={"log_dir": str(tmp_path), "flush_interval": 60})
+    trace_id = trace_logger.log_system_event("last words")
+
+    trace_segment_store._close_open_stores()
+
+    assert trace_logger.store not in trace_segment_store._open_stores
+    assert TraceSegmentStore(str(tmp_path), flush_interval=0).get(trace_id)["message"] == "last words"
@@ -0,0 +1,169 @@
+"""Tests for the verified-token cache in EnhancedAuthenticationSystem.verify_jwt."""
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+jwt = pytest.importorskip("jwt")
+
+
+@pytest.fixture
+def auth_module(monkeypatch):
+    # Imported lazily and pinned to the real PyJWT: other suites import this
+    # module at collection time with PyJWT mocked out of sys.modules.
+    from labs.core.security import auth
+
+    monkeypatch.setattr(auth, "jwt", jwt)
+    monkeypatch.setattr(auth, "JWT_AVAILABLE", True)
+    return auth
+
+
+@pytest.fixture
+def auth_system(auth_module):
+    return auth_module.EnhancedAuthenticationSystem()
+
+
+@pytest.fixture
+def decode_spy(auth_module):
+    with patch.object(auth_module.jwt, "decode", wraps=jwt.decode) as spy:
+        yield spy
+
+
+def test_repeated_verification_is_served_from_cache(auth_system, decode_spy):
+    token = auth_system.generate_jwt("user-1", {"roles": ["admin"]})
+
+    first = auth_system.verify_jwt(token)
+    second = auth_system.verify_jwt(token)
+
+    assert first == second
+    assert second["user_id"] == "user-1"
+    assert decode_spy.call_count == 1
+
+
+def test_cached_payload_is_a_copy(auth_system):
+    token = auth_system.generate_jwt("user-1", {"roles": ["reader"]})
+
+    auth_system.verify_jwt(token)["roles"].append("admin")
+
+    assert auth_system.verify_jwt(token)["roles"] == ["reader"]
+
+
+def test_revoked_token_is_never_served_from_cache(auth_system, decode_spy):
+    token = auth_system.generate_jwt("user-1")
+    payload = auth_system.verify_jwt(token)
+
+    auth_system.revoke_jwt(payload["jti"])
+
+    assert auth_system.verify_jwt(token) is None
+    assert auth_system.verify_jwt(token) is None
+    assert not auth_system._verified_jwts
+    assert not auth_system._verified_jwts_by_jti
+
+
+def test_revoked_jti_added_directly_is_not_served(auth_system):
+    """A revocation that bypassed revoke_jwt is still checked on cache hits."""
+    token = auth_system.generate_jwt("user-1")
+    payload = auth_system.verify_jwt(token)
+
+    auth_system._revoked_jtis[payload["jti"]] = time.time() + 60
+
+    assert auth_system.verify_jwt(token) is None
+
+
+def test_expired_token_is_never_served_from_cache(auth_module, auth_system, decode_spy):
+    exp = int(datetime.now(timezone.utc).timestamp()) + 60
+    token = auth_system.generate_jwt("user-1", {"exp": exp})
+    assert auth_system.verify_jwt(token) is not None
+
+    with (
+        patch.object(auth_module.time, "time", return_value=exp),
+        patch.object(auth_module.jwt, "decode", side_effect=jwt.ExpiredSignatureError),
+    ):
+        assert auth_system.verify_jwt(token) is None
+
+    assert not auth_system._verified_jwts
+
+
+def test_cache_entries_expire_after_ttl(auth_module, auth_system, decode_spy):
+    auth_system.jwt_cache_ttl_seconds = 5
+    token = auth_system.generate_jwt("user-1")
+    now = time.time()
+
+    with patch.object(auth_module.time, "time", return_value=now):
+        auth_system.verify_jwt(token)
+    with patch.object(auth_module.time, "time", return_value=now + 4):
+        auth_system.verify_jwt(token)
+    assert decode_spy.call_count == 1
+
+    with patch.object(auth_module.time, "time", return_value=now + 6):
+        assert auth_system.verify_jwt(token) is not None
+    assert decode_spy.call_count == 2
+
+
+def test_cache_hits_skip_redis_revocation_lookup(auth_system):
+    auth_system.redis_client = MagicMock()
+    auth_system.redis_client.exists.return_value = 0
+    token = auth_system.generate_jwt("user-1")
+
+    for _ in range(5):
+        assert auth_system.verify_jwt(token) is not None
+
+    assert auth_system.redis_client.exists.call_count == 1
+
+
+def test_local_revocation_front_avoids_redis(auth_system):
+    auth_system.redis_client = MagicMock()
+    auth_system.redis_client.exists.return_value = 0
+    token = auth_system.generate_jwt("user-1")
+    jti = jwt.decode(token, options={"verify_signature": False})["jti"]
+
+    auth_system.revoke_jwt(jti)
+
+    assert auth_system.verify_jwt(token) is None
+    auth_system.redis_client.setex.assert_called_once()
+    auth_system.redis_client.exists.assert_not_called()
+
+
+def test_revocations_lapse_after_token_lifetime(auth_module, auth_system):
+    now = time.time()
+    lifetime = auth_system.jwt_expiry_hours * 3600
+
+    with patch.object(auth_module.time, "time", return_value=now):
+        auth_system.revoke_jwt("old")
+        auth_system.revoke_jwt("recent")
+    with patch.object(auth_module.time, "time", return_value=now + lifetime - 1):
+        assert auth_system._is_token_revoked("old")
+    with patch.object(auth_module.time, "time", return_value=now + lifetime):
+        assert not auth_system._is_token_revoked("old")
+        auth_system.revoke_jwt("new")
+
+    assert list(auth_system._revoked_jtis) == ["new"]
+
+
+def test_cache_is_bounded(auth_system):
+    auth_system.jwt_cache_max_entries = 3
+    tokens = [auth_system.generate_jwt(f"user-{i}") for i in range(5)]
+
+    for token in tokens:
+        auth_system.verify_jwt(token)
+
+    assert len(auth_system._verified_jwts) == 3
+    assert len(auth_system._verified_jwts_by_jti) == 3
+
+
+def test_invalid_tokens_are_not_cached(auth_module, auth_system):
+    assert auth_system.verify_jwt("not-a-token") is None
+    other = auth_module.EnhancedAuthenticationSystem()
+    assert auth_system.verify_jwt(other.generate_jwt("user-1")) is None
+    assert not auth_system._verified_jwts
+
+
+def test_zero_ttl_disables_cache(auth_system, decode_spy):
+    auth_system.jwt_cache_ttl_seconds = 0
+    token = auth_system.generate_jwt("user-1")
+
+    auth_system.verify_jwt(token)
+    auth_system.verify_jwt(token)
+
+    assert decode_spy.call_count == 2
@@ -0,0 +1,50 @@
+"""Tests for batch hash lookups on the labs memory fold database."""
+
+import numpy as np
+import pytest
+
+from labs.memory.folds import memory_fold
+from labs.memory.folds.memory_fold import MemoryFoldDatabase
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = MemoryFoldDatabase(str(tmp_path / "folds.db"))
+    for i in range(2_000):
+        db.add_fold(
+            {
+                "timestamp": f"2025-01-01T00:00:{i % 60:02d}+00:00",
+                "emotion": "joy",
+                "context": f"memory {i}",
+                "hash": f"h{i}",
+                "user_id": "alice" if i % 2 else "system",
+                "emotion_vector": np.array([0.1, 0.2, 0.3]),
+                "relevance_score": 1.0,
+            }
+        )
+    return db
+
+
+def test_get_folds_by_hash_preserves_order_across_chunks(database, monkeypatch):
+    monkeypatch.setattr(memory_fold, "_HASH_LOOKUP_CHUNK", 7)
+    hashes = [f"h{i}" for i in (1999, 3, 500, 42, 7, 1000)] + ["missing"]
+
+    folds = database.get_folds_by_hash(hashes)
+
+    assert [f["hash"] for f in folds] == hashes[:-1]
+    assert folds[1]["context"] == "memory 3"
+    np.testing.assert_allclose(folds[0]["emotion_vector"], [0.1, 0.2, 0.3])
+
+
+def test_get_folds_by_hash_filters_user_and_bumps_access(database):
+    folds = database.get_folds_by_hash(["h1", "h2", "h3"], user_id="bob")
+    # Only the system-owned fold is visible to another user
+    assert [f["hash"] for f in folds] == ["h2"]
+
+    database.get_folds_by_hash(["h2"])
+    (fold,) = database.get_folds_by_hash(["h2"])
+    assert fold["access_count"] == 2
+
+
+def test_get_folds_by_hash_empty(database):
+    assert database.get_folds_by_hash([]) == []
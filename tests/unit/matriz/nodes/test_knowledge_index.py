@@ -0,0 +1,105 @@
+"""
+Tests for the MATRIZ knowledge base index used by FactNode and ValidatorNode.
+"""
+
+import json
+
+import pytest
+from matriz.nodes.fact_node import FactNode
+from matriz.nodes.knowledge_index import KnowledgeIndex, load_knowledge_base
+from matriz.nodes.validator_node import ValidatorNode
+
+
+def _synthetic_kb(size: int) -> dict[str, dict]:
+    return {
+        f"what is the population of city {i}": {
+            "answer": f"City {i} has {i * 7} inhabitants.",
+            "category": "geography",
+            "certainty": 0.9,
+            "keywords": [f"city{i}", "population"],
+        }
+        for i in range(size)
+    }
+
+
+def test_small_kb_returns_every_entry_in_order():
+    """Built-in sized knowledge bases are scored exhaustively."""
+    node = FactNode()
+    index = KnowledgeIndex(node.knowledge_base)
+
+    assert index.candidates("anything at all") == list(node.knowledge_base)
+
+
+def test_exact_match_always_shortlisted():
+    kb = _synthetic_kb(5000)
+    index = KnowledgeIndex(kb, max_candidates=8)
+
+    question = "what is the population of city 4321"
+    assert index.exact(question) == question
+    assert question in index.candidates(question)
+    assert len(index.candidates(question)) <= 9
+
+
+def test_keyword_postings_shortlist_entry():
+    kb = _synthetic_kb(5000)
+    index = KnowledgeIndex(kb, max_candidates=8)
+
+    assert "what is the population of city 17" in index.candidates("population city17")
+
+
+def test_fact_node_large_kb_matches_exhaustive_scan():
+    """Index-backed search returns the same best answer as scoring every entry."""
+    node = FactNode()
+    node.knowledge_base.update(_synthetic_kb(2000))
+
+    question = node._normalize_question("What is the population of city 1234?")
+    indexed = node._search_knowledge_base(question)
+
+    node._kb_index = KnowledgeIndex(node.knowledge_base, max_candidates=len(node.knowledge_base))
+    exhaustive = node._search_knowledge_base(question)
+
+    assert indexed[0]["answer"] == exhaustive[0]["answer"] == "City 1234 has 8638 inhabitants."
+    assert indexed[0]["confidence"] == exhaustive[0]["confidence"]
+
+
+def test_fact_node_builtin_answers_unchanged():
+    result = FactNode().process({"question": "What is the capital of France?"})
+
+    assert result["answer"] == "The capital of France is Paris."
+    assert result["confidence"] > 0.5
+
+
+def test_load_knowledge_base_json_and_jsonl(tmp_path):
+    json_path = tmp_path / "kb.json"
+    json_path.write_text(
+        json.dumps({"What is the tallest mountain": {"answer": "Mount Everest.", "keywords": ["everest"]}})
+    )
+    jsonl_path = tmp_path / "kb.jsonl"
+    jsonl_path.write_text(
+        json.dumps({"question": "what is the longest river", "answer": "The Nile.", "certainty": 0.8}) + "\n"
+    )
+
+    loaded = load_knowledge_base(json_path)
+    assert loaded["what is the tallest mountain"]["category"] == "general"
+
+    node = FactNode(knowledge_base_path=jsonl_path)
+    assert node.process({"question": "What is the longest river?"})["answer"] == "The Nile."
+    assert node.load_knowledge_base(json_path, replace=True) == 1
+    assert list(node.knowledge_base) == ["what is the tallest mountain"]
+
+
+def test_load_knowledge_base_rejects_entries_without_answer(tmp_path):
+    path = tmp_path / "kb.json"
+    path.write_text(json.dumps([{"question": "what is x"}]))
+
+    with pytest.raises(ValueError):
+        load_knowledge_base(path)
+
+
+def test_validator_known_fact_uses_index():
+    validator = ValidatorNode()
+    validator.known_facts.update(_synthetic_kb(3000))
+
+    assert validator._verify_known_fact("what is the capital of france", "The capital of France is Paris.") == 1.0
+    assert validator._verify_known_fact("what is the population of city 99", "City 99 has 693 inhabitants.") == 0.9
+    assert validator._verify_known_fact("what is the population of city 99", "Nobody lives there") == 0.1
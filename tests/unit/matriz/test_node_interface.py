@@ -562,19 +562,50 @@ class TestDeterministicHashing:
 class TestProcessingHistory:
     """Test processing history tracking."""
 
-    def test_get_trace_returns_copy(self):
-        """get_trace should return copy of history."""
+    def test_get_trace_returns_read_only_view(self):
+        """get_trace should return a live, read-only view of history."""
         node = TestNode(node_name="test", capabilities=["test"])
         node.create_matriz_node(node_type="CONTEXT", state=NodeState(confidence=0.8, salience=0.7))
 
         trace = node.get_trace()
 
-        # Modify the returned trace
-        trace.append("extra_item")
+        assert not hasattr(trace, "append")
+        assert len(trace) == 1
 
-        # Original should be unchanged
-        assert len(node.processing_history) == 1
+        # View reflects nodes created afterwards
+        node.create_matriz_node(node_type="DECISION", state=NodeState(confidence=0.9, salience=0.8))
         assert len(trace) == 2
+        assert [n["type"] for n in trace] == ["CONTEXT", "DECISION"]
+        assert trace[-1:][0]["type"] == "DECISION"
+
+    def test_history_is_bounded(self):
+        """History should retain only the configured number of nodes."""
+        node = TestNode(node_name="test", capabilities=["test"], history_limit=3)
+
+        created = [
+            node.create_matriz_node(node_type="CONTEXT", state=NodeState(confidence=0.8, salience=0.7))
+            for _ in range(5)
+        ]
+
+        assert len(node.processing_history) == 3
+        assert node.processing_history.total_recorded == 5
+        assert [n["id"] for n in node.get_trace()] == [n["id"] for n in created[-3:]]
+
+    def test_compact_history_round_trips_schema(self):
+        """Compact history should render the same matriz_node_v1 dicts."""
+        node = TestNode(node_name="test", capabilities=["cap1", "cap2"], compact_history=True)
+        other = TestNode(node_name="other", capabilities=["cap1", "cap2"], compact_history=True)
+
+        created = node.create_matriz_node(
+            node_type="DECISION",
+            state=NodeState(confidence=0.9, salience=0.8),
+            trace_id="trace-1",
+            additional_data={"answer": 42},
+        )
+        other.create_matriz_node(node_type="DECISION", state=NodeState(confidence=0.9, salience=0.8))
+
+        assert node.get_trace()[0] == created
+        assert node.processing_history._entries[0].capabilities is other.processing_history._entries[0].capabilities
 
     def test_get_trace_includes_all_created_nodes(self):
         """Trace should include all nodes created by this processor."""
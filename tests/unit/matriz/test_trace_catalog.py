@@ -0,0 +1,198 @@
+"""
+Tests for matriz.trace_catalog and its use by the traces router.
+
+Deterministic, network-free; trace directories live under tmp_path.
+"""
+
+import json
+import os
+
+import pytest
+from matriz.trace_catalog import TraceCatalog
+
+
+def _write_trace(root, name, trace_id, mtime=None):
+    path = root / name
+    path.write_text(json.dumps({"trace_id": trace_id, "timestamp": 1730000000}))
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def _read_id(calls):
+    def read(path):
+        calls.append(path.name)
+        try:
+            return json.loads(path.read_text()).get("trace_id")
+        except ValueError:
+            return None
+
+    return read
+
+
+@pytest.fixture
+def trace_root(tmp_path):
+    root = tmp_path / "traces"
+    root.mkdir()
+    return root
+
+
+def test_catalog_maps_ids_and_sorts_by_mtime(trace_root):
+    _write_trace(trace_root, "a.json", "trace-a", mtime=1000)
+    _write_trace(trace_root, "b.json", "trace-b", mtime=3000)
+    _write_trace(trace_root, "c.json", "trace-c", mtime=2000)
+    (trace_root / "bad.json").write_text("{not json")
+    os.utime(trace_root / "bad.json", (500, 500))
+
+    catalog = TraceCatalog(trace_root, iter_files=lambda r: r.glob("*.json"), read_trace_id=_read_id([]))
+    catalog.refresh()
+
+    assert catalog.lookup("trace-c").name == "c.json"
+    assert catalog.lookup("missing") is None
+    assert [e.name for e in catalog.entries()] == ["b.json", "c.json", "a.json", "bad.json"]
+    assert catalog.get("bad.json").ident == "bad"
+
+
+def test_catalog_only_reparses_changed_files(trace_root):
+    _write_trace(trace_root, "a.json", "trace-a")
+    _write_trace(trace_root, "b.json", "trace-b")
+    calls = []
+    catalog = TraceCatalog(trace_root, iter_files=lambda r: r.glob("*.json"), read_trace_id=_read_id(calls))
+
+    catalog.refresh()
+    assert sorted(calls) == ["a.json", "b.json"]
+
+    calls.clear()
+    path = _write_trace(trace_root, "b.json", "trace-b2")
+    os.utime(path, (5000, 5000))
+    catalog.refresh(force=True)
+
+    assert calls == ["b.json"]
+    assert catalog.lookup("trace-b") is None
+    assert catalog.lookup("trace-b2").name == "b.json"
+
+
+def test_catalog_detects_in_place_rewrite(trace_root):
+    path = _write_trace(trace_root, "a.json", "trace-a", mtime=1000)
+    catalog = TraceCatalog(trace_root, iter_files=lambda r: r.glob("*.json"), read_trace_id=_read_id([]))
+    catalog.refresh()
+    entry = catalog.lookup("trace-a")
+
+    _write_trace(trace_root, "a.json", "trace-a-longer", mtime=2000)
+
+    assert not catalog.is_current(entry)
+    assert path.exists()
+
+
+def test_catalog_side_file_persists_entries(trace_root, tmp_path):
+    _write_trace(trace_root, "a.json", "trace-a")
+    db_path = tmp_path / "catalog.sqlite"
+
+    first = TraceCatalog(
+        trace_root, iter_files=lambda r: r.glob("*.json"), read_trace_id=_read_id([]), db_path=db_path
+    )
+    first.refresh()
+
+    calls = []
+    second = TraceCatalog(
+        trace_root, iter_files=lambda r: r.glob("*.json"), read_trace_id=_read_id(calls), db_path=db_path
+    )
+    assert second.lookup("trace-a").name == "a.json"
+
+    second.refresh()
+    assert calls == []
+
+
+@pytest.fixture
+def router_client(tmp_path, monkeypatch):
+    pytest.importorskip("fastapi")
+    import matriz.traces_router as traces_router
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    live = tmp_path / "live"
+    golden = tmp_path / "golden"
+    live.mkdir()
+    golden.mkdir()
+    monkeypatch.delenv("MATRIZ_TRACES_DIR", raising=False)
+    monkeypatch.setattr(traces_router, "TRACES_BASE_PATH", live)
+    monkeypatch.setattr(traces_router, "GOLDEN_TRACES_PATH", golden)
+    monkeypatch.setattr(traces_router, "_catalogs", {})
+
+    app = FastAPI()
+    app.include_router(traces_router.router)
+    return TestClient(app), live, golden
+
+
+def test_router_lists_and_resolves_from_catalog(router_client):
+    client, live, golden = router_client
+    for i in range(5):
+        _write_trace(live, f"live_{i}.json", f"live-{i}", mtime=1000 + i)
+    _write_trace(golden, "gold.json", "gold-0", mtime=5000)
+
+    listing = client.get("/traces/?offset=1&limit=2").json()
+    assert listing["total"] == 6
+    assert [t["id"] for t in listing["traces"]] == ["live-4", "live-3"]
+    assert listing["next_offset"] == 3
+
+    golden_only = client.get("/traces/?source=golden").json()
+    assert [t["id"] for t in golden_only["traces"]] == ["gold-0"]
+
+    assert client.get("/traces/live-2").json()["trace_id"] == "live-2"
+    assert client.get("/traces/gold-0").json()["source"] == "golden"
+
+    # New files are visible immediately
+    _write_trace(live, "late.json", "late-trace")
+    assert client.get("/traces/late-trace").status_code == 200
+
+
+def test_router_catalog_skips_symlink_escape(router_client, tmp_path):
+    client, live, _ = router_client
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    secret = _write_trace(outside, "secret.json", "secret-trace")
+    try:
+        (live / "escape.json").symlink_to(secret)
+    except OSError:
+        pytest.skip("Symlinks not supported on this system")
+
+    assert client.get("/traces/secret-trace").status_code == 404
+    assert client.get("/traces/").json()["total"] == 0
+
+
+def test_router_misses_do_not_rescan_a_warm_catalog(router_client, monkeypatch):
+    client, live, golden = router_client
+    stale = _write_trace(live, "moved.json", "moved-trace", mtime=1000)
+    for root in (live, golden):
+        os.utime(root, (1000, 1000))  # Outside the racy window
+    assert client.get("/traces/moved-trace").status_code == 200
+
+    forced = []
+    refresh = TraceCatalog.refresh
+
+    def spy(self, force=False):
+        forced.append(force)
+        return refresh(self, force)
+
+    monkeypatch.setattr(TraceCatalog, "refresh", spy)
+    assert client.get("/traces/unknown-trace").status_code == 404
+    assert forced and not any(forced)
+
+    # A catalogued entry that changed on disk still forces one rescan
+    stale.write_text(json.dumps({"trace_id": "moved-trace", "timestamp": 1730000001}))
+    assert client.get("/traces/moved-trace").status_code == 200
+    assert forced.count(True) == 1
+
+
+def test_router_lifespan_runs_background_catalog_refresh(router_client, monkeypatch):
+    import matriz.traces_router as traces_router
+
+    client, _, _ = router_client
+    monkeypatch.setenv("MATRIZ_TRACE_CATALOG_REFRESH_SECONDS", "0.05")
+
+    with client:
+        catalogs = list(traces_router._catalogs.values())
+        assert len(catalogs) == 2
+        assert all(c._refresh_thread is not None and c._refresh_thread.is_alive() for c in catalogs)
+
+    assert all(c._refresh_thread is None for c in catalogs)
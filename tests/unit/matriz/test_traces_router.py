@@ -273,40 +273,6 @@ def test_iter_json_files_skips_directories(traces_router_module, temp_trace_dir)
     assert len(files) == 0
 
 
-# =============================================================================
-# Test: _sorted_files_in helper
-# =============================================================================
-
-
-def test_sorted_files_in_empty_dir(traces_router_module, temp_trace_dir):
-    """Test _sorted_files_in returns empty list for empty directory."""
-    files = traces_router_module._sorted_files_in(temp_trace_dir["traces"])
-    assert len(files) == 0
-
-
-def test_sorted_files_in_sorts_by_mtime(traces_router_module, temp_trace_dir):
-    """Test _sorted_files_in sorts files by modification time descending."""
-    import time
-
-    file1 = temp_trace_dir["traces"] / "old.json"
-    file1.write_text('{"trace_id": "old"}')
-    old_time = file1.stat().st_mtime - 100
-
-    time.sleep(0.01)
-
-    file2 = temp_trace_dir["traces"] / "new.json"
-    file2.write_text('{"trace_id": "new"}')
-
-    # Set old file's mtime to past
-    os.utime(file1, (old_time, old_time))
-
-    files = traces_router_module._sorted_files_in(temp_trace_dir["traces"])
-
-    assert len(files) == 2
-    assert files[0] == file2  # Latest first
-    assert files[1] == file1
-
-
 # =============================================================================
 # Test: _classify_root helper
 # =============================================================================
@@ -839,13 +805,12 @@ def test_error_handling_permission_denied(traces_router_module, temp_trace_dir):
 # =============================================================================
 # Summary: Test coverage for matriz.traces_router
 # =============================================================================
-# Total tests: 68
+# Total tests: 66
 #
 # Helper function coverage:
 # - _iter_trace_dirs: 5 tests
 # - _is_within: 5 tests
 # - _iter_json_files: 6 tests
-# - _sorted_files_in: 2 tests
 # - _classify_root: 4 tests
 # - load_trace_file: 9 tests
 #
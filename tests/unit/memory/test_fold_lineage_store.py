@@ -0,0 +1,154 @@
+"""Tests for the columnar lineage graph store behind FoldLineageTracker."""
+
+from __future__ import annotations
+
+import json
+import random
+from collections import deque
+
+import pytest
+
+import memory.fold_lineage_tracker as flt
+from memory.fold_lineage_tracker import CausationType, FoldLineageTracker
+
+
+@pytest.fixture(autouse=True)
+def _logger_bind(monkeypatch):
+    # track_causation calls logger.bind (structlog API) on a stdlib logger
+    if not hasattr(flt.logger, "bind"):
+        monkeypatch.setattr(flt.logger, "bind", lambda **_kwargs: flt.logger, raising=False)
+
+
+def _tracker(tmp_path, **kwargs) -> FoldLineageTracker:
+    return FoldLineageTracker(log_directory=tmp_path, **kwargs)
+
+
+def _populate(tracker: FoldLineageTracker, seed: int = 7, folds: int = 60, links: int = 200) -> None:
+    rng = random.Random(seed)
+    types = list(CausationType)
+    for i in range(folds):
+        if rng.random() < 0.85:
+            tracker.track_fold_state(f"f{i}", rng.random(), rng.random() * 0.8, f"h{i}")
+    for _ in range(links):
+        source, target = rng.randrange(folds), rng.randrange(folds)
+        tracker.track_causation(f"f{source}", f"f{target}", rng.choice(types), strength=round(rng.random(), 3))
+
+
+def _reference_trace(log_path, fold_key: str, max_depth: int) -> list[str]:
+    """The original dict-walking BFS over the JSONL log."""
+    graph: dict[str, list[dict]] = {}
+    nodes: dict[str, dict] = {}
+    with open(log_path, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            if record["event_type"] == "causal_link":
+                graph.setdefault(record["source_fold_key"], []).append(record)
+            else:
+                nodes[record["fold_key"]] = record
+
+    visited, trace = set(), []
+    queue = deque([(fold_key, 0)])
+    while queue and len(trace) < max_depth:
+        current, depth = queue.popleft()
+        if current in visited or depth >= max_depth:
+            continue
+        visited.add(current)
+        if current in nodes:
+            trace.append(current)
+        for source, links in graph.items():
+            for link in links:
+                if link["target_fold_key"] == current and source not in visited:
+                    queue.append((source, depth + 1))
+    return trace
+
+
+def _assert_traces_match(tracker: FoldLineageTracker, folds: int = 60) -> None:
+    for i in range(folds):
+        for max_depth in (1, 3, 10):
+            expected = _reference_trace(tracker.lineage_log_path, f"f{i}", max_depth)
+            actual = [node.fold_key for node in tracker._trace_lineage_backwards(f"f{i}", max_depth)]
+            assert actual == expected, (i, max_depth)
+
+
+def test_construction_is_lazy(tmp_path):
+    _populate(_tracker(tmp_path, merge_threshold=10**9))
+    tracker = _tracker(tmp_path)
+    assert not tracker._graph.is_open
+    assert len(tracker.fold_nodes) > 0
+    assert tracker._graph.is_open
+
+
+def test_backward_trace_matches_reference_before_and_after_merge(tmp_path):
+    tracker = _tracker(tmp_path, merge_threshold=10**9)
+    _populate(tracker)
+    _assert_traces_match(tracker)
+
+    assert tracker._graph.merge()
+    _assert_traces_match(tracker)
+
+    # Overlay on top of the snapshot
+    tracker.track_causation("f3", "f4", CausationType.ASSOCIATION, strength=0.5)
+    tracker.track_fold_state("f_new", 0.4, 0.1, "hnew")
+    tracker.track_causation("f_new", "f3", CausationType.ASSOCIATION, strength=0.5)
+    _assert_traces_match(tracker)
+
+
+def test_reopen_replays_only_journal_tail(tmp_path):
+    tracker = _tracker(tmp_path, merge_threshold=10**9)
+    _populate(tracker)
+    tracker._graph.merge()
+    tracker.track_causation("f1", "f2", CausationType.DRIFT_INDUCED, strength=0.25)
+    tracker.close()
+
+    reopened = _tracker(tmp_path, merge_threshold=10**9)
+    graph = reopened._graph
+    graph.open()
+    assert graph.snapshot_offset > 0
+    assert len(graph._ov_edges) == 1 and not graph._ov_nodes
+    assert graph.num_links == tracker._graph.num_links
+    _assert_traces_match(reopened)
+    assert reopened.lineage_graph["f1"][-1].causation_type is CausationType.DRIFT_INDUCED
+
+
+def test_background_merge_keeps_results(tmp_path):
+    tracker = _tracker(tmp_path, merge_threshold=50)
+    _populate(tracker)
+    tracker.close()  # joins the merge thread
+    assert tracker._graph.snapshot_offset > 0
+    _assert_traces_match(tracker)
+
+    analysis = tracker.analyze_fold_lineage("f5")
+    reference = _tracker(tmp_path / "unmerged", merge_threshold=10**9)
+    (tmp_path / "unmerged").mkdir(exist_ok=True)
+    (tmp_path / "unmerged" / "fold_lineage_log.jsonl").write_bytes(tracker.lineage_log_path.read_bytes())
+    expected = reference.analyze_fold_lineage("f5")
+    for field in ("lineage_depth", "total_causal_links", "causation_analysis", "lineage_trace"):
+        assert analysis[field] == expected[field]
+
+
+def test_torn_journal_tail_is_skipped(tmp_path):
+    tracker = _tracker(tmp_path, merge_threshold=10**9)
+    tracker.track_fold_state("a", 0.5, 0.1, "ha")
+    with open(tracker.lineage_log_path, "ab") as f:
+        f.write(b'{"event_type": "fold_state", "fold_key": "tor')
+
+    reopened = _tracker(tmp_path, merge_threshold=10**9)
+    reopened.track_fold_state("b", 0.5, 0.1, "hb")
+    reopened.track_causation("a", "b", CausationType.ASSOCIATION)
+
+    again = _tracker(tmp_path, merge_threshold=10**9)
+    assert set(again.fold_nodes) == {"a", "b"}
+    assert [node.fold_key for node in again._trace_lineage_backwards("b", 5)] == ["b", "a"]
+
+
+def test_lineage_graph_edges_stay_within_lineage(tmp_path):
+    tracker = _tracker(tmp_path)
+    for key in ("a", "b", "c", "d"):
+        tracker.track_fold_state(key, 0.5, 0.1, f"h-{key}")
+    tracker.track_causation("a", "b", CausationType.ASSOCIATION, strength=0.8)
+    tracker.track_causation("b", "c", CausationType.CONTENT_UPDATE, strength=0.6)
+    tracker.track_causation("c", "d", CausationType.ASSOCIATION, strength=0.1)
+
+    graph = tracker.generate_lineage_graph("b")
+    assert {node["id"] for node in graph["nodes"]} == {"a", "b"}
+    assert [(edge["source"], edge["target"], edge["type"]) for edge in graph["edges"]] == [("a", "b", "association")]
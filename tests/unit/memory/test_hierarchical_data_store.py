@@ -0,0 +1,178 @@
+"""Tests for HierarchicalDataStore persistence and ordered retrieval/pruning."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from memory.hds_segment_log import MAGIC, HDSSegmentLog
+from memory.hierarchical_data_store import HierarchicalDataStore, MemoryTier, RetrievalContext
+
+
+def _store(tmp_path, **kwargs) -> HierarchicalDataStore:
+    return HierarchicalDataStore(storage_path=tmp_path / "hds.json", flush_interval_seconds=0, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_only_changed_nodes(tmp_path):
+    store = _store(tmp_path)
+    first = await store.store({"text": "alpha"}, MemoryTier.SEMANTIC)
+    await store.store({"text": "beta"}, MemoryTier.SEMANTIC)
+    await store.flush_to_disk()
+    size_after_first = store._segment_log.log_bytes
+
+    await store.flush_to_disk()
+    assert store._segment_log.log_bytes - size_after_first < 512  # metrics record only
+
+    await store.update_importance(first, 2.0)
+    assert store._dirty == {first}
+    await store.flush_to_disk()
+    assert not store._dirty
+
+
+@pytest.mark.asyncio
+async def test_round_trip_preserves_content_and_compressed_payload(tmp_path):
+    store = _store(tmp_path)
+    plain = await store.store({"text": "kept"}, MemoryTier.EPISODIC, metadata={"k": 1}, importance=4.0)
+    packed = await store.store([1, 2, 3], MemoryTier.SENSORY)
+    child = await store.store("child", MemoryTier.EPISODIC, parent_id=plain)
+    await store._compress_node(store.nodes[packed])
+    payload = store.compression_cache[packed]
+    await store.update_collapse_state(plain, "trace-1", 0.3, "YELLOW")
+    await store.flush_to_disk()
+
+    restored = _store(tmp_path)
+    await restored.load_from_disk()
+
+    assert set(restored.nodes) == {plain, packed, child}
+    assert restored.nodes[plain].content == {"text": "kept"}
+    assert restored.nodes[plain].metadata == {"k": 1}
+    assert restored.nodes[plain].children_ids == [child]
+    assert restored.nodes[plain].collapse_trace_id == "trace-1"
+    assert restored.compression_cache[packed] == payload
+    assert restored.nodes[packed].content is None
+    await restored._decompress_node(restored.nodes[packed])
+    assert restored.nodes[packed].content == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_removed_nodes_are_tombstoned(tmp_path):
+    store = _store(tmp_path)
+    keep = await store.store("keep", MemoryTier.SEMANTIC)
+    drop = await store.store("drop", MemoryTier.SEMANTIC)
+    await store.flush_to_disk()
+    await store._remove_node(drop)
+    await store.flush_to_disk()
+
+    restored = _store(tmp_path)
+    await restored.load_from_disk()
+    assert set(restored.nodes) == {keep}
+
+
+@pytest.mark.asyncio
+async def test_torn_tail_is_truncated_on_load(tmp_path):
+    store = _store(tmp_path)
+    node_id = await store.store("durable", MemoryTier.SEMANTIC)
+    await store.flush_to_disk()
+    seg_path = store._segment_log.path
+    good_size = seg_path.stat().st_size
+
+    await store.store("torn", MemoryTier.SEMANTIC)
+    await store.flush_to_disk()
+    with open(seg_path, "r+b") as f:
+        f.truncate(seg_path.stat().st_size - 7)
+
+    restored = _store(tmp_path)
+    await restored.load_from_disk()
+    assert node_id in restored.nodes
+    assert seg_path.stat().st_size >= good_size
+    assert HDSSegmentLog(seg_path).load()[0].keys() == restored.nodes.keys()
+
+
+@pytest.mark.asyncio
+async def test_compaction_keeps_live_state(tmp_path):
+    store = _store(tmp_path)
+    node_id = await store.store("x" * 2048, MemoryTier.SEMANTIC)
+    for _ in range(5):
+        await store.update_importance(node_id, 0.1)
+        await store.flush_to_disk()
+
+    log = store._segment_log
+    assert log.should_compact(min_bytes=0)
+    bloated = log.log_bytes
+    log.should_compact = lambda: True  # force compaction on the next flush
+    await store.flush_to_disk()
+    assert log.log_bytes < bloated
+    assert log.path.read_bytes().startswith(MAGIC)
+
+    restored = _store(tmp_path)
+    await restored.load_from_disk()
+    assert restored.nodes[node_id].importance_score == pytest.approx(1.5)
+
+
+@pytest.mark.asyncio
+async def test_legacy_json_state_is_migrated(tmp_path):
+    store = _store(tmp_path)
+    node_id = await store.store("legacy", MemoryTier.META)
+    node = store.nodes[node_id]
+    legacy = {
+        "nodes": {
+            node_id: {
+                "tier": node.tier.value,
+                "metadata": {},
+                "parent_id": None,
+                "children_ids": [],
+                "cross_refs": [],
+                "importance_score": 2.0,
+                "access_count": 0,
+                "compression_level": node.compression_level.value,
+                "is_compressed": False,
+                "checksum": node.checksum,
+                "created_at": node.created_at.isoformat(),
+                "last_accessed": node.last_accessed.isoformat(),
+            }
+        },
+        "compression_cache": {},
+        "metrics": {"total_nodes": 1},
+    }
+    (tmp_path / "hds.json").write_text(__import__("json").dumps(legacy))
+
+    restored = _store(tmp_path)
+    await restored.load_from_disk()
+    assert node_id in restored.nodes
+    assert restored._dirty == {node_id}
+    await restored.flush_to_disk()
+    assert restored._segment_log.path.exists()
+
+
+@pytest.mark.asyncio
+async def test_retrieve_walks_importance_order():
+    store = HierarchicalDataStore()
+    ids = {importance: await store.store(f"m{importance}", MemoryTier.SEMANTIC, importance=importance) for importance in (1.0, 7.0, 3.0, 9.0)}
+    await store.store("other tier", MemoryTier.EPISODIC, importance=10.0)
+
+    results = await store.retrieve(
+        RetrievalContext(query="", tier_filter=MemoryTier.SEMANTIC, importance_threshold=2.0, max_depth=0)
+    )
+    assert [n.node_id for n in results] == [ids[9.0], ids[7.0], ids[3.0]]
+    # Nodes below the threshold are never visited
+    assert store.nodes[ids[1.0]].access_count == 0
+
+
+@pytest.mark.asyncio
+async def test_prune_removes_stale_low_importance_nodes():
+    store = HierarchicalDataStore()
+    stale = await store.store("stale", MemoryTier.SEMANTIC, importance=0.0)
+    fresh = await store.store("fresh", MemoryTier.SEMANTIC, importance=0.0)
+    important = await store.store("important", MemoryTier.SEMANTIC, importance=5.0)
+
+    old = datetime.now(timezone.utc) - timedelta(days=90)
+    for node_id in (stale, important):
+        store.nodes[node_id].created_at = old
+        store.nodes[node_id].last_accessed = old
+    store._rebuild_ordered_indexes()
+
+    assert await store._prune_memories() == 1
+    assert set(store.nodes) == {fresh, important}
+    assert stale not in store._recency and stale not in store._importance_keys
@@ -168,3 +168,110 @@ class TestQuotaResolver:
         quota = resolver.resolve("ip:invalid-ip")
         assert quota.rps == 20
         assert quota.burst == 40
+
+    def test_longest_prefix_wins(self, tmp_path):
+        """Test the most specific CIDR range wins regardless of config order."""
+        config = {
+            "version": 1,
+            "defaults": {"rps": 20, "burst": 40},
+            "principals": [
+                {"principal": "ip:10.0.0.0/8", "rps": 50, "burst": 100},
+                {"principal": "ip:10.1.0.0/16", "rps": 10, "burst": 20},
+                {"principal": "ip:10.1.2.0/24", "rps": 1, "burst": 2},
+                {"principal": "ip:2001:db8::/32", "rps": 7, "burst": 14},
+                {"principal": "ip:2001:db8:abcd::/48", "rps": 3, "burst": 6},
+            ],
+        }
+
+        config_file = tmp_path / "quotas.yaml"
+        config_file.write_text(yaml.dump(config))
+
+        resolver = QuotaResolver(config_path=str(config_file))
+
+        assert resolver.resolve("ip:10.1.2.3").rps == 1
+        assert resolver.resolve("ip:10.1.9.9").rps == 10
+        assert resolver.resolve("ip:10.200.0.1").rps == 50
+        assert resolver.resolve("ip:11.0.0.1").rps == 20
+        assert resolver.resolve("ip:2001:db8:abcd::1").rps == 3
+        assert resolver.resolve("ip:2001:db8:1::1").rps == 7
+        assert resolver.resolve("ip:2001:db9::1").rps == 20
+        assert len(resolver.cidr_matcher) == 5
+
+    def test_invalid_cidr_is_ignored(self, tmp_path):
+        """Test an invalid CIDR principal does not disable the others."""
+        config = {
+            "version": 1,
+            "defaults": {"rps": 20, "burst": 40},
+            "principals": [
+                {"principal": "ip:not-a-network/24", "rps": 1, "burst": 2},
+                {"principal": "ip:203.0.113.0/24", "rps": 5, "burst": 10},
+            ],
+        }
+
+        config_file = tmp_path / "quotas.yaml"
+        config_file.write_text(yaml.dump(config))
+
+        resolver = QuotaResolver(config_path=str(config_file))
+
+        assert resolver.resolve("ip:203.0.113.9").rps == 5
+
+    def test_resolutions_are_cached_and_bounded(self, tmp_path):
+        """Test resolved quotas are cached per (principal, endpoint) up to cache_size."""
+        config = {
+            "version": 1,
+            "defaults": {"rps": 20, "burst": 40},
+            "principals": [{"principal": "tenant:test", "rps": 50, "burst": 100}],
+            "endpoint_multipliers": {"/v1/embeddings": 2.0},
+        }
+
+        config_file = tmp_path / "quotas.yaml"
+        config_file.write_text(yaml.dump(config))
+
+        resolver = QuotaResolver(config_path=str(config_file), cache_size=4)
+
+        first = resolver.resolve("tenant:test", endpoint="/v1/embeddings")
+        assert resolver.resolve("tenant:test", endpoint="/v1/embeddings") is first
+        assert resolver.resolve("tenant:test").rps == 50
+
+        for i in range(10):
+            resolver.resolve(f"ip:192.0.2.{i}")
+        assert len(resolver._resolved) == 4
+
+    def test_reload_invalidates_cached_quotas(self, tmp_path):
+        """Test reload recompiles CIDR ranges and drops cached resolutions."""
+        config = {
+            "version": 1,
+            "defaults": {"rps": 20, "burst": 40},
+            "principals": [{"principal": "ip:203.0.113.0/24", "rps": 5, "burst": 10}],
+        }
+
+        config_file = tmp_path / "quotas.yaml"
+        config_file.write_text(yaml.dump(config))
+
+        resolver = QuotaResolver(config_path=str(config_file))
+        assert resolver.resolve("ip:203.0.113.50").rps == 5
+        assert resolver.resolve("ip:198.51.100.1").rps == 20
+
+        config["principals"] = [{"principal": "ip:198.51.100.0/24", "rps": 8, "burst": 16}]
+        config_file.write_text(yaml.dump(config))
+        resolver.reload()
+
+        assert resolver.resolve("ip:203.0.113.50").rps == 20
+        assert resolver.resolve("ip:198.51.100.1").rps == 8
+
+    def test_failed_reload_keeps_current_quotas(self, tmp_path):
+        """Test a broken config file on reload leaves the loaded quotas in place."""
+        config = {
+            "version": 1,
+            "defaults": {"rps": 20, "burst": 40},
+            "principals": [{"principal": "tenant:test", "rps": 50, "burst": 100}],
+        }
+
+        config_file = tmp_path / "quotas.yaml"
+        config_file.write_text(yaml.dump(config))
+
+        resolver = QuotaResolver(config_path=str(config_file))
+        config_file.write_text("principals: [unclosed")
+        resolver.reload()
+
+        assert resolver.resolve("tenant:test").rps == 50
@@ -0,0 +1,131 @@
+"""
+Unit tests for the bounded, lock-striped RateLimiter bucket table.
+"""
+import random
+import threading
+from types import SimpleNamespace
+
+import pytest
+from core.reliability import ratelimit
+from core.reliability.ratelimit import BucketTable, RateLimiter, TokenBucket
+
+
+class Clock:
+    def __init__(self, now=1_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ratelimit.time, "time", clock)
+    return clock
+
+
+def _request(ip, path="/v1/embeddings"):
+    return SimpleNamespace(url=SimpleNamespace(path=path), headers={}, client=SimpleNamespace(host=ip))
+
+
+def test_matches_token_bucket_semantics(clock):
+    """Same allow/deny decisions and retry-after as a dedicated TokenBucket."""
+    rng = random.Random(7)
+    table = BucketTable(max_buckets=1_000, idle_horizon=0.5)
+    reference = {}
+
+    for _ in range(5_000):
+        clock.now += rng.choice([0.0, 0.001, 0.01, 0.3, 2.0])
+        key = f"k{rng.randrange(8)}"
+        bucket = reference.setdefault(key, TokenBucket(capacity=4, refill_rate=2.0))
+        assert table.consume(key, 4, 2.0) == pytest.approx(bucket.consume(1))
+
+
+def test_burst_then_refill(clock):
+    limiter = RateLimiter(default_rps=2)
+    request = _request("10.0.0.1")
+
+    assert [limiter.check_limit(request)[0] for _ in range(5)] == [True] * 4 + [False]
+    allowed, retry_after = limiter.check_limit(request)
+    assert not allowed and retry_after == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert limiter.check_limit(request)[0]
+
+
+def test_idle_full_buckets_are_evicted_lazily(clock):
+    table = BucketTable(max_buckets=1_000, idle_horizon=10.0, stripes=1)
+    table.consume("busy", 2, 1.0)
+    table.consume("busy", 2, 1.0)
+    table.consume("idle", 2, 1.0)
+
+    clock.now += 11.0
+    table.consume("busy", 2, 1.0)  # Still draining: must be kept
+    table.consume("new", 2, 1.0)
+
+    assert "idle" not in table
+    assert "busy" in table and "new" in table
+
+
+def test_partially_drained_buckets_survive_idle_horizon(clock):
+    table = BucketTable(max_buckets=1_000, idle_horizon=1.0, stripes=1)
+    for _ in range(10):
+        table.consume("slow", 10, 0.1)
+
+    clock.now += 5.0
+    table.consume("other", 10, 0.1)
+
+    assert "slow" in table
+    assert table.consume("slow", 10, 0.1)[0] is False
+
+
+def test_hard_cap_evicts_least_recently_used(clock):
+    table = BucketTable(max_buckets=3, idle_horizon=3_600.0, stripes=1)
+    for key in ("a", "b", "c"):
+        table.consume(key, 2, 1.0)
+    table.consume("a", 2, 1.0)
+    table.consume("d", 2, 1.0)
+
+    assert len(table) == 3
+    assert "b" not in table
+    assert table.evictions == 1
+
+
+def test_many_principals_stay_bounded(clock):
+    limiter = RateLimiter(default_rps=5, max_buckets=1_000, idle_horizon_s=1.0)
+
+    for i in range(50_000):
+        clock.now += 0.001
+        assert limiter.check_limit(_request(f"ip-{i}"))[0]
+
+    assert len(limiter.buckets) <= 1_000
+
+
+def test_configured_limits_survive_eviction(clock, monkeypatch):
+    monkeypatch.setenv("LUKHAS_RL_KEYING", "route_only")
+    limiter = RateLimiter(default_rps=20, max_buckets=1, idle_horizon_s=0.0)
+    limiter.configure_endpoint("/v1/dreams", rps=1)
+
+    limiter.check_limit(_request("1.1.1.1", path="/v1/other"))
+    assert "/v1/dreams" not in limiter.buckets
+
+    request = _request("1.1.1.1", path="/v1/dreams")
+    assert [limiter.check_limit(request)[0] for _ in range(3)] == [True, True, False]
+    assert limiter.current_window("/v1/dreams")["limit"] == 2.0
+
+
+def test_concurrent_consumers_never_overdraw(clock):
+    table = BucketTable(max_buckets=100, stripes=4)
+    allowed = []
+
+    def worker():
+        allowed.append(sum(table.consume("shared", 100, 1.0)[0] for _ in range(200)))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(allowed) == 100
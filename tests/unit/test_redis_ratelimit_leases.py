@@ -0,0 +1,234 @@
+"""
+Tests for multi-key checks and local token leases in RedisRateLimitBackend.
+
+The backend runs against an in-process stub that evaluates the check-limits
+script with a Python port of its Lua; when fakeredis (with Lua support) is
+installed, the real script is exercised as well.
+"""
+
+import math
+import random
+
+import pytest
+from core.reliability import redis_backend
+from core.reliability.redis_backend import RedisRateLimitBackend
+
+
+class Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FixedQuotas:
+    """Quota resolver stub: (rps, burst) per key."""
+
+    def __init__(self, quotas, default=(10, 20)):
+        self.quotas = quotas
+        self.default = default
+
+    def get_quota_for_key(self, key):
+        return self.quotas.get(key, self.default)
+
+
+class ScriptRedis:
+    """In-process Redis stub that runs the check-limits script as Python."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.calls = 0
+        self.fail = False
+
+    def ping(self):
+        return True
+
+    def hmget(self, key, *fields):
+        bucket = self.hashes.get(key, {})
+        return [bucket.get(field) for field in fields]
+
+    def register_script(self, source):
+        assert source == RedisRateLimitBackend.LUA_CHECK_LIMITS_SCRIPT
+        return self._check_limits
+
+    def _check_limits(self, keys, args):
+        """Python port of LUA_CHECK_LIMITS_SCRIPT."""
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("redis down")
+        now = float(args[0])
+        specs = [args[2 + 4 * i : 6 + 4 * i] for i in range(len(keys))]
+        available = []
+        allowed, retry_after = 1, 0.0
+        for key, (capacity, rate, requested, _) in zip(keys, specs):
+            bucket = self.hashes.get(key, {})
+            tokens = float(bucket.get("tokens", capacity))
+            last_refill = float(bucket.get("last_refill", now))
+            tokens = min(capacity, tokens + max(0.0, now - last_refill) * rate)
+            available.append(tokens)
+            if tokens < requested:
+                allowed = 0
+                retry_after = max(retry_after, (requested - tokens) / rate)
+
+        result = [allowed, str(retry_after)]
+        for i, (key, (_, _, requested, wanted)) in enumerate(zip(keys, specs)):
+            granted = max(requested, min(wanted, math.floor(available[i]))) if allowed else 0
+            self.hashes[key] = {"tokens": available[i] - granted, "last_refill": now}
+            result.append(granted)
+        return result
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(redis_backend.time, "time", clock)
+    return clock
+
+
+def make_backend(client, quotas=None, **kwargs):
+    return RedisRateLimitBackend(
+        quota_resolver=FixedQuotas(quotas or {}), client=client, key_prefix="rl:", **kwargs
+    )
+
+
+def test_all_limits_are_checked_in_one_round_trip(clock):
+    server = ScriptRedis()
+    backend = make_backend(server, {"org": (1, 2)})
+
+    results = [backend.check_limits(["route", "principal", "org"]) for _ in range(3)]
+
+    assert [allowed for allowed, _ in results] == [True, True, False]
+    assert results[2][1] == pytest.approx(1.0)
+    assert server.calls == 3
+
+
+def test_denied_check_charges_no_limit(clock):
+    server = ScriptRedis()
+    backend = make_backend(server, {"org": (1, 1)})
+    assert backend.check_limits(["route", "org"]) == (True, 0.0)
+
+    assert backend.check_limits(["route", "org"])[0] is False
+    assert backend.check_limits(["route", "route"]) == (True, 0.0)  # Duplicate keys count once
+
+    assert float(server.hashes["rl:route"]["tokens"]) == 20 - 2
+
+
+def test_check_limit_is_a_single_key_check(clock):
+    backend = make_backend(ScriptRedis(), {"k": (1, 1)})
+
+    assert backend.check_limit("k") == (True, 0.0)
+    assert backend.check_limit("k") == (False, pytest.approx(1.0))
+
+
+def test_lease_serves_hot_key_locally_until_spent_or_expired(clock):
+    server = ScriptRedis()
+    backend = make_backend(server, {"hot": (100, 200)}, lease_tokens=10, lease_ttl_seconds=0.5)
+
+    for _ in range(11):
+        assert backend.check_limit("hot")[0]
+    assert server.calls == 1
+    assert float(server.hashes["rl:hot"]["tokens"]) == 200 - 11
+
+    assert backend.check_limit("hot")[0]
+    assert server.calls == 2
+
+    clock.now += 0.5
+    assert backend.check_limit("hot")[0]
+    assert server.calls == 3
+
+
+def test_lease_is_capped_by_refill_over_its_horizon(clock):
+    server = ScriptRedis()
+    backend = make_backend(server, {"slow": (2, 20)}, lease_tokens=10, lease_ttl_seconds=1.0)
+
+    backend.check_limit("slow")
+
+    assert float(server.hashes["rl:slow"]["tokens"]) == 20 - 3
+
+
+def test_denial_refunds_local_lease_charges(clock):
+    server = ScriptRedis()
+    backend = make_backend(server, {"hot": (100, 200), "cold": (1, 1)}, lease_tokens=5)
+    backend.check_limit("hot")
+    assert backend.check_limit("cold")[0]
+
+    assert backend.check_limits(["hot", "cold"])[0] is False
+
+    assert backend._leases["hot"][0] == 5
+
+
+def test_redis_errors_fail_open(clock):
+    server = ScriptRedis()
+    backend = make_backend(server, {"k": (1, 1)})
+    server.fail = True
+
+    assert all(backend.check_limit("k") == (True, 0.0) for _ in range(3))
+
+
+def test_lease_table_is_bounded(clock):
+    backend = make_backend(ScriptRedis(), lease_tokens=5, max_leases=8)
+
+    for i in range(50):
+        backend.check_limit(f"k{i}")
+
+    assert list(backend._leases) == [f"k{i}" for i in range(42, 50)]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_leases_bound_over_admission_across_processes(clock, seed):
+    """Across processes, admissions in any W-second window stay within burst + rps * (W + ttl)."""
+    rng = random.Random(seed)
+    quotas = {"route": (50, 60), "principal": (20, 30), "org": (40, 10)}
+    lease_ttl = 0.5
+    server = ScriptRedis()
+    processes = [
+        make_backend(server, quotas, lease_tokens=8, lease_ttl_seconds=lease_ttl) for _ in range(4)
+    ]
+    admitted = {key: [] for key in quotas}
+
+    for _ in range(6_000):
+        clock.now += rng.expovariate(400.0)
+        keys = rng.choice([["route", "principal"], ["route", "org"], ["route", "principal", "org"]])
+        if rng.choice(processes).check_limits(keys)[0]:
+            for key in keys:
+                admitted[key].append(clock.now)
+
+    for key, (rps, burst) in quotas.items():
+        times = admitted[key]
+        for window in (0.1, 1.0, 5.0):
+            bound = burst + rps * (window + lease_ttl)
+            j = 0
+            for i, start in enumerate(times):
+                while j < len(times) and times[j] <= start + window:
+                    j += 1
+                assert j - i <= bound, (key, window)
+        # Traffic saturates every bucket, so admissions run close to the refill rate
+        assert len(times) > rps * (clock.now - 1_700_000_000.0) * 0.5
+
+
+def test_leases_cut_round_trips_for_hot_keys(clock):
+    server = ScriptRedis()
+    processes = [make_backend(server, {"hot": (1000, 1000)}, lease_tokens=8) for _ in range(4)]
+
+    for i in range(2_000):
+        clock.now += 0.005
+        assert processes[i % 4].check_limits(["hot"])[0]
+
+    # Each process spends one Redis call per lease of 1 + 8 tokens
+    assert server.calls == 4 * math.ceil(500 / 9)
+
+
+def test_real_lua_script_with_fakeredis(clock):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    client = fakeredis.FakeRedis(decode_responses=True)
+    backend = make_backend(client, {"org": (1, 2), "hot": (100, 200)}, lease_tokens=10)
+
+    assert [backend.check_limits(["route", "org"])[0] for _ in range(3)] == [True, True, False]
+    assert backend.check_limits(["route", "org"])[1] == pytest.approx(1.0)
+    assert float(client.hget("rl:route", "tokens")) == 18
+
+    for _ in range(11):
+        assert backend.check_limit("hot")[0]
+    assert float(client.hget("rl:hot", "tokens")) == 200 - 11
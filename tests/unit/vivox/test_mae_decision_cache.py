@@ -0,0 +1,111 @@
+"""Tests for shared action features and the VIVOX.MAE decision cache."""
+import pytest
+from vivox.moral_alignment.action_features import (
+    FRAMEWORK_KEYWORDS,
+    DecisionCache,
+    extract_action_features,
+)
+from vivox.moral_alignment.vivox_mae_core import ActionProposal, VIVOXMoralAlignmentEngine
+
+
+class RecordingME:
+    def __init__(self):
+        self.records = []
+
+    async def record_decision_mutation(self, **kwargs):
+        self.records.append(kwargs)
+
+
+def proposal(text="help the user with care and honest support", action_type="help_user"):
+    return ActionProposal(action_type=action_type, content={"text": text}, context={})
+
+
+def test_keyword_hits_match_text_scan():
+    action = proposal("Must avoid harm; be fair, kind and honest about autonomy")
+    features = extract_action_features(action, {})
+    text = str(action.content).lower()
+
+    for group, keywords in FRAMEWORK_KEYWORDS.items():
+        assert features.matches(group) == any(keyword in text for keyword in keywords)
+        assert features.weighted_hits(group, 0.2) == sum(0.2 for keyword in keywords if keyword in text)
+
+
+def test_decision_key_ignores_timestamp_but_not_inputs():
+    first = extract_action_features(proposal(), {"scope": "group"})
+    again = extract_action_features(proposal(), {"scope": "group"})
+
+    assert first.decision_key == again.decision_key
+    assert extract_action_features(proposal(), {"scope": "society"}).decision_key != first.decision_key
+    assert extract_action_features(proposal("other"), {"scope": "group"}).decision_key != first.decision_key
+
+
+def test_cache_evicts_least_recently_used():
+    cache = DecisionCache(max_entries=2)
+    cache.put(("a",), 1)
+    cache.put(("b",), 2)
+    assert cache.get(("a",)) == 1
+    cache.put(("c",), 3)
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == 1 and cache.get(("c",)) == 3
+
+
+def test_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("vivox.moral_alignment.action_features.time.monotonic", lambda: now[0])
+    cache = DecisionCache(ttl_seconds=5.0)
+    cache.put(("a",), {"approved": True})
+
+    now[0] += 4.0
+    assert cache.get(("a",)) == {"approved": True}
+    now[0] += 2.0
+    assert cache.get(("a",)) is None
+    assert len(cache) == 0
+
+
+def test_cached_values_are_isolated_copies():
+    cache = DecisionCache()
+    value = {"alternatives": []}
+    cache.put(("a",), value)
+    value["alternatives"].append("mutated")
+
+    hit = cache.get(("a",))
+    hit["alternatives"].append("also mutated")
+    assert cache.get(("a",)) == {"alternatives": []}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["evaluate_action_proposal", "evaluate_action_with_harmonization"])
+async def test_repeated_proposals_hit_cache_and_are_still_recorded(method):
+    me = RecordingME()
+    engine = VIVOXMoralAlignmentEngine(me)
+    evaluate = getattr(engine, method)
+    context = {"scope": "community", "social_impact": 0.8}
+
+    first = await evaluate(proposal(), dict(context))
+    second = await evaluate(proposal(), dict(context))
+
+    third = await evaluate(proposal(), dict(context))
+
+    assert engine.decision_cache.hits == 2
+    assert second is not first
+    assert second.approved == first.approved
+    assert second.to_dict()["harmonization_data"] == first.to_dict()["harmonization_data"]
+    # Every evaluation is its own decision: hits are restamped, not replayed
+    fingerprints = [record["moral_fingerprint"] for record in me.records]
+    assert fingerprints == [first.moral_fingerprint, second.moral_fingerprint, third.moral_fingerprint]
+    assert len(set(fingerprints)) == 3
+    assert len({record["decision"]["timestamp"] for record in me.records}) == 3
+
+
+@pytest.mark.asyncio
+async def test_new_precedents_invalidate_cached_decisions():
+    engine = VIVOXMoralAlignmentEngine(RecordingME())
+    action = proposal()
+
+    decision = await engine.evaluate_action_proposal(action, {})
+    await engine.ethical_precedent_db.add_precedent(action, {}, decision, {"valence": 0.9})
+    await engine.evaluate_action_proposal(action, {})
+
+    assert engine.decision_cache.hits == 0
+    assert engine.decision_cache.misses == 2
@@ -0,0 +1,183 @@
+"""Tests for the indexed VIVOX precedent search against the per-precedent similarity scan."""
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from vivox.moral_alignment.precedent_index import PrecedentIndex, PrecedentMatches, feature_hash
+from vivox.moral_alignment.vivox_mae_core import (
+    ActionProposal,
+    EthicalPrecedentDatabase,
+    MAEDecision,
+)
+
+ACTION_TYPES = ["data_access", "read_data", "generate_content", "create_content", "help_user", "compute", "delete"]
+CONTEXT_KEYS = ["user_consent", "data_sensitivity", "situation", "urgency", "harm_potential"]
+CONTENT_KEYS = ["target", "purpose", "type", "scope", "format"]
+VALUES = [True, False, 0.1, 0.25, 0.9, 1, "research", "emergency", None, [1, 2]]
+
+
+def random_action(rng):
+    return ActionProposal(
+        action_type=rng.choice(ACTION_TYPES),
+        content={k: rng.choice(VALUES) for k in rng.sample(CONTENT_KEYS, rng.randrange(0, 4))},
+        context={k: rng.choice(VALUES) for k in rng.sample(CONTEXT_KEYS, rng.randrange(0, 4))},
+    )
+
+
+def random_context(rng):
+    return {k: rng.choice(VALUES) for k in rng.sample(CONTEXT_KEYS, rng.randrange(0, 3))}
+
+
+async def populate(db, rng, n):
+    for _ in range(n):
+        decision = MAEDecision(approved=rng.random() < 0.5, dissonance_score=rng.random(), moral_fingerprint="fp")
+        outcome = {"valence": rng.random(), "resolution_action": rng.choice(["proceed", "deny", None])}
+        await db.add_precedent(random_action(rng), random_context(rng), decision, outcome)
+        if rng.random() < 0.3:
+            db._index_precedent(
+                {
+                    "action": {"action_type": rng.choice(ACTION_TYPES), "content": random_action(rng).content},
+                    "context": random_context(rng),
+                    "outcome": {"valence": rng.random(), "resolution_action": rng.choice(["a", "b"])},
+                },
+                None,
+            )
+
+
+async def reference_cases(db, action, context):
+    """The original scan: score every precedent, keep > 0.3, stable sort by similarity."""
+    cases = []
+    for i, precedent in enumerate(db.precedents):
+        similarity = await db._calculate_similarity(action, context, precedent)
+        if similarity > 0.3:
+            cases.append({**precedent, "similarity": similarity, "index": i})
+    cases.sort(key=lambda x: x["similarity"], reverse=True)
+    return cases
+
+
+@pytest_asyncio.fixture
+async def db():
+    database = EthicalPrecedentDatabase()
+    await populate(database, random.Random(7), 300)
+    return database
+
+
+class TestFeatureHash:
+    def test_equality_follows_python_equality(self):
+        assert feature_hash(1) == feature_hash(1.0) == feature_hash(True)
+        assert feature_hash(0) == feature_hash(False) == feature_hash(-0.0)
+        assert feature_hash("1") != feature_hash(1)
+        assert feature_hash(0.5) != feature_hash(0.25)
+        assert feature_hash({"a": 1, "b": 2}) == feature_hash({"b": 2, "a": 1})
+        assert feature_hash([1, 2]) != feature_hash((1, 2))
+
+
+class TestPrecedentMatches:
+    def test_ranked_breaks_ties_by_insertion_order(self):
+        matches = PrecedentMatches(np.array([3, 5, 8, 9, 12]), np.array([0.5, 0.9, 0.5, 0.9, 0.5]))
+        assert matches.ranked().tolist() == [1, 3, 0, 2, 4]
+        assert matches.ranked(3).tolist() == [1, 3, 0]
+        assert matches.ranked(10).tolist() == [1, 3, 0, 2, 4]
+
+
+class TestIndexedSearch:
+    @pytest.mark.asyncio
+    async def test_matches_reference_scan(self, db):
+        rng = random.Random(11)
+        for _ in range(60):
+            action, context = random_action(rng), random_context(rng)
+            expected = await reference_cases(db, action, context)
+            found = await db._find_similar_cases(action, context)
+            assert [c["index"] for c in found] == [c["index"] for c in expected]
+            assert [c["similarity"] for c in found] == pytest.approx([c["similarity"] for c in expected])
+
+    @pytest.mark.asyncio
+    async def test_limit_returns_prefix(self, db):
+        rng = random.Random(2)
+        action, context = random_action(rng), random_context(rng)
+        full = await db._find_similar_cases(action, context)
+        top = await db._find_similar_cases(action, context, limit=5)
+        assert [c["index"] for c in top] == [c["index"] for c in full[:5]]
+
+    @pytest.mark.asyncio
+    async def test_analysis_matches_reference(self, db):
+        rng = random.Random(23)
+        for _ in range(40):
+            action, context = random_action(rng), random_context(rng)
+            expected = await reference_cases(db, action, context)
+            analysis = await db.analyze_precedents(action, context)
+            if not expected:
+                assert analysis.weight == 0.5 and analysis.confidence == 0.1
+                continue
+            positive = sum(1 for c in expected if c.get("outcome", {}).get("valence", 0) > 0.5)
+            weight = positive / len(expected) * np.mean([c["similarity"] for c in expected])
+            successful = [
+                c["outcome"]["resolution_action"]
+                for c in expected
+                if c.get("outcome", {}).get("valence", 0) > 0.7 and c.get("outcome", {}).get("resolution_action")
+            ]
+            assert analysis.weight == pytest.approx(weight)
+            assert analysis.confidence == min(1.0, len(expected) / 10)
+            assert [c["index"] for c in analysis.similar_cases] == [c["index"] for c in expected[:5]]
+            assert analysis.recommended_action == (
+                Counter(successful).most_common(1)[0][0] if successful else None
+            )
+
+    @pytest.mark.asyncio
+    async def test_seeded_database_finds_related_precedents(self):
+        database = EthicalPrecedentDatabase()
+        action = ActionProposal(
+            action_type="read_data",
+            content={"target": "user_personal_data"},
+            context={"user_consent": False},
+        )
+        cases = await database._find_similar_cases(action, {})
+        assert cases == await reference_cases(database, action, {})
+
+
+class TestSnapshots:
+    @pytest.mark.asyncio
+    async def test_round_trip_preserves_results_and_accepts_inserts(self, db, tmp_path):
+        db.save_snapshot(tmp_path / "snap")
+        restored = EthicalPrecedentDatabase()
+        restored.load_snapshot(tmp_path / "snap")
+        assert len(restored.precedents) == len(db.precedents)
+        assert restored.precedent_index == db.precedent_index
+
+        rng = random.Random(5)
+        for _ in range(20):
+            action, context = random_action(rng), random_context(rng)
+            original = await db._find_similar_cases(action, context)
+            loaded = await restored._find_similar_cases(action, context)
+            assert [(c["index"], c["similarity"]) for c in loaded] == [
+                (c["index"], c["similarity"]) for c in original
+            ]
+
+        await populate(restored, random.Random(99), 20)
+        await populate(db, random.Random(99), 20)
+        action, context = random_action(rng), random_context(rng)
+        assert [c["index"] for c in await restored._find_similar_cases(action, context)] == [
+            c["index"] for c in await db._find_similar_cases(action, context)
+        ]
+
+    def test_inconsistent_snapshot_is_rejected(self, tmp_path):
+        database = EthicalPrecedentDatabase()
+        database.save_snapshot(tmp_path)
+        PrecedentIndex().save(tmp_path / "index")
+        with pytest.raises(ValueError):
+            EthicalPrecedentDatabase().load_snapshot(tmp_path)
+
+    def test_non_json_resolutions_survive_round_trip(self, tmp_path):
+        index = PrecedentIndex()
+        index.add("compute", {}, {}, 0.9, ("escalate", "review"))
+        index.add("compute", {}, {}, 0.9, ("escalate", "review"))
+        index.add("compute", {}, {}, 0.9, frozenset({"notify"}))
+        index.save(tmp_path / "index")
+
+        restored = PrecedentIndex.load(tmp_path / "index")
+        rows = np.arange(3)
+        assert restored.most_common_resolution(rows, 0.5) == ("escalate", "review")
+        restored.add("compute", {}, {}, 0.9, ("escalate", "review"))
+        assert len(restored._resolutions) == 2
@@ -0,0 +1,120 @@
+"""Tests for batched VIVOX.EVRN window features against the per-window pipeline."""
+import numpy as np
+import pytest
+
+from vivox.encrypted_perception.window_features import (
+    WindowFeatureStream,
+    encryption_params,
+    extract_window_features,
+    sliding_windows,
+)
+
+SEED = 0x5EED
+DIMENSION = 512
+
+
+def reference_texture(window):
+    if window.ndim == 3:
+        window = np.mean(window, axis=2)
+    features = []
+    if window.shape[0] > 1 and window.shape[1] > 1:
+        dy, dx = np.gradient(window)
+        features.extend([np.mean(np.abs(dx)), np.mean(np.abs(dy)), np.std(dx), np.std(dy)])
+    else:
+        features.extend([0, 0, 0, 0])
+    features.append(np.var(window))
+    hist, _ = np.histogram(window.flatten(), bins=16)
+    hist = hist / hist.sum() + 1e-10
+    features.append(-np.sum(hist * np.log(hist)))
+    features.append(np.ptp(window))
+    features.append(1.0 / (1.0 + np.var(window)))
+    return np.array(features)
+
+
+def reference_features(window):
+    """The original single-window pipeline with a freshly seeded global RNG."""
+    if window.ndim > 1:
+        fft_features = np.abs(np.fft.fft2(window))[:8, :8].flatten()
+    else:
+        fft_features = np.abs(np.fft.fft(window))[:16]
+    moments = np.array(
+        [
+            np.mean(window),
+            np.std(window),
+            np.median(window),
+            np.percentile(window, 25),
+            np.percentile(window, 75),
+        ]
+    )
+    texture = reference_texture(window) if window.ndim > 1 else np.zeros(8)
+    combined = np.concatenate([fft_features, moments, texture])
+
+    np.random.seed(SEED)
+    matrix = np.random.randn(len(combined), len(combined))
+    encrypted = np.tanh(np.dot(matrix, combined) / np.std(np.dot(matrix, combined)))
+    encrypted += np.random.normal(0, 0.01, encrypted.shape)
+
+    if len(encrypted) < DIMENSION:
+        return np.pad(encrypted, (0, DIMENSION - len(encrypted)))
+    return encrypted[:DIMENSION]
+
+
+def reference_extract(array):
+    window_size = min(64, array.shape[0] // 4) if array.ndim > 1 else 16
+    stride = window_size // 2
+    return [reference_features(array[i : i + window_size]) for i in range(0, array.shape[0] - window_size, stride)]
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.random.default_rng(0).random(200),
+        np.random.default_rng(1).random((128, 96)),
+        np.random.default_rng(2).random((64, 40, 3)),
+        np.random.default_rng(3).integers(0, 255, (300, 48)).astype(np.uint8),
+        np.ones((40, 40)),
+        np.random.default_rng(4).random((40, 1)),
+    ],
+    ids=["1d", "2d", "rgb", "uint8", "constant", "column"],
+)
+def test_batched_features_match_per_window_pipeline(array):
+    expected = reference_extract(array)
+    features = extract_window_features(array, SEED, DIMENSION)
+
+    assert features.shape == (len(expected), DIMENSION)
+    for row, reference in zip(features, expected):
+        assert np.array_equal(row, reference)
+
+
+def test_too_short_input_has_no_windows():
+    assert extract_window_features(np.arange(10.0), SEED, DIMENSION).shape == (0, DIMENSION)
+    assert sliding_windows(np.zeros(16)).shape == (0, 16)
+
+
+def test_windows_are_views_of_the_input():
+    array = np.random.default_rng(5).random((128, 32))
+    windows = sliding_windows(array)
+    assert windows.shape == (6, 32, 32)
+    assert np.array_equal(windows[1], array[16:48])
+    assert np.shares_memory(windows, array)
+
+
+def test_encryption_params_are_cached_and_read_only():
+    matrix, noise = encryption_params(SEED, 85)
+    assert encryption_params(SEED, 85)[0] is matrix
+    assert not matrix.flags.writeable and not noise.flags.writeable
+
+
+def test_stream_reuses_buffer_across_frames():
+    rng = np.random.default_rng(6)
+    stream = WindowFeatureStream(SEED, DIMENSION)
+    frames = [rng.random((128, 96)) for _ in range(3)]
+
+    first = stream.extract(frames[0])
+    first_copy = first.copy()
+    second = stream.extract(frames[1])
+
+    assert second is first
+    assert np.array_equal(first_copy, extract_window_features(frames[0], SEED, DIMENSION))
+    assert np.array_equal(second, extract_window_features(frames[1], SEED, DIMENSION))
+    assert stream.extract(rng.random((512, 96))).shape == (14, DIMENSION)
@@ -10,6 +10,8 @@ import asyncio
 import base64
 import hashlib
 import json
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -19,6 +21,8 @@ import numpy as np
 
 from lukhas.core.common import get_logger
 
+from .window_features import WindowFeatureStream, encryption_params, extract_window_features
+
 logger = get_logger(__name__)
 
 
@@ -283,13 +287,23 @@ class VIVOXEncryptedPerceptionNode:
         Returns:
             EncryptedPerception object with vectors and anomaly analysis
         """
+        return await self._process_raw_perception(raw_input, modality, context)
+
+    async def _process_raw_perception(
+        self,
+        raw_input: Union[np.ndarray, dict[str, Any]],
+        modality: str,
+        context: dict[str, Any],
+        encrypted_features: Optional[list[np.ndarray]] = None,
+    ) -> EncryptedPerception:
+        """process_raw_perception, optionally with array features extracted ahead of time"""
         async with self.processing_lock:
             try:
                 # Generate perception ID
                 perception_id = self._generate_perception_id(modality, context)
 
                 # Convert to encrypted vectors WITHOUT decoding content
-                encrypted_vectors = await self._encrypt_perceptual_input(raw_input, modality)
+                encrypted_vectors = await self._encrypt_perceptual_input(raw_input, modality, encrypted_features)
 
                 # Detect anomalies in encrypted space
                 anomalies = await self._detect_encrypted_anomalies(encrypted_vectors, context)
@@ -337,15 +351,18 @@ class VIVOXEncryptedPerceptionNode:
                 raise
 
     async def _encrypt_perceptual_input(
-        self, raw_input: Union[np.ndarray, dict[str, Any]], modality: str
+        self,
+        raw_input: Union[np.ndarray, dict[str, Any]],
+        modality: str,
+        encrypted_features: Optional[list[np.ndarray]] = None,
     ) -> list[PerceptualVector]:
         """Convert raw input to encrypted vectors without decoding"""
         vectors = []
 
-        if isinstance(raw_input, np.ndarray):
+        if encrypted_features is None and isinstance(raw_input, np.ndarray):
             # Process array input (images, sensor grids, etc.)
             encrypted_features = await self._encrypt_array_features(raw_input)
-        else:
+        elif encrypted_features is None:
             # Process structured input
             encrypted_features = await self._encrypt_structured_features(raw_input)
 
@@ -366,25 +383,37 @@ class VIVOXEncryptedPerceptionNode:
 
         return vectors
 
+    @property
+    def _transform_seed(self) -> int:
+        return int.from_bytes(self.encryption_key[:4], "big")
+
     async def _encrypt_array_features(self, array: np.ndarray) -> list[np.ndarray]:
         """Encrypt array features using non-reversible transformation"""
-        encrypted_list = []
-
         # Apply ethical filters first (blur faces, remove identifying features)
         filtered_array = await self._apply_ethical_filters(array)
 
-        # Extract features using sliding windows
-        window_size = min(64, array.shape[0] // 4) if array.ndim > 1 else 16
-        stride = window_size // 2
+        # Extract features from all sliding windows in one batch
+        features = extract_window_features(filtered_array, self._transform_seed, self.vector_dimension)
+        return list(features)
 
-        for i in range(0, array.shape[0] - window_size, stride):
-            window = filtered_array[i : i + window_size] if array.ndim == 1 else filtered_array[i : i + window_size, :]
+    async def encrypt_frames(self, frames: Iterable[np.ndarray]) -> AsyncIterator[np.ndarray]:
+        """
+        Stream encrypted window features for a sequence of frames
 
-            # Apply non-reversible transformations
-            features = self._extract_encrypted_features(window)
-            encrypted_list.append(features)
+        Frames are filtered and encrypted exactly as in process_raw_perception,
+        but the per-frame (n_windows, vector_dimension) output buffer is reused:
+        each yielded array is overwritten by the next frame, so copy what you keep.
 
-        return encrypted_list
+        Args:
+            frames: Raw frames, typically of one shape (camera or sensor stream)
+
+        Yields:
+            Encrypted feature matrix for each frame
+        """
+        stream = WindowFeatureStream(self._transform_seed, self.vector_dimension)
+        for frame in frames:
+            filtered = await self._apply_ethical_filters(frame)
+            yield stream.extract(filtered)
 
     async def _encrypt_structured_features(self, data: dict[str, Any]) -> list[np.ndarray]:
         """Encrypt structured data features"""
@@ -411,89 +440,11 @@ class VIVOXEncryptedPerceptionNode:
 
         return encrypted_list
 
-    def _extract_encrypted_features(self, window: np.ndarray) -> np.ndarray:
-        """Extract encrypted features from data window"""
-        # Apply series of non-reversible transformations
-
-        # 1. Fourier transform for frequency features
-        if window.ndim > 1:
-            fft_features = np.abs(np.fft.fft2(window))[:8, :8].flatten()
-        else:
-            fft_features = np.abs(np.fft.fft(window))[:16]
-
-        # 2. Statistical moments
-        moments = np.array(
-            [
-                np.mean(window),
-                np.std(window),
-                np.median(window),
-                np.percentile(window, 25),
-                np.percentile(window, 75),
-            ]
-        )
-
-        # 3. Texture features (if 2D)
-        texture_features = self._compute_texture_features(window) if window.ndim > 1 else np.zeros(8)
-
-        # 4. Combine and encrypt
-        combined = np.concatenate([fft_features, moments, texture_features])
-
-        # 5. Apply final encryption transform
-        encrypted = self._apply_encryption_transform(combined)
-
-        # 6. Normalize to fixed dimension
-        if len(encrypted) < self.vector_dimension:
-            encrypted = np.pad(encrypted, (0, self.vector_dimension - len(encrypted)))
-        else:
-            encrypted = encrypted[: self.vector_dimension]
-
-        return encrypted
-
-    def _compute_texture_features(self, window: np.ndarray) -> np.ndarray:
-        """Compute texture features for anomaly detection"""
-        features = []
-
-        # Handle different array dimensions
-        if window.ndim == 3:
-            # For RGB images, convert to grayscale
-            window = np.mean(window, axis=2)
-
-        # Gradient magnitudes
-        if window.ndim >= 2 and window.shape[0] > 1 and window.shape[1] > 1:
-            gradients = np.gradient(window)
-            if isinstance(gradients, (list, tuple)):
-                # For 2D arrays, gradient returns (dy, dx)
-                dy, dx = gradients[0], gradients[1]
-            else:
-                # For 1D arrays
-                dy = dx = gradients
-
-            features.extend([np.mean(np.abs(dx)), np.mean(np.abs(dy)), np.std(dx), np.std(dy)])
-        else:
-            features.extend([0, 0, 0, 0])
-
-        # Local variance
-        features.append(np.var(window))
-
-        # Entropy-like measure
-        hist, _ = np.histogram(window.flatten(), bins=16)
-        hist = hist / hist.sum() + 1e-10
-        entropy = -np.sum(hist * np.log(hist))
-        features.append(entropy)
-
-        # Contrast measure
-        features.append(np.ptp(window))  # Peak-to-peak
-
-        # Homogeneity measure
-        features.append(1.0 / (1.0 + np.var(window)))
-
-        return np.array(features)
-
     def _apply_encryption_transform(self, features: np.ndarray) -> np.ndarray:
         """Apply non-reversible encryption transformation"""
-        # Use encryption key to generate transformation matrix
-        np.random.seed(int.from_bytes(self.encryption_key[:4], "big"))
-        transform_matrix = np.random.randn(len(features), len(features))
+        # Use encryption key to generate transformation matrix (cached per length)
+        output_shape = (len(features), *np.shape(features)[1:])
+        transform_matrix, noise = encryption_params(self._transform_seed, len(features), output_shape)
 
         # Apply transformation
         encrypted = np.dot(transform_matrix, features)
@@ -502,7 +453,6 @@ class VIVOXEncryptedPerceptionNode:
         encrypted = np.tanh(encrypted / np.std(encrypted))
 
         # Add noise for additional privacy
-        noise = np.random.normal(0, 0.01, encrypted.shape)
         encrypted += noise
 
         return encrypted
@@ -838,16 +788,45 @@ class VIVOXEncryptedPerceptionNode:
         self,
         inputs: dict[str, Union[np.ndarray, dict[str, Any]]],
         context: dict[str, Any],
+        executor: Optional[Executor] = None,
     ) -> EncryptedPerception:
-        """Process multiple modalities together"""
+        """
+        Process multiple modalities together
+
+        Args:
+            inputs: Raw input per modality
+            context: Processing context
+            executor: Optional (process) pool used to extract array features for
+                all modalities concurrently; results are identical to in-process runs
+        """
 
         all_vectors = []
         all_anomalies = []
         modalities = []
 
+        # Shard array feature extraction across the executor
+        precomputed: dict[str, list[np.ndarray]] = {}
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            jobs = {}
+            for modality, raw_input in inputs.items():
+                if isinstance(raw_input, np.ndarray):
+                    filtered = await self._apply_ethical_filters(raw_input)
+                    jobs[modality] = loop.run_in_executor(
+                        executor,
+                        extract_window_features,
+                        filtered,
+                        self._transform_seed,
+                        self.vector_dimension,
+                    )
+            results = await asyncio.gather(*jobs.values())
+            precomputed = {modality: list(features) for modality, features in zip(jobs, results)}
+
         # Process each modality
         for modality, raw_input in inputs.items():
-            perception = await self.process_raw_perception(raw_input, modality, context)
+            perception = await self._process_raw_perception(
+                raw_input, modality, context, precomputed.get(modality)
+            )
 
             all_vectors.extend(perception.encrypted_vectors)
             all_anomalies.extend(perception.detected_anomalies)
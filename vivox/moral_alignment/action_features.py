@@ -0,0 +1,142 @@
+"""
+VIVOX.MAE Action Features
+Shared per-action feature extraction and decision caching
+
+Every ethical framework evaluator, the dissonance calculator and the moral
+fingerprinter derive their inputs from the same few properties of an
+ActionProposal: the lower-cased action type, the lower-cased text of its
+content, which framework keywords that text contains, and stable hashes of
+the content and context. ActionFeatures computes these once per evaluation
+so the five framework passes share a single keyword scan.
+
+DecisionCache keeps recent decisions keyed by a timestamp-free fingerprint of
+the proposal (action type, priority, content, action context, evaluation
+context), so identical proposals repeated in agent loops skip evaluation.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# Keyword lists scanned in the action content text, by assessment
+FRAMEWORK_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "rights_violations": ("privacy", "autonomy", "dignity", "liberty", "safety"),
+    "duty": ("responsibility", "obligation", "duty", "should", "must"),
+    "positive_outcomes": ("benefit", "improve", "help", "enhance", "solve"),
+    "negative_outcomes": ("harm", "damage", "hurt", "worsen", "destroy"),
+    "courage": ("brave", "bold", "courageous", "face", "confront"),
+    "temperance": ("moderate", "balanced", "restrained", "controlled"),
+    "justice": ("fair", "just", "equal", "right", "equitable"),
+    "wisdom": ("wise", "prudent", "thoughtful", "informed", "considered"),
+    "compassion": ("kind", "caring", "empathetic", "compassionate"),
+    "integrity": ("honest", "truthful", "authentic", "genuine", "sincere"),
+    "excellence": ("excellence", "virtue", "noble", "exemplary", "admirable"),
+    "care": ("care", "nurture", "support", "comfort", "tend"),
+    "relationship_positive": ("bond", "connect", "unite", "together", "collaborate"),
+    "relationship_negative": ("separate", "isolate", "divide", "conflict", "alienate"),
+    "authentic": ("authentic", "genuine", "true", "honest", "real"),
+    "inauthentic": ("fake", "pretend", "false", "deceptive", "artificial"),
+    "freedom": ("freedom", "choice", "liberty", "autonomy", "voluntary"),
+    "constraint": ("force", "compel", "mandate", "restrict", "limit"),
+    "responsibility": ("responsible", "accountable", "own", "accept", "acknowledge"),
+}
+
+VIRTUES = ("courage", "temperance", "justice", "wisdom", "compassion", "integrity")
+
+_ALL_KEYWORDS = frozenset(keyword for keywords in FRAMEWORK_KEYWORDS.values() for keyword in keywords)
+
+
+def _md5_json(value: Any) -> str:
+    return hashlib.md5(json.dumps(value, sort_keys=True).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class ActionFeatures:
+    """Features of one (action, context) pair shared by all MAE evaluators"""
+
+    action_type_lower: str
+    action_text: str
+    keyword_hits: frozenset[str]
+    content_hash: str
+    context_hash: str
+    decision_key: str
+
+    def matches(self, group: str) -> bool:
+        """Whether any keyword of ``group`` occurs in the action text"""
+        return any(keyword in self.keyword_hits for keyword in FRAMEWORK_KEYWORDS[group])
+
+    def weighted_hits(self, group: str, weight: float) -> float:
+        """Sum ``weight`` over the keywords of ``group`` found in the action text"""
+        return sum(weight for keyword in FRAMEWORK_KEYWORDS[group] if keyword in self.keyword_hits)
+
+
+def extract_action_features(action: Any, context: dict[str, Any]) -> ActionFeatures:
+    """Compute the shared features of an ActionProposal in its evaluation context"""
+    action_text = str(action.content).lower()
+    content_hash = _md5_json(action.content)
+    context_hash = _md5_json(context)
+
+    key_data = {
+        "action_type": action.action_type,
+        "priority": action.priority,
+        "content_hash": content_hash,
+        "context_hash": context_hash,
+        "action_context": json.dumps(action.context, sort_keys=True, default=repr),
+    }
+    decision_key = hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+    return ActionFeatures(
+        action_type_lower=action.action_type.lower(),
+        action_text=action_text,
+        keyword_hits=frozenset(keyword for keyword in _ALL_KEYWORDS if keyword in action_text),
+        content_hash=content_hash,
+        context_hash=context_hash,
+        decision_key=decision_key,
+    )
+
+
+class DecisionCache:
+    """
+    LRU cache of MAE decisions with a time-to-live.
+
+    Entries are deep-copied on the way in and out, so callers can mutate the
+    decisions they receive without affecting later hits.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: tuple, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,421 @@
+"""
+VIVOX Ethical Precedent Index
+Columnar feature index for vectorised precedent similarity search
+
+Each precedent is reduced to:
+- an interned action type, posted under its type and related-action group
+- hashed context (key, value) features with a numeric column for fuzzy matches,
+  stored row-contiguously (CSR) so a candidate's features are one slice
+- hashed content keys, posted per key
+
+A query only touches precedents that can clear the similarity threshold: a
+positive score needs a type/group match or a shared content key, so the
+candidate set is the union of those postings. Context similarity for the
+candidates is computed over their gathered CSR rows with NumPy segment sums,
+and top-k selection uses ``np.partition`` rather than a full sort.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import shutil
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+ACTION_WEIGHT = 0.5
+CONTEXT_WEIGHT = 0.3
+CONTENT_WEIGHT = 0.2
+FUZZY_NUMERIC_TOLERANCE = 0.2
+
+RELATED_ACTION_GROUPS = [
+    {"data_access", "access_resource", "read_data", "query_data"},
+    {"modify_settings", "update_configuration", "change_preferences"},
+    {"generate_content", "create_content", "produce_output"},
+    {"help_user", "assist_user", "provide_assistance"},
+    {"analyze_data", "process_data", "compute", "analyze"},
+]
+
+# Snapshot file column -> PrecedentIndex attribute
+_SNAPSHOT_COLUMNS = {
+    "type_ids": "_types",
+    "content_counts": "_content_counts",
+    "valences": "_valences",
+    "resolution_ids": "_resolution_rows",
+    "ctx_indptr": "_ctx_indptr",
+    "ctx_keys": "_ctx_keys",
+    "ctx_values": "_ctx_values",
+    "ctx_numbers": "_ctx_numbers",
+    "content_rows": "_content_rows",
+    "content_keys": "_content_keys",
+}
+
+
+def feature_hash(value: Any) -> int:
+    """Stable signed 64-bit hash whose equality follows ``==`` for common context values."""
+    if isinstance(value, int):
+        canonical = f"n:{int(value)}"
+    elif isinstance(value, float):
+        canonical = f"n:{int(value)}" if value.is_integer() else f"n:{value!r}"
+    elif isinstance(value, str):
+        canonical = f"s:{value}"
+    else:
+        canonical = f"{type(value).__name__}:{json.dumps(value, sort_keys=True, default=repr)}"
+    digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def _numeric(value: Any) -> float:
+    return float(value) if isinstance(value, (int, float)) else math.nan
+
+
+class _Column:
+    """Append-only NumPy column with amortised growth."""
+
+    __slots__ = ("_data", "_size")
+
+    def __init__(self, dtype: Any, data: Optional[np.ndarray] = None):
+        if data is None:
+            self._data = np.empty(16, dtype=dtype)
+            self._size = 0
+        else:
+            self._data = np.array(data, dtype=dtype)
+            self._size = len(self._data)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        if needed > len(self._data):
+            grown = np.empty(max(needed, 2 * len(self._data)), dtype=self._data.dtype)
+            grown[: self._size] = self._data[: self._size]
+            self._data = grown
+
+    def append(self, value: Any) -> None:
+        self._reserve(1)
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values: Iterable[Any]) -> None:
+        if not isinstance(values, np.ndarray):
+            values = list(values)
+        values = np.asarray(values, dtype=self._data.dtype)
+        self._reserve(len(values))
+        self._data[self._size : self._size + len(values)] = values
+        self._size += len(values)
+
+    def view(self) -> np.ndarray:
+        return self._data[: self._size]
+
+
+@dataclass
+class PrecedentMatches:
+    """Precedents scoring above the threshold, in insertion order."""
+
+    rows: np.ndarray
+    similarities: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def ranked(self, k: Optional[int] = None) -> np.ndarray:
+        """
+        Positions of the best ``k`` matches (all if None), by similarity then insertion order.
+
+        Ties at the cut-off are resolved towards earlier precedents, matching a stable sort.
+        """
+        count = len(self.rows)
+        if k is not None and k < count:
+            kth = np.partition(-self.similarities, k - 1)[k - 1]
+            positions = np.flatnonzero(-self.similarities <= kth)
+        else:
+            positions = np.arange(count)
+        order = np.lexsort((self.rows[positions], -self.similarities[positions]))
+        return positions[order][:k]
+
+
+class PrecedentIndex:
+    """Incrementally built feature index over precedent cases."""
+
+    def __init__(self):
+        self._type_ids: dict[Optional[str], int] = {}
+        self._group_of: dict[str, list[int]] = {}
+        for group_id, group in enumerate(RELATED_ACTION_GROUPS):
+            for action_type in group:
+                self._group_of.setdefault(action_type, []).append(group_id)
+        self._resolutions: list[Any] = []
+        self._resolution_ids: dict[Any, int] = {}
+
+        # Per precedent
+        self._types = _Column(np.int32)
+        self._content_counts = _Column(np.int32)
+        self._valences = _Column(np.float64)
+        self._resolution_rows = _Column(np.int32)
+        self._ctx_indptr = _Column(np.int64, np.zeros(1))
+        # Per context feature (CSR by precedent)
+        self._ctx_keys = _Column(np.int64)
+        self._ctx_values = _Column(np.int64)
+        self._ctx_numbers = _Column(np.float64)
+        # Per content key
+        self._content_rows = _Column(np.int64)
+        self._content_keys = _Column(np.int64)
+
+        self._type_postings: dict[int, _Column] = {}
+        self._group_postings: dict[int, _Column] = {}
+        self._content_postings: dict[int, _Column] = {}
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def _type_id(self, action_type: Optional[str]) -> int:
+        type_id = self._type_ids.get(action_type)
+        if type_id is None:
+            type_id = self._type_ids[action_type] = len(self._type_ids)
+        return type_id
+
+    def _groups(self, action_type: Optional[str]) -> list[int]:
+        return self._group_of.get(action_type, []) if isinstance(action_type, str) else []
+
+    def add(
+        self,
+        action_type: Optional[str],
+        context: dict[str, Any],
+        content: Any,
+        valence: float,
+        resolution_action: Any,
+    ) -> int:
+        """
+        Index one precedent and return its row.
+
+        Args:
+            action_type: Precedent action type (None if unknown)
+            context: Merged precedent context
+            content: Precedent action content (only a non-empty dict contributes keys)
+            valence: Outcome valence
+            resolution_action: Outcome resolution action (falsy if none)
+        """
+        row = len(self._types)
+        type_id = self._type_id(action_type) if action_type else -1
+        self._types.append(type_id)
+        if type_id >= 0:
+            self._type_postings.setdefault(type_id, _Column(np.int64)).append(row)
+            for group_id in self._groups(action_type):
+                self._group_postings.setdefault(group_id, _Column(np.int64)).append(row)
+
+        self._ctx_keys.extend([feature_hash(key) for key in context])
+        self._ctx_values.extend([feature_hash(value) for value in context.values()])
+        self._ctx_numbers.extend([_numeric(value) for value in context.values()])
+        self._ctx_indptr.append(len(self._ctx_keys))
+
+        content_keys = list(content) if isinstance(content, dict) else []
+        self._content_counts.append(len(content_keys))
+        for key in content_keys:
+            key_hash = feature_hash(key)
+            self._content_rows.append(row)
+            self._content_keys.append(key_hash)
+            self._content_postings.setdefault(key_hash, _Column(np.int64)).append(row)
+
+        self._valences.append(valence)
+        self._resolution_rows.append(self._resolution_id(resolution_action))
+        return row
+
+    def _resolution_id(self, resolution_action: Any) -> int:
+        if not resolution_action:
+            return -1
+        try:
+            resolution_id = self._resolution_ids.get(resolution_action)
+        except TypeError:  # unhashable resolutions cannot be tallied
+            return -1
+        if resolution_id is None:
+            resolution_id = self._resolution_ids[resolution_action] = len(self._resolutions)
+            self._resolutions.append(resolution_action)
+        return resolution_id
+
+    def search(
+        self,
+        action_type: Optional[str],
+        context: dict[str, Any],
+        content: Any,
+        threshold: float = 0.3,
+    ) -> PrecedentMatches:
+        """
+        Score every precedent that can clear ``threshold`` against a query.
+
+        Args:
+            action_type: Query action type
+            context: Merged query context
+            content: Query action content (keys are compared when it is a dict)
+            threshold: Minimum similarity (exclusive)
+        """
+        empty = PrecedentMatches(np.empty(0, dtype=np.int64), np.empty(0))
+        query_keys = list(content) if isinstance(content, dict) else None
+
+        exact: list[np.ndarray] = []
+        type_id = self._type_ids.get(action_type) if action_type else None
+        if type_id is not None and type_id in self._type_postings:
+            exact.append(self._type_postings[type_id].view())
+        related = [
+            self._group_postings[g].view() for g in self._groups(action_type) if g in self._group_postings
+        ]
+        content_hits = []
+        if query_keys:
+            content_hits = [
+                self._content_postings[h].view()
+                for h in {feature_hash(key) for key in query_keys}
+                if h in self._content_postings
+            ]
+        if not (exact or related or content_hits):
+            return empty
+
+        candidates = np.unique(np.concatenate(exact + related + content_hits))
+        types = self._types.view()[candidates]
+
+        # Action type: full credit for the same type, half for a related one
+        action_score = np.zeros(len(candidates))
+        if related:
+            action_score[np.isin(candidates, np.concatenate(related))] = ACTION_WEIGHT * 0.5
+        if type_id is not None:
+            action_score[types == type_id] = ACTION_WEIGHT
+        score = action_score
+
+        # Context: exact value matches count 1, close numeric values 0.5, over common keys
+        if context:
+            score = score + CONTEXT_WEIGHT * self._context_similarity(candidates, context)
+
+        # Content: key overlap relative to the larger key set
+        if query_keys is not None:
+            counts = self._content_counts.view()[candidates]
+            overlap = np.zeros(len(candidates))
+            for hits in content_hits:
+                positions = np.searchsorted(candidates, hits)
+                np.add.at(overlap, positions, 1.0)
+            denominator = np.maximum(np.maximum(counts, len(query_keys)), 1)
+            score = score + np.where(counts > 0, CONTENT_WEIGHT * (overlap / denominator), 0.0)
+
+        score = score / (ACTION_WEIGHT + CONTEXT_WEIGHT + CONTENT_WEIGHT)
+        keep = score > threshold
+        return PrecedentMatches(candidates[keep], score[keep])
+
+    def _context_similarity(self, candidates: np.ndarray, context: dict[str, Any]) -> np.ndarray:
+        indptr = self._ctx_indptr.view()
+        starts, ends = indptr[candidates], indptr[candidates + 1]
+        lengths = ends - starts
+        total = int(lengths.sum())
+        similarity = np.zeros(len(candidates))
+        if not total:
+            return similarity
+
+        owners = np.repeat(np.arange(len(candidates)), lengths)
+        offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        entries = np.repeat(starts, lengths) + offsets
+
+        query_keys = np.array([feature_hash(key) for key in context], dtype=np.int64)
+        key_order = np.argsort(query_keys)
+        sorted_keys = query_keys[key_order]
+        entry_keys = self._ctx_keys.view()[entries]
+        slot = np.minimum(np.searchsorted(sorted_keys, entry_keys), len(sorted_keys) - 1)
+        common = sorted_keys[slot] == entry_keys
+        if not common.any():
+            return similarity
+
+        owners, entries = owners[common], entries[common]
+        query_index = key_order[slot[common]]
+        query_values = np.array([feature_hash(value) for value in context.values()], dtype=np.int64)
+        query_numbers = np.array([_numeric(value) for value in context.values()])
+
+        equal = self._ctx_values.view()[entries] == query_values[query_index]
+        with np.errstate(invalid="ignore"):
+            close = np.abs(self._ctx_numbers.view()[entries] - query_numbers[query_index]) < FUZZY_NUMERIC_TOLERANCE
+        points = np.where(equal, 1.0, np.where(close, 0.5, 0.0))
+
+        matches = np.bincount(owners, weights=points, minlength=len(candidates))
+        common_counts = np.bincount(owners, minlength=len(candidates))
+        np.divide(matches, common_counts, out=similarity, where=common_counts > 0)
+        return similarity
+
+    def outcome_valences(self, rows: np.ndarray) -> np.ndarray:
+        return self._valences.view()[rows]
+
+    def most_common_resolution(self, rows: np.ndarray, min_valence: float) -> Any:
+        """Most frequent resolution among ``rows`` (given in ranked order) above ``min_valence``."""
+        resolution_ids = self._resolution_rows.view()[rows]
+        keep = (self._valences.view()[rows] > min_valence) & (resolution_ids >= 0)
+        if not keep.any():
+            return None
+        ids, first, counts = np.unique(resolution_ids[keep], return_index=True, return_counts=True)
+        best = np.lexsort((first, -counts))[0]
+        return self._resolutions[int(ids[best])]
+
+    # Snapshots
+
+    def save(self, directory: Path) -> None:
+        """Write the index columns to ``directory`` (replaced atomically)."""
+        directory = Path(directory)
+        temp_dir = directory.with_name(f".{directory.name}.tmp")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        temp_dir.mkdir(parents=True)
+        np.savez(
+            temp_dir / "columns.npz",
+            **{name: getattr(self, attr).view() for name, attr in _SNAPSHOT_COLUMNS.items()},
+        )
+        vocabulary = {"types": list(self._type_ids.items()), "resolutions": self._resolutions}
+        # Resolutions are arbitrary hashables: non-JSON values are stored as
+        # their str() and tuples come back from load as tuples
+        (temp_dir / "vocabulary.json").write_text(json.dumps(vocabulary, default=str), encoding="utf-8")
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(temp_dir, directory)
+
+    @classmethod
+    def load(cls, directory: Path) -> PrecedentIndex:
+        """Rebuild an index from a snapshot written by ``save``."""
+        directory = Path(directory)
+        index = cls()
+        vocabulary = json.loads((directory / "vocabulary.json").read_text(encoding="utf-8"))
+        index._type_ids = dict(vocabulary["types"])
+        index._resolutions = [_hashable(resolution) for resolution in vocabulary["resolutions"]]
+        index._resolution_ids = {action: i for i, action in enumerate(index._resolutions)}
+        with np.load(directory / "columns.npz") as data:
+            for name, attr in _SNAPSHOT_COLUMNS.items():
+                setattr(index, attr, _Column(data[name].dtype, data[name]))
+
+        # Postings are derived data: regroup the columns instead of storing them
+        types = index._types.view()
+        known = types >= 0
+        index._type_postings = _group_rows(types[known], np.flatnonzero(known))
+        names = {type_id: action_type for action_type, type_id in index._type_ids.items()}
+        group_rows: dict[int, list[np.ndarray]] = {}
+        for type_id, rows in index._type_postings.items():
+            for group_id in index._groups(names[type_id]):
+                group_rows.setdefault(group_id, []).append(rows.view())
+        index._group_postings = {
+            group_id: _Column(np.int64, np.sort(np.concatenate(parts)))
+            for group_id, parts in group_rows.items()
+        }
+        index._content_postings = _group_rows(index._content_keys.view(), index._content_rows.view())
+        return index
+
+
+def _hashable(value: Any) -> Any:
+    """Undo JSON's tuple-to-list conversion so a loaded resolution can be a key again."""
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+def _group_rows(keys: np.ndarray, rows: np.ndarray) -> dict[int, _Column]:
+    """Postings ``key -> rows`` (ascending) for parallel key/row arrays."""
+    order = np.lexsort((rows, keys))
+    keys, rows = keys[order], rows[order]
+    bounds = np.flatnonzero(np.diff(keys)) + 1
+    return {
+        int(chunk_keys[0]): _Column(np.int64, chunk_rows)
+        for chunk_keys, chunk_rows in zip(np.split(keys, bounds), np.split(rows, bounds))
+        if len(chunk_keys)
+    }
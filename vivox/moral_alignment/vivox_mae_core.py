@@ -7,16 +7,23 @@ Computes dissonance scores and moral fingerprints
 """
 
 # ruff: noqa: F821
+import asyncio
 import hashlib
 import json
 import math
+import os
+import pickle
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Optional
 
 import numpy as np
 
+from .action_features import VIRTUES, ActionFeatures, DecisionCache, extract_action_features
+from .precedent_index import RELATED_ACTION_GROUPS, PrecedentIndex, PrecedentMatches
+
 
 @dataclass
 class ActionProposal:
@@ -155,10 +162,12 @@ class DissonanceCalculator:
         """Compute dissonance score for proposed action"""
         dissonance_components = []
 
-        # Check each ethical principle
-        for principle, weight in self.ethical_principles.items():
-            violation_score = await self._check_principle_violation(principle, action, context)
+        # Check each ethical principle once; the scores also give the ethical distance
+        violations = [
+            await self._check_principle_violation(principle, action, context) for principle in self.ethical_principles
+        ]
 
+        for (principle, weight), violation_score in zip(self.ethical_principles.items(), violations):
             if violation_score > 0:
                 dissonance_components.append(
                     {
@@ -179,7 +188,7 @@ class DissonanceCalculator:
             primary_conflict = f"Violation of {primary_component['principle']}"
 
         # Calculate ethical distance
-        ethical_distance = await self._calculate_ethical_distance(action, context)
+        ethical_distance = await self._calculate_ethical_distance(action, context, violations)
 
         return DissonanceResult(
             score=normalized_dissonance,
@@ -236,16 +245,22 @@ class DissonanceCalculator:
 
         return violation_score
 
-    async def _calculate_ethical_distance(self, action: ActionProposal, context: dict[str, Any]) -> float:
+    async def _calculate_ethical_distance(
+        self,
+        action: ActionProposal,
+        context: dict[str, Any],
+        violations: Optional[list[float]] = None,
+    ) -> float:
         """Calculate distance from ethical ideal"""
         ideal_state = np.ones(len(self.ethical_principles))
 
-        current_state = []
-        for principle in self.ethical_principles:
-            violation = await self._check_principle_violation(principle, action, context)
-            current_state.append(1.0 - violation)
+        if violations is None:
+            violations = [
+                await self._check_principle_violation(principle, action, context)
+                for principle in self.ethical_principles
+            ]
 
-        current_state = np.array(current_state)
+        current_state = np.array([1.0 - violation for violation in violations])
 
         # Euclidean distance from ideal
         distance = np.linalg.norm(ideal_state - current_state)
@@ -273,12 +288,14 @@ class MoralFingerprinter:
         context: dict[str, Any],
         dissonance_score: float,
         precedent_weight: float,
+        features: Optional[ActionFeatures] = None,
     ) -> str:
         """Generate unique moral fingerprint"""
+        features = features or extract_action_features(action, context)
         fingerprint_data = {
             "action_type": action.action_type,
-            "action_content_hash": hashlib.md5(json.dumps(action.content, sort_keys=True).encode()).hexdigest(),
-            "context_hash": hashlib.md5(json.dumps(context, sort_keys=True).encode()).hexdigest(),
+            "action_content_hash": features.content_hash,
+            "context_hash": features.context_hash,
             "dissonance_score": round(dissonance_score, 4),
             "precedent_weight": round(precedent_weight, 4),
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -308,17 +325,20 @@ class MoralFingerprinter:
 class EthicalPrecedentDatabase:
     """Database of ethical precedents for decision making"""
 
+    SIMILARITY_THRESHOLD = 0.3  # Lowered similarity threshold for better matching
+
     def __init__(self):
         self.precedents: list[dict[str, Any]] = []
         self.precedent_index: dict[str, list[int]] = {}
+        self.feature_index = PrecedentIndex()
         self._seed_precedents()
 
     async def analyze_precedents(self, action: ActionProposal, context: dict[str, Any]) -> PrecedentAnalysis:
         """Analyze relevant ethical precedents"""
         # Find similar cases
-        similar_cases = await self._find_similar_cases(action, context)
+        matches = self._search(action, context)
 
-        if not similar_cases:
+        if not len(matches):
             return PrecedentAnalysis(
                 weight=0.5,  # Neutral weight for novel situations
                 confidence=0.1,
@@ -326,33 +346,44 @@ class EthicalPrecedentDatabase:
                 recommended_action=None,
             )
 
-        # Calculate precedent weight
-        weight = await self._calculate_precedent_weight(similar_cases)
+        # Weight by outcomes across all matches
+        positive_outcomes = np.count_nonzero(self.feature_index.outcome_valences(matches.rows) > 0.5)
+        weight = positive_outcomes / len(matches) * np.mean(matches.similarities)
 
-        # Extract recommendations
-        recommended_action = await self._extract_recommendation(similar_cases)
+        # Most common successful resolution, ties going to the most similar case
+        ranked = matches.ranked()
+        recommended_action = self.feature_index.most_common_resolution(matches.rows[ranked], min_valence=0.7)
 
         return PrecedentAnalysis(
             weight=weight,
-            confidence=min(1.0, len(similar_cases) / 10),  # More cases = higher confidence
-            similar_cases=similar_cases[:5],  # Top 5 most relevant
+            confidence=min(1.0, len(matches) / 10),  # More cases = higher confidence
+            similar_cases=self._materialize(matches, ranked[:5]),  # Top 5 most relevant
             recommended_action=recommended_action,
         )
 
-    async def _find_similar_cases(self, action: ActionProposal, context: dict[str, Any]) -> list[dict[str, Any]]:
-        """Find similar precedent cases"""
-        similar_cases = []
-
-        for i, precedent in enumerate(self.precedents):
-            similarity = await self._calculate_similarity(action, context, precedent)
-
-            if similarity > 0.3:  # Lowered similarity threshold for better matching
-                similar_cases.append({**precedent, "similarity": similarity, "index": i})
-
-        # Sort by similarity
-        similar_cases.sort(key=lambda x: x["similarity"], reverse=True)
+    async def _find_similar_cases(
+        self, action: ActionProposal, context: dict[str, Any], limit: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """Find similar precedent cases, most similar first"""
+        matches = self._search(action, context)
+        return self._materialize(matches, matches.ranked(limit))
+
+    def _search(self, action: ActionProposal, context: dict[str, Any]) -> PrecedentMatches:
+        content = action.content if isinstance(getattr(action, "content", None), dict) else None
+        return self.feature_index.search(
+            action.action_type,
+            {**action.context, **context},
+            content,
+            threshold=self.SIMILARITY_THRESHOLD,
+        )
 
-        return similar_cases
+    def _materialize(self, matches: PrecedentMatches, positions: np.ndarray) -> list[dict[str, Any]]:
+        return [
+            {**self.precedents[row], "similarity": similarity, "index": row}
+            for row, similarity in zip(
+                matches.rows[positions].tolist(), matches.similarities[positions].tolist()
+            )
+        ]
 
     async def _calculate_similarity(
         self, action: ActionProposal, context: dict[str, Any], precedent: dict[str, Any]
@@ -430,52 +461,7 @@ class EthicalPrecedentDatabase:
 
     def _are_actions_related(self, action1: str, action2: str) -> bool:
         """Check if two action types are related"""
-        # Define related action groups
-        related_groups = [
-            {"data_access", "access_resource", "read_data", "query_data"},
-            {"modify_settings", "update_configuration", "change_preferences"},
-            {"generate_content", "create_content", "produce_output"},
-            {"help_user", "assist_user", "provide_assistance"},
-            {"analyze_data", "process_data", "compute", "analyze"},
-        ]
-
-        return any(action1 in group and action2 in group for group in related_groups)
-
-    async def _calculate_precedent_weight(self, similar_cases: list[dict[str, Any]]) -> float:
-        """Calculate weight based on precedent outcomes"""
-        if not similar_cases:
-            return 0.5
-
-        positive_outcomes = sum(1 for case in similar_cases if case.get("outcome", {}).get("valence", 0) > 0.5)
-
-        weight = positive_outcomes / len(similar_cases)
-
-        # Adjust weight based on average similarity
-        avg_similarity = np.mean([case["similarity"] for case in similar_cases])
-        weight = weight * avg_similarity
-
-        return weight
-
-    async def _extract_recommendation(self, similar_cases: list[dict[str, Any]]) -> Optional[str]:
-        """Extract recommendation from precedents"""
-        if not similar_cases:
-            return None
-
-        # Find most common successful action
-        successful_actions = [
-            case.get("outcome", {}).get("resolution_action")
-            for case in similar_cases
-            if case.get("outcome", {}).get("valence", 0) > 0.7 and case.get("outcome", {}).get("resolution_action")
-        ]
-
-        if successful_actions:
-            # Return most common action
-            from collections import Counter
-
-            action_counts = Counter(successful_actions)
-            return action_counts.most_common(1)[0][0]
-
-        return None
+        return any(action1 in group and action2 in group for group in RELATED_ACTION_GROUPS)
 
     async def add_precedent(
         self,
@@ -494,12 +480,70 @@ class EthicalPrecedentDatabase:
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
+        self._index_precedent(precedent, action.action_type)
+
+    def _index_precedent(self, precedent: dict[str, Any], index_key: Optional[str]) -> None:
+        """Append a precedent and index its features (and action type, if ``index_key`` is given)"""
         self.precedents.append(precedent)
+        row = len(self.precedents) - 1
 
-        # Update index
-        if action.action_type not in self.precedent_index:
-            self.precedent_index[action.action_type] = []
-        self.precedent_index[action.action_type].append(len(self.precedents) - 1)
+        precedent_action = precedent.get("action")
+        if isinstance(precedent_action, ActionProposal):
+            action_type = precedent_action.action_type
+            content = precedent_action.content
+            action_context = precedent_action.context
+        elif isinstance(precedent_action, dict):
+            action_type = precedent_action.get("action_type")
+            content = precedent_action.get("content", {})
+            action_context = precedent_action.get("context", {})
+        else:
+            action_type = precedent.get("action_type")
+            content = {}
+            action_context = {}
+
+        combined_context = {**precedent.get("context", {}), **action_context}
+        if "decision" in precedent and isinstance(precedent["decision"], dict):
+            combined_context.update(precedent["decision"].get("context", {}))
+
+        outcome = precedent.get("outcome", {})
+        self.feature_index.add(
+            action_type,
+            combined_context,
+            content,
+            valence=outcome.get("valence", 0),
+            resolution_action=outcome.get("resolution_action"),
+        )
+
+        if index_key is not None:
+            self.precedent_index.setdefault(index_key, []).append(row)
+
+    def save_snapshot(self, directory: str) -> None:
+        """Persist precedents and their feature index to ``directory``"""
+        path = Path(directory)
+        self.feature_index.save(path / "index")
+        temp_file = path / "precedents.pkl.tmp"
+        with open(temp_file, "wb") as f:
+            pickle.dump(
+                {"precedents": self.precedents, "precedent_index": self.precedent_index},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp_file, path / "precedents.pkl")
+
+    def load_snapshot(self, directory: str) -> None:
+        """Replace the database contents with a snapshot written by ``save_snapshot``"""
+        path = Path(directory)
+        with open(path / "precedents.pkl", "rb") as f:
+            state = pickle.load(f)
+        feature_index = PrecedentIndex.load(path / "index")
+        if len(feature_index) != len(state["precedents"]):
+            raise ValueError(
+                f"Inconsistent precedent snapshot: {len(state['precedents'])} cases, {len(feature_index)} indexed"
+            )
+
+        self.precedents = state["precedents"]
+        self.precedent_index = state["precedent_index"]
+        self.feature_index = feature_index
 
     def _seed_precedents(self):
         """Seed the precedent database with common ethical scenarios"""
@@ -517,16 +561,10 @@ class EthicalPrecedentDatabase:
                     }
                     seed["action"] = action_dict
 
-                # Add to precedents
-                self.precedents.append(seed)
-
-                # Index by action type
+                # Add to precedents, indexed by action type
                 action = seed.get("action", {})
-                if isinstance(action, dict):
-                    action_type = action.get("action_type", "unknown")
-                    if action_type not in self.precedent_index:
-                        self.precedent_index[action_type] = []
-                    self.precedent_index[action_type].append(len(self.precedents) - 1)
+                index_key = action.get("action_type", "unknown") if isinstance(action, dict) else None
+                self._index_precedent(seed, index_key)
         except ImportError:
             # If precedent seeds not available, start with empty database
             pass
@@ -578,17 +616,68 @@ class VIVOXMoralAlignmentEngine:
         self.harmonizer = EthicalFrameworkHarmonizer()  # New harmonization system
         self.dissonance_threshold = 0.7
         self.consciousness_coherence_time = 1.0  # seconds
+        self.decision_cache = DecisionCache()  # Repeated identical proposals
+
+    def _decision_cache_key(self, mode: str, features: ActionFeatures) -> tuple:
+        # Precedents and the threshold feed into decisions, so they are part of the key
+        return (
+            mode,
+            features.decision_key,
+            len(self.ethical_precedent_db.precedents),
+            self.dissonance_threshold,
+        )
 
     async def evaluate_action_proposal(self, action: ActionProposal, context: dict[str, Any]) -> MAEDecision:
         """
         Evaluate ethical resonance of generated intent
         Suppress decisions that fail moral alignment
         """
-        # Calculate dissonance score (system pain)
-        dissonance = await self.dissonance_calculator.compute_dissonance(action, context)
+        features = extract_action_features(action, context)
+        cache_key = self._decision_cache_key("proposal", features)
+        cached = self.decision_cache.get(cache_key)
 
-        # Check against ethical precedents
-        precedent_analysis = await self.ethical_precedent_db.analyze_precedents(action, context)
+        if cached is not None:
+            decision, precedent_weight = cached
+            await self._restamp_cached_decision(decision, action, context, features, precedent_weight)
+        else:
+            decision, precedent_weight = await self._evaluate_action_proposal(action, context, features)
+            self.decision_cache.put(cache_key, (decision, precedent_weight))
+
+        # Log decision to VIVOX.ME
+        await self.vivox_me.record_decision_mutation(
+            decision=decision.to_dict(),
+            emotional_context=context.get("emotional_state", {}),
+            moral_fingerprint=decision.moral_fingerprint,
+        )
+
+        return decision
+
+    async def _restamp_cached_decision(
+        self,
+        decision: MAEDecision,
+        action: ActionProposal,
+        context: dict[str, Any],
+        features: ActionFeatures,
+        precedent_weight: float,
+    ) -> None:
+        """Give a cache hit its own timestamp and moral fingerprint"""
+        decision.moral_fingerprint = await self.moral_fingerprinter.generate_fingerprint(
+            action=action,
+            context=context,
+            dissonance_score=decision.dissonance_score,
+            precedent_weight=precedent_weight,
+            features=features,
+        )
+        decision.decision_timestamp = datetime.utcnow()
+
+    async def _evaluate_action_proposal(
+        self, action: ActionProposal, context: dict[str, Any], features: ActionFeatures
+    ) -> tuple[MAEDecision, float]:
+        # Calculate dissonance score (system pain) and check against ethical precedents
+        dissonance, precedent_analysis = await asyncio.gather(
+            self.dissonance_calculator.compute_dissonance(action, context),
+            self.ethical_precedent_db.analyze_precedents(action, context),
+        )
 
         # Generate moral fingerprint
         moral_fingerprint = await self.moral_fingerprinter.generate_fingerprint(
@@ -596,6 +685,7 @@ class VIVOXMoralAlignmentEngine:
             context=context,
             dissonance_score=dissonance.score,
             precedent_weight=precedent_analysis.weight,
+            features=features,
         )
 
         # Determine ethical permission
@@ -615,50 +705,74 @@ class VIVOXMoralAlignmentEngine:
                 ethical_confidence=precedent_analysis.confidence,
             )
 
-        # Log decision to VIVOX.ME
-        await self.vivox_me.record_decision_mutation(
-            decision=decision.to_dict(),
-            emotional_context=context.get("emotional_state", {}),
-            moral_fingerprint=moral_fingerprint,
-        )
-
-        return decision
+        return decision, precedent_analysis.weight
 
     async def evaluate_action_with_harmonization(self, action: ActionProposal, context: dict[str, Any]) -> MAEDecision:
         """
         Enhanced evaluation using multiple ethical frameworks with harmonization
         """
-        # Evaluate action using multiple ethical frameworks
-        framework_evaluations = {}
-
-        # Deontological evaluation (duty-based)
-        framework_evaluations["deontological"] = await self._evaluate_deontological(action, context)
+        features = extract_action_features(action, context)
+        cache_key = self._decision_cache_key("harmonized", features)
+        cached = self.decision_cache.get(cache_key)
 
-        # Consequentialist evaluation (outcome-based)
-        framework_evaluations["consequentialist"] = await self._evaluate_consequentialist(action, context)
+        if cached is not None:
+            final_decision, harmonization_trace, precedent_weight = cached
+            await self._restamp_cached_decision(final_decision, action, context, features, precedent_weight)
+        else:
+            final_decision, harmonization_trace, precedent_weight = await self._evaluate_with_harmonization(
+                action, context, features
+            )
+            self.decision_cache.put(cache_key, (final_decision, harmonization_trace, precedent_weight))
 
-        # Virtue ethics evaluation (character-based)
-        framework_evaluations["virtue_ethics"] = await self._evaluate_virtue_ethics(action, context)
+        # Log enhanced decision to VIVOX.ME
+        await self.vivox_me.record_decision_mutation(
+            decision=final_decision.to_dict(),
+            emotional_context=context.get("emotional_state", {}),
+            moral_fingerprint=final_decision.moral_fingerprint,
+            harmonization_trace=harmonization_trace,
+        )
 
-        # Care ethics evaluation (relationship-based)
-        framework_evaluations["care_ethics"] = await self._evaluate_care_ethics(action, context)
+        return final_decision
 
-        # Existentialist evaluation (authenticity-based)
-        framework_evaluations["existentialist"] = await self._evaluate_existentialist(action, context)
+    async def _evaluate_with_harmonization(
+        self, action: ActionProposal, context: dict[str, Any], features: ActionFeatures
+    ) -> tuple[MAEDecision, dict[str, Any], float]:
+        # Evaluate action using multiple ethical frameworks, all sharing one feature extraction
+        (
+            deontological,  # Duty-based
+            consequentialist,  # Outcome-based
+            virtue_ethics,  # Character-based
+            care_ethics,  # Relationship-based
+            existentialist,  # Authenticity-based
+            dissonance,
+            precedent_analysis,
+        ) = await asyncio.gather(
+            self._evaluate_deontological(action, context, features),
+            self._evaluate_consequentialist(action, context, features),
+            self._evaluate_virtue_ethics(action, context, features),
+            self._evaluate_care_ethics(action, context, features),
+            self._evaluate_existentialist(action, context, features),
+            self.dissonance_calculator.compute_dissonance(action, context),
+            self.ethical_precedent_db.analyze_precedents(action, context),
+        )
+        framework_evaluations = {
+            "deontological": deontological,
+            "consequentialist": consequentialist,
+            "virtue_ethics": virtue_ethics,
+            "care_ethics": care_ethics,
+            "existentialist": existentialist,
+        }
 
         # Harmonize potentially conflicting evaluations
         harmonization = await self.harmonizer.harmonize_frameworks(action, context, framework_evaluations)
 
-        # Calculate dissonance and precedent analysis (existing logic)
-        dissonance = await self.dissonance_calculator.compute_dissonance(action, context)
-        precedent_analysis = await self.ethical_precedent_db.analyze_precedents(action, context)
-
         # Generate enhanced moral fingerprint
         moral_fingerprint = await self.moral_fingerprinter.generate_fingerprint(
             action=action,
             context=context,
             dissonance_score=dissonance.score,
             precedent_weight=precedent_analysis.weight,
+            features=features,
         )
 
         # Make final decision based on harmonization
@@ -679,18 +793,13 @@ class VIVOXMoralAlignmentEngine:
             },
         )
 
-        # Log enhanced decision to VIVOX.ME
-        await self.vivox_me.record_decision_mutation(
-            decision=final_decision.to_dict(),
-            emotional_context=context.get("emotional_state", {}),
-            moral_fingerprint=moral_fingerprint,
-            harmonization_trace=harmonization.__dict__,
-        )
-
-        return final_decision
+        return final_decision, harmonization.__dict__, precedent_analysis.weight
 
-    async def _evaluate_deontological(self, action: ActionProposal, context: dict[str, Any]) -> dict[str, Any]:
+    async def _evaluate_deontological(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> dict[str, Any]:
         """Evaluate action using deontological (duty-based) ethics"""
+        features = features or extract_action_features(action, context)
         # Check universal rules and duties
         violation_score = 0
 
@@ -699,11 +808,11 @@ class VIVOXMoralAlignmentEngine:
             violation_score += 0.4
 
         # Rights violation check
-        if await self._violates_fundamental_rights(action, context):
+        if await self._violates_fundamental_rights(action, context, features):
             violation_score += 0.5
 
         # Duty fulfillment check
-        duty_score = await self._evaluates_duty_fulfillment(action, context)
+        duty_score = await self._evaluates_duty_fulfillment(action, context, features)
 
         approved = violation_score < 0.3 and duty_score > 0.6
         confidence = max(0.1, 1.0 - violation_score) * duty_score
@@ -719,11 +828,14 @@ class VIVOXMoralAlignmentEngine:
             },
         }
 
-    async def _evaluate_consequentialist(self, action: ActionProposal, context: dict[str, Any]) -> dict[str, Any]:
+    async def _evaluate_consequentialist(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> dict[str, Any]:
         """Evaluate action using consequentialist (outcome-based) ethics"""
+        features = features or extract_action_features(action, context)
         # Calculate expected outcomes
-        positive_outcomes = await self._predict_positive_outcomes(action, context)
-        negative_outcomes = await self._predict_negative_outcomes(action, context)
+        positive_outcomes = await self._predict_positive_outcomes(action, context, features)
+        negative_outcomes = await self._predict_negative_outcomes(action, context, features)
 
         # Utility calculation
         utility_score = positive_outcomes - negative_outcomes
@@ -746,24 +858,19 @@ class VIVOXMoralAlignmentEngine:
             },
         }
 
-    async def _evaluate_virtue_ethics(self, action: ActionProposal, context: dict[str, Any]) -> dict[str, Any]:
+    async def _evaluate_virtue_ethics(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> dict[str, Any]:
         """Evaluate action using virtue ethics (character-based)"""
+        features = features or extract_action_features(action, context)
         # Check alignment with virtues
         virtue_scores = {}
-        virtues = [
-            "courage",
-            "temperance",
-            "justice",
-            "wisdom",
-            "compassion",
-            "integrity",
-        ]
 
-        for virtue in virtues:
-            virtue_scores[virtue] = await self._assess_virtue_alignment(action, context, virtue)
+        for virtue in VIRTUES:
+            virtue_scores[virtue] = await self._assess_virtue_alignment(action, context, virtue, features)
 
         avg_virtue_score = np.mean(list(virtue_scores.values()))
-        character_excellence = await self._assess_character_excellence(action, context)
+        character_excellence = await self._assess_character_excellence(action, context, features)
 
         approved = avg_virtue_score > 0.6 and character_excellence > 0.5
         confidence = (avg_virtue_score + character_excellence) / 2
@@ -779,11 +886,14 @@ class VIVOXMoralAlignmentEngine:
             },
         }
 
-    async def _evaluate_care_ethics(self, action: ActionProposal, context: dict[str, Any]) -> dict[str, Any]:
+    async def _evaluate_care_ethics(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> dict[str, Any]:
         """Evaluate action using care ethics (relationship-based)"""
+        features = features or extract_action_features(action, context)
         # Assess care and relationship preservation
-        care_score = await self._assess_care_provision(action, context)
-        relationship_impact = await self._assess_relationship_impact(action, context)
+        care_score = await self._assess_care_provision(action, context, features)
+        relationship_impact = await self._assess_relationship_impact(action, context, features)
         contextual_responsibility = await self._assess_contextual_responsibility(action, context)
 
         overall_care = (care_score + relationship_impact + contextual_responsibility) / 3
@@ -802,12 +912,15 @@ class VIVOXMoralAlignmentEngine:
             },
         }
 
-    async def _evaluate_existentialist(self, action: ActionProposal, context: dict[str, Any]) -> dict[str, Any]:
+    async def _evaluate_existentialist(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> dict[str, Any]:
         """Evaluate action using existentialist ethics (authenticity-based)"""
+        features = features or extract_action_features(action, context)
         # Assess authenticity and freedom
-        authenticity_score = await self._assess_authenticity(action, context)
-        freedom_preservation = await self._assess_freedom_preservation(action, context)
-        responsibility_acceptance = await self._assess_responsibility_acceptance(action, context)
+        authenticity_score = await self._assess_authenticity(action, context, features)
+        freedom_preservation = await self._assess_freedom_preservation(action, context, features)
+        responsibility_acceptance = await self._assess_responsibility_acceptance(action, context, features)
 
         existential_score = (authenticity_score + freedom_preservation + responsibility_acceptance) / 3
 
@@ -826,6 +939,7 @@ class VIVOXMoralAlignmentEngine:
         }
 
     # Helper methods for ethical framework evaluations
+    # Keyword lists live in action_features.FRAMEWORK_KEYWORDS and are scanned once per action
     async def _passes_categorical_imperative(self, action: ActionProposal) -> bool:
         """Test if action passes Kant's categorical imperative"""
         # Simplified universalizability test
@@ -837,34 +951,34 @@ class VIVOXMoralAlignmentEngine:
             bad in action_type for bad in universal_bads
         )
 
-    async def _violates_fundamental_rights(self, action: ActionProposal, context: dict[str, Any]) -> bool:
+    async def _violates_fundamental_rights(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> bool:
         """Check if action violates fundamental rights"""
-        rights_violations = ["privacy", "autonomy", "dignity", "liberty", "safety"]
-        action_text = str(action.content).lower()
+        features = features or extract_action_features(action, context)
+        return features.matches("rights_violations")
 
-        return any(violation in action_text for violation in rights_violations)
-
-    async def _evaluates_duty_fulfillment(self, action: ActionProposal, context: dict[str, Any]) -> float:
+    async def _evaluates_duty_fulfillment(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> float:
         """Evaluate how well action fulfills duties"""
-        duty_keywords = ["responsibility", "obligation", "duty", "should", "must"]
-        action_text = str(action.content).lower()
-
-        duty_score = sum(0.2 for keyword in duty_keywords if keyword in action_text)
+        features = features or extract_action_features(action, context)
+        duty_score = features.weighted_hits("duty", 0.2)
         return min(1.0, 0.5 + duty_score)
 
-    async def _predict_positive_outcomes(self, action: ActionProposal, context: dict[str, Any]) -> float:
+    async def _predict_positive_outcomes(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> float:
         """Predict positive outcomes of action"""
-        positive_keywords = ["benefit", "improve", "help", "enhance", "solve"]
-        action_text = str(action.content).lower()
+        features = features or extract_action_features(action, context)
+        return min(1.0, features.weighted_hits("positive_outcomes", 0.2))
 
-        return min(1.0, sum(0.2 for keyword in positive_keywords if keyword in action_text))
-
-    async def _predict_negative_outcomes(self, action: ActionProposal, context: dict[str, Any]) -> float:
+    async def _predict_negative_outcomes(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> float:
         """Predict negative outcomes of action"""
-        negative_keywords = ["harm", "damage", "hurt", "worsen", "destroy"]
-        action_text = str(action.content).lower()
-
-        return min(1.0, sum(0.3 for keyword in negative_keywords if keyword in action_text))
+        features = features or extract_action_features(action, context)
+        return min(1.0, features.weighted_hits("negative_outcomes", 0.3))
 
     async def _assess_greatest_good(self, action: ActionProposal, context: dict[str, Any]) -> float:
         """Assess if action serves greatest good for greatest number"""
@@ -880,60 +994,42 @@ class VIVOXMoralAlignmentEngine:
 
         return min(1.0, impact_score * scope_multiplier)
 
-    async def _assess_virtue_alignment(self, action: ActionProposal, context: dict[str, Any], virtue: str) -> float:
+    async def _assess_virtue_alignment(
+        self,
+        action: ActionProposal,
+        context: dict[str, Any],
+        virtue: str,
+        features: Optional[ActionFeatures] = None,
+    ) -> float:
         """Assess how well action aligns with specific virtue"""
-        virtue_keywords = {
-            "courage": ["brave", "bold", "courageous", "face", "confront"],
-            "temperance": ["moderate", "balanced", "restrained", "controlled"],
-            "justice": ["fair", "just", "equal", "right", "equitable"],
-            "wisdom": ["wise", "prudent", "thoughtful", "informed", "considered"],
-            "compassion": ["kind", "caring", "empathetic", "compassionate"],
-            "integrity": ["honest", "truthful", "authentic", "genuine", "sincere"],
-        }
+        features = features or extract_action_features(action, context)
+        if virtue not in VIRTUES:
+            # Unknown virtues are matched by name
+            return min(1.0, 0.2 if virtue in features.action_text else 0)
 
-        keywords = virtue_keywords.get(virtue, [virtue])
-        action_text = str(action.content).lower()
-
-        return min(1.0, sum(0.2 for keyword in keywords if keyword in action_text))
+        return min(1.0, features.weighted_hits(virtue, 0.2))
 
-    async def _assess_character_excellence(self, action: ActionProposal, context: dict[str, Any]) -> float:
+    async def _assess_character_excellence(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> float:
         """Assess overall character excellence demonstrated by action"""
-        excellence_keywords = [
-            "excellence",
-            "virtue",
-            "noble",
-            "exemplary",
-            "admirable",
-        ]
-        action_text = str(action.content).lower()
-
-        return min(
-            1.0,
-            0.5 + sum(0.1 for keyword in excellence_keywords if keyword in action_text),
-        )
+        features = features or extract_action_features(action, context)
+        return min(1.0, 0.5 + features.weighted_hits("excellence", 0.1))
 
-    async def _assess_care_provision(self, action: ActionProposal, context: dict[str, Any]) -> float:
+    async def _assess_care_provision(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> float:
         """Assess level of care provided by action"""
-        care_keywords = ["care", "nurture", "support", "comfort", "tend"]
-        action_text = str(action.content).lower()
-
-        return min(1.0, sum(0.2 for keyword in care_keywords if keyword in action_text))
+        features = features or extract_action_features(action, context)
+        return min(1.0, features.weighted_hits("care", 0.2))
 
-    async def _assess_relationship_impact(self, action: ActionProposal, context: dict[str, Any]) -> float:
+    async def _assess_relationship_impact(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> float:
         """Assess impact on relationships"""
-        relationship_positive = ["bond", "connect", "unite", "together", "collaborate"]
-        relationship_negative = [
-            "separate",
-            "isolate",
-            "divide",
-            "conflict",
-            "alienate",
-        ]
-
-        action_text = str(action.content).lower()
-
-        positive_score = sum(0.2 for keyword in relationship_positive if keyword in action_text)
-        negative_score = sum(0.3 for keyword in relationship_negative if keyword in action_text)
+        features = features or extract_action_features(action, context)
+        positive_score = features.weighted_hits("relationship_positive", 0.2)
+        negative_score = features.weighted_hits("relationship_negative", 0.3)
 
         return max(0.0, min(1.0, 0.5 + positive_score - negative_score))
 
@@ -942,45 +1038,32 @@ class VIVOXMoralAlignmentEngine:
         responsibility_level = context.get("responsibility_level", 0.5)
         return min(1.0, responsibility_level)
 
-    async def _assess_authenticity(self, action: ActionProposal, context: dict[str, Any]) -> float:
+    async def _assess_authenticity(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> float:
         """Assess authenticity of action"""
-        authentic_keywords = ["authentic", "genuine", "true", "honest", "real"]
-        inauthentic_keywords = ["fake", "pretend", "false", "deceptive", "artificial"]
-
-        action_text = str(action.content).lower()
-
-        authentic_score = sum(0.2 for keyword in authentic_keywords if keyword in action_text)
-        inauthentic_penalty = sum(0.3 for keyword in inauthentic_keywords if keyword in action_text)
+        features = features or extract_action_features(action, context)
+        authentic_score = features.weighted_hits("authentic", 0.2)
+        inauthentic_penalty = features.weighted_hits("inauthentic", 0.3)
 
         return max(0.0, min(1.0, 0.6 + authentic_score - inauthentic_penalty))
 
-    async def _assess_freedom_preservation(self, action: ActionProposal, context: dict[str, Any]) -> float:
+    async def _assess_freedom_preservation(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> float:
         """Assess how well action preserves freedom"""
-        freedom_keywords = ["freedom", "choice", "liberty", "autonomy", "voluntary"]
-        constraint_keywords = ["force", "compel", "mandate", "restrict", "limit"]
-
-        action_text = str(action.content).lower()
-
-        freedom_score = sum(0.2 for keyword in freedom_keywords if keyword in action_text)
-        constraint_penalty = sum(0.3 for keyword in constraint_keywords if keyword in action_text)
+        features = features or extract_action_features(action, context)
+        freedom_score = features.weighted_hits("freedom", 0.2)
+        constraint_penalty = features.weighted_hits("constraint", 0.3)
 
         return max(0.0, min(1.0, 0.6 + freedom_score - constraint_penalty))
 
-    async def _assess_responsibility_acceptance(self, action: ActionProposal, context: dict[str, Any]) -> float:
+    async def _assess_responsibility_acceptance(
+        self, action: ActionProposal, context: dict[str, Any], features: Optional[ActionFeatures] = None
+    ) -> float:
         """Assess level of responsibility acceptance"""
-        responsibility_keywords = [
-            "responsible",
-            "accountable",
-            "own",
-            "accept",
-            "acknowledge",
-        ]
-        action_text = str(action.content).lower()
-
-        return min(
-            1.0,
-            0.4 + sum(0.15 for keyword in responsibility_keywords if keyword in action_text),
-        )
+        features = features or extract_action_features(action, context)
+        return min(1.0, 0.4 + features.weighted_hits("responsibility", 0.15))
 
     async def z_collapse_gating(
         self, potential_states: list[PotentialState], collapse_context: dict[str, Any]